@@ -0,0 +1,120 @@
+'''本地谱面指标基准测试
+
+测量 `bestdori.ayachan.metrics.chart_metrics_local` 的计算耗时，并与录制的 Ayachan 谱面分析响应逐字段比较。
+
+Ayachan 响应通过录制回放（`Cassette`）保存在 `benchmarks/fixtures/ayachan.zip` 中，
+使用 `--record` 时请求 Ayachan 并录制，之后无需网络即可重复比较。参与比较的谱面为
+`benchmarks/fixtures/charts` 中的谱面（见 `charts.py --capture`），不存在时使用生成的谱面。
+计算前会校验各谱面的 `total_hote` 与 `Chart.count` 的音符数一致，包括首尾节点隐藏的滑条。
+
+用法:
+    python benchmarks/chart_metrics.py --record   # 请求 Ayachan 并录制响应
+    python benchmarks/chart_metrics.py            # 与录制的响应比较并测量耗时
+'''
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bestdori.charts import Chart
+from bestdori.utils.network import Cassette, Session
+from bestdori.ayachan.metrics import chart_metrics_local
+from bestdori.ayachan.chartmetrics import chart_metrics_custom
+from charts import FIXTURES, check
+from mock_server import synthesize_chart
+
+CASSETTE = Path(__file__).resolve().parent / 'fixtures' / 'ayachan.zip'
+'''Ayachan 响应录制文件'''
+
+def _charts(count: int) -> List[Tuple[str, str, Chart]]:
+    '''参与比较的 `(名称, 难度, 谱面)`'''
+    if FIXTURES.exists() and (paths := sorted(FIXTURES.glob('*.json'))):
+        return [(path.stem, path.stem.split('.')[-1], Chart.from_json(path.read_bytes())) for path in paths]
+    return [
+        (f'synthetic.{seed}', 'expert', Chart.from_python(synthesize_chart(seed, 800)))
+        for seed in range(count)
+    ]
+
+# 首尾节点均隐藏的滑条，`Chart.count` 不计入隐藏节点
+HIDDEN_ENDPOINTS = Chart.from_python([
+    {'type': 'BPM', 'beat': 0.0, 'bpm': 120.0},
+    {'type': 'Single', 'beat': 1.0, 'lane': 3.0},
+    {'type': 'Slide', 'connections': [
+        {'beat': 2.0, 'lane': 1.0, 'hidden': True},
+        {'beat': 3.0, 'lane': 2.0, 'hidden': True},
+    ]},
+])
+
+def verify(charts: List[Tuple[str, str, Chart]]) -> None:
+    '''校验本地指标的音符数与 `Chart.count` 一致
+
+    异常:
+        AssertionError: 任意谱面的音符数不一致
+    '''
+    for name, _, chart in [*charts, ('hidden-endpoints', 'expert', HIDDEN_ENDPOINTS)]:
+        metrics = chart_metrics_local(chart)['metrics']
+        notes = chart.count().notes
+        check(metrics['total_hote'] == notes, f'{name}: total_hote {metrics["total_hote"]} != Chart.count notes {notes}')
+        check(metrics['total_hit_note'] <= notes, f'{name}: total_hit_note {metrics["total_hit_note"]} > notes {notes}')
+
+def _flatten(data: Dict[str, Any], prefix: str='') -> Dict[str, Any]:
+    fields: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            fields.update(_flatten(value, f'{prefix}{key}.'))
+        else:
+            fields[f'{prefix}{key}'] = value
+    return fields
+
+def _matches(local: Any, remote: Any, tolerance: float) -> bool:
+    if isinstance(remote, list):
+        return isinstance(local, list) and len(local) == len(remote) and all(
+            _matches(a, b, tolerance) for a, b in zip(local, remote)
+        )
+    if isinstance(remote, (int, float)) and not isinstance(remote, bool):
+        return abs(local - remote) <= tolerance * max(1.0, abs(remote))
+    return local == remote
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark local chart metrics against recorded Ayachan responses')
+    parser.add_argument('--record', action='store_true', help='query Ayachan and record its responses first')
+    parser.add_argument('--charts', type=int, default=20, help='synthetic charts when no fixtures exist')
+    parser.add_argument('--tolerance', type=float, default=0.01, help='relative tolerance for numeric fields')
+    args = parser.parse_args()
+
+    charts = _charts(args.charts)
+    verify(charts)
+    print(f'{len(charts) + 1} charts: total_hote matches Chart.count')
+    start = time.perf_counter()
+    local = [chart_metrics_local(chart) for _, _, chart in charts]
+    seconds = time.perf_counter() - start
+    print(f'local metrics for {len(charts)} charts: {seconds * 1000:.1f} ms ({seconds / len(charts) * 1000:.2f} ms/chart)')
+
+    if not args.record and not CASSETTE.exists():
+        print(f'no recorded Ayachan responses at {CASSETTE}, run with --record to compare')
+        return
+    session = Session(cassette=Cassette(CASSETTE, mode='auto' if args.record else 'replay'))
+    try:
+        remote = [chart_metrics_custom(diff, chart, session=session) for _, diff, chart in charts]
+    finally:
+        session.close()
+
+    # 统计各字段与 Ayachan 一致的谱面数
+    agreed: Dict[str, int] = {}
+    for mine, theirs in zip(local, remote):
+        mine_fields = _flatten({key: mine[key] for key in theirs if key in mine})  # type: ignore[literal-required]
+        for field, value in _flatten(dict(theirs)).items():
+            if field == 'difficulty.difficulty':
+                continue
+            ok = field in mine_fields and _matches(mine_fields[field], value, args.tolerance)
+            agreed[field] = agreed.get(field, 0) + ok
+    print(f'\nfields matching Ayachan within {args.tolerance:.0%} ({len(charts)} charts)')
+    for field, count in sorted(agreed.items()):
+        print(f'  {field:42} {count:4}/{len(charts)}')
+
+if __name__ == '__main__':
+    main()
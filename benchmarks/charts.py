@@ -0,0 +1,240 @@
+'''谱面表示基准测试
+
+比较由音符对象组成的 `Chart` 与以类型化数组存储的 `CompactChart` 在同时保留大量谱面时的
+内存占用、完整垃圾回收耗时与解析耗时，以及 `Chart.count`、`CompactChart.count` 与 `charts.count_many`
+的统计耗时，并校验两者转换得到的谱面与统计结果完全一致。
+
+谱面数据由 `mock_server.synthesize_chart` 生成，结构与 Bestdori 谱面相近，另外生成一组含负 BPM 的谱面。
+`benchmarks/fixtures/charts` 中的谱面也会参与一致性校验，其中包含负 BPM、同拍与末尾 BPM、隐藏节点、
+空滑条等边界情况，可通过 `--capture` 从 Bestdori 下载更多官方谱面。校验不会被 `python -O` 跳过，
+`--verify` 只校验测试样本，无需网络。
+
+用法:
+    python benchmarks/charts.py --capture 1 128 243   # 下载官方谱面作为测试样本
+    python benchmarks/charts.py --verify              # 只校验测试样本
+    python benchmarks/charts.py
+    python benchmarks/charts.py --charts 500 --notes 1500 --workers 8
+'''
+
+import gc
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Callable, Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bestdori.utils import codec
+from bestdori.charts import API, Chart, TimingMap, CompactChart, count_many, analyze_many
+from bestdori.models.note import BPM
+from mock_server import synthesize_chart
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'charts'
+'''测试样本目录'''
+
+# 下载官方谱面作为测试样本
+def capture(ids: List[int], diffs: List[str]) -> None:
+    '''从 Bestdori 下载官方谱面并保存到测试样本目录
+
+    参数:
+        ids (List[int]): 谱面 ID
+        diffs (List[str]): 难度名称
+    '''
+    from bestdori.utils.network import Api
+
+    FIXTURES.mkdir(parents=True, exist_ok=True)
+    for id in ids:
+        for diff in diffs:
+            content = Api(API['charts']['info'].format(id=id, diff=diff)).get().content
+            (FIXTURES / f'{id}.{diff}.json').write_bytes(content)
+            print(f'captured chart {id} {diff}: {len(content)} bytes')
+
+# 生成含负 BPM 的谱面
+def synthesize_negative(seed: Any, notes: int=1000) -> List[Dict[str, Any]]:
+    '''生成含负 BPM 段（倒流）的谱面，BPM 音符可能与音符同拍或位于最后一个音符之后
+
+    参数:
+        seed (Any): 随机种子
+        notes (int, optional): 大致的音符数
+
+    返回:
+        List[Dict[str, Any]]: 谱面数据
+    '''
+    rng = random.Random(seed)
+    chart = synthesize_chart(seed, notes)
+    end = max(note['beat'] for note in chart if 'beat' in note)
+    for _ in range(rng.randint(1, 8)):
+        beat = rng.choice([rng.uniform(0.0, end), float(rng.randint(0, int(end))), end])
+        chart.append({'type': 'BPM', 'beat': beat, 'bpm': rng.choice([-240.0, -120.0, -60.0, 0.0, 120.0, 180.0])})
+    if rng.random() < 0.5:
+        chart.append({'type': 'BPM', 'beat': end + 1.0, 'bpm': 100.0})
+    if rng.random() < 0.5:
+        chart.append({'type': 'Slide', 'connections': [
+            {'beat': end + 2.0, 'lane': 1.0, 'hidden': True},
+            {'beat': end + 3.0, 'lane': 2.0, 'hidden': True},
+        ]})
+    rng.shuffle(chart)
+    return chart
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def _memory(build: Callable[[], List[Any]]) -> float:
+    '''构建谱面列表时分配且仍被持有的内存，单位为 MiB'''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        charts = build()
+        current = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del charts
+    return current / 2**20
+
+def _gc(build: Callable[[], List[Any]]) -> float:
+    '''持有谱面列表时完整垃圾回收的耗时，单位为毫秒'''
+    charts = build()
+    gc.collect()
+    start = time.perf_counter()
+    gc.collect()
+    elapsed = time.perf_counter() - start
+    del charts
+    return elapsed * 1000
+
+def check(ok: bool, message: str) -> None:
+    '''校验失败时抛出 `AssertionError`，与 `assert` 不同不会被 `python -O` 移除'''
+    if not ok:
+        raise AssertionError(message)
+
+# 读取测试样本
+def fixtures() -> Dict[str, bytes]:
+    '''读取测试样本目录中的谱面
+
+    返回:
+        Dict[str, bytes]: 谱面 JSON 数据，键为文件名（不含扩展名）
+    '''
+    return {path.stem: path.read_bytes() for path in sorted(FIXTURES.glob('*.json'))}
+
+# 校验两种表示一致
+def verify(contents: Dict[str, bytes]) -> None:
+    '''校验 `Chart` 与 `CompactChart` 的转换结果一致
+
+    参数:
+        contents (Dict[str, bytes]): 谱面 JSON 数据，键为谱面名称
+
+    异常:
+        AssertionError: 任意谱面的结果不一致
+    '''
+    for name, content in contents.items():
+        chart = Chart.from_json(content)
+        compact = CompactChart.from_json(content)
+        check(compact.to_list() == chart.to_list(), f'{name}: CompactChart.to_list differs from Chart.to_list')
+        check(compact == chart.compact(), f'{name}: Chart.compact differs from CompactChart.from_json')
+        check(compact.to_chart().to_list() == chart.to_list(), f'{name}: CompactChart.to_chart differs from Chart')
+        check(compact.is_sp_rhythm == chart.is_sp_rhythm, f'{name}: CompactChart.is_sp_rhythm differs')
+        check(compact.count() == chart.count(), f'{name}: CompactChart.count differs from Chart.count')
+    expected = [Chart.from_json(content).count() for content in contents.values()]
+    check(count_many(list(contents.values())) == expected, 'count_many differs from Chart.count')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare memory and GC cost of Chart and CompactChart')
+    parser.add_argument('--charts', type=int, default=200, help='charts held in memory at once')
+    parser.add_argument('--notes', type=int, default=1000, help='approximate notes per chart')
+    parser.add_argument('--repeat', type=int, default=20, help='timed parse runs')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='processes for analyze_many')
+    parser.add_argument('--capture', type=int, nargs='*', metavar='ID', help='download official charts as fixtures first')
+    parser.add_argument('--diffs', nargs='+', default=['expert', 'special'], help='difficulties to capture')
+    parser.add_argument('--verify', action='store_true', help='only verify the fixtures and exit')
+    args = parser.parse_args()
+
+    if args.capture:
+        capture(args.capture, args.diffs)
+
+    samples = fixtures()
+    verify(samples)
+    print(f'{len(samples)} fixtures: outputs verified identical')
+    if args.verify:
+        return
+
+    contents = [codec.dumpb(synthesize_chart(seed, args.notes)) for seed in range(args.charts)]
+    negative = [codec.dumpb(synthesize_negative(seed, args.notes)) for seed in range(args.charts)]
+    verify({
+        **{f'synthetic.{seed}': content for seed, content in enumerate(contents)},
+        **{f'negative-bpm.{seed}': content for seed, content in enumerate(negative)},
+    })
+    print(f'{args.charts} charts x ~{args.notes} notes, {len(negative)} negative-BPM charts: outputs verified identical')
+
+    print(f'{"":12} {"memory MiB":>11} {"full gc ms":>11} {"parse ms":>9}')
+    results = {}
+    for cls in (Chart, CompactChart):
+        build = lambda: [cls.from_json(content) for content in contents]
+        parse = _measure(lambda: cls.from_json(contents[0]), args.repeat)
+        results[cls.__name__] = (_memory(build), _gc(build), parse * 1000)
+        print(f'{cls.__name__:12} {results[cls.__name__][0]:11.1f} {results[cls.__name__][1]:11.2f} {results[cls.__name__][2]:9.2f}')
+    memory, collect, _ = results['Chart']
+    print(f'CompactChart memory x{memory / results["CompactChart"][0]:.1f} smaller, gc x{collect / results["CompactChart"][1]:.1f} faster')
+
+    charts = [Chart.from_json(content) for content in contents]
+    compacts = [chart.compact() for chart in charts]
+    counts = {
+        'Chart.count': _measure(lambda: [chart.count() for chart in charts], max(1, args.repeat // 4)),
+        'CompactChart.count': _measure(lambda: [compact.count() for compact in compacts], max(1, args.repeat // 4)),
+    }
+    parsed = {
+        'Chart.from_json().count': _measure(lambda: [Chart.from_json(content).count() for content in contents], 1),
+        'count_many(json)': _measure(lambda: count_many(contents), 1),
+    }
+    print(f'\nstats for {args.charts} charts')
+    for name, seconds in {**counts, **parsed}.items():
+        print(f'  {name:24} {seconds * 1000:9.2f} ms')
+    print(f'CompactChart.count x{counts["Chart.count"] / counts["CompactChart.count"]:.1f} faster than Chart.count')
+
+    # 逐个音符从头累加 BPM 段换算时间，与 TimingMap 的批量换算比较
+    def _naive(chart: Chart, beats: Iterable[float]) -> List[float]:
+        changes = sorted((note.beat, note.bpm) for note in chart if isinstance(note, BPM))
+        times = []
+        for beat in beats:
+            seconds, index = 0.0, 0
+            while index + 1 < len(changes) and changes[index + 1][0] <= beat:
+                seconds += (changes[index + 1][0] - changes[index][0]) * 60.0 / changes[index][1]
+                index += 1
+            times.append(seconds + (beat - changes[index][0]) * 60.0 / changes[index][1])
+        return times
+
+    timing = TimingMap.from_chart(compacts[0])
+    check(
+        all(abs(a - b) < 1e-6 for a, b in zip(_naive(charts[0], compacts[0].beats), timing.beats_to_times(compacts[0].beats))),
+        'TimingMap.beats_to_times differs from the per-note BPM walk',
+    )
+    naive = _measure(lambda: _naive(charts[0], compacts[0].beats), args.repeat)
+    mapped = _measure(lambda: TimingMap.from_chart(compacts[0]).beats_to_times(compacts[0].beats), args.repeat)
+    print(f'\nbeat to time for {compacts[0].rows} rows, {len(timing)} BPM segments')
+    print(f'  {"per-note BPM walk":24} {naive * 1000:9.2f} ms')
+    print(f'  {"TimingMap":24} {mapped * 1000:9.2f} ms')
+
+    # 多进程批量统计
+    sources = contents * 4
+    start = time.perf_counter()
+    expected = count_many(sources)
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    results = dict(analyze_many(sources, workers=args.workers))
+    parallel = time.perf_counter() - start
+    check([results[index] for index in range(len(sources))] == expected, 'analyze_many differs from count_many')
+    print(f'\nparse and count {len(sources)} charts')
+    print(f'  {"count_many":24} {sequential * 1000:9.2f} ms')
+    print(f'  {f"analyze_many x{args.workers}":24} {parallel * 1000:9.2f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+'''HTTP/1.1 连接池与 HTTP/2 多路复用的批量请求基准测试
+
+同时发起大量 `Card.get_info_async` 或资源文件请求（fan-out），比较 `httpx` 异步客户端
+使用 HTTP/1.1 连接池与启用 `http2` 时的总耗时、吞吐量、延迟与建立的连接数。
+
+Bestdori 的请求将被重定向到本地模拟服务器（见 `mock_server.py`）。由于模拟服务器没有 TLS，
+HTTP/2 场景使用明文 HTTP/2（h2c，prior knowledge）代替通过 ALPN 协商的 HTTP/2，
+多路复用的行为与实际访问 bestdori.com 时一致。两种协议的模拟服务器均为单线程 asyncio 实现，
+避免每个连接一个线程的服务器在连接数较多时争用 GIL 而影响对比。
+
+需要安装 `httpx[http2]`；测试期间将关闭 `settings.coalesce` 与 `settings.memo`。
+
+用法:
+    python benchmarks/http2.py
+    python benchmarks/http2.py --latency 50 --fanout 1000 --max-connections 100
+    python benchmarks/http2.py --kind asset --fanout 200 --asset-size 65536
+'''
+
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+
+from bestdori import settings
+from bestdori.cards import Card
+from bestdori.utils.endpoints import PREFIX
+from bestdori.utils.network import Api, Session, session as _session
+from bestdori.utils.network import httpx as _httpx
+from mock_server import MockServer
+
+# 重定向传输类
+class _Redirect(httpx.AsyncBaseTransport):
+    '''将所有请求重定向到模拟服务器的传输'''
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, base: httpx.URL) -> None:
+        self.transport = transport
+        self.base = base
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme=self.base.scheme, host=self.base.host, port=self.base.port)
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    @property
+    def connections(self) -> int:
+        '''连接池中的连接数'''
+        return len(self.transport._pool.connections)
+
+_transports: List[_Redirect] = []
+
+def _client_class(base: str) -> Any:
+    '''构建将请求重定向到模拟服务器的 httpx 异步客户端类型'''
+
+    class MockClient(_httpx.AsyncClient):
+        async def __aenter__(self) -> 'MockClient':
+            kwargs = _httpx._client_kwargs(self)
+            transport = _Redirect(
+                httpx.AsyncHTTPTransport(
+                    limits=kwargs.get('limits', httpx.Limits()),
+                    # 模拟服务器没有 TLS，无法通过 ALPN 协商，直接使用 HTTP/2 连接
+                    http1=not self.http2,
+                    http2=self.http2,
+                ),
+                httpx.URL(base),
+            )
+            _transports.append(transport)
+            self._async_client = httpx.AsyncClient(timeout=kwargs['timeout'], transport=transport, trust_env=False)
+            await self._async_client.__aenter__()
+            return self
+
+    return MockClient
+
+# 测试结果类
+@dataclass
+class Result:
+    '''测试结果，耗时单位为毫秒'''
+    protocol: str
+    fanout: int
+    errors: int
+    seconds: float
+    throughput: float
+    p50: float
+    p99: float
+    connections: int
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+async def _fetch(kind: str, id: int, session: Session) -> None:
+    if kind == 'info':
+        await Card(id, session=session).get_info_async()
+    else:
+        await Api(f'{PREFIX["bestdori"]}/assets/jp/characters/resourceset/res{id:06}_rip/card_normal.png', session=session).aget()
+
+async def _run(kind: str, fanout: int, rounds: int, http2: bool, max_connections: int) -> Tuple[List[float], int, float, int]:
+    session = Session(http2=http2, max_connections=max_connections, max_connections_per_host=max_connections)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one(id: int) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            await _fetch(kind, id, session)
+        except Exception:
+            errors += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    try:
+        # 预热连接
+        await asyncio.gather(*[one(id) for id in range(1, min(fanout, max_connections) + 1)])
+        latencies.clear()
+        errors = 0
+        start = time.perf_counter()
+        for round in range(rounds):
+            await asyncio.gather(*[one(round * fanout + id) for id in range(1, fanout + 1)])
+        seconds = time.perf_counter() - start
+        connections = _transports[-1].connections
+    finally:
+        await session.aclose()
+    return latencies, errors, seconds, connections
+
+# 运行测试
+def run(
+    server: MockServer,
+    kind: str,
+    fanout: int,
+    rounds: int,
+    http2: bool,
+    max_connections: int,
+) -> Result:
+    '''运行单个协议的批量请求测试
+
+    参数:
+        server (MockServer): 已启动的模拟服务器
+        kind (str): 请求类型，`info` 为卡牌信息，`asset` 为资源文件
+        fanout (int): 每轮同时发起的请求数
+        rounds (int): 计时的轮数
+        http2 (bool): 是否启用 HTTP/2
+        max_connections (int): 连接池最大连接数
+
+    返回:
+        Result: 测试结果
+    '''
+    _session.__AsyncClient__ = _client_class(server.url)
+    latencies, errors, seconds, connections = asyncio.run(_run(kind, fanout, rounds, http2, max_connections))
+    latencies = latencies or [float('nan')]
+    return Result(
+        'HTTP/2' if http2 else 'HTTP/1.1',
+        fanout,
+        errors,
+        seconds,
+        fanout * rounds / seconds,
+        _percentile(latencies, 0.5) * 1000,
+        _percentile(latencies, 0.99) * 1000,
+        connections,
+    )
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare HTTP/1.1 pooling with HTTP/2 multiplexing for bulk fan-out')
+    parser.add_argument('--kind', choices=['info', 'asset'], default='info', help='card info JSON or asset files')
+    parser.add_argument('--fanout', type=int, default=500, help='concurrent requests per round')
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--max-connections', type=int, default=settings.max_connections)
+    parser.add_argument('--latency', type=float, default=20.0, help='mock server latency per response (ms)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='mock server max random extra latency (ms)')
+    parser.add_argument('--asset-size', type=int, default=64 * 1024, help='bytes per asset file')
+    args = parser.parse_args()
+
+    settings.coalesce = False
+    settings.memo.ttl = 0
+    print(
+        f'{args.fanout} concurrent x {args.rounds} rounds of {args.kind}, '
+        f'latency {args.latency} ms, max {args.max_connections} connections'
+    )
+    print(f'{"protocol":9} {"seconds":>8} {"req/s":>9} {"p50 ms":>8} {"p99 ms":>8} {"conns":>6} {"errors":>6}')
+    results: List[Result] = []
+    for http2 in (False, True):
+        with MockServer(
+            latency=args.latency / 1000,
+            jitter=args.jitter / 1000,
+            asset_size=args.asset_size,
+            backend='http2' if http2 else 'asyncio',
+        ) as server:
+            result = run(server, args.kind, args.fanout, args.rounds, http2, args.max_connections)
+        results.append(result)
+        print(
+            f'{result.protocol:9} {result.seconds:8.3f} {result.throughput:9.1f} {result.p50:8.2f} '
+            f'{result.p99:8.2f} {result.connections:6} {result.errors:6}'
+        )
+    print(f'HTTP/2 throughput vs HTTP/1.1: {(results[1].throughput / results[0].throughput - 1) * 100:+.1f}%')
+
+if __name__ == '__main__':
+    main()
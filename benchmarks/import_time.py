@@ -0,0 +1,67 @@
+'''导入耗时基准测试
+
+在独立的子进程中分别测量导入各模块的耗时，避免模块缓存的影响。
+
+用法:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 20 bestdori.charts bestdori.songs
+'''
+
+import sys
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+TARGETS: List[str] = [
+    'bestdori',
+    'bestdori.charts',
+    'bestdori.cards',
+    'bestdori.songs',
+    'bestdori.utils.network',
+]
+'''默认测量的模块'''
+
+_SCRIPT = '''
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+'''
+
+_ALL = 'import bestdori; [getattr(bestdori, name) for name in bestdori.__all__]'
+
+# 在子进程中测量导入耗时
+def measure(statement: str) -> float:
+    '''在新的解释器中执行导入语句并返回耗时（秒）
+
+    参数:
+        statement (str): 导入语句
+
+    返回:
+        float: 耗时（秒）
+    '''
+    output = subprocess.check_output(
+        [sys.executable, '-c', _SCRIPT.format(statement=statement)],
+        cwd=ROOT,
+        text=True,
+    )
+    return float(output.strip().splitlines()[-1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark bestdori import time')
+    parser.add_argument('modules', nargs='*', default=TARGETS, help='modules to import')
+    parser.add_argument('--repeat', type=int, default=10, help='runs per module')
+    args = parser.parse_args()
+
+    statements = [(module, f'import {module}') for module in args.modules]
+    statements.append(('bestdori (all submodules)', _ALL))
+    for name, statement in statements:
+        times = [measure(statement) for _ in range(args.repeat)]
+        print(f'{name:32} median {statistics.median(times) * 1000:8.2f} ms   min {min(times) * 1000:8.2f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+'''JSON 编解码器基准测试
+
+比较 `bestdori.utils.codec` 中各已安装编解码器解析主数据的耗时。
+
+用法:
+    python benchmarks/json_codec.py --capture   # 从 Bestdori 下载主数据作为测试样本
+    python benchmarks/json_codec.py             # 运行基准测试
+
+测试样本保存在 `benchmarks/fixtures` 中，若不存在则使用结构相近的生成数据。
+'''
+
+import sys
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bestdori.utils import codec
+from bestdori.utils.network import Api
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures'
+'''测试样本目录'''
+
+PAYLOADS: Dict[str, str] = {
+    'cards.all.5': '/api/cards/all.5.json',
+    'songs.all.7': '/api/songs/all.7.json',
+    'skills.all.10': '/api/skills/all.10.json',
+}
+'''测试样本名称与对应的 API'''
+
+# 下载主数据作为测试样本
+def capture() -> None:
+    '''从 Bestdori 下载主数据并保存到测试样本目录'''
+    FIXTURES.mkdir(parents=True, exist_ok=True)
+    for name, url in PAYLOADS.items():
+        content = Api(url).get().content
+        (FIXTURES / f'{name}.json').write_bytes(content)
+        print(f'captured {name}: {len(content)} bytes')
+
+def _servers(rng: random.Random, value: Callable[[], Any]) -> List[Any]:
+    return [value() if rng.random() < 0.8 else None for _ in range(5)]
+
+def _text(rng: random.Random) -> str:
+    return ''.join(rng.choice('あいうえおかきくけこBanG Dream!ガルパ') for _ in range(rng.randint(4, 16)))
+
+# 生成与主数据结构相近的测试数据
+def synthesize(name: str) -> bytes:
+    '''生成与主数据结构相近的测试数据
+
+    参数:
+        name (str): 测试样本名称
+
+    返回:
+        bytes: JSON 数据
+    '''
+    rng = random.Random(name)
+    data: Dict[str, Any] = {}
+    if name == 'cards.all.5':
+        for id in range(1, 2001):
+            data[str(id)] = {
+                'characterId': rng.randint(1, 40),
+                'attribute': rng.choice(['cool', 'happy', 'pure', 'powerful']),
+                'prefix': _servers(rng, lambda: _text(rng)),
+                'releasedAt': _servers(rng, lambda: str(rng.randint(1, 2) * 10 ** 12)),
+                'rarity': rng.randint(1, 5),
+                'levelLimit': 50,
+                'resourceSetName': f'res{id:06d}',
+                'skillId': rng.randint(1, 100),
+                'type': 'permanent',
+                'stat': {
+                    str(level): {
+                        'performance': rng.randint(1000, 20000),
+                        'technique': rng.randint(1000, 20000),
+                        'visual': rng.randint(1000, 20000),
+                    }
+                    for level in range(1, 61, 5)
+                },
+            }
+    elif name == 'songs.all.7':
+        for id in range(1, 701):
+            data[str(id)] = {
+                'tag': 'normal',
+                'bandId': rng.randint(1, 20),
+                'jacketImage': [f'jacket{id}'],
+                'musicTitle': _servers(rng, lambda: _text(rng)),
+                'publishedAt': _servers(rng, lambda: str(rng.randint(1, 2) * 10 ** 12)),
+                'closedAt': _servers(rng, lambda: None),
+                'difficulty': {
+                    str(diff): {'playLevel': rng.randint(5, 32)}
+                    for diff in range(5)
+                },
+                'length': rng.uniform(90, 180),
+                'notes': {str(diff): rng.randint(100, 1500) for diff in range(5)},
+                'bpm': {
+                    str(diff): [{'bpm': rng.randint(80, 240), 'start': 0, 'end': rng.uniform(90, 180)}]
+                    for diff in range(5)
+                },
+            }
+    else:
+        for id in range(1, 201):
+            data[str(id)] = {
+                'simpleDescription': _servers(rng, lambda: _text(rng)),
+                'description': _servers(rng, lambda: _text(rng) * 3),
+                'duration': [rng.uniform(5, 10) for _ in range(5)],
+                'activationEffect': {
+                    'unificationActivateEffectValue': rng.randint(0, 100),
+                    'activateEffectTypes': {
+                        'score': {
+                            'activateEffectValue': [rng.randint(10, 150) for _ in range(5)],
+                            'activateEffectValueType': 'rate',
+                            'activateCondition': 'good',
+                        },
+                    },
+                },
+            }
+    return codec.get_codec('json').dumpb(data)
+
+def _load(name: str) -> bytes:
+    path = FIXTURES / f'{name}.json'
+    if path.exists():
+        return path.read_bytes()
+    return synthesize(name)
+
+def _measure(func: Callable[[], Any], repeat: int) -> float:
+    func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark bestdori JSON codecs')
+    parser.add_argument('--capture', action='store_true', help='download master data fixtures first')
+    parser.add_argument('--repeat', type=int, default=20, help='timed runs per codec')
+    args = parser.parse_args()
+
+    if args.capture:
+        capture()
+
+    codecs = codec.available()
+    print(f'codecs: {", ".join(c.name for c in codecs)} (auto: {codec.get_codec().name})')
+    for name in PAYLOADS:
+        content = _load(name)
+        source = 'fixture' if (FIXTURES / f'{name}.json').exists() else 'synthetic'
+        print(f'\n{name} ({source}, {len(content) / 1024:.0f} KiB)')
+        expected = codec.get_codec('json').loads(content)
+        results: Dict[str, Tuple[float, float]] = {}
+        for _codec in codecs:
+            assert _codec.loads(content) == expected, f'{_codec.name} decoded differently'
+            results[_codec.name] = (
+                _measure(lambda: _codec.loads(content), args.repeat),
+                _measure(lambda: _codec.dumpb(expected), args.repeat),
+            )
+        base_loads, base_dumps = results['json']
+        for _name, (loads, dumps) in results.items():
+            print(
+                f'  {_name:8} loads {loads * 1000:8.2f} ms (x{base_loads / loads:4.1f})'
+                f'   dumps {dumps * 1000:8.2f} ms (x{base_dumps / dumps:4.1f})'
+            )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,739 @@
+'''本地模拟 Bestdori / Ayachan 服务器
+
+在本地模拟主数据 `all.N.json`、谱面 JSON、资源文件、帖子列表与 Ayachan API 的响应，
+并可为每个响应添加固定延迟与随机抖动，供网络基准测试使用。
+
+仓库中不附带录制的响应，默认所有请求均使用结构相近的生成数据。需要回放真实响应时，
+先运行 `--capture` 从 Bestdori 与 Ayachan 录制 `CAPTURE` 中的响应到 `benchmarks/fixtures/http`
+（文件路径即请求路径），之后已录制的请求将回放录制的响应，其余请求仍使用生成数据。
+
+用法:
+    python benchmarks/mock_server.py --capture          # 从 Bestdori 与 Ayachan 录制响应
+    python benchmarks/mock_server.py --port 8000 --latency 20
+    python benchmarks/mock_server.py --port 8000 --backend http2  # HTTP/2 明文，需要安装 `h2`
+'''
+
+import sys
+import time
+import socket
+import random
+import asyncio
+import gzip
+import hashlib
+import argparse
+import threading
+import multiprocessing
+from pathlib import Path
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List, Type, Tuple, Union, Literal, Callable, Optional, cast
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bestdori.utils import codec
+from json_codec import synthesize
+
+FIXTURES = Path(__file__).resolve().parent / 'fixtures' / 'http'
+'''录制的响应目录，由 `--capture` 创建，仓库中不附带'''
+
+CAPTURE: Dict[str, str] = {
+    '/api/cards/all.5.json': 'https://bestdori.com',
+    '/api/songs/all.7.json': 'https://bestdori.com',
+    '/api/skills/all.10.json': 'https://bestdori.com',
+    '/api/events/all.5.json': 'https://bestdori.com',
+    '/api/gacha/all.5.json': 'https://bestdori.com',
+    '/api/charts/128/expert.json': 'https://bestdori.com',
+    '/assets/jp/musicjacket/musicjacket130_rip/assets-star-forassetbundle-startapp-musicjacket-musicjacket130-128_rip-jacket.png': 'https://bestdori.com',
+    '/v2/version': 'https://api.ayachan.fun',
+    '/v2/chart/metrics/bandori/128/expert': 'https://api.ayachan.fun',
+}
+'''录制的请求路径与对应的主机'''
+
+ServerBackend = Literal['threading', 'asyncio', 'http2']
+'''模拟服务器实现'''
+
+def _compressors() -> List[Tuple[str, Callable[[bytes], bytes]]]:
+    '''获取可用的响应压缩实现，按压缩率从高到低排列'''
+    compressors: List[Tuple[str, Callable[[bytes], bytes]]] = []
+    try:
+        import zstandard
+        compressors.append(('zstd', zstandard.ZstdCompressor(level=3).compress))
+    except ModuleNotFoundError:
+        pass
+    try:
+        import brotli
+        compressors.append(('br', lambda content: brotli.compress(content, quality=5)))
+    except ModuleNotFoundError:
+        pass
+    compressors.append(('gzip', lambda content: gzip.compress(content, compresslevel=6)))
+    return compressors
+
+_COMPRESSORS = _compressors()
+
+_DIFFICULTIES = ['easy', 'normal', 'hard', 'expert', 'special']
+
+# 生成谱面
+def synthesize_chart(seed: Any, notes: int=1000) -> List[Dict[str, Any]]:
+    '''生成结构与 Bestdori 谱面相近的谱面数据
+
+    参数:
+        seed (Any): 随机种子，相同的种子生成相同的谱面
+        notes (int, optional): 大致的音符数
+
+    返回:
+        List[Dict[str, Any]]: 谱面数据
+    '''
+    rng = random.Random(seed)
+    chart: List[Dict[str, Any]] = [{'type': 'BPM', 'beat': 0.0, 'bpm': float(rng.choice([120, 150, 180, 200]))}]
+    beat = 0.0
+    count = 0
+    while count < notes:
+        beat += rng.choice([0.25, 0.5, 0.5, 1.0])
+        kind = rng.random()
+        if kind < 0.01:
+            chart.append({'type': 'BPM', 'beat': beat, 'bpm': float(rng.randint(80, 240))})
+        elif kind < 0.7:
+            note: Dict[str, Any] = {'type': 'Single', 'beat': beat, 'lane': float(rng.randint(0, 6))}
+            if rng.random() < 0.1:
+                note['flick'] = True
+            if rng.random() < 0.02:
+                note['skill'] = True
+            chart.append(note)
+            count += 1
+        elif kind < 0.95:
+            connections = []
+            _beat = beat
+            for index in range(rng.randint(2, 4)):
+                connection: Dict[str, Any] = {'beat': _beat, 'lane': float(rng.randint(0, 6))}
+                if index > 0 and rng.random() < 0.1:
+                    connection['hidden'] = True
+                connections.append(connection)
+                _beat += rng.choice([0.5, 1.0, 2.0])
+            if rng.random() < 0.2:
+                connections[-1]['flick'] = True
+            chart.append({'type': 'Slide', 'connections': connections})
+            count += len(connections)
+        else:
+            chart.append({
+                'type': 'Directional',
+                'beat': beat,
+                'lane': float(rng.randint(0, 6)),
+                'width': rng.randint(1, 3),
+                'direction': rng.choice(['Left', 'Right']),
+            })
+            count += 1
+    return chart
+
+def _master(kind: str, index: str) -> Dict[str, Any]:
+    rng = random.Random(f'{kind}.{index}')
+    return {
+        str(id): {
+            'name': [f'{kind} {id}' if rng.random() < 0.8 else None for _ in range(5)],
+            'startAt': [str(rng.randint(1, 2) * 10 ** 12) for _ in range(5)],
+            'type': rng.choice(['normal', 'special']),
+        }
+        for id in range(1, 301)
+    }
+
+def _info(kind: str, id: str) -> Dict[str, Any]:
+    rng = random.Random(f'{kind}/{id}')
+    return {
+        'characterId': rng.randint(1, 40),
+        'rarity': rng.randint(1, 5),
+        'attribute': rng.choice(['powerful', 'cool', 'pure', 'happy']),
+        'levelLimit': 50,
+        'resourceSetName': f'res{int(id):06}',
+        'prefix': [f'{kind} {id}' if rng.random() < 0.8 else None for _ in range(5)],
+        'releasedAt': [str(rng.randint(1, 2) * 10 ** 12) if rng.random() < 0.8 else None for _ in range(5)],
+        'skillId': rng.randint(1, 100),
+        'type': rng.choice(['initial', 'permanent', 'limited', 'event']),
+        'stat': {
+            str(level): {'performance': rng.randint(1000, 10000), 'technique': rng.randint(1000, 10000), 'visual': rng.randint(1000, 10000)}
+            for level in range(1, 51)
+        },
+    }
+
+def _posts(limit: int, offset: int) -> Dict[str, Any]:
+    rng = random.Random(offset)
+    return {
+        'result': True,
+        'count': 10000,
+        'posts': [
+            {
+                'id': offset + index,
+                'categoryName': 'SELF_POST',
+                'categoryId': 'chart',
+                'title': f'Chart {offset + index}',
+                'song': {'type': 'custom', 'audio': '', 'cover': ''},
+                'level': rng.randint(20, 32),
+                'difficulty': rng.randint(0, 4),
+                'time': 1700000000000 + index,
+                'author': {'username': f'user{rng.randint(1, 500)}', 'nickname': None, 'titles': None},
+                'likes': rng.randint(0, 300),
+                'liked': False,
+                'tags': [],
+            }
+            for index in range(limit)
+        ],
+    }
+
+def _metrics(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'result': True,
+        'metrics': {
+            'difficulty': 3,
+            'level': 27,
+            'total_note': 1000,
+            'total_time': 120.0,
+            'total_npm': 500.0,
+            'total_nps': 8.3,
+            'total_hit_note': 1200,
+            'total_hpm': 600.0,
+            'total_hps': 10.0,
+            'max_screen_nps': 20.0,
+            'sp_rhythm': False,
+            'irregular': 0,
+            'irregular_info': '',
+            'note_count': {'single': 600, 'flick': 60, 'slide': 300, 'directional': 40},
+            'distribution': {'note': [rng.randint(0, 20) for _ in range(120)], 'hit': [rng.randint(0, 25) for _ in range(120)]},
+        },
+    }
+
+# 生成响应
+def synthesize_response(method: str, path: str, body: bytes, asset_size: int) -> Tuple[int, str, bytes]:
+    '''为未录制的请求生成响应
+
+    参数:
+        method (str): 请求方法
+        path (str): 请求路径，不含查询参数
+        body (bytes): 请求内容
+        asset_size (int): 资源文件的字节数
+
+    返回:
+        Tuple[int, str, bytes]: 状态码、`Content-Type` 与响应内容
+    '''
+    dump = codec.get_codec('json').dumpb
+    parts = path.strip('/').split('/')
+    if path.startswith(('/assets/', '/res/')):
+        data = hashlib.sha256(path.encode()).digest()
+        return 200, 'application/octet-stream', (data * (asset_size // len(data) + 1))[:asset_size]
+    if path == '/api/post/list' and method == 'POST':
+        request = codec.loads(body) if body else {}
+        return 200, 'application/json', dump(_posts(int(request.get('limit', 20)), int(request.get('offset', 0))))
+    if len(parts) == 4 and parts[:2] == ['api', 'charts'] and parts[3].endswith('.json'):
+        difficulty = parts[3][:-5]
+        notes = 200 * (_DIFFICULTIES.index(difficulty) + 1) if difficulty in _DIFFICULTIES else 1000
+        return 200, 'application/json', dump(synthesize_chart(path, notes))
+    if len(parts) == 3 and parts[0] == 'api' and parts[2].startswith('all.'):
+        name = f'{parts[1]}.{parts[2][:-5]}'
+        if name in ('cards.all.5', 'songs.all.7', 'skills.all.10'):
+            return 200, 'application/json', synthesize(name)
+        return 200, 'application/json', dump(_master(parts[1], parts[2]))
+    if len(parts) == 3 and parts[0] == 'api' and parts[2].endswith('.json') and parts[2][:-5].isdigit():
+        return 200, 'application/json', dump(_info(parts[1], parts[2][:-5]))
+    if path == '/v2/version':
+        return 200, 'application/json', dump({'result': True, 'version': 'mock'})
+    if path.startswith('/v2/chart/metrics/'):
+        return 200, 'application/json', dump(_metrics(random.Random(path)))
+    return 404, 'application/json', dump({'result': False, 'code': 'NOT_FOUND'})
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # 响应头与响应内容分两次写入，启用 Nagle 算法时会与客户端的延迟确认叠加产生约 40ms 的延迟
+    disable_nagle_algorithm = True
+    server: '_Server'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _respond(self, method: str) -> None:
+        server = self.server
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        body = self.rfile.read(length) if length else b''
+        path = urlsplit(self.path).path
+        status, content_type, content, etag = server.lookup(method, path, body)
+
+        if (delay := server.delay()) > 0:
+            time.sleep(delay)
+
+        if method == 'GET' and status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', server.cache_control)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        encoding, content = server.encode(content, etag, self.headers.get('Accept-Encoding'))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        if encoding is not None:
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Vary', 'Accept-Encoding')
+        if method == 'GET' and status == 200:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', server.cache_control)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        self._respond('GET')
+
+    def do_POST(self) -> None:
+        self._respond('POST')
+
+class _Responses:
+    '''按请求查找并缓存响应，由 HTTP/1.1 与 HTTP/2 服务器共用'''
+    latency: float
+    jitter: float
+    cache_control: str
+    asset_size: int
+    fixtures: Path
+    compression: bool
+    _responses: Dict[Tuple[str, str, bytes], Tuple[int, str, bytes, str]]
+    _encoded: Dict[Tuple[str, str], bytes]
+
+    def lookup(self, method: str, path: str, body: bytes) -> Tuple[int, str, bytes, str]:
+        '''获取请求对应的状态码、`Content-Type`、响应内容与 `ETag`'''
+        key = (method, path, body)
+        if (response := self._responses.get(key, None)) is None:
+            fixture = self.fixtures / path.lstrip('/')
+            if method == 'GET' and fixture.is_file():
+                content = fixture.read_bytes()
+                content_type = 'application/json' if path.endswith('.json') or path.startswith('/v2/') else 'application/octet-stream'
+                status = 200
+            else:
+                status, content_type, content = synthesize_response(method, path, body, self.asset_size)
+            etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+            response = self._responses[key] = (status, content_type, content, etag)
+        return response
+
+    def encode(self, content: bytes, etag: str, accept: Optional[str]) -> Tuple[Optional[str], bytes]:
+        '''按 `Accept-Encoding` 压缩响应内容，返回使用的内容编码与压缩后的内容'''
+        if not self.compression or not accept or len(content) < 1024:
+            return None, content
+        accepted = {item.split(';')[0].strip() for item in accept.split(',')}
+        for encoding, compress in _COMPRESSORS:
+            if encoding in accepted:
+                if (encoded := self._encoded.get((etag, encoding), None)) is None:
+                    encoded = self._encoded[(etag, encoding)] = compress(content)
+                return encoding, encoded
+        return None, content
+
+    def delay(self) -> float:
+        '''获取本次响应的延迟（秒）'''
+        return self.latency + random.uniform(0, self.jitter) if self.jitter else self.latency
+
+class _Server(_Responses, ThreadingHTTPServer):
+    daemon_threads = True
+    # 默认的监听队列过短，高并发新建连接时会因 SYN 重传产生秒级延迟
+    request_queue_size = 1024
+
+class _H1Protocol(asyncio.Protocol):
+    '''基于 `h11` 的 HTTP/1.1 连接'''
+
+    def __init__(self, server: '_AsyncServer') -> None:
+        import h11
+
+        self.h11 = h11
+        self.server = server
+        self.connection = h11.Connection(h11.SERVER)
+        self.transport: Optional[asyncio.Transport] = None
+        self.request: Optional[Any] = None
+        self.body = bytearray()
+        self.busy = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = cast(asyncio.Transport, transport)
+        self.transport.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def data_received(self, data: bytes) -> None:
+        self.connection.receive_data(data)
+        self.process()
+
+    def process(self) -> None:
+        '''处理已接收的数据，同一连接上的请求依次响应'''
+        h11 = self.h11
+        while not self.busy:
+            try:
+                event = self.connection.next_event()
+            except h11.RemoteProtocolError:
+                cast(asyncio.Transport, self.transport).close()
+                return
+            if event is h11.NEED_DATA or event is h11.PAUSED:
+                return
+            if isinstance(event, h11.Request):
+                self.request = event
+                self.body = bytearray()
+            elif isinstance(event, h11.Data):
+                self.body.extend(event.data)
+            elif isinstance(event, h11.EndOfMessage):
+                self.busy = True
+                asyncio.ensure_future(self.respond())
+            elif isinstance(event, h11.ConnectionClosed):
+                cast(asyncio.Transport, self.transport).close()
+                return
+
+    async def respond(self) -> None:
+        h11 = self.h11
+        server = self.server
+        request = cast(Any, self.request)
+        method = request.method.decode()
+        headers = {name.decode(): value.decode() for name, value in request.headers}
+        status, content_type, content, etag = server.lookup(method, urlsplit(request.target.decode()).path, bytes(self.body))
+        if (delay := server.delay()) > 0:
+            await asyncio.sleep(delay)
+
+        response: List[Tuple[str, str]]
+        if method == 'GET' and status == 200 and headers.get('if-none-match') == etag:
+            status, content = 304, b''
+            response = [('ETag', etag), ('Cache-Control', server.cache_control)]
+        else:
+            encoding, content = server.encode(content, etag, headers.get('accept-encoding'))
+            response = [('Content-Type', content_type), ('Content-Length', str(len(content)))]
+            if encoding is not None:
+                response += [('Content-Encoding', encoding), ('Vary', 'Accept-Encoding')]
+            if method == 'GET' and status == 200:
+                response += [('ETag', etag), ('Cache-Control', server.cache_control)]
+        transport = cast(asyncio.Transport, self.transport)
+        if transport.is_closing():
+            return
+        transport.write(self.connection.send(h11.Response(status_code=status, headers=response)))
+        if content:
+            transport.write(self.connection.send(h11.Data(data=content)))
+        transport.write(self.connection.send(h11.EndOfMessage()))
+        if self.connection.our_state is h11.MUST_CLOSE:
+            transport.close()
+            return
+        self.connection.start_next_cycle()
+        self.busy = False
+        self.process()
+
+class _H2Protocol(asyncio.Protocol):
+    '''HTTP/2 明文（h2c，prior knowledge）连接'''
+
+    def __init__(self, server: '_AsyncServer') -> None:
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self.server = server
+        self.connection = H2Connection(H2Configuration(client_side=False, header_encoding='utf-8'))
+        self.transport: Optional[asyncio.Transport] = None
+        self.requests: Dict[int, Tuple[Dict[str, str], bytearray]] = {}
+        self.windows: Dict[int, asyncio.Event] = {}
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = cast(asyncio.Transport, transport)
+        self.transport.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection.initiate_connection()
+        self.flush()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        for window in self.windows.values():
+            window.set()
+
+    def flush(self) -> None:
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.write(self.connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        from h2 import events
+        from h2.exceptions import ProtocolError
+
+        try:
+            received = self.connection.receive_data(data)
+        except ProtocolError:
+            self.flush()
+            cast(asyncio.Transport, self.transport).close()
+            return
+        for event in received:
+            if isinstance(event, events.RequestReceived):
+                self.requests[event.stream_id] = (dict(cast(Any, event.headers)), bytearray())
+            elif isinstance(event, events.DataReceived):
+                self.requests[event.stream_id][1].extend(event.data)
+                self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, events.StreamEnded):
+                headers, body = self.requests.pop(event.stream_id)
+                asyncio.ensure_future(self.respond(event.stream_id, headers, bytes(body)))
+            elif isinstance(event, events.WindowUpdated):
+                # 连接级窗口更新时唤醒所有等待的流
+                for stream_id, window in self.windows.items():
+                    if event.stream_id in (0, stream_id):
+                        window.set()
+            elif isinstance(event, events.StreamReset):
+                self.requests.pop(event.stream_id, None)
+                if (window := self.windows.get(event.stream_id, None)) is not None:
+                    window.set()
+            elif isinstance(event, events.ConnectionTerminated):
+                cast(asyncio.Transport, self.transport).close()
+        self.flush()
+
+    async def respond(self, stream_id: int, headers: Dict[str, str], body: bytes) -> None:
+        from h2.exceptions import StreamClosedError
+
+        server = self.server
+        method = headers.get(':method', 'GET')
+        status, content_type, content, etag = server.lookup(method, urlsplit(headers.get(':path', '/')).path, body)
+        if (delay := server.delay()) > 0:
+            await asyncio.sleep(delay)
+
+        response: List[Tuple[str, str]]
+        if method == 'GET' and status == 200 and headers.get('if-none-match') == etag:
+            status, content = 304, b''
+            response = [(':status', '304'), ('etag', etag), ('cache-control', server.cache_control)]
+        else:
+            encoding, content = server.encode(content, etag, headers.get('accept-encoding'))
+            response = [(':status', str(status)), ('content-type', content_type), ('content-length', str(len(content)))]
+            if encoding is not None:
+                response += [('content-encoding', encoding), ('vary', 'accept-encoding')]
+            if method == 'GET' and status == 200:
+                response += [('etag', etag), ('cache-control', server.cache_control)]
+        try:
+            self.connection.send_headers(stream_id, response, end_stream=not content)
+            self.flush()
+            await self.send(stream_id, memoryview(content))
+        except StreamClosedError:
+            pass
+
+    async def send(self, stream_id: int, data: memoryview) -> None:
+        '''按流量控制窗口分帧发送响应内容'''
+        connection = self.connection
+        while data:
+            while (window := connection.local_flow_control_window(stream_id)) < 1:
+                event = self.windows[stream_id] = asyncio.Event()
+                await event.wait()
+                self.windows.pop(stream_id, None)
+                if self.transport is None or self.transport.is_closing():
+                    return
+            size = min(window, len(data), connection.max_outbound_frame_size)
+            connection.send_data(stream_id, data[:size].tobytes(), end_stream=size == len(data))
+            self.flush()
+            data = data[size:]
+
+class _AsyncServer(_Responses):
+    '''单线程 asyncio 服务器，接口与 `socketserver` 的服务器一致'''
+
+    def __init__(self, address: Tuple[str, int], protocol: Type[Union[_H1Protocol, _H2Protocol]]) -> None:
+        self.protocol = protocol
+        self.socket = socket.create_server(address, backlog=1024)
+        self.server_address = self.socket.getsockname()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped = threading.Event()
+
+    def serve_forever(self) -> None:
+        loop = self._loop = asyncio.new_event_loop()
+        try:
+            server = loop.run_until_complete(loop.create_server(lambda: self.protocol(self), sock=self.socket))
+            loop.run_forever()
+            server.close()
+        finally:
+            loop.close()
+            self._stopped.set()
+
+    def shutdown(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._stopped.wait()
+
+    def server_close(self) -> None:
+        self.socket.close()
+
+def _make_server(config: Dict[str, Any]) -> Union[_Server, _AsyncServer]:
+    server: Union[_Server, _AsyncServer]
+    address = (config['host'], config['port'])
+    if config['backend'] == 'http2':
+        server = _AsyncServer(address, _H2Protocol)
+    elif config['backend'] == 'asyncio':
+        server = _AsyncServer(address, _H1Protocol)
+    else:
+        server = _Server(address, _Handler)
+    server.latency = config['latency']
+    server.jitter = config['jitter']
+    server.cache_control = config['cache_control']
+    server.asset_size = config['asset_size']
+    server.fixtures = config['fixtures']
+    server.compression = config['compression']
+    server._responses = {}
+    server._encoded = {}
+    return server
+
+def _serve(config: Dict[str, Any], address: 'multiprocessing.Queue[Tuple[str, int]]') -> None:
+    '''在子进程中运行服务器'''
+    server = _make_server(config)
+    address.put(server.server_address[:2])
+    server.serve_forever()
+
+# 模拟服务器类
+class MockServer:
+    '''本地模拟服务器
+
+    默认在子进程中运行，避免服务器与被测客户端争用 GIL 而影响测量结果
+
+    ```python
+    with MockServer(latency=0.02) as server:
+        Api(f'{server.url}/api/cards/all.5.json').get()
+    ```
+
+    参数:
+        host (str, optional): 监听地址
+        port (int, optional): 监听端口，为 `0` 时自动分配
+        latency (float, optional): 每个响应的固定延迟（秒）
+        jitter (float, optional): 每个响应额外的随机延迟上限（秒）
+        cache_control (str, optional): GET 响应的 `Cache-Control` 响应头，
+            默认要求每次验证，可设置为 `max-age=60` 等以测试直接复用缓存
+        asset_size (int, optional): 未录制的资源文件的字节数
+        fixtures (Path, optional): 录制的响应目录
+        compression (bool, optional): 是否按 `Accept-Encoding` 压缩响应，
+            依次尝试 `zstd`（需要 `zstandard`）、`br`（需要 `brotli`）与 `gzip`
+        process (bool, optional): 是否在子进程中运行，为 `False` 时在后台线程中运行
+        backend (ServerBackend, optional): 服务器实现，`threading` 为每个连接一个线程的 HTTP/1.1 服务器，
+            `asyncio` 为单线程的 HTTP/1.1 服务器（需要 `h11`），
+            `http2` 为单线程的 HTTP/2 明文（h2c，prior knowledge）服务器（需要 `h2`），
+            客户端需直接使用 HTTP/2 连接（如 `httpx.AsyncHTTPTransport(http1=False, http2=True)`）。
+            连接数较多时 `threading` 的线程会争用 GIL，比较不同协议时应使用后两者
+    '''
+
+    def __init__(
+        self,
+        host: str='127.0.0.1',
+        port: int=0,
+        *,
+        latency: float=0.0,
+        jitter: float=0.0,
+        cache_control: str='no-cache',
+        asset_size: int=256 * 1024,
+        fixtures: Path=FIXTURES,
+        compression: bool=False,
+        process: bool=True,
+        backend: ServerBackend='threading',
+    ) -> None:
+        self.config: Dict[str, Any] = {
+            'host': host,
+            'port': port,
+            'latency': latency,
+            'jitter': jitter,
+            'cache_control': cache_control,
+            'asset_size': asset_size,
+            'fixtures': fixtures,
+            'compression': compression,
+            'backend': backend,
+        }
+        '''服务器配置'''
+        self.process = process
+        '''是否在子进程中运行'''
+        self.address: Optional[Tuple[str, int]] = None
+        '''服务器监听的地址与端口'''
+        self._server: Optional[Union[_Server, _AsyncServer]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def url(self) -> str:
+        '''服务器地址，如 `http://127.0.0.1:8000`'''
+        if self.address is None:
+            raise RuntimeError('mock server is not running.')
+        host, port = self.address
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'MockServer':
+        '''启动服务器'''
+        if self.process:
+            address: 'multiprocessing.Queue[Tuple[str, int]]' = multiprocessing.Queue()
+            self._process = multiprocessing.Process(target=_serve, args=(self.config, address), daemon=True)
+            self._process.start()
+            self.address = address.get(timeout=30)
+        else:
+            self._server = _make_server(self.config)
+            self.address = self._server.server_address[:2]
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        '''在当前线程中运行服务器直到被中断'''
+        self._server = _make_server(self.config)
+        self.address = self._server.server_address[:2]
+        fixtures = self.config['fixtures']
+        recorded = sum(1 for path in fixtures.rglob('*') if path.is_file()) if fixtures.is_dir() else 0
+        if recorded:
+            print(f'replaying {recorded} recorded responses from {fixtures}')
+        else:
+            print(f'no recorded responses in {fixtures}, serving synthetic data (run --capture to record)')
+        print(f'serving on {self.url}, press Ctrl+C to stop')
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        '''停止服务器'''
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.address = None
+
+    def __enter__(self) -> 'MockServer':
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+# 录制响应
+def capture() -> None:
+    '''从 Bestdori 与 Ayachan 下载 `CAPTURE` 中的响应并保存到录制目录'''
+    from bestdori.utils.network import Api
+
+    for path, host in CAPTURE.items():
+        try:
+            content = Api(f'{host}{path}').get().content
+        except Exception as exception:
+            print(f'skipped {path}: {exception!r}')
+            continue
+        target = FIXTURES / path.lstrip('/')
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        print(f'captured {path}: {len(content)} bytes')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Serve synthetic or recorded Bestdori/Ayachan responses locally')
+    parser.add_argument('--capture', action='store_true', help='record fixtures from the real servers and exit')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='fixed latency per response (ms)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='max random extra latency per response (ms)')
+    parser.add_argument('--cache-control', default='no-cache', help='Cache-Control header of GET responses')
+    parser.add_argument('--compression', action='store_true', help='compress responses according to Accept-Encoding')
+    parser.add_argument(
+        '--backend',
+        choices=['threading', 'asyncio', 'http2'],
+        default='threading',
+        help='thread-per-connection HTTP/1.1, single-threaded HTTP/1.1 (h11), or cleartext HTTP/2 with prior knowledge (h2)',
+    )
+    args = parser.parse_args()
+
+    if args.capture:
+        capture()
+        return
+
+    MockServer(
+        args.host,
+        args.port,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        cache_control=args.cache_control,
+        compression=args.compression,
+        backend=args.backend,
+    ).serve_forever()
+
+if __name__ == '__main__':
+    main()
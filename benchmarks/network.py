@@ -0,0 +1,331 @@
+'''网络请求基准测试
+
+在本地模拟服务器（见 `mock_server.py`）上测量不同配置下请求的吞吐量与延迟，
+为每次性能改动提供可对比的回归数据。
+
+默认以 `httpx` 异步客户端、复用连接池、不启用缓存、自动选择 JSON 编解码器为基准，
+每次只改变其中一项：客户端与同步/异步、每个请求新建连接池、启用缓存、各 JSON 编解码器。
+使用 `--matrix` 可运行所有组合。
+
+测试期间将关闭 `settings.coalesce`，以免并发的相同请求被合并。
+
+用法:
+    python benchmarks/network.py
+    python benchmarks/network.py --latency 20 --requests 500 --concurrency 32 --payloads all chart
+    python benchmarks/network.py --output before.json
+    python benchmarks/network.py --compare before.json
+'''
+
+import sys
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+from pathlib import Path
+from dataclasses import asdict, replace, dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bestdori import settings
+from bestdori.utils import codec
+from bestdori.utils.network import Api, Session, MemoryCache, session as _session
+from mock_server import MockServer
+
+PAYLOADS: Dict[str, Tuple[str, str]] = {
+    'all': ('GET', '/api/cards/all.5.json'),
+    'chart': ('GET', '/api/charts/128/expert.json'),
+    'asset': ('GET', '/assets/jp/musicjacket/musicjacket130_rip/jacket.png'),
+    'posts': ('POST', '/api/post/list'),
+    'ayachan': ('GET', '/v2/chart/metrics/bandori/128/expert'),
+}
+'''测试负载名称与对应的请求方法、路径'''
+
+POST_BODY: Dict[str, Any] = {
+    'following': False,
+    'categoryName': 'SELF_POST',
+    'categoryId': 'chart',
+    'order': 'TIME_DESC',
+    'limit': 20,
+    'offset': 0,
+}
+'''帖子列表请求的内容'''
+
+CLIENTS: List[Tuple[str, str]] = [
+    ('httpx', 'async'),
+    ('httpx', 'sync'),
+    ('aiohttp', 'async'),
+]
+'''可用的客户端与同步/异步组合'''
+
+# 测试场景类
+@dataclass(frozen=True)
+class Scenario:
+    '''测试场景'''
+    payload: str
+    client: str = 'httpx'
+    mode: str = 'async'
+    pooled: bool = True
+    cache: bool = False
+    codec: str = 'auto'
+
+    @property
+    def name(self) -> str:
+        return (
+            f'{self.payload:7} {self.client:7} {self.mode:5} '
+            f'{"pooled" if self.pooled else "per-req":7} {"cache" if self.cache else "-":5} {self.codec}'
+        )
+
+# 测试结果类
+@dataclass
+class Result:
+    '''测试结果，耗时单位为毫秒'''
+    scenario: Scenario
+    requests: int
+    errors: int
+    seconds: float
+    throughput: float
+    p50: float
+    p90: float
+    p99: float
+    mean: float
+
+def _use_client(name: str, mode: str) -> None:
+    '''切换新建会话使用的客户端'''
+    if mode == 'sync':
+        _session.__Client__ = _session._import_client(name)
+    else:
+        _session.__AsyncClient__ = _session._import_client(name, _async=True)
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def _call(scenario: Scenario, api: Api, body: Optional[Dict[str, Any]]) -> Any:
+    if body is not None:
+        response = api.post(data=body)
+    else:
+        response = api.get()
+    return response.json() if scenario.payload != 'asset' else response.content
+
+async def _acall(scenario: Scenario, api: Api, body: Optional[Dict[str, Any]]) -> Any:
+    if body is not None:
+        response = await api.apost(data=body)
+    else:
+        response = await api.aget()
+    return response.json() if scenario.payload != 'asset' else response.content
+
+def _run_sync(
+    scenario: Scenario,
+    url: str,
+    body: Optional[Dict[str, Any]],
+    requests: int,
+    concurrency: int,
+    cache: Optional[MemoryCache],
+) -> Tuple[List[float], int, float]:
+    shared = Session(cache=cache)
+    latencies: List[float] = []
+    errors = 0
+
+    def one(_: int) -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            if scenario.pooled:
+                _call(scenario, Api(url, session=shared), body)
+            else:
+                with Session(cache=cache) as session:
+                    _call(scenario, Api(url, session=session), body)
+        except Exception:
+            errors += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    try:
+        # 预热连接池与缓存
+        for index in range(min(concurrency, requests)):
+            one(index)
+        latencies.clear()
+        errors = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            list(executor.map(one, range(requests)))
+            seconds = time.perf_counter() - start
+    finally:
+        shared.close()
+    return latencies, errors, seconds
+
+async def _run_async(
+    scenario: Scenario,
+    url: str,
+    body: Optional[Dict[str, Any]],
+    requests: int,
+    concurrency: int,
+    cache: Optional[MemoryCache],
+) -> Tuple[List[float], int, float]:
+    shared = Session(cache=cache)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                if scenario.pooled:
+                    await _acall(scenario, Api(url, session=shared), body)
+                else:
+                    async with Session(cache=cache) as session:
+                        await _acall(scenario, Api(url, session=session), body)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    try:
+        await asyncio.gather(*[one() for _ in range(min(concurrency, requests))])
+        latencies.clear()
+        errors = 0
+        start = time.perf_counter()
+        await asyncio.gather(*[one() for _ in range(requests)])
+        seconds = time.perf_counter() - start
+    finally:
+        await shared.aclose()
+    return latencies, errors, seconds
+
+# 运行测试场景
+def run(scenario: Scenario, base: str, requests: int, concurrency: int) -> Result:
+    '''运行单个测试场景
+
+    参数:
+        scenario (Scenario): 测试场景
+        base (str): 模拟服务器地址
+        requests (int): 计时的请求数
+        concurrency (int): 并发数
+
+    返回:
+        Result: 测试结果
+    '''
+    _use_client(scenario.client, scenario.mode)
+    settings.json_codec = None if scenario.codec == 'auto' else scenario.codec
+    method, path = PAYLOADS[scenario.payload]
+    body = POST_BODY if method == 'POST' else None
+    cache = MemoryCache() if scenario.cache else None
+
+    if scenario.mode == 'sync':
+        latencies, errors, seconds = _run_sync(scenario, base + path, body, requests, concurrency, cache)
+    else:
+        latencies, errors, seconds = asyncio.run(
+            _run_async(scenario, base + path, body, requests, concurrency, cache)
+        )
+    latencies = latencies or [float('nan')]
+    return Result(
+        scenario,
+        requests,
+        errors,
+        seconds,
+        requests / seconds,
+        _percentile(latencies, 0.5) * 1000,
+        _percentile(latencies, 0.9) * 1000,
+        _percentile(latencies, 0.99) * 1000,
+        statistics.fmean(latencies) * 1000,
+    )
+
+def _available_clients() -> List[Tuple[str, str]]:
+    available = []
+    for name, mode in CLIENTS:
+        try:
+            _session._import_client(name, _async=mode == 'async')
+        except ImportError:
+            continue
+        available.append((name, mode))
+    return available
+
+# 生成测试场景
+def scenarios(payloads: List[str], matrix: bool) -> List[Scenario]:
+    '''生成测试场景
+
+    参数:
+        payloads (List[str]): 测试负载名称
+        matrix (bool): 是否生成所有组合，否则每次只改变基准场景的一项配置
+
+    返回:
+        List[Scenario]: 测试场景
+    '''
+    clients = _available_clients()
+    codecs = [_codec.name for _codec in codec.available()]
+    result: List[Scenario] = []
+    for payload in payloads:
+        json_codecs = codecs if payload != 'asset' else []
+        if matrix:
+            for client, mode in clients:
+                for pooled in (True, False):
+                    for cache in (False, True):
+                        for _codec in ['auto'] + json_codecs:
+                            result.append(Scenario(payload, client, mode, pooled, cache, _codec))
+            continue
+        base = Scenario(payload)
+        variants = [base]
+        variants += [replace(base, client=client, mode=mode) for client, mode in clients[1:]]
+        variants.append(replace(base, pooled=False))
+        if PAYLOADS[payload][0] == 'GET':
+            variants.append(replace(base, cache=True))
+        variants += [replace(base, codec=_codec) for _codec in json_codecs]
+        result.extend(variants)
+    return result
+
+def _key(scenario: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(scenario[name] for name in ('payload', 'client', 'mode', 'pooled', 'cache', 'codec'))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark bestdori network clients against a local mock server')
+    parser.add_argument('--payloads', nargs='+', default=list(PAYLOADS), choices=list(PAYLOADS))
+    parser.add_argument('--requests', type=int, default=200, help='timed requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=5.0, help='mock server latency per response (ms)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='mock server max random extra latency (ms)')
+    parser.add_argument('--cache-control', default='no-cache', help='Cache-Control header of mock GET responses')
+    parser.add_argument('--compression', action='store_true', help='let the mock server compress responses per Accept-Encoding')
+    parser.add_argument('--matrix', action='store_true', help='run every combination instead of one change at a time')
+    parser.add_argument('--output', type=Path, help='write results as JSON')
+    parser.add_argument('--compare', type=Path, help='compare throughput with a previous --output file')
+    args = parser.parse_args()
+
+    settings.coalesce = False
+    baseline: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    if args.compare is not None:
+        baseline = {_key(item['scenario']): item for item in codec.loads(args.compare.read_bytes())['results']}
+
+    results: List[Result] = []
+    with MockServer(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        cache_control=args.cache_control,
+        compression=args.compression,
+    ) as server:
+        print(f'mock server {server.url}, latency {args.latency} ms, {args.requests} requests x {args.concurrency} concurrent')
+        print(f'{"payload client  mode  pool    cache codec":44} {"req/s":>9} {"p50 ms":>8} {"p90 ms":>8} {"p99 ms":>8} {"errors":>6}')
+        for scenario in scenarios(args.payloads, args.matrix):
+            result = run(scenario, server.url, args.requests, args.concurrency)
+            results.append(result)
+            line = (
+                f'{scenario.name:44} {result.throughput:9.1f} {result.p50:8.2f} '
+                f'{result.p90:8.2f} {result.p99:8.2f} {result.errors:6}'
+            )
+            if (previous := baseline.get(_key(asdict(scenario)), None)) is not None:
+                line += f'  {(result.throughput / previous["throughput"] - 1) * 100:+6.1f}%'
+            print(line)
+
+    if args.output is not None:
+        args.output.write_bytes(codec.get_codec('json').dumpb({
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'args': {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()},
+            'results': [asdict(result) for result in results],
+        }))
+
+if __name__ == '__main__':
+    main()
@@ -1,39 +1,59 @@
 '''`bestdori`
 
-Bestdori 的各种 API 调用整合，另外附带部分功能'''
+Bestdori 的各种 API 调用整合，另外附带部分功能
 
-from . import (
-    bands,
-    cards,
-    characters,
-    charts,
-    comics,
-    costumes,
-    eventarchives,
-    events,
-    eventtop,
-    eventtracker,
-    exceptions,
-    festival,
-    gacha,
-    icon,
-    logincampaigns,
-    miracleticket,
-    missions,
-    player,
-    post,
-    skills,
-    songmeta,
-    songs,
-    stamps,
-    thumb,
-    typing,
-    upload,
-    user,
-)
+子模块在首次访问时才会被导入，例如只使用 `bestdori.charts` 时不会导入其他模块'''
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# `settings` 与子模块同名，需预先导入以保证 `bestdori.settings` 始终为设置实例
 from .settings import settings as settings
 
+if TYPE_CHECKING:
+    from . import (
+        bands,
+        cards,
+        characters,
+        charts,
+        comics,
+        costumes,
+        eventarchives,
+        events,
+        eventtop,
+        eventtracker,
+        exceptions,
+        festival,
+        gacha,
+        icon,
+        index,
+        logincampaigns,
+        miracleticket,
+        mirror,
+        missions,
+        player,
+        post,
+        skills,
+        songmeta,
+        songs,
+        stamps,
+        thumb,
+        typing,
+        upload,
+        user,
+    )
+
+    from .utils.network import (
+        Session as Session,
+        DiskCache as DiskCache,
+        MemoryCache as MemoryCache,
+        RateLimit as RateLimit,
+        RetryPolicy as RetryPolicy,
+        Hooks as Hooks,
+        MetricsCollector as MetricsCollector,
+        Cassette as Cassette,
+    )
+
 __all__ = [
     'bands',
     'cards',
@@ -49,8 +69,10 @@ __all__ = [
     'festival',
     'gacha',
     'icon',
+    'index',
     'logincampaigns',
     'miracleticket',
+    'mirror',
     'missions',
     'player',
     'post',
@@ -63,4 +85,38 @@ __all__ = [
     'upload',
     'user',
     'settings',
-]
\ No newline at end of file
+    'Session',
+    'DiskCache',
+    'MemoryCache',
+    'RateLimit',
+    'RetryPolicy',
+    'Hooks',
+    'MetricsCollector',
+    'Cassette',
+]
+
+_ATTRIBUTES = {
+    'Session': '.utils.network',
+    'DiskCache': '.utils.network',
+    'MemoryCache': '.utils.network',
+    'RateLimit': '.utils.network',
+    'RetryPolicy': '.utils.network',
+    'Hooks': '.utils.network',
+    'MetricsCollector': '.utils.network',
+    'Cassette': '.utils.network',
+}
+'''延迟导入的属性及其所在模块'''
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: 首次访问时导入子模块或属性
+    if name in _ATTRIBUTES:
+        value = getattr(import_module(_ATTRIBUTES[name], __name__), name)
+    elif name in __all__:
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module \'{__name__}\' has no attribute \'{name}\'')
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,31 +2,32 @@
 
 ayachan 的各种 API 调用整合'''
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from bestdori.utils import get_api
-from bestdori.utils.network import Api
+from bestdori.utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import Version
 
 API = get_api('ayachan.api')
 
-def get_version() -> 'Version':
+def get_version(*, session: Optional[Session]=None) -> 'Version':
     '''获取 API 版本信息
 
     返回:
         Version: API 版本信息
     '''
-    return Api(API['version']['get']).get().json()
+    return Api(API['version']['get'], session=session).get().json()
 
-async def get_version_async() -> 'Version':
+async def get_version_async(*, session: Optional[Session]=None) -> 'Version':
     '''获取 API 版本信息
 
     返回:
         Version: API 版本信息
     '''
-    return (await Api(API['version']['get']).aget()).json()
+    return (await Api(API['version']['get'], session=session).aget()).json()
 
 from . import sonolus as sonolus
 from . import chartmetrics as chartmetrics
+from . import metrics as metrics
@@ -2,11 +2,11 @@
 
 Ayachan 谱面信息分析获取模块'''
 
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
 
 from bestdori.charts import Chart
 from bestdori.utils import get_api
-from bestdori.utils.network import Api
+from bestdori.utils.network import Api, Session
 
 if TYPE_CHECKING:
     from bestdori.typing import DifficultyName
@@ -18,95 +18,111 @@ API = get_api('ayachan.api')
 # BanG Dream 谱面分析
 def chart_metrics_bandori(
     chart_id: int,
-    diff_str: DifficultyName,
+    diff_str: 'DifficultyName',
+    *,
+    session: Optional[Session]=None,
 ) -> 'ChartMetrics':
     '''BanG Dream 谱面分析
 
     参数:
         chart_id (int): 谱面 ID
         diff_str (DifficultyName): 难度类型
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         ChartMetrics: 分析结果
     '''
     return Api(
-        API['chart_metrics']['bandori'].format(chart_id=chart_id, diff_str=diff_str)
+        API['chart_metrics']['bandori'].format(chart_id=chart_id, diff_str=diff_str),
+        session=session,
     ).get().json()
 
 # 异步 BanG Dream 谱面分析
 async def chart_metrics_bandori_async(
     chart_id: int,
-    diff_str: DifficultyName,
+    diff_str: 'DifficultyName',
+    *,
+    session: Optional[Session]=None,
 ) -> 'ChartMetrics':
     '''BanG Dream 谱面分析
 
     参数:
         chart_id (int): 谱面 ID
         diff_str (DifficultyName): 难度类型
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         ChartMetrics: 分析结果
     '''
     return (await Api(
-        API['chart_metrics']['bandori'].format(chart_id=chart_id, diff_str=diff_str)
+        API['chart_metrics']['bandori'].format(chart_id=chart_id, diff_str=diff_str),
+        session=session,
     ).aget()).json()
 
 # Bestdori 谱面分析
-def chart_metrics_bestdori(chart_id: int) -> 'ChartMetrics':
+def chart_metrics_bestdori(chart_id: int, *, session: Optional[Session]=None) -> 'ChartMetrics':
     '''Bestdori 谱面分析
 
     参数:
         chart_id (int): 谱面 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         ChartMetrics: 分析结果
     '''
-    return Api(API['chart_metrics']['bestdori'].format(chart_id=chart_id)).get().json()
+    return Api(API['chart_metrics']['bestdori'].format(chart_id=chart_id), session=session).get().json()
 
 # 异步 Bestdori 谱面分析
-async def chart_metrics_bestdori_async(chart_id: int) -> 'ChartMetrics':
+async def chart_metrics_bestdori_async(chart_id: int, *, session: Optional[Session]=None) -> 'ChartMetrics':
     '''Bestdori 谱面分析
 
     参数:
         chart_id (int): 谱面 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         ChartMetrics: 分析结果
     '''
-    return (await Api(API['chart_metrics']['bestdori'].format(chart_id=chart_id)).aget()).json()
+    return (await Api(API['chart_metrics']['bestdori'].format(chart_id=chart_id), session=session).aget()).json()
 
 # 自定义谱面分析
 def chart_metrics_custom(
     diff_str: 'DifficultyName',
     chart: Union[Chart, List[Dict[str, Any]]],
+    *,
+    session: Optional[Session]=None,
 ) -> 'ChartMetrics':
     '''自定义谱面分析
 
     参数:
         diff_str (DifficultyName): 难度类型
         chart (Union[Chart, List[Dict[str, Any]]]): 谱面
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         ChartMetrics: 分析结果
     '''
     if not isinstance(chart, Chart):
         chart = Chart.from_python(chart)
-    return Api(API['chart_metrics']['custom'].format(diff_str=diff_str)).post(data=chart.to_list()).json()
+    return Api(API['chart_metrics']['custom'].format(diff_str=diff_str), session=session).post(data=chart.to_list()).json()
 
 # 异步自定义谱面分析
 async def chart_metrics_custom_async(
     diff_str: 'DifficultyName',
     chart: Union[Chart, List[Dict[str, Any]]],
+    *,
+    session: Optional[Session]=None,
 ) -> 'ChartMetrics':
     '''自定义谱面分析
 
     参数:
         diff_str (DifficultyName): 难度类型
         chart (Union[Chart, List[Dict[str, Any]]]): 谱面
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         ChartMetrics: 分析结果
     '''
     if not isinstance(chart, Chart):
         chart = Chart.from_python(chart)
-    return (await Api(API['chart_metrics']['custom'].format(diff_str=diff_str)).apost(data=chart.to_list())).json()
+    return (await Api(API['chart_metrics']['custom'].format(diff_str=diff_str), session=session).apost(data=chart.to_list())).json()
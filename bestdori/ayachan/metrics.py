@@ -0,0 +1,313 @@
+'''`bestdori.ayachan.metrics`
+
+本地谱面指标计算模块
+
+按 Ayachan 谱面分析的字段在本地计算谱面指标，返回与 `chart_metrics_custom` 相同结构的 `ChartMetrics`，
+无需为每个谱面发送请求，也不受请求限速影响。
+
+```python
+from bestdori.ayachan.metrics import chart_metrics_local
+
+metrics = chart_metrics_local(chart)
+metrics['metrics']['total_nps']
+```
+
+各指标的计算方式:
+
+- 时间由 `TimingMap` 换算，谱面时长为第一个与最后一个音符之间的时间
+- `total_hote` 为除隐藏节点外的音符数，`total_hit_note` 为其中除滑条中间节点外需要按下或抬起的音符数
+- `distribution` 为从第一个音符开始每秒的音符数与按键数，`max_screen_nps` 为任意 1 秒内的最大音符数
+- 主 BPM 为持续时间最长的 BPM，`bpm_high` 与 `bpm_low` 为谱面中出现的 BPM 绝对值的最大值与最小值
+- 同时按下（含按住的滑条）超过两个音符或同一时刻同一轨道重叠的谱面为非常规谱面
+- 左右手按轨道分配：同时按下的两个音符左侧为左手，滑条由按下的手持续按住，其余音符左侧三轨为左手、
+  右侧三轨为右手、中间轨道交替分配
+
+`difficulty` 中的难度值由 Ayachan 的预测模型给出，本地无法计算，其值为 `nan`。
+本地计算的指标与 Ayachan 的结果可能存在细微差异，可运行 `python benchmarks/chart_metrics.py` 与录制的 Ayachan 响应比较。'''
+
+from math import inf, nan
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
+
+from bestdori.charts import TimingMap, ChartSource, CompactChart, _to_compact
+
+if TYPE_CHECKING:
+    from .typing import NoteCount, ChartMetrics, RegularType
+
+REGULAR_UNKNOWN: 'RegularType' = 0
+'''无法判断是否为常规谱面，如谱面没有音符'''
+REGULAR: 'RegularType' = 1
+'''常规谱面'''
+IRREGULAR: 'RegularType' = 2
+'''非常规谱面'''
+
+_SINGLE, _FLICK, _SLIDE_START, _SLIDE_TICK, _SLIDE_END, _SLIDE_FLICK, _SLIDE_HIDDEN, _DIRECTION_LEFT, _DIRECTION_RIGHT = range(9)
+_KINDS = (
+    'single', 'flick', 'slide_start', 'slide_tick', 'slide_end',
+    'slide_flick', 'slide_hidden', 'direction_left', 'direction_right',
+)
+_HIT_KINDS = frozenset((_SINGLE, _FLICK, _SLIDE_START, _SLIDE_END, _SLIDE_FLICK, _DIRECTION_LEFT, _DIRECTION_RIGHT))
+'''需要按下或抬起的音符种类'''
+_FLICK_KINDS = frozenset((_FLICK, _SLIDE_FLICK, _DIRECTION_LEFT, _DIRECTION_RIGHT))
+'''需要滑动的音符种类'''
+
+_LEFT, _RIGHT = 0, 1
+_Note = Tuple[float, float, int, int]
+'''`(时间, 轨道, 种类, 滑条编号)`，非滑条音符的滑条编号为 -1'''
+
+def _notes(chart: CompactChart, timing: TimingMap) -> List[_Note]:
+    '''将谱面展开为按时间排序的音符'''
+    types = chart.types
+    flags = chart.flags
+    lanes = chart.lanes
+    offsets = chart.offsets
+    times = timing.beats_to_times(chart.beats)
+    notes: List[_Note] = []
+    slide = 0
+    for index in range(len(offsets) - 1):
+        start, end = offsets[index], offsets[index + 1]
+        code = types[start]
+        if code == CompactChart.BPM:
+            continue
+        if code == CompactChart.SINGLE:
+            notes.append((times[start], lanes[start], _FLICK if flags[start] & CompactChart.FLICK else _SINGLE, -1))
+        elif code == CompactChart.DIRECTIONAL:
+            kind = _DIRECTION_RIGHT if flags[start] & CompactChart.RIGHT else _DIRECTION_LEFT
+            notes.append((times[start], lanes[start] + (chart.widths[start] - 1) / 2, kind, -1))
+        elif chart.beats[start] != inf:
+            # 滑条，空滑条的节拍为无穷大，隐藏节点与 `Chart.count` 一致不计入音符，包括首尾节点
+            for row in range(start, end):
+                if flags[row] & CompactChart.HIDDEN:
+                    kind = _SLIDE_HIDDEN
+                elif row == start:
+                    kind = _SLIDE_START
+                elif row == end - 1:
+                    kind = _SLIDE_FLICK if flags[row] & CompactChart.FLICK else _SLIDE_END
+                else:
+                    kind = _SLIDE_TICK
+                notes.append((times[row], lanes[row], kind, slide))
+            slide += 1
+    notes.sort(key=lambda note: note[0])
+    return notes
+
+def _window_max(times: List[float], window: float) -> int:
+    '''任意 `window` 秒内的最大数量，`times` 需已排序'''
+    best = 0
+    for index, time in enumerate(times):
+        best = max(best, bisect_left(times, time + window, index) - index)
+    return best
+
+def _distribution(times: List[float], start: float, seconds: int) -> List[int]:
+    counts = [0] * seconds
+    for time in times:
+        counts[min(int(time - start), seconds - 1)] += 1
+    return counts
+
+def _tempo(timing: TimingMap, end: float) -> Tuple[float, float, float]:
+    '''返回第一个 BPM 音符至谱面结束节拍之间出现的 `(最高 BPM, 最低 BPM, 主 BPM)`'''
+    durations: Dict[float, float] = {}
+    for index, start in enumerate(timing.beats):
+        if start > end and index > 0:
+            break
+        stop = timing.beats[index + 1] if index + 1 < len(timing) else end
+        bpm = abs(timing.bpms[index])
+        if bpm == 0.0:
+            continue
+        durations[bpm] = durations.get(bpm, 0.0) + max(min(stop, end) - start, 0.0) * 60.0 / bpm
+    if not durations:
+        return 0.0, 0.0, 0.0
+    main = max(durations, key=lambda bpm: durations[bpm])
+    return max(durations), min(durations), main
+
+def _irregular(notes: List[_Note]) -> Tuple['RegularType', str]:
+    '''检查是否需要同时按下超过两个音符或同一时刻同一轨道重叠'''
+    if not notes:
+        return REGULAR_UNKNOWN, ''
+    ends: Dict[int, float] = {}
+    for time, _, kind, slide in notes:
+        if slide >= 0:
+            ends[slide] = time
+    holding: Dict[int, float] = {}
+    index = 0
+    while index < len(notes):
+        time = notes[index][0]
+        group = []
+        while index < len(notes) and notes[index][0] == time:
+            group.append(notes[index])
+            index += 1
+        for slide in [slide for slide, end in holding.items() if end <= time]:
+            del holding[slide]
+        taps = [note for note in group if note[2] in _HIT_KINDS]
+        touching = {note[3] for note in taps if note[3] >= 0} | set(holding)
+        fingers = len(touching) + sum(1 for note in taps if note[3] < 0)
+        if fingers > 2:
+            return IRREGULAR, f'{fingers} notes are held at the same time at {time:.3f}s'
+        lanes = [note[1] for note in group if note[2] != _SLIDE_HIDDEN]
+        if len(lanes) != len(set(lanes)):
+            return IRREGULAR, f'notes overlap in the same lane at {time:.3f}s'
+        for note in group:
+            if note[2] == _SLIDE_START:
+                holding[note[3]] = ends[note[3]]
+    return REGULAR, ''
+
+def _hands(notes: List[_Note]) -> List[Tuple[float, int, int]]:
+    '''为需要按下或抬起的音符分配左右手，返回 `(时间, 手, 种类)`'''
+    assigned: List[Tuple[float, int, int]] = []
+    slides: Dict[int, int] = {}
+    holding: Dict[int, float] = {}
+    ends: Dict[int, float] = {}
+    for time, _, _, slide in notes:
+        if slide >= 0:
+            ends[slide] = time
+    last = _RIGHT
+    index = 0
+    while index < len(notes):
+        time = notes[index][0]
+        group = []
+        while index < len(notes) and notes[index][0] == time:
+            if notes[index][2] in _HIT_KINDS:
+                group.append(notes[index])
+            index += 1
+        for slide in [slide for slide, end in holding.items() if end <= time]:
+            del holding[slide]
+        busy = {slides[slide] for slide in holding}
+        group.sort(key=lambda note: note[1])
+        for order, (_, lane, kind, slide) in enumerate(group):
+            if slide >= 0 and kind != _SLIDE_START:
+                hand = slides.get(slide, last)
+            elif len(busy) == 1:
+                hand = _RIGHT if _LEFT in busy else _LEFT
+            elif len(group) >= 2:
+                hand = _LEFT if order == 0 else _RIGHT
+            elif lane < 3:
+                hand = _LEFT
+            elif lane > 3:
+                hand = _RIGHT
+            else:
+                hand = _RIGHT if last == _LEFT else _LEFT
+            if kind == _SLIDE_START:
+                slides[slide] = hand
+                holding[slide] = ends[slide]
+            assigned.append((time, hand, kind))
+            last = hand
+    return assigned
+
+def _intervals(assigned: List[Tuple[float, int, int]]) -> Tuple[int, int]:
+    '''同一只手上滑动音符到下一个音符与音符到下一个滑动音符的最短间隔，单位为毫秒，没有时为 0'''
+    flick_note: Optional[float] = None
+    note_flick: Optional[float] = None
+    previous: Dict[int, Tuple[float, int]] = {}
+    for time, hand, kind in assigned:
+        # 同一时刻的音符不计算间隔
+        if hand in previous and time > previous[hand][0]:
+            last_time, last_kind = previous[hand]
+            interval = time - last_time
+            if last_kind in _FLICK_KINDS and (flick_note is None or interval < flick_note):
+                flick_note = interval
+            if kind in _FLICK_KINDS and (note_flick is None or interval < note_flick):
+                note_flick = interval
+        previous[hand] = (time, kind)
+    return (
+        round(flick_note * 1000) if flick_note is not None else 0,
+        round(note_flick * 1000) if note_flick is not None else 0,
+    )
+
+def _max_speed(notes: List[_Note]) -> float:
+    '''滑条相邻节点之间的最大横向移动速度，单位为轨道每秒'''
+    previous: Dict[int, Tuple[float, float]] = {}
+    speed = 0.0
+    for time, lane, _, slide in notes:
+        if slide < 0:
+            continue
+        if slide in previous:
+            last_time, last_lane = previous[slide]
+            if time > last_time:
+                speed = max(speed, abs(lane - last_lane) / (time - last_time))
+        previous[slide] = (time, lane)
+    return speed
+
+# 本地谱面分析
+def chart_metrics_local(chart: ChartSource) -> 'ChartMetrics':
+    '''在本地计算谱面指标，计算方式见模块说明
+
+    参数:
+        chart (ChartSource): 谱面对象、谱面 `json` 字符串或谱面字典列表，
+            字符串与字典列表将与 `Chart.from_json`、`Chart.from_python` 一样进行规范化处理
+
+    返回:
+        ChartMetrics: 分析结果，`difficulty.difficulty` 为 `nan`
+
+    异常:
+        ValueError: 谱面没有 BPM 音符
+    '''
+    compact = _to_compact(chart)
+    timing = TimingMap.from_chart(compact)
+    notes = _notes(compact, timing)
+    counts = [0] * len(_KINDS)
+    for note in notes:
+        counts[note[2]] += 1
+    note_count: 'NoteCount' = dict(zip(_KINDS, counts))  # type: ignore[assignment]
+
+    note_times = [note[0] for note in notes if note[2] != _SLIDE_HIDDEN]
+    hit_times = [note[0] for note in notes if note[2] in _HIT_KINDS]
+    start = note_times[0] if note_times else 0.0
+    total_time = note_times[-1] - start if note_times else 0.0
+    total_note = len(note_times)
+    total_hit = len(hit_times)
+    total_nps = total_note / total_time if total_time > 0.0 else 0.0
+    total_hps = total_hit / total_time if total_time > 0.0 else 0.0
+    max_screen_nps = float(_window_max(note_times, 1.0))
+    seconds = int(total_time) + 1 if note_times else 0
+
+    end = max((beat for beat, code in zip(compact.beats, compact.types) if code != CompactChart.BPM and beat != inf), default=0.0)
+    bpm_high, bpm_low, main_bpm = _tempo(timing, end)
+    irregular, irregular_info = _irregular(notes)
+
+    assigned = _hands(notes)
+    hand_times: Tuple[List[float], List[float]] = ([], [])
+    for time, hand, _ in assigned:
+        hand_times[hand].append(time)
+    finger_max_hps = max(_window_max(hand_times[_LEFT], 1.0), _window_max(hand_times[_RIGHT], 1.0))
+    flick_note_interval, note_flick_interval = _intervals(assigned)
+    max_speed = _max_speed(notes)
+
+    return {
+        'difficulty': {
+            'difficulty': nan,
+            'max_screen_nps': max_screen_nps,
+            'total_hps': total_hps,
+            'total_nps': total_nps,
+        },
+        'difficulty_extend': {
+            'finger_max_hps': finger_max_hps,
+            'flick_note_interval': flick_note_interval,
+            'max_speed': round(max_speed),
+            'note_flick_interval': note_flick_interval,
+        },
+        'metrics': {
+            'bpm_high': bpm_high,
+            'bpm_low': bpm_low,
+            'distribution': {
+                'hit': _distribution(hit_times, start, seconds),
+                'note': _distribution(note_times, start, seconds),
+            },
+            'irregular': irregular,
+            'irregular_info': irregular_info,
+            'main_bpm': main_bpm,
+            'max_screen_nps': max_screen_nps,
+            'note_count': note_count,
+            'sp_rhythm': compact.is_sp_rhythm,
+            'total_hit_note': total_hit,
+            'total_hps': total_hps,
+            'total_hote': total_note,
+            'total_nps': total_nps,
+            'total_time': total_time,
+        },
+        'metrics_extend': {
+            'finger_max_hps': finger_max_hps,
+            'flick_note_interval': flick_note_interval,
+            'left_percent': len(hand_times[_LEFT]) / len(assigned) if assigned else 0.0,
+            'max_speed': max_speed,
+            'note_flick_interval': note_flick_interval,
+        },
+    }
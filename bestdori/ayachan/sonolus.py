@@ -4,11 +4,11 @@ Sonolus 测试服模块'''
 
 from pathlib import Path
 from mimetypes import guess_type
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
 
 from bestdori.charts import Chart
 from bestdori.utils import get_api
-from bestdori.utils.network import Api
+from bestdori.utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import Level
@@ -23,6 +23,8 @@ def levels_post(
     difficulty: int = 25,
     hidden: bool = False,
     lifetime: int = 21600,
+    *,
+    session: Optional[Session]=None,
 ) -> int:
     '''Sonolus 谱面测试
 
@@ -33,6 +35,7 @@ def levels_post(
         difficulty (int, optional): 谱面难度. 默认为 25
         hidden (bool, optional): 谱面隐藏. 默认为 False
         lifetime (int, optional): 存活时间. 默认为 21600
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 测试服 ID
@@ -60,7 +63,7 @@ def levels_post(
     files = {'bgm': (bgm_name, file, guess_type(bgm)[0])}
     
     # 发送请求
-    response = Api(API['levels']['post']).post(data=data, files=files)
+    response = Api(API['levels']['post'], session=session).post(data=data, files=files)
     file.close()
     if (uid := response.json().get('uid', None)) is None:
         raise ValueError(f"Unable to get `uid` from response: {response.json()}")
@@ -74,6 +77,8 @@ async def levels_post_async(
     difficulty: int = 25,
     hidden: bool = False,
     lifetime: int = 21600,
+    *,
+    session: Optional[Session]=None,
 ) -> int:
     '''Sonolus 谱面测试
 
@@ -84,6 +89,7 @@ async def levels_post_async(
         difficulty (int, optional): 谱面难度. 默认为 25
         hidden (bool, optional): 谱面隐藏. 默认为 False
         lifetime (int, optional): 存活时间. 默认为 21600
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 测试服 ID
@@ -111,58 +117,62 @@ async def levels_post_async(
     files = {'bgm': (bgm_name, file, guess_type(bgm)[0])}
     
     # 发送请求
-    response = await Api(API['levels']['post']).apost(data=data, files=files)
+    response = await Api(API['levels']['post'], session=session).apost(data=data, files=files)
     file.close()
     if (uid := response.json().get('uid', None)) is None:
         raise ValueError(f"Unable to get `uid` from response: {response.json()}")
     return uid
 
 # Sonolus 测试服谱面获取
-def levels_get(uid: int) -> Chart:
+def levels_get(uid: int, *, session: Optional[Session]=None) -> Chart:
     '''Sonolus 测试服谱面获取
 
     参数:
         uid (int): 测试服 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Chart: 谱面
     '''
-    response = Api(API['levels']['get'].format(uid=uid)).get()
+    response = Api(API['levels']['get'].format(uid=uid), session=session).get()
     return Chart.standardize(response.json())
 
 # 异步 Sonolus 测试服谱面获取
-async def levels_get_async(uid: int) -> Chart:
+async def levels_get_async(uid: int, *, session: Optional[Session]=None) -> Chart:
     '''Sonolus 测试服谱面获取
 
     参数:
         uid (int): 测试服 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Chart: 谱面
     '''
-    response = await Api(API['levels']['get'].format(uid=uid)).aget()
+    response = await Api(API['levels']['get'].format(uid=uid), session=session).aget()
     return Chart.standardize(response.json())
 
 # Sonolus 测试服谱面信息获取
-def levels(uid: int) -> 'Level':
+def levels(uid: int, *, session: Optional[Session]=None) -> 'Level':
     '''Sonolus 测试服谱面信息获取
 
     参数:
         uid (int): 测试服 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Level: 谱面信息
     '''
-    return Api(API['levels']['info'].format(uid=uid)).get().json()
+    return Api(API['levels']['info'].format(uid=uid), session=session).get().json()
 
 # 异步 Sonolus 测试服谱面信息获取
-async def levels_async(uid: int) -> 'Level':
+async def levels_async(uid: int, *, session: Optional[Session]=None) -> 'Level':
     '''Sonolus 测试服谱面信息获取
 
     参数:
         uid (int): 测试服 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Level: 谱面信息
     '''
-    return (await Api(API['levels']['info'].format(uid=uid)).aget()).json()
+    return (await Api(API['levels']['info'].format(uid=uid), session=session).aget()).json()
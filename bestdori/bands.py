@@ -5,7 +5,7 @@
 from typing import TYPE_CHECKING, Literal, Optional
 
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import (
@@ -18,63 +18,70 @@ API = get_api('bestdori.api')
 ASSETS = get_api('bestdori.assets')
 
 # 获取总乐队信息
-def get_all(index: Literal[1]=1) -> 'BandsAll1':
+def get_all(index: Literal[1]=1, *, session: Optional[Session]=None) -> 'BandsAll1':
     '''获取总乐队信息
 
     参数:
         index (Literal[1], optional): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, Dict[str, Any]]: 获取到的总乐队名称信息
     '''
-    return Api(API['bands']['all'].format(index=index)).get().json()
+    return Api(API['bands']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总乐队信息
-async def get_all_async(index: Literal[1]=1) -> 'BandsAll1':
+async def get_all_async(index: Literal[1]=1, *, session: Optional[Session]=None) -> 'BandsAll1':
     '''获取总乐队信息
 
     参数:
         index (Literal[1], optional): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, Dict[str, Any]]: 获取到的总乐队名称信息
     '''
-    return (await Api(API['bands']['all'].format(index=index)).aget()).json()
+    return (await Api(API['bands']['all'].format(index=index), session=session).aget()).json()
 
 # 获取主要乐队信息
-def get_main(index: Literal[1]=1) -> 'BandsMain1':
+def get_main(index: Literal[1]=1, *, session: Optional[Session]=None) -> 'BandsMain1':
     '''获取主要乐队信息
 
     参数:
         index (Literal[1], optional): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, Dict[str, Any]]: 获取到的主要乐队信息
     '''
-    return Api(API['bands']['main'].format(index=index)).get().json()
+    return Api(API['bands']['main'].format(index=index), session=session).get().json()
 
 # 异步获取主要乐队信息
-async def get_main_async(index: Literal[1]=1) -> 'BandsMain1':
+async def get_main_async(index: Literal[1]=1, *, session: Optional[Session]=None) -> 'BandsMain1':
     '''获取主要乐队信息
 
     参数:
         index (Literal[1], optional): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, Dict[str, Any]]: 获取到的主要乐队信息
     '''
-    return (await Api(API['bands']['main'].format(index=index)).aget()).json()
+    return (await Api(API['bands']['main'].format(index=index), session=session).aget()).json()
 
 # 获取乐队 logo
 def get_logo(
     id: int,
     type: Literal['logoS', 'logoL', 'logoL_Mask'],
     server: 'ServerName',
+    *,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取乐队 logo
 
     参数:
         id (int): 乐队 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
         type (Literal[&#39;logoS&#39;, &#39;logoL&#39;, &#39;logoL_Mask&#39;]): logo 类型
             `logoS`: 小 logo
@@ -86,18 +93,21 @@ def get_logo(
     返回:
         bytes: 乐队 logo 字节数据 `bytes`
     '''
-    return Api(ASSETS['band']['logo'].format(server=server, id=id, type=type)).get().content
+    return Api(ASSETS['band']['logo'].format(server=server, id=id, type=type), session=session).get().content
 
 # 异步获取乐队 logo
 async def get_logo_async(
     id: int,
     type: Literal['logoS', 'logoL', 'logoL_Mask'],
     server: 'ServerName',
+    *,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取乐队 logo
 
     参数:
         id (int): 乐队 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
         type (Literal[&#39;logoS&#39;, &#39;logoL&#39;, &#39;logoL_Mask&#39;]): logo 类型
             `logoS`: 小 logo
@@ -109,4 +119,4 @@ async def get_logo_async(
     返回:
         bytes: 乐队 logo 字节数据 `bytes`
     '''
-    return (await Api(ASSETS['band']['logo'].format(server=server, id=id, type=type)).aget()).content
+    return (await Api(ASSETS['band']['logo'].format(server=server, id=id, type=type), session=session).aget()).content
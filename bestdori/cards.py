@@ -3,11 +3,14 @@
 BanG Dream! 卡牌相关操作'''
 
 from typing_extensions import overload
-from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Union, Literal, Iterable, Optional
 
 from .utils import get_api
 from .post import get_list, get_list_async
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
+from .utils.batch import gather_many, gather_many_async
 from .exceptions import (
     HTTPStatusError,
     NoDataException,
@@ -23,6 +26,7 @@ if TYPE_CHECKING:
         NoneDict,
         PostList,
         ServerName,
+        CardAll5Info,
     )
 
 API = get_api('bestdori.api')
@@ -31,104 +35,112 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总卡牌信息
 @overload
-def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总卡牌信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有卡牌 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[2]) -> 'CardAll2':
+def get_all(index: Literal[2], *, session: Optional[Session]=None) -> 'CardAll2':
     '''获取总卡牌信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CardAll2: 所有已有卡牌的属性信息 `all.2.json`
     '''
     ...
 @overload
-def get_all(index: Literal[3]) -> 'CardAll3':
+def get_all(index: Literal[3], *, session: Optional[Session]=None) -> 'CardAll3':
     '''获取总卡牌信息
 
     参数:
         index (Literal[3]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CardAll3: 所有已有卡牌的简洁信息 `all.3.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'CardAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'CardAll5':
     '''获取总卡牌信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CardAll5: 所有已有卡牌的较详细信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[0, 2, 3, 5]=5) -> Union[Dict[str, 'NoneDict'], 'CardAll2', 'CardAll3', 'CardAll5']:
-    return Api(API['cards']['all'].format(index=index)).get().json()
+def get_all(index: Literal[0, 2, 3, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'CardAll2', 'CardAll3', 'CardAll5']:
+    return Api(API['cards']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总卡牌信息
 @overload
-async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总卡牌信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有卡牌 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[2]) -> 'CardAll2':
+async def get_all_async(index: Literal[2], *, session: Optional[Session]=None) -> 'CardAll2':
     '''获取总卡牌信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CardAll2: 所有已有卡牌的属性信息 `all.2.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[3]) -> 'CardAll3':
+async def get_all_async(index: Literal[3], *, session: Optional[Session]=None) -> 'CardAll3':
     '''获取总卡牌信息
 
     参数:
         index (Literal[3]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CardAll3: 所有已有卡牌的简洁信息 `all.3.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'CardAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'CardAll5':
     '''获取总卡牌信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CardAll5: 所有已有卡牌的较详细信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[0, 2, 3, 5]=5) -> Union[Dict[str, 'NoneDict'], 'CardAll2', 'CardAll3', 'CardAll5']:
-    return (await Api(API['cards']['all'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[0, 2, 3, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'CardAll2', 'CardAll3', 'CardAll5']:
+    return (await Api(API['cards']['all'].format(index=index), session=session).aget()).json()
 
 # 获取属性图标
-def get_attribute_icon(attribute: Literal['powerful', 'pure', 'cool', 'happy']) -> bytes:
+def get_attribute_icon(attribute: Literal['powerful', 'pure', 'cool', 'happy'], *, session: Optional[Session]=None) -> bytes:
     '''获取属性图标
 
     参数:
@@ -137,14 +149,15 @@ def get_attribute_icon(attribute: Literal['powerful', 'pure', 'cool', 'happy'])
             `pure`: PURE
             `cool`: COOL
             `happy`: HAPPY
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 属性图标字节数据
     '''
-    return Api(RES['icon']['svg'].format(name=f'{attribute}')).get().content
+    return Api(RES['icon']['svg'].format(name=f'{attribute}'), session=session).get().content
 
 # 异步获取属性图标
-async def get_attribute_icon_async(attribute: Literal['powerful', 'pure', 'cool', 'happy']) -> bytes:
+async def get_attribute_icon_async(attribute: Literal['powerful', 'pure', 'cool', 'happy'], *, session: Optional[Session]=None) -> bytes:
     '''获取属性图标
 
     参数:
@@ -153,87 +166,94 @@ async def get_attribute_icon_async(attribute: Literal['powerful', 'pure', 'cool'
             `pure`: PURE
             `cool`: COOL
             `happy`: HAPPY
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 属性图标字节数据
     '''
-    return (await Api(RES['icon']['svg'].format(name=f'{attribute}')).aget()).content
+    return (await Api(RES['icon']['svg'].format(name=f'{attribute}'), session=session).aget()).content
 
 # 获取星星图标
-def get_star_icon(star: Literal['star', 'star_trained']) -> bytes:
+def get_star_icon(star: Literal['star', 'star_trained'], *, session: Optional[Session]=None) -> bytes:
     '''获取星星图标
 
     参数:
         star (Literal[&#39;star&#39;, &#39;star_trained&#39;]): 星标种类
             `star`: 普通星标
             `star_trained`: 训练后星标
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 星星图标字节数据
     '''
-    return Api(RES['icon']['png'].format(name=f'{star}')).get().content
+    return Api(RES['icon']['png'].format(name=f'{star}'), session=session).get().content
 
 # 异步获取星星图标
-async def get_star_icon_async(star: Literal['star', 'star_trained']) -> bytes:
+async def get_star_icon_async(star: Literal['star', 'star_trained'], *, session: Optional[Session]=None) -> bytes:
     '''获取星星图标
 
     参数:
         star (Literal[&#39;star&#39;, &#39;star_trained&#39;]): 星标种类
             `star`: 普通星标
             `star_trained`: 训练后星标
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 星星图标字节数据
     '''
-    return (await Api(RES['icon']['png'].format(name=f'{star}')).aget()).content
+    return (await Api(RES['icon']['png'].format(name=f'{star}'), session=session).aget()).content
 
 # 获取卡牌完整边框
-def get_frame(level: Literal[1, 2, 3, 4, 5]) -> bytes:
+def get_frame(level: Literal[1, 2, 3, 4, 5], *, session: Optional[Session]=None) -> bytes:
     '''获取卡牌完整边框
 
     参数:
         level (Literal[1, 2, 3, 4, 5]): 边框星级
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 卡牌完整边框字节数据
     '''
-    return Api(RES['image']['png'].format(name=f'frame-{level}')).get().content
+    return Api(RES['image']['png'].format(name=f'frame-{level}'), session=session).get().content
 
 # 异步获取卡牌完整边框
-async def get_frame_async(level: Literal[1, 2, 3, 4, 5]) -> bytes:
+async def get_frame_async(level: Literal[1, 2, 3, 4, 5], *, session: Optional[Session]=None) -> bytes:
     '''获取卡牌完整边框
 
     参数:
         level (Literal[1, 2, 3, 4, 5]): 边框星级
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 卡牌完整边框字节数据
     '''
-    return (await Api(RES['image']['png'].format(name=f'frame-{level}')).aget()).content
+    return (await Api(RES['image']['png'].format(name=f'frame-{level}'), session=session).aget()).content
 
 # 获取卡牌缩略图边框
-def get_card_frame(level: Literal[1, 2, 3, 4, 5]) -> bytes:
+def get_card_frame(level: Literal[1, 2, 3, 4, 5], *, session: Optional[Session]=None) -> bytes:
     '''获取卡牌缩略图边框
 
     参数:
         level (Literal[1, 2, 3, 4, 5]): 边框星级
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 卡牌缩略图边框字节数据
     '''
-    return Api(RES['image']['png'].format(name=f'card-{level}')).get().content
+    return Api(RES['image']['png'].format(name=f'card-{level}'), session=session).get().content
 
 # 异步获取卡牌缩略图边框
-async def get_card_frame_async(level: Literal[1, 2, 3, 4, 5]) -> bytes:
+async def get_card_frame_async(level: Literal[1, 2, 3, 4, 5], *, session: Optional[Session]=None) -> bytes:
     '''获取卡牌缩略图边框
 
     参数:
         level (Literal[1, 2, 3, 4, 5]): 边框星级
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 卡牌缩略图边框字节数据
     '''
-    return (await Api(RES['image']['png'].format(name=f'card-{level}')).aget()).content
+    return (await Api(RES['image']['png'].format(name=f'card-{level}'), session=session).aget()).content
 
 # 卡牌类
 class Card:
@@ -241,13 +261,16 @@ class Card:
 
     参数:
         id (int): 卡牌 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         self.id: int = id
         '''卡牌 ID'''
         self.__info: Optional['CardInfo'] = None
         '''卡牌信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     @property
@@ -265,16 +288,21 @@ class Card:
             CardInfo: 卡牌信息
         '''
         try:
-            response = Api(
-                API['cards']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'cards',
+                self.id,
+                Api(
+                    API['cards']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Card {self.id}')
             else:
                 raise exception
-        self.__info = response.json()
-        return response.json()
+        self.__info = info
+        return info
     
     def __get_info__(self) -> 'CardInfo':
         if self.__info is None:
@@ -289,16 +317,21 @@ class Card:
             CardInfo: 卡牌信息
         '''
         try:
-            response = await Api(
-                API['cards']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'cards',
+                self.id,
+                Api(
+                    API['cards']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Card {self.id}')
             else:
                 raise exception
-        self.__info = response.json()
-        return response.json()
+        self.__info = info
+        return info
     
     async def __get_info_async__(self) -> 'CardInfo':
         if self.__info is None:
@@ -356,6 +389,7 @@ class Card:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取卡牌评论
@@ -388,6 +422,7 @@ class Card:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取卡牌完整图片
@@ -407,7 +442,8 @@ class Card:
                 resource_set_name=info['resourceSetName'],
                 name='card',
                 type=type,
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取卡牌完整图片
@@ -428,9 +464,58 @@ class Card:
                 resource_set_name=info['resourceSetName'],
                 name='card',
                 type=type,
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
+    # 下载卡牌完整图片
+    def download_card(self, type: Literal['normal', 'after_training'], path: Union[str, Path]) -> int:
+        '''将卡牌完整图片流式下载到文件
+
+        参数:
+            type (Literal[&#39;normal&#39;, &#39;after_training&#39;]): 指定特训前或特训后
+            path (Union[str, Path]): 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        '''
+        info = self.__get_info__()
+        return Api(
+            ASSETS['characters']['resourceset'].format(
+                server=self.__server__,
+                resource_set_name=info['resourceSetName'],
+                name='card',
+                type=type,
+            ),
+            session=self.session,
+        ).download_to(path)
+    
+    # 异步下载卡牌完整图片
+    async def download_card_async(
+        self,
+        type: Literal['normal', 'after_training'],
+        path: Union[str, Path],
+    ) -> int:
+        '''将卡牌完整图片流式下载到文件
+
+        参数:
+            type (Literal[&#39;normal&#39;, &#39;after_training&#39;]): 指定特训前或特训后
+            path (Union[str, Path]): 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        '''
+        info = await self.__get_info_async__()
+        return await Api(
+            ASSETS['characters']['resourceset'].format(
+                server=self.__server__,
+                resource_set_name=info['resourceSetName'],
+                name='card',
+                type=type,
+            ),
+            session=self.session,
+        ).adownload_to(path)
+    
     # 获取卡牌无背景图片
     def get_trim(self, type: Literal['normal', 'after_training']) -> bytes:
         '''获取卡牌无背景图片
@@ -448,7 +533,8 @@ class Card:
                 resource_set_name=info['resourceSetName'],
                 name='trim',
                 type=type,
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取卡牌无背景图片
@@ -468,7 +554,8 @@ class Card:
                 resource_set_name=info['resourceSetName'],
                 name='trim',
                 type=type,
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取卡牌缩略图图片
@@ -488,7 +575,8 @@ class Card:
                 id=self.id // 50,
                 resource_set_name=info['resourceSetName'],
                 type=type,
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取卡牌缩略图图片
@@ -508,7 +596,8 @@ class Card:
                 id=self.id // 50,
                 resource_set_name=info['resourceSetName'],
                 type=type,
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取 LIVE 服装图片
@@ -523,7 +612,8 @@ class Card:
             ASSETS['characters']['livesd'].format(
                 server=self.__server__,
                 sd_resource_name=info['sdResourceName'],
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取 LIVE 服装图片
@@ -538,5 +628,64 @@ class Card:
             ASSETS['characters']['livesd'].format(
                 server=self.__server__,
                 sd_resource_name=info['sdResourceName'],
-            )
-        ).aget()).content
\ No newline at end of file
+            ),
+            session=self.session,
+        ).aget()).content
+
+# 批量获取卡牌信息
+def get_many(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['CardInfo', 'CardAll5Info', Exception]]:
+    '''并发获取多个卡牌信息
+
+    参数:
+        ids (Iterable[int]): 卡牌 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总卡牌信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[CardInfo, CardAll5Info, Exception]]: 与 `ids` 顺序一致的卡牌信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'CardAll5Info'] = get_all(5, session=session) if from_all else {}
+    
+    def fetch(id: int) -> Union['CardInfo', 'CardAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return Card(id, session=session).get_info()
+    
+    return gather_many(ids, fetch, concurrency)
+
+# 异步批量获取卡牌信息
+async def get_many_async(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['CardInfo', 'CardAll5Info', Exception]]:
+    '''并发获取多个卡牌信息
+
+    参数:
+        ids (Iterable[int]): 卡牌 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总卡牌信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[CardInfo, CardAll5Info, Exception]]: 与 `ids` 顺序一致的卡牌信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'CardAll5Info'] = await get_all_async(5, session=session) if from_all else {}
+    
+    async def fetch(id: int) -> Union['CardInfo', 'CardAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return await Card(id, session=session).get_info_async()
+    
+    return await gather_many_async(ids, fetch, concurrency)
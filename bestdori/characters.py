@@ -6,7 +6,8 @@ from typing_extensions import overload
 from typing import TYPE_CHECKING, Dict, List, Tuple, Union, Literal, Optional
 
 from . import post
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
 from .utils import get_api, hex_to_rgb
 from .exceptions import (
     HTTPStatusError,
@@ -32,155 +33,167 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总角色信息
 @overload
-def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总角色信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有角色 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[2]) -> 'CharacterAll2':
+def get_all(index: Literal[2], *, session: Optional[Session]=None) -> 'CharacterAll2':
     '''获取总角色信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterAll2: 所有已有角色的简洁信息 `all.2.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'CharacterAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'CharacterAll5':
     '''获取总角色信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterAll5: 所有已有角色的较详细信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[0, 2, 5]=5) -> Union[Dict[str, 'NoneDict'], 'CharacterAll2', 'CharacterAll5']:
-    return Api(API['characters']['all'].format(index=index)).get().json()
+def get_all(index: Literal[0, 2, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'CharacterAll2', 'CharacterAll5']:
+    return Api(API['characters']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总角色信息
 @overload
-async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总角色信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有角色 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[2]) -> 'CharacterAll2':
+async def get_all_async(index: Literal[2], *, session: Optional[Session]=None) -> 'CharacterAll2':
     '''获取总角色信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterAll2: 所有已有角色的简洁信息 `all.2.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'CharacterAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'CharacterAll5':
     '''获取总角色信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterAll5: 所有已有角色的较详细信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[0, 2, 3, 5]=5) -> Union[Dict[str, 'NoneDict'], 'CharacterAll2', 'CharacterAll5']:
-    return (await Api(API['characters']['all'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[0, 2, 3, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'CharacterAll2', 'CharacterAll5']:
+    return (await Api(API['characters']['all'].format(index=index), session=session).aget()).json()
 
 # 获取主要角色信息
 @overload
-def get_main(index: Literal[1]) -> 'CharacterMain1':
+def get_main(index: Literal[1], *, session: Optional[Session]=None) -> 'CharacterMain1':
     '''获取主要角色信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterMain1: 所有已有主要角色 ID 与其乐队 ID `main.1.json`
     '''
     ...
 @overload
-def get_main(index: Literal[2]) -> 'CharacterMain2':
+def get_main(index: Literal[2], *, session: Optional[Session]=None) -> 'CharacterMain2':
     '''获取主要角色信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterMain2: 所有已有主要角色的简洁信息 `main.2.json`
     '''
     ...
 @overload
-def get_main(index: Literal[3]) -> 'CharacterMain3':
+def get_main(index: Literal[3], *, session: Optional[Session]=None) -> 'CharacterMain3':
     '''获取主要角色信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterMain3: 所有已有主要角色的较详细信息 `main.3.json`
     '''
     ...
 
-def get_main(index: Literal[1, 2, 3]=3) -> Union['CharacterMain1', 'CharacterMain2', 'CharacterMain3']:
-    return Api(API['characters']['main'].format(index=index)).get().json()
+def get_main(index: Literal[1, 2, 3]=3, *, session: Optional[Session]=None) -> Union['CharacterMain1', 'CharacterMain2', 'CharacterMain3']:
+    return Api(API['characters']['main'].format(index=index), session=session).get().json()
 
 # 异步获取主要角色信息
 @overload
-async def get_main_async(index: Literal[1]) -> 'CharacterMain1':
+async def get_main_async(index: Literal[1], *, session: Optional[Session]=None) -> 'CharacterMain1':
     '''获取主要角色信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterMain1: 所有已有主要角色 ID 与其乐队 ID `main.1.json`
     '''
     ...
 @overload
-async def get_main_async(index: Literal[2]) -> 'CharacterMain2':
+async def get_main_async(index: Literal[2], *, session: Optional[Session]=None) -> 'CharacterMain2':
     '''获取主要角色信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterMain2: 所有已有主要角色的简洁信息 `main.2.json`
     '''
     ...
 @overload
-async def get_main_async(index: Literal[3]) -> 'CharacterMain3':
+async def get_main_async(index: Literal[3], *, session: Optional[Session]=None) -> 'CharacterMain3':
     '''获取主要角色信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `main.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CharacterMain3: 所有已有主要角色的较详细信息 `main.3.json`
     '''
     ...
 
-async def get_main_async(index: Literal[1, 2, 3]=3) -> Union['CharacterMain1', 'CharacterMain2', 'CharacterMain3']:
-    return (await Api(API['characters']['main'].format(index=index)).aget()).json()
+async def get_main_async(index: Literal[1, 2, 3]=3, *, session: Optional[Session]=None) -> Union['CharacterMain1', 'CharacterMain2', 'CharacterMain3']:
+    return (await Api(API['characters']['main'].format(index=index), session=session).aget()).json()
 
 # 角色类
 class Character:
@@ -188,18 +201,22 @@ class Character:
 
     参数:
         id (int): 角色 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''角色类
 
         参数:
             id (int): 角色 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''角色 ID'''
         self.__info: Optional['CharacterInfo'] = None
         '''角色信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
         
     
@@ -237,17 +254,22 @@ class Character:
             CharacterInfo: 角色信息
         '''
         try:
-            response = Api(
-                API['characters']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'characters',
+                self.id,
+                Api(
+                    API['characters']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Character {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return response.json()
+        self.__info = info
+        return info
     
     # 异步获取角色信息
     async def get_info_async(self) -> 'CharacterInfo':
@@ -257,17 +279,22 @@ class Character:
             CharacterInfo: 角色信息
         '''
         try:
-            response = await Api(
-                API['characters']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'characters',
+                self.id,
+                Api(
+                    API['characters']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Character {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return response.json()
+        self.__info = info
+        return info
     
     # 获取角色评论
     def get_comment(
@@ -299,6 +326,7 @@ class Character:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取角色评论
@@ -331,6 +359,7 @@ class Character:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取角色图标
@@ -340,7 +369,7 @@ class Character:
         返回:
             bytes: 角色图标字节数据 `bytes`
         '''
-        return Api(RES['icon']['png'].format(name=f'chara_icon_{self.id}')).get(
+        return Api(RES['icon']['png'].format(name=f'chara_icon_{self.id}'), session=self.session).get(
     ).content
     
     # 异步获取角色图标
@@ -350,7 +379,7 @@ class Character:
         返回:
             bytes: 角色图标字节数据 `bytes`
         '''
-        return (await Api(RES['icon']['png'].format(name=f'chara_icon_{self.id}')).aget(
+        return (await Api(RES['icon']['png'].format(name=f'chara_icon_{self.id}'), session=self.session).aget(
     )).content
     
     # 获取角色主视觉图
@@ -361,7 +390,8 @@ class Character:
             bytes: 主视觉图资源字节 `bytes`
         '''
         return Api(
-            ASSETS['characters']['character_kv_image'].format(server='jp', id=self.id)
+            ASSETS['characters']['character_kv_image'].format(server='jp', id=self.id),
+            session=self.session,
         ).get().content
     
     # 异步获取角色主视觉图
@@ -372,5 +402,6 @@ class Character:
             bytes: 主视觉图资源字节 `bytes`
         '''
         return (await Api(
-            ASSETS['characters']['character_kv_image'].format(server='jp', id=self.id)
+            ASSETS['characters']['character_kv_image'].format(server='jp', id=self.id),
+            session=self.session,
         ).aget()).content
@@ -1,18 +1,24 @@
 '''`bestdori.charts`
 
 谱面相关操作'''
+import os
+from math import inf
+from bisect import bisect_left, bisect_right
+from array import array
 from copy import deepcopy
-from json import dumps, loads
 from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, Any, Set, Dict, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Set, Dict, List, Tuple, Union, Iterable, Iterator, Optional, TypedDict
 
-from .utils import get_api
+from .utils import codec, get_api
 from .models.note import *
-from .utils.network import Api
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from .user import Me
+    from .utils.network import Session
     from .typing import DifficultyName
+    from .ayachan.typing import ChartMetrics
 
 API = get_api('bestdori.api')
 
@@ -188,64 +194,17 @@ class Chart(List[Note]):
         返回:
             Stats: 统计到的谱面详细数据
         '''
-        stats = Stats(
-            time=0.0,
-            notes=0,
-            bpms=[],
-            main_bpm=0.0
-        )
-
         # 扁平化谱面
         notes = self.__flatten__()
 
-        bpm_duration_stack: List[_BPMDuration] = []
-        prev_beat = 0.0
-        prev_bpm = 0.0
-        bpms: Set[float] = set()
-        # 再次遍历音符列表进行统计
+        bpms: List[Tuple[float, float]] = []
+        count = 0
         for note in notes:
             if isinstance(note, BPM):
-                if prev_bpm != 0.0:
-                    # bpm_duration_stack 为空与 prev_bpm == 0.0 必定同时成立
-                    duration = (note.beat - prev_beat) * 60.0 / abs(prev_bpm)
-                    _handle_bpm_duration(duration, prev_bpm, bpm_duration_stack)
-                
-                prev_bpm = note.bpm
-                prev_beat = note.beat
-                if prev_bpm > 0.0 and prev_bpm not in bpms:
-                    bpms.add(prev_bpm)
-                    stats.bpms.append(prev_bpm)
-            else:
-                if not isinstance(note, Connection) or not note.hidden:
-                    stats.notes += 1
-        
-        # 处理收尾 BPM 时长
-        if prev_bpm != 0.0 and prev_beat != 0.0:
-            duration = (notes[-1].beat - prev_beat) * 60.0 / abs(prev_bpm)
-            _handle_bpm_duration(duration, prev_bpm, bpm_duration_stack)
-            if duration > 0.0 and prev_bpm > 0.0 and prev_bpm not in bpms:
-                bpms.add(prev_bpm)
-                stats.bpms.append(prev_bpm)
-        
-        # 处理 BPM 计算栈计算谱面时长与 BPM 时长统计
-        bpm_time_dict: Dict[float, float] = {}
-        total_time = 0.0
-        for bpm_dur in bpm_duration_stack:
-            total_time += bpm_dur['duration']
-            if bpm_dur['bpm'] in bpm_time_dict:
-                bpm_time_dict[bpm_dur['bpm']] += bpm_dur['duration']
-            else:
-                bpm_time_dict[bpm_dur['bpm']] = bpm_dur['duration']
-        stats.time = total_time
-
-        # 计算主 BPM
-        main_duration = 0.0
-        for bpm, duration in bpm_time_dict.items():
-            if duration > main_duration:
-                main_duration = duration
-                stats.main_bpm = bpm
-        
-        return stats
+                bpms.append((note.beat, note.bpm))
+            elif not isinstance(note, Connection) or not note.hidden:
+                count += 1
+        return _bpm_stats(bpms, notes[-1].beat if notes else 0.0, count)
 
     # 转换为字典列表对象
     def to_list(self) -> List[Dict[str, Any]]:
@@ -258,7 +217,7 @@ class Chart(List[Note]):
     # 转换为 json 字符串
     def json(self) -> str:
         '''将 `Chart` 谱面转换为 `json` 字符串'''
-        return dumps(self.to_list(), ensure_ascii=False)
+        return codec.dumps(self.to_list())
 
     @classmethod
     def from_python(cls, data: List[Dict[str, Any]]) -> 'Chart':
@@ -274,16 +233,16 @@ class Chart(List[Note]):
 
     # 通过 json 字符串转换为 Chart 谱面
     @classmethod
-    def from_json(cls, data: str) -> 'Chart':
+    def from_json(cls, data: Union[str, bytes]) -> 'Chart':
         '''通过 `json` 字符串转换为 `Chart` 谱面
 
         参数:
-            data (str): 谱面 `json` 字符串
+            data (Union[str, bytes]): 谱面 `json` 字符串或其 UTF-8 字节
 
         返回:
             Chart: 谱面对象 `bestdori.chart.Chart`
         '''
-        return cls(loads(data)).standardize()
+        return cls(codec.loads(data)).standardize()
     
     # 获取官方谱面
     @classmethod
@@ -292,18 +251,23 @@ class Chart(List[Note]):
         id: int,
         diff: 'DifficultyName' = 'expert',
         *,
-        me: Optional['Me'] = None
+        me: Optional['Me'] = None,
+        session: Optional['Session']=None,
     ) -> 'Chart':
         '''获取官方谱面
 
         参数:
             id (int): 谱面 ID
             diff (DifficultyName, optional): 难度名称
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
         返回:
             Chart: 获取到的谱面对象 `bestdori.chart.Chart`
         '''
-        response = Api(API['charts']['info'].format(id=id, diff=diff)).get()
+        # 网络模块仅在获取谱面时导入，只处理谱面时无需加载
+        from .utils.network import Api
+
+        response = Api(API['charts']['info'].format(id=id, diff=diff), session=session).get()
         return cls(response.json()).standardize()
     
     # 异步获取官方谱面
@@ -313,18 +277,22 @@ class Chart(List[Note]):
         id: int,
         diff: 'DifficultyName' = 'expert',
         *,
-        me: Optional['Me'] = None
+        me: Optional['Me'] = None,
+        session: Optional['Session']=None,
     ) -> 'Chart':
         '''获取官方谱面
 
         参数:
             id (int): 谱面 ID
             diff (DifficultyName, optional): 难度名称
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
         返回:
             Chart: 获取到的谱面对象 `bestdori.chart.Chart`
         '''
-        response = await Api(API['charts']['info'].format(id=id, diff=diff)).aget()
+        from .utils.network import Api
+
+        response = await Api(API['charts']['info'].format(id=id, diff=diff), session=session).aget()
         return cls(response.json()).standardize()
     
     def copy(self) -> 'Chart':
@@ -342,3 +310,765 @@ class Chart(List[Note]):
         new_chart = Chart([])
         new_chart.extend(deepcopy(list(self), memo))
         return new_chart
+    
+    # 转换为紧凑谱面
+    def compact(self) -> 'CompactChart':
+        '''将谱面转换为以数组存储的紧凑谱面
+
+        返回:
+            CompactChart: 紧凑谱面对象 `bestdori.charts.CompactChart`
+        '''
+        return CompactChart.from_chart(self)
+
+_TYPES: Tuple[str, ...] = ('Single', 'Slide', 'Long', 'BPM', 'Directional')
+_TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(_TYPES)}
+_SINGLE, _SLIDE, _LONG, _BPM, _DIRECTIONAL = range(len(_TYPES))
+
+_FLICK, _SKILL, _HIDDEN, _CHARGE, _RIGHT, _EMPTY = 1, 2, 4, 8, 16, 32
+
+_STANDARD_TYPES = bytes(_SLIDE if code == _LONG else code for code in range(256))
+'''规范化时将 `Long` 统一为 `Slide` 的类型转换表'''
+
+def _flags(note: Dict[str, Any]) -> int:
+    return (
+        (_FLICK if note.get('flick', False) else 0)
+        | (_SKILL if note.get('skill', False) else 0)
+        | (_HIDDEN if note.get('hidden', False) else 0)
+        | (_CHARGE if note.get('charge', False) else 0)
+    )
+
+_BPM_ROWS = bytes(1 if code == _BPM else 0 for code in range(256))
+'''BPM 行的查找表'''
+_EMPTY_ROWS = bytes(1 if flags & _EMPTY else 0 for flags in range(256))
+'''空滑条行的查找表'''
+_HIDDEN_ROWS = bytes(1 if flags & _HIDDEN else 0 for flags in range(256))
+'''隐藏行的查找表'''
+
+def _find_rows(column: array, table: bytes) -> List[int]:
+    '''查找按查找表转换后非零的行，查找在 C 层完成，适合结果较少的查找'''
+    data = column.tobytes().translate(table)
+    rows: List[int] = []
+    row = data.find(1)
+    while row >= 0:
+        rows.append(row)
+        row = data.find(1, row + 1)
+    return rows
+
+def _bpm_stats(bpms: List[Tuple[float, float]], end: float, notes: int) -> Stats:
+    '''根据按节拍排序的 BPM 音符 `(节拍, BPM)` 与谱面结束节拍统计谱面数据，供 `Chart.count` 与 `CompactChart.count` 共用'''
+    stats = Stats(time=0.0, notes=notes, bpms=[], main_bpm=0.0)
+    bpm_duration_stack: List[_BPMDuration] = []
+    prev_beat = 0.0
+    prev_bpm = 0.0
+    seen: Set[float] = set()
+    for beat, bpm in bpms:
+        if prev_bpm != 0.0:
+            # bpm_duration_stack 为空与 prev_bpm == 0.0 必定同时成立
+            duration = (beat - prev_beat) * 60.0 / abs(prev_bpm)
+            _handle_bpm_duration(duration, prev_bpm, bpm_duration_stack)
+        prev_bpm = bpm
+        prev_beat = beat
+        if prev_bpm > 0.0 and prev_bpm not in seen:
+            seen.add(prev_bpm)
+            stats.bpms.append(prev_bpm)
+
+    # 处理收尾 BPM 时长
+    if prev_bpm != 0.0 and prev_beat != 0.0:
+        duration = (end - prev_beat) * 60.0 / abs(prev_bpm)
+        _handle_bpm_duration(duration, prev_bpm, bpm_duration_stack)
+        if duration > 0.0 and prev_bpm > 0.0 and prev_bpm not in seen:
+            seen.add(prev_bpm)
+            stats.bpms.append(prev_bpm)
+
+    # 处理 BPM 计算栈计算谱面时长与 BPM 时长统计
+    bpm_time_dict: Dict[float, float] = {}
+    total_time = 0.0
+    for bpm_dur in bpm_duration_stack:
+        total_time += bpm_dur['duration']
+        if bpm_dur['bpm'] in bpm_time_dict:
+            bpm_time_dict[bpm_dur['bpm']] += bpm_dur['duration']
+        else:
+            bpm_time_dict[bpm_dur['bpm']] = bpm_dur['duration']
+    stats.time = total_time
+
+    # 计算主 BPM
+    main_duration = 0.0
+    for bpm, duration in bpm_time_dict.items():
+        if duration > main_duration:
+            main_duration = duration
+            stats.main_bpm = bpm
+    return stats
+
+# 紧凑谱面类
+class CompactChart:
+    '''以并列的类型化数组存储的紧凑谱面，内容不可变
+
+    每个单键、BPM、方向键音符与每个滑条节点各占一行，同一滑条的节点连续存储。
+    相比由音符对象组成的 `Chart`，内存占用约为其 1/7，且不产生需要垃圾回收追踪的对象，
+    适合同时在内存中保留大量谱面。可与 `Chart` 及谱面字典列表无损地相互转换。
+
+    ```python
+    compact = CompactChart.from_json(response.content)
+    chart = compact.to_chart()
+    ```
+    '''
+    __slots__ = ('types', 'flags', 'beats', 'lanes', 'bpms', 'widths', 'groups', '_offsets')
+
+    SINGLE = _SINGLE
+    '''行类型：单键'''
+    SLIDE = _SLIDE
+    '''行类型：滑条节点'''
+    LONG = _LONG
+    '''行类型：类型名称为 `Long` 的滑条节点'''
+    BPM = _BPM
+    '''行类型：BPM'''
+    DIRECTIONAL = _DIRECTIONAL
+    '''行类型：方向键'''
+
+    FLICK = _FLICK
+    '''标记位：粉键'''
+    SKILL = _SKILL
+    '''标记位：技能键'''
+    HIDDEN = _HIDDEN
+    '''标记位：隐藏节点'''
+    CHARGE = _CHARGE
+    '''标记位：蓄力'''
+    RIGHT = _RIGHT
+    '''标记位：方向键朝右'''
+
+    def __init__(self) -> None:
+        self.types = array('B')
+        '''各行的类型，见 `SINGLE`、`SLIDE`、`LONG`、`BPM`、`DIRECTIONAL`'''
+        self.flags = array('B')
+        '''各行的标记位，见 `FLICK`、`SKILL`、`HIDDEN`、`CHARGE`、`RIGHT`'''
+        self.beats = array('d')
+        '''各行的节拍'''
+        self.lanes = array('d')
+        '''各行的轨道，BPM 行为 `0`'''
+        self.bpms = array('d')
+        '''各行的 BPM，非 BPM 行为 `0`'''
+        self.widths = array('B')
+        '''各行的方向键宽度，非方向键行为 `0`'''
+        self.groups = array('i')
+        '''各行所属音符在谱面中的序号，同一滑条的节点相同'''
+        self._offsets: Optional[array] = None
+
+    def _append(self, code: int, flags: int, beat: float, lane: float, bpm: float, width: int, group: int) -> None:
+        self.types.append(code)
+        self.flags.append(flags)
+        self.beats.append(beat)
+        self.lanes.append(lane)
+        self.bpms.append(bpm)
+        self.widths.append(width)
+        self.groups.append(group)
+
+    # 从谱面字典列表转换
+    @classmethod
+    def from_list(cls, data: List[Dict[str, Any]]) -> 'CompactChart':
+        '''通过谱面字典列表构建紧凑谱面，不进行规范化处理
+
+        与 `Chart` 相同，未知类型的音符将被忽略，单键的 `charge` 字段将被丢弃
+
+        参数:
+            data (List[Dict[str, Any]]): 谱面字典列表
+
+        返回:
+            CompactChart: 紧凑谱面对象
+        '''
+        types: List[int] = []
+        flags: List[int] = []
+        beats: List[float] = []
+        lanes: List[float] = []
+        bpms: List[float] = []
+        widths: List[int] = []
+        groups: List[int] = []
+        group = 0
+        for note in data:
+            code = _TYPE_CODES.get(note.get('type', ''), None)
+            if code is None:
+                continue
+            if code == _SLIDE or code == _LONG:
+                connections = note.get('connections', [])
+                if not connections:
+                    connections = [{'beat': inf, 'lane': 0.0}]
+                for connection in connections:
+                    types.append(code)
+                    # 只有 beat 与 lane 字段的节点没有标记位
+                    flags.append((_flags(connection) if len(connection) > 2 else 0) if connection['beat'] != inf else _EMPTY)
+                    beats.append(connection['beat'])
+                    lanes.append(connection['lane'])
+                    groups.append(group)
+                bpms.extend([0.0] * len(connections))
+                widths.extend([0] * len(connections))
+            else:
+                types.append(code)
+                beats.append(note['beat'])
+                groups.append(group)
+                if code == _BPM:
+                    flags.append(0)
+                    lanes.append(0.0)
+                    bpms.append(note['bpm'])
+                    widths.append(0)
+                elif code == _DIRECTIONAL:
+                    flags.append(_RIGHT if note['direction'] == 'Right' else 0)
+                    lanes.append(note['lane'])
+                    bpms.append(0.0)
+                    widths.append(note['width'])
+                else:
+                    flags.append(_flags(note) & ~_CHARGE if len(note) > 3 else 0)
+                    lanes.append(note['lane'])
+                    bpms.append(0.0)
+                    widths.append(0)
+            group += 1
+
+        compact = cls()
+        compact.types = array('B', types)
+        compact.flags = array('B', flags)
+        compact.beats = array('d', beats)
+        compact.lanes = array('d', lanes)
+        compact.bpms = array('d', bpms)
+        compact.widths = array('B', widths)
+        compact.groups = array('i', groups)
+        return compact
+
+    # 从谱面转换
+    @classmethod
+    def from_chart(cls, chart: Chart) -> 'CompactChart':
+        '''通过 `Chart` 谱面构建紧凑谱面
+
+        参数:
+            chart (Chart): 谱面对象
+
+        返回:
+            CompactChart: 紧凑谱面对象
+        '''
+        compact = cls()
+        append = compact._append
+        for group, note in enumerate(chart):
+            code = _TYPE_CODES[note.type]
+            if isinstance(note, Slide):
+                if not note.connections:
+                    append(code, _EMPTY, inf, 0.0, 0.0, 0, group)
+                for connection in note.connections:
+                    flags = (
+                        (_FLICK if connection.flick else 0)
+                        | (_SKILL if connection.skill else 0)
+                        | (_HIDDEN if connection.hidden else 0)
+                        | (_CHARGE if connection.charge else 0)
+                    )
+                    append(code, flags, connection.beat, connection.lane, 0.0, 0, group)
+            elif isinstance(note, BPM):
+                append(code, 0, note.beat, 0.0, note.bpm, 0, group)
+            elif isinstance(note, Directional):
+                append(code, _RIGHT if note.direction == 'Right' else 0, note.beat, note.lane, 0.0, note.width, group)
+            else:
+                flags = (
+                    (_FLICK if note.flick else 0)
+                    | (_SKILL if note.skill else 0)
+                    | (_HIDDEN if note.hidden else 0)
+                    | (_CHARGE if note.charge else 0)
+                )
+                append(code, flags, note.beat, note.lane, 0.0, 0, group)
+        return compact
+
+    # 通过 json 字符串转换为紧凑谱面
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> 'CompactChart':
+        '''通过 `json` 字符串构建规范化的紧凑谱面，结果与 `Chart.from_json(data).compact()` 相同
+
+        参数:
+            data (Union[str, bytes]): 谱面 `json` 字符串或其 UTF-8 字节
+
+        返回:
+            CompactChart: 紧凑谱面对象
+        '''
+        return cls.from_list(codec.loads(data)).standardize()
+
+    @property
+    def offsets(self) -> array:
+        '''各音符的起始行，长度为音符数加一，第 `i` 个音符占据 `offsets[i]` 至 `offsets[i + 1]` 行'''
+        if self._offsets is None:
+            offsets = array('I')
+            previous = -1
+            for row, group in enumerate(self.groups):
+                if group != previous:
+                    offsets.append(row)
+                    previous = group
+            offsets.append(len(self.groups))
+            self._offsets = offsets
+        return self._offsets
+
+    @property
+    def rows(self) -> int:
+        '''行数'''
+        return len(self.types)
+
+    @property
+    def nbytes(self) -> int:
+        '''数组占用的字节数'''
+        return sum(
+            len(column) * column.itemsize
+            for column in (self.types, self.flags, self.beats, self.lanes, self.bpms, self.widths, self.groups)
+        )
+
+    def __len__(self) -> int:
+        return len(self.groups) and self.groups[-1] + 1
+
+    def _note(self, start: int, end: int) -> Note:
+        code = self.types[start]
+        flags = self.flags[start]
+        if code == _SLIDE or code == _LONG:
+            return Slide(
+                type=_TYPES[code],  # type: ignore[arg-type]
+                connections=[] if flags & _EMPTY else [
+                    Connection(
+                        beat=self.beats[row],
+                        lane=self.lanes[row],
+                        flick=bool(self.flags[row] & _FLICK),
+                        skill=bool(self.flags[row] & _SKILL),
+                        hidden=bool(self.flags[row] & _HIDDEN),
+                        charge=bool(self.flags[row] & _CHARGE),
+                    )
+                    for row in range(start, end)
+                ],
+            )
+        if code == _BPM:
+            return BPM(type='BPM', beat=self.beats[start], bpm=self.bpms[start])
+        if code == _DIRECTIONAL:
+            return Directional(
+                type='Directional',
+                beat=self.beats[start],
+                lane=self.lanes[start],
+                width=self.widths[start],
+                direction='Right' if flags & _RIGHT else 'Left',
+            )
+        return Single(
+            type='Single',
+            beat=self.beats[start],
+            lane=self.lanes[start],
+            flick=bool(flags & _FLICK),
+            skill=bool(flags & _SKILL),
+            hidden=bool(flags & _HIDDEN),
+            charge=bool(flags & _CHARGE),
+        )
+
+    def __getitem__(self, index: int) -> Note:
+        '''获取第 `index` 个音符，每次调用都会构建新的音符对象'''
+        offsets = self.offsets
+        count = len(offsets) - 1
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('CompactChart index out of range')
+        return self._note(offsets[index], offsets[index + 1])
+
+    def __iter__(self) -> Iterator[Note]:
+        '''依次构建各音符对象'''
+        offsets = self.offsets
+        for index in range(len(offsets) - 1):
+            yield self._note(offsets[index], offsets[index + 1])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactChart):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in ('types', 'flags', 'beats', 'lanes', 'bpms', 'widths', 'groups')
+        )
+
+    def __repr__(self) -> str:
+        return f'CompactChart(notes={len(self)}, rows={self.rows}, nbytes={self.nbytes})'
+
+    # 检查是否为 SP 谱面
+    @property
+    def is_sp_rhythm(self) -> bool:
+        '''是否为使用了 SP 键的谱面'''
+        for code, flags in zip(self.types, self.flags):
+            if code == _DIRECTIONAL:
+                return True
+            if (code == _SLIDE or code == _LONG) and flags & _HIDDEN:
+                return True
+        return False
+
+    # 谱面规范化处理
+    def standardize(self) -> 'CompactChart':
+        '''谱面规范化处理，处理方式与 `Chart.standardize` 相同
+
+        返回:
+            CompactChart: 处理后的新紧凑谱面
+        '''
+        offsets = self.offsets
+        types = self.types
+        beats = self.beats
+        # 按首个节拍稳定排序，空滑条的节拍为无穷大，排在最后
+        order = sorted(range(len(offsets) - 1), key=lambda index: beats[offsets[index]])
+        rows = [row for index in order for row in range(offsets[index], offsets[index + 1])]
+
+        # 偏移量计算
+        offset = 0.0
+        for index in order:
+            if types[offsets[index]] == _BPM:
+                offset = beats[offsets[index]]
+                break
+
+        result = CompactChart()
+        if rows == list(range(len(rows))):
+            # 已按节拍排序时直接复制各列
+            result.types = array('B', types.tobytes().translate(_STANDARD_TYPES))
+            result.flags = array('B', self.flags)
+            result.beats = array('d', [max(beat - offset, 0.0) for beat in beats])
+            result.lanes = array('d', self.lanes)
+            result.bpms = array('d', self.bpms)
+            result.widths = array('B', self.widths)
+            result.groups = array('i', self.groups)
+        else:
+            # 统一类型名称
+            result.types = array('B', bytes([types[row] for row in rows]).translate(_STANDARD_TYPES))
+            result.flags = array('B', [self.flags[row] for row in rows])
+            # 修正偏移量
+            result.beats = array('d', [max(beats[row] - offset, 0.0) for row in rows])
+            result.lanes = array('d', [self.lanes[row] for row in rows])
+            result.bpms = array('d', [self.bpms[row] for row in rows])
+            result.widths = array('B', [self.widths[row] for row in rows])
+            result.groups = array('i', [
+                group for group, index in enumerate(order) for _ in range(offsets[index + 1] - offsets[index])
+            ])
+
+        # 修正字段值，滑条中间节点不能为粉键或技能键
+        flags = result.flags
+        row = 0
+        for index in order:
+            size = offsets[index + 1] - offsets[index]
+            if size > 2 and types[offsets[index]] in (_SLIDE, _LONG):
+                for middle in range(row + 1, row + size - 1):
+                    flags[middle] &= ~(_FLICK | _SKILL)
+            row += size
+        return result
+
+    # 谱面数据统计
+    def count(self) -> Stats:
+        '''谱面数据统计，结果与 `Chart.count` 相同
+
+        音符数与结束节拍直接在数组上计算，无需扁平化并排序全部音符，只有 BPM 音符需要逐个处理
+
+        返回:
+            Stats: 统计到的谱面详细数据
+        '''
+        types = self.types
+        beats = self.beats
+        bpm_rows = _find_rows(types, _BPM_ROWS)
+        empty_rows = _find_rows(self.flags, _EMPTY_ROWS)
+        # 单键的 hidden 字段不影响统计，只排除隐藏的滑条节点
+        hidden = sum(1 for row in _find_rows(self.flags, _HIDDEN_ROWS) if types[row] in (_SLIDE, _LONG))
+        rows = len(types)
+        if rows == len(bpm_rows) + len(empty_rows):
+            # 没有音符时扁平化后的谱面为空
+            return Stats(time=0.0, notes=0, bpms=[], main_bpm=0.0)
+        notes = rows - len(bpm_rows) - len(empty_rows) - hidden
+        if not bpm_rows:
+            return Stats(time=0.0, notes=notes, bpms=[], main_bpm=0.0)
+
+        # 谱面结束节拍为最后一个非 BPM 音符的节拍
+        masked = array('d', beats)
+        for row in bpm_rows + empty_rows:
+            masked[row] = -inf
+        end = max(masked)
+
+        # 按节拍稳定排序后位于最后一个音符之后的 BPM 音符不参与统计
+        last: Optional[int] = None
+        bpms: List[Tuple[float, float]] = []
+        for beat, row in sorted((beats[row], row) for row in bpm_rows):
+            if beat > end:
+                break
+            if beat == end:
+                if last is None:
+                    last = next(row for row in range(rows - 1, -1, -1) if masked[row] == end)
+                if row > last:
+                    break
+            bpms.append((beat, self.bpms[row]))
+        return _bpm_stats(bpms, end, notes)
+
+    # 转换为谱面
+    def to_chart(self) -> Chart:
+        '''将紧凑谱面转换为 `Chart` 谱面
+
+        返回:
+            Chart: 谱面对象 `bestdori.charts.Chart`
+        '''
+        chart = Chart([])
+        chart.extend(self)
+        return chart
+
+    # 转换为字典列表对象
+    def to_list(self) -> List[Dict[str, Any]]:
+        '''将紧凑谱面转换为 `List[Dict[str, Any]]` 对象，结果与 `Chart.to_list` 相同'''
+        return [asdict(note) for note in self]
+
+    # 转换为 json 字符串
+    def json(self) -> str:
+        '''将紧凑谱面转换为 `json` 字符串'''
+        return codec.dumps(self.to_list())
+
+ChartSource = Union[Chart, CompactChart, str, bytes, List[Dict[str, Any]]]
+'''可批量处理的谱面：谱面对象、谱面 `json` 字符串或谱面字典列表'''
+
+def _to_compact(chart: ChartSource) -> CompactChart:
+    '''将谱面转换为紧凑谱面，字符串与字典列表将与 `Chart.from_json`、`Chart.from_python` 一样进行规范化处理'''
+    if isinstance(chart, CompactChart):
+        return chart
+    if isinstance(chart, Chart):
+        return chart.compact()
+    if isinstance(chart, (str, bytes)):
+        return CompactChart.from_json(chart)
+    return CompactChart.from_list(chart).standardize()
+
+# 批量谱面数据统计
+def count_many(charts: Iterable[ChartSource]) -> List[Stats]:
+    '''批量统计谱面数据，结果与逐个调用 `Chart.count` 相同
+
+    谱面将转换为 `CompactChart` 进行统计，适合一次统计大量谱面。
+
+    参数:
+        charts (Iterable[ChartSource]): 谱面对象、谱面 `json` 字符串或谱面字典列表，
+            字符串与字典列表将与 `Chart.from_json`、`Chart.from_python` 一样进行规范化处理
+
+    返回:
+        List[Stats]: 各谱面统计到的详细数据
+    '''
+    return [_to_compact(chart).count() for chart in charts]
+
+def _analyze_chunk(
+    chunk: List[Tuple[int, ChartSource]],
+    metrics: bool,
+) -> List[Tuple[int, Union[Stats, 'ChartMetrics', Exception]]]:
+    '''在工作进程中分析一组谱面，单个谱面出错时返回对应的异常'''
+    if metrics:
+        from .ayachan.metrics import chart_metrics_local
+    results: List[Tuple[int, Union[Stats, 'ChartMetrics', Exception]]] = []
+    for index, source in chunk:
+        try:
+            compact = _to_compact(source)
+            results.append((index, chart_metrics_local(compact) if metrics else compact.count()))
+        except Exception as exception:
+            results.append((index, exception))
+    return results
+
+def _chunks(sources: Iterable[ChartSource], size: int) -> Iterator[List[Tuple[int, ChartSource]]]:
+    chunk: List[Tuple[int, ChartSource]] = []
+    for item in enumerate(sources):
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# 多进程批量分析谱面
+def analyze_many(
+    sources: Iterable[ChartSource],
+    workers: Optional[int]=None,
+    *,
+    chunksize: int=64,
+    metrics: bool=False,
+) -> Iterator[Tuple[int, Union[Stats, 'ChartMetrics', Exception]]]:
+    '''在进程池中批量解析、规范化并统计谱面，每组谱面完成后立即返回其结果
+
+    `sources` 按 `chunksize` 分组后提交到 `ProcessPoolExecutor`，同时提交的组数不超过工作进程数的两倍，
+    可以逐个读取大量谱面而无需全部载入内存。谱面 `json` 字符串的传输开销最小，建议直接传入下载到的响应内容。
+    在 Windows 与 macOS 等使用 `spawn` 启动进程的平台上，调用处需位于 `if __name__ == '__main__':` 之下。
+
+    ```python
+    for index, stats in analyze_many(contents, workers=8):
+        if isinstance(stats, Exception):
+            ...  # 解析失败的谱面
+    ```
+
+    参数:
+        sources (Iterable[ChartSource]): 谱面对象、谱面 `json` 字符串或谱面字典列表
+        workers (Optional[int], optional): 工作进程数，默认为 CPU 核心数，不大于 1 时在当前进程中处理
+        chunksize (int, optional): 每个工作单元包含的谱面数
+        metrics (bool, optional): 是否计算 `bestdori.ayachan.metrics.chart_metrics_local` 的谱面指标代替 `Stats`
+
+    返回:
+        Iterator[Tuple[int, Union[Stats, ChartMetrics, Exception]]]: 按完成顺序产生的 `(谱面在 sources 中的序号, 结果)`，
+            处理失败时结果为对应的异常
+    '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = _chunks(sources, max(1, chunksize))
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _analyze_chunk(chunk, metrics)
+        return
+
+    # 进程池相关模块仅在使用时导入，只处理谱面时无需加载 multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Set['Future[List[Tuple[int, Union[Stats, ChartMetrics, Exception]]]]'] = set()
+        for chunk in chunks:
+            pending.add(executor.submit(_analyze_chunk, chunk, metrics))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in as_completed(pending):
+            yield from future.result()
+
+# 节拍时间映射类
+class TimingMap:
+    '''谱面节拍与时间（秒）的映射，由 BPM 音符一次性构建，每次转换只需二分查找所在的 BPM 段
+
+    负 BPM 段中时间随节拍增加而倒退，与 `Chart.count` 中反向 BPM 时长相减的处理一致；
+    0 BPM 段中时间不变。第一个 BPM 音符之前按第一个 BPM 推算，时间为负数。
+
+    ```python
+    timing = TimingMap.from_chart(chart)
+    seconds = timing.beat_to_time(32.0)
+    times = timing.beats_to_times(compact.beats)
+    ```
+
+    参数:
+        bpms (Iterable[Tuple[float, float]]): BPM 音符的 `(节拍, BPM)`，将按节拍稳定排序，
+            同一节拍的多个 BPM 音符以最后一个为准
+    '''
+    __slots__ = ('beats', 'times', 'bpms', '_factors', '_highest', '_lowest')
+
+    def __init__(self, bpms: Iterable[Tuple[float, float]]) -> None:
+        changes: Dict[float, float] = {}
+        for beat, bpm in sorted(bpms, key=lambda change: change[0]):
+            changes[beat] = bpm
+        if not changes:
+            raise ValueError('Cannot build a timing map from a chart without BPM notes.')
+        self.beats = array('d', changes.keys())
+        '''各 BPM 段的起始节拍'''
+        self.bpms = array('d', changes.values())
+        '''各 BPM 段的 BPM'''
+        # 每拍的秒数，0 BPM 段为 0
+        self._factors = array('d', [60.0 / bpm if bpm != 0.0 else 0.0 for bpm in self.bpms])
+        self.times = array('d', [0.0])
+        '''各 BPM 段起始节拍对应的时间，第一个 BPM 音符为 0 秒'''
+        for index in range(1, len(self.beats)):
+            self.times.append(self.times[-1] + (self.beats[index] - self.beats[index - 1]) * self._factors[index - 1])
+        # 截至各段起始的最大时间与最小时间的相反数，均单调不减，用于二分查找首次到达某一时间的 BPM 段
+        self._highest = array('d', self.times)
+        self._lowest = array('d', [-time for time in self.times])
+        for index in range(1, len(self.times)):
+            self._highest[index] = max(self._highest[index], self._highest[index - 1])
+            self._lowest[index] = max(self._lowest[index], self._lowest[index - 1])
+
+    # 从谱面构建
+    @classmethod
+    def from_chart(cls, chart: Union[Chart, 'CompactChart']) -> 'TimingMap':
+        '''从谱面的 BPM 音符构建节拍时间映射
+
+        参数:
+            chart (Union[Chart, CompactChart]): 谱面对象，通常应已规范化处理
+
+        返回:
+            TimingMap: 节拍时间映射
+        '''
+        if isinstance(chart, CompactChart):
+            return cls((chart.beats[row], chart.bpms[row]) for row in _find_rows(chart.types, _BPM_ROWS))
+        return cls((note.beat, note.bpm) for note in chart if isinstance(note, BPM))
+
+    def __len__(self) -> int:
+        return len(self.beats)
+
+    def __repr__(self) -> str:
+        return f'TimingMap(segments={len(self.beats)})'
+
+    # 获取节拍所在的 BPM
+    def bpm_at(self, beat: float) -> float:
+        '''获取节拍所在 BPM 段的 BPM
+
+        参数:
+            beat (float): 节拍
+
+        返回:
+            float: BPM
+        '''
+        return self.bpms[max(bisect_right(self.beats, beat) - 1, 0)]
+
+    # 节拍转换为时间
+    def beat_to_time(self, beat: float) -> float:
+        '''将节拍转换为时间
+
+        参数:
+            beat (float): 节拍
+
+        返回:
+            float: 相对第一个 BPM 音符的时间，单位为秒
+        '''
+        index = max(bisect_right(self.beats, beat) - 1, 0)
+        return self.times[index] + (beat - self.beats[index]) * self._factors[index]
+
+    # 时间转换为节拍
+    def time_to_beat(self, time: float) -> float:
+        '''将时间转换为节拍
+
+        存在负 BPM 时同一时间可能对应多个节拍，返回从第一个 BPM 音符开始首次到达该时间的节拍，
+        之后不会到达的时间按第一个 BPM 向前推算
+
+        参数:
+            time (float): 相对第一个 BPM 音符的时间，单位为秒
+
+        返回:
+            float: 节拍
+
+        异常:
+            ValueError: 该时间无法到达
+        '''
+        if time >= 0.0:
+            index = bisect_left(self._highest, time)
+        else:
+            index = bisect_left(self._lowest, -time)
+        if index == 0:
+            return self.beats[0]
+        if index < len(self.times):
+            # 时间在该段中首次被越过，该段 BPM 必定不为 0
+            index -= 1
+            return self.beats[index] + (time - self.times[index]) / self._factors[index]
+        # 最后一段之后继续推进
+        index -= 1
+        factor = self._factors[index]
+        if factor != 0.0 and (time - self.times[index]) / factor >= 0.0:
+            return self.beats[index] + (time - self.times[index]) / factor
+        # 第一个 BPM 音符之前向前推算
+        factor = self._factors[0]
+        if factor != 0.0 and time / factor <= 0.0:
+            return self.beats[0] + time / factor
+        raise ValueError(f'Time {time} is never reached by this timing map.')
+
+    # 批量节拍转换为时间
+    def beats_to_times(self, beats: Iterable[float]) -> array:
+        '''将一组节拍（如 `CompactChart.beats`）转换为时间
+
+        参数:
+            beats (Iterable[float]): 节拍
+
+        返回:
+            array: 各节拍对应的时间，类型为 `array('d')`
+        '''
+        starts, times, factors = self.beats, self.times, self._factors
+        result = array('d')
+        append = result.append
+        index, last = 0, len(starts) - 1
+        for beat in beats:
+            # 已排序的节拍只需顺序推进所在的 BPM 段
+            if not (starts[index] <= beat and (index == last or beat < starts[index + 1])):
+                index = max(bisect_right(starts, beat) - 1, 0)
+            append(times[index] + (beat - starts[index]) * factors[index])
+        return result
+
+    # 批量时间转换为节拍
+    def times_to_beats(self, times: Iterable[float]) -> array:
+        '''将一组时间转换为节拍
+
+        参数:
+            times (Iterable[float]): 相对第一个 BPM 音符的时间，单位为秒
+
+        返回:
+            array: 各时间对应的节拍，类型为 `array('d')`
+        '''
+        return array('d', [self.time_to_beat(time) for time in times])
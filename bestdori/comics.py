@@ -1,11 +1,12 @@
 '''`bestdori.comics`
 
 BanG Dream! 漫画相关操作'''
-from typing import TYPE_CHECKING, List, Literal, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Union, Literal, Iterable, Optional
 
 from . import post
 from .user import Me  # 仅用于类型兼容，可后续移除
-from .utils.network import Api
+from .utils.network import Api, Session
 from .utils import name, get_api
 from .exceptions import (
     NoDataException,
@@ -20,32 +21,34 @@ API = get_api('bestdori.api')
 ASSETS = get_api('bestdori.assets')
 
 # 获取总漫画信息
-def get_all(index: Literal[5]=5) -> 'ComicsAll5':
+def get_all(index: Literal[5]=5, *, session: Optional[Session]=None) -> 'ComicsAll5':
     '''获取总漫画信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`
             `5`: 获取所有已有漫画信息 `all.5.json`
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         ComicsAll5: 获取到的总漫画信息
     '''
-    return Api(API['all']['comics'].format(index=index)).get().json()
+    return Api(API['all']['comics'].format(index=index), session=session).get().json()
 
 # 异步获取总漫画信息
-async def get_all_async(index: Literal[5]=5) -> 'ComicsAll5':
+async def get_all_async(index: Literal[5]=5, *, session: Optional[Session]=None) -> 'ComicsAll5':
     '''获取总漫画信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`
             `5`: 获取所有已有漫画信息 `all.5.json`
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         ComicsAll5: 获取到的总漫画信息
     '''
-    return (await Api(API['all']['comics'].format(index=index)).aget()).json()
+    return (await Api(API['all']['comics'].format(index=index), session=session).aget()).json()
 
 # 漫画类
 class Comic:
@@ -53,18 +56,22 @@ class Comic:
 
     参数:
         id (int): 漫画 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''漫画类
 
         参数:
             id (int): 漫画 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''漫画 ID'''
         self.__info: Optional['ComicInfo'] = None
         '''漫画信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
 
     # me 参数已移除
     
@@ -82,7 +89,7 @@ class Comic:
         返回:
             ComicInfo: 漫画详细信息
         '''
-        _all = get_all()
+        _all = get_all(session=self.session)
         if str(self.id) not in _all:
             raise NotExistException(f'Comic {self.id}')
         self.__info = _all[str(self.id)]
@@ -100,7 +107,7 @@ class Comic:
         返回:
             ComicInfo: 漫画详细信息
         '''
-        _all = await get_all_async()
+        _all = await get_all_async(session=self.session)
         if str(self.id) not in _all:
             raise NotExistException(f'Comic {self.id}')
         self.__info = _all[str(self.id)]
@@ -180,6 +187,7 @@ class Comic:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取漫画评论
@@ -212,6 +220,7 @@ class Comic:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取漫画缩略图图像
@@ -236,7 +245,8 @@ class Comic:
         return Api(
             ASSETS['comic']['thumbnail'].format(
                 server=server, type=self.__type__, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取漫画缩略图图像
@@ -261,7 +271,8 @@ class Comic:
         return (await Api(
             ASSETS['comic']['thumbnail'].format(
                 server=server, type=self.__type__, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取漫画图像
@@ -286,7 +297,8 @@ class Comic:
         return Api(
             ASSETS['comic']['comic'].format(
                 server=server, type=self.__type__, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取漫画图像
@@ -311,5 +323,78 @@ class Comic:
         return (await Api(
             ASSETS['comic']['comic'].format(
                 server=server, type=self.__type__, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).aget()).content
+    
+    def __asset_url__(self, info: 'ComicInfo', server: 'ServerName') -> str:
+        # 判断服务器并构建漫画图像 URL
+        SERVERS = ['jp', 'en', 'tw', 'cn', 'kr']
+        if info['publicStartAt'][SERVERS.index(server)] is None:
+            raise ServerNotAvailableError(f'Comic {name(self)}', server)
+        return ASSETS['comic']['comic'].format(
+            server=server, type=self.__type__, asset_bundle_name=info['assetBundleName']
+        )
+    
+    # 下载漫画图像
+    def download_asset(self, server: 'ServerName', path: Union[str, Path]) -> int:
+        '''将漫画图像流式下载到文件
+
+        参数:
+            server (Literal[&#39;jp&#39;, &#39;en&#39;, &#39;tw&#39;, &#39;cn&#39;, &#39;kr&#39;]): 指定服务器
+            path (Union[str, Path]): 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        '''
+        info = self.__get_info__()
+        return Api(self.__asset_url__(info, server), session=self.session).download_to(path)
+    
+    # 异步下载漫画图像
+    async def download_asset_async(self, server: 'ServerName', path: Union[str, Path]) -> int:
+        '''将漫画图像流式下载到文件
+
+        参数:
+            server (Literal[&#39;jp&#39;, &#39;en&#39;, &#39;tw&#39;, &#39;cn&#39;, &#39;kr&#39;]): 指定服务器
+            path (Union[str, Path]): 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        '''
+        info = await self.__get_info_async__()
+        return await Api(self.__asset_url__(info, server), session=self.session).adownload_to(path)
+
+# 批量获取漫画信息
+def get_many(ids: Iterable[int], *, session: Optional[Session]=None) -> List[Union['ComicInfo', Exception]]:
+    '''获取多个漫画信息，所有 ID 共用一次总漫画信息请求
+
+    参数:
+        ids (Iterable[int]): 漫画 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[ComicInfo, Exception]]: 与 `ids` 顺序一致的漫画信息，不存在的 ID 对应 `NotExistException`
+    '''
+    return _pick_many(ids, get_all(session=session))
+
+# 异步批量获取漫画信息
+async def get_many_async(ids: Iterable[int], *, session: Optional[Session]=None) -> List[Union['ComicInfo', Exception]]:
+    '''获取多个漫画信息，所有 ID 共用一次总漫画信息请求
+
+    参数:
+        ids (Iterable[int]): 漫画 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[ComicInfo, Exception]]: 与 `ids` 顺序一致的漫画信息，不存在的 ID 对应 `NotExistException`
+    '''
+    return _pick_many(ids, await get_all_async(session=session))
+
+def _pick_many(ids: Iterable[int], _all: 'ComicsAll5') -> List[Union['ComicInfo', Exception]]:
+    result: List[Union['ComicInfo', Exception]] = []
+    for id in ids:
+        if (info := _all.get(str(id), None)) is not None:
+            result.append(info)
+        else:
+            result.append(NotExistException(f'Comic {id}'))
+    return result
@@ -3,11 +3,13 @@
 BanG Dream! 服装相关操作'''
 
 from typing_extensions import overload
-from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Literal, Iterable, Optional
 
 from . import post
 from .utils import get_api
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
+from .utils.batch import gather_many, gather_many_async
 from .exceptions import (
     HTTPStatusError,
     NoDataException,
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
         ServerName,
         CostumeInfo,
         CostumesAll5,
+        CostumesAll5Info,
     )
 
 API = get_api('bestdori.api')
@@ -29,57 +32,61 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总服装信息
 @overload
-def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总服装信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有服装 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'CostumesAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'CostumesAll5':
     '''获取总服装信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CostumesAll5: 所有已有服装的简洁信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[0, 5]=5) -> Union[Dict[str, 'NoneDict'], 'CostumesAll5']:
-    return Api(API['costumes']['all'].format(index=index)).get().json()
+def get_all(index: Literal[0, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'CostumesAll5']:
+    return Api(API['costumes']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总服装信息
 @overload
-async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总服装信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有服装 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'CostumesAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'CostumesAll5':
     '''获取总服装信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         CostumesAll5: 所有已有服装的简洁信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[0, 5]=5) -> Union[Dict[str, 'NoneDict'], 'CostumesAll5']:
-    return (await Api(API['costumes']['all'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[0, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'CostumesAll5']:
+    return (await Api(API['costumes']['all'].format(index=index), session=session).aget()).json()
 
 # 服装类
 class Costume:
@@ -87,18 +94,22 @@ class Costume:
 
     参数:
         id (int): 服装 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''服装类
 
         参数:
             id (int): 服装 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''服装 ID'''
         self.__info: Optional['CostumeInfo'] = None
         '''服装信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     @property
@@ -116,16 +127,21 @@ class Costume:
             CostumeInfo: 服装详细信息
         '''
         try:
-            response = Api(
-                API['costumes']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'costumes',
+                self.id,
+                Api(
+                    API['costumes']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Costume {self.id}') from exception
             else:
                 raise exception
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     def __get_info__(self) -> 'CostumeInfo':
         if self.__info is None:
@@ -140,16 +156,21 @@ class Costume:
             CostumeInfo: 服装详细信息
         '''
         try:
-            response = await Api(
-                API['costumes']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'costumes',
+                self.id,
+                Api(
+                    API['costumes']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Costume {self.id}') from exception
             else:
                 raise exception
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     async def __get_info_async__(self) -> 'CostumeInfo':
         if self.__info is None:
@@ -223,6 +244,7 @@ class Costume:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取服装评论
@@ -255,6 +277,7 @@ class Costume:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取 LIVE 服装图片
@@ -268,7 +291,8 @@ class Costume:
         return Api(
             ASSETS['characters']['livesd'].format(
                 server=self.__server__, sd_resource_name=info['sdResourceName']
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取 LIVE 服装图片
@@ -282,7 +306,8 @@ class Costume:
         return (await Api(
             ASSETS['characters']['livesd'].format(
                 server=self.__server__, sd_resource_name=info['sdResourceName']
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取服装模型数据
@@ -299,7 +324,8 @@ class Costume:
             return Api(
                 ASSETS['live2d']['buildData'].format(
                     server=self.__server__, asset_bundle_name=asset_bundle_name
-                )
+                ),
+                session=self.session,
             ).get().content
         except AssetsNotExistError:
             raise AssetsNotExistError(f'costume build data {asset_bundle_name}-{self.__server__}')
@@ -318,7 +344,8 @@ class Costume:
             return (await Api(
                 ASSETS['live2d']['buildData'].format(
                     server=self.__server__, asset_bundle_name=asset_bundle_name
-                )
+                ),
+                session=self.session,
             ).aget()).content
         except AssetsNotExistError:
             raise AssetsNotExistError(f'costume build data {asset_bundle_name}-{self.__server__}')
@@ -337,7 +364,8 @@ class Costume:
             return Api(
                 ASSETS['thumb']['costume'].format(
                     server=self.__server__, id=self.id // 50, asset_bundle_name=asset_bundle_name
-                )
+                ),
+                session=self.session,
             ).get().content
         except AssetsNotExistError:
             raise AssetsNotExistError(f'costume icon {asset_bundle_name}-{self.__server__}')
@@ -356,7 +384,66 @@ class Costume:
             return (await Api(
                 ASSETS['thumb']['costume'].format(
                     server=self.__server__, id=self.id // 50, asset_bundle_name=asset_bundle_name
-                )
+                ),
+                session=self.session,
             ).aget()).content
         except AssetsNotExistError:
             raise AssetsNotExistError(f'costume icon {asset_bundle_name}-{self.__server__}')
+
+# 批量获取服装信息
+def get_many(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['CostumeInfo', 'CostumesAll5Info', Exception]]:
+    '''并发获取多个服装信息
+
+    参数:
+        ids (Iterable[int]): 服装 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总服装信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[CostumeInfo, CostumesAll5Info, Exception]]: 与 `ids` 顺序一致的服装信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'CostumesAll5Info'] = get_all(5, session=session) if from_all else {}
+    
+    def fetch(id: int) -> Union['CostumeInfo', 'CostumesAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return Costume(id, session=session).get_info()
+    
+    return gather_many(ids, fetch, concurrency)
+
+# 异步批量获取服装信息
+async def get_many_async(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['CostumeInfo', 'CostumesAll5Info', Exception]]:
+    '''并发获取多个服装信息
+
+    参数:
+        ids (Iterable[int]): 服装 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总服装信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[CostumeInfo, CostumesAll5Info, Exception]]: 与 `ids` 顺序一致的服装信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'CostumesAll5Info'] = await get_all_async(5, session=session) if from_all else {}
+    
+    async def fetch(id: int) -> Union['CostumeInfo', 'CostumesAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return await Costume(id, session=session).get_info_async()
+    
+    return await gather_many_async(ids, fetch, concurrency)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Literal, Optional
 from .user import Me  # 类型兼容保留，稍后可整体移除
 from .utils import get_api
 from . import post, eventtop
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import NotExistException
 
 if TYPE_CHECKING:
@@ -21,32 +21,34 @@ if TYPE_CHECKING:
 API = get_api('bestdori.api')
 
 # 获取总活动数据信息
-def get_all(index: Literal[5]=5) -> 'EventArchiveAll5':
+def get_all(index: Literal[5]=5, *, session: Optional[Session]=None) -> 'EventArchiveAll5':
     '''获取总活动信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`
             `5`: 获取所有已有活动数据的简洁信息 `all.5.json`
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         EventArchiveAll5: 获取到的总活动信息
     '''
-    return Api(API['all']['archives'].format(index=index)).get().json()
+    return Api(API['all']['archives'].format(index=index), session=session).get().json()
 
 # 异步获取总活动数据信息
-async def get_all_async(index: Literal[5]=5) -> 'EventArchiveAll5':
+async def get_all_async(index: Literal[5]=5, *, session: Optional[Session]=None) -> 'EventArchiveAll5':
     '''获取总活动信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`
             `5`: 获取所有已有活动数据的简洁信息 `all.5.json`
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         EventArchiveAll5: 获取到的总活动信息
     '''
-    return (await Api(API['all']['archives'].format(index=index)).aget()).json()
+    return (await Api(API['all']['archives'].format(index=index), session=session).aget()).json()
 
 # 活动数据类
 class EventArchive:
@@ -54,18 +56,22 @@ class EventArchive:
 
     参数:
         id (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''活动数据类
 
         参数:
             id (int): 活动 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''活动 ID'''
         self.__info: Optional['EventArchiveInfo'] = None
         '''活动信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
 
     # me 参数已移除
     
@@ -76,7 +82,7 @@ class EventArchive:
         返回:
             EventArchiveInfo: 活动数据信息
         '''
-        _all = get_all()
+        _all = get_all(session=self.session)
         if str(self.id) not in _all:
             raise NotExistException(f'Event archive {self.id}')
         self.__info = _all[str(self.id)]
@@ -89,7 +95,7 @@ class EventArchive:
         返回:
             EventArchiveInfo: 活动数据信息
         '''
-        _all = await get_all_async()
+        _all = await get_all_async(session=self.session)
         if str(self.id) not in _all:
             raise NotExistException(f'Event archive {self.id}')
         self.__info = _all[str(self.id)]
@@ -111,7 +117,7 @@ class EventArchive:
         返回:
             EventTopData: 最终排名分数线数据
         '''
-        return eventtop.get_data(server, self.id, mid, latest=1)
+        return eventtop.get_data(server, self.id, mid, latest=1, session=self.session)
     
     # 异步获取最终排名分数线
     async def get_top_async(self, server: 'Server', mid: int = 0) -> 'EventTopData':
@@ -129,7 +135,7 @@ class EventArchive:
         返回:
             EventTopData: 最终排名分数线数据
         '''
-        return await eventtop.get_data_async(server, self.id, mid, latest=1)
+        return await eventtop.get_data_async(server, self.id, mid, latest=1, session=self.session)
 
     # 获取活动数据评论
     def get_comment(
@@ -161,6 +167,7 @@ class EventArchive:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 异步获取活动数据评论
@@ -193,4 +200,5 @@ class EventArchive:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
@@ -2,12 +2,14 @@
 
 BanG Dream! 活动相关操作'''
 from typing_extensions import overload
-from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Literal, Iterable, Optional
 
 from . import post
 from .user import Me  # 仅用于类型兼容，可后续移除
 from .stamps import Stamp
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
+from .utils.batch import gather_many, gather_many_async
 from .utils import name, get_api
 from .eventtracker import EventTracker
 from .eventarchives import EventArchive
@@ -38,6 +40,7 @@ if TYPE_CHECKING:
         ServerName,
         EventTopData,
         FestivalStage,
+        EventsAll5Info,
         FestivalRotationMusic,
     )
 
@@ -46,11 +49,12 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总活动信息
 @overload
-def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总活动信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -58,11 +62,12 @@ def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
     '''
     ...
 @overload
-def get_all(index: Literal[1]) -> 'EventsAll1':
+def get_all(index: Literal[1], *, session: Optional[Session]=None) -> 'EventsAll1':
     '''获取总活动信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -70,11 +75,12 @@ def get_all(index: Literal[1]) -> 'EventsAll1':
     '''
     ...
 @overload
-def get_all(index: Literal[3]) -> 'EventsAll3':
+def get_all(index: Literal[3], *, session: Optional[Session]=None) -> 'EventsAll3':
     '''获取总活动信息
 
     参数:
         index (Literal[3]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -82,11 +88,12 @@ def get_all(index: Literal[3]) -> 'EventsAll3':
     '''
     ...
 @overload
-def get_all(index: Literal[4]) -> 'EventsAll4':
+def get_all(index: Literal[4], *, session: Optional[Session]=None) -> 'EventsAll4':
     '''获取总活动信息
 
     参数:
         index (Literal[4]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -94,11 +101,12 @@ def get_all(index: Literal[4]) -> 'EventsAll4':
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'EventsAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'EventsAll5':
     '''获取总活动信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -106,11 +114,12 @@ def get_all(index: Literal[5]) -> 'EventsAll5':
     '''
     ...
 @overload
-def get_all(index: Literal[6]) -> 'EventsAll6':
+def get_all(index: Literal[6], *, session: Optional[Session]=None) -> 'EventsAll6':
     '''获取总活动信息
 
     参数:
         index (Literal[6]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -120,16 +129,19 @@ def get_all(index: Literal[6]) -> 'EventsAll6':
 
 def get_all(
     index: Literal[0, 1, 3, 4, 5, 6]=5,
+    *,
+    session: Optional[Session]=None,
 ) -> Union[Dict[str, 'NoneDict'], 'EventsAll1', 'EventsAll3', 'EventsAll4', 'EventsAll5', 'EventsAll6']:
-    return Api(API['events']['all'].format(index=index)).get().json()
+    return Api(API['events']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总活动信息
 @overload
-async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总活动信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -137,11 +149,12 @@ async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
     '''
     ...
 @overload
-async def get_all_async(index: Literal[1]) -> 'EventsAll1':
+async def get_all_async(index: Literal[1], *, session: Optional[Session]=None) -> 'EventsAll1':
     '''获取总活动信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -149,11 +162,12 @@ async def get_all_async(index: Literal[1]) -> 'EventsAll1':
     '''
     ...
 @overload
-async def get_all_async(index: Literal[3]) -> 'EventsAll3':
+async def get_all_async(index: Literal[3], *, session: Optional[Session]=None) -> 'EventsAll3':
     '''获取总活动信息
 
     参数:
         index (Literal[3]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -161,11 +175,12 @@ async def get_all_async(index: Literal[3]) -> 'EventsAll3':
     '''
     ...
 @overload
-async def get_all_async(index: Literal[4]) -> 'EventsAll4':
+async def get_all_async(index: Literal[4], *, session: Optional[Session]=None) -> 'EventsAll4':
     '''获取总活动信息
 
     参数:
         index (Literal[4]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -173,11 +188,12 @@ async def get_all_async(index: Literal[4]) -> 'EventsAll4':
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'EventsAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'EventsAll5':
     '''获取总活动信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -185,11 +201,12 @@ async def get_all_async(index: Literal[5]) -> 'EventsAll5':
     '''
     ...
 @overload
-async def get_all_async(index: Literal[6]) -> 'EventsAll6':
+async def get_all_async(index: Literal[6], *, session: Optional[Session]=None) -> 'EventsAll6':
     '''获取总活动信息
 
     参数:
         index (Literal[6]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         
 
     返回:
@@ -199,8 +216,10 @@ async def get_all_async(index: Literal[6]) -> 'EventsAll6':
 
 async def get_all_async(
     index: Literal[0, 1, 3, 4, 5, 6]=5,
+    *,
+    session: Optional[Session]=None,
 ) -> Union[Dict[str, 'NoneDict'], 'EventsAll1', 'EventsAll3', 'EventsAll4', 'EventsAll5', 'EventsAll6']:
-    return (await Api(API['events']['all'].format(index=index)).aget()).json()
+    return (await Api(API['events']['all'].format(index=index), session=session).aget()).json()
 
 # 活动类
 class Event:
@@ -208,20 +227,24 @@ class Event:
 
     参数:
         id (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''活动类
 
         参数:
             id (int): 活动 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''活动 ID'''
-        self.archive: EventArchive = EventArchive(self.id)
+        self.archive: EventArchive = EventArchive(self.id, session=session)
         '''活动档案'''
         self.__info: Optional['EventInfo'] = None
         '''活动信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
 
     # me 参数已移除
     
@@ -263,7 +286,7 @@ class Event:
         返回:
             EventTracker: 活动追踪器
         '''
-        return EventTracker(server, self.id)
+        return EventTracker(server, self.id, session=self.session)
 
     # 获取活动信息
     def get_info(self) -> 'EventInfo':
@@ -273,17 +296,22 @@ class Event:
             EventInfo: 活动详细信息
         '''
         try:
-            response = Api(
-                API['events']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'events',
+                self.id,
+                Api(
+                    API['events']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Event {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     def __get_info__(self) -> 'EventInfo':
         if not self.__info:
@@ -298,17 +326,22 @@ class Event:
             EventInfo: 活动详细信息
         '''
         try:
-            response = await Api(
-                API['events']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'events',
+                self.id,
+                Api(
+                    API['events']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Event {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     async def __get_info_async__(self) -> 'EventInfo':
         if not self.__info:
@@ -345,6 +378,7 @@ class Event:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取活动评论
@@ -377,6 +411,7 @@ class Event:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取活动缩略图图像
@@ -401,7 +436,8 @@ class Event:
         return Api(
             ASSETS['event']['banner'].format(
                 server=server, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取活动缩略图图像
@@ -426,7 +462,8 @@ class Event:
         return (await Api(
             ASSETS['event']['banner'].format(
                 server=server, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取活动 logo 图像
@@ -451,7 +488,8 @@ class Event:
         return Api(
             ASSETS['event']['logo'].format(
                 server=server, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取活动 logo 图像
@@ -476,7 +514,8 @@ class Event:
         return (await Api(
             ASSETS['event']['logo'].format(
                 server=server, asset_bundle_name=asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).aget()).content
 
     # 获取活动主界面图像
@@ -504,7 +543,8 @@ class Event:
         return Api(
             ASSETS['event']['topscreen'].format(
                 server=server, asset_bundle_name=asset_bundle_name, type=type
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取活动主界面图像
@@ -532,7 +572,8 @@ class Event:
         return (await Api(
             ASSETS['event']['topscreen'].format(
                 server=server, asset_bundle_name=asset_bundle_name, type=type
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取活动奖励稀有表情
@@ -559,7 +600,7 @@ class Event:
         if stamp_id is None:
             raise ValueError(f'Event {self.id} has no stamp reward.')
         # 获取贴纸资源
-        stamp = Stamp(stamp_id)
+        stamp = Stamp(stamp_id, session=self.session)
         return stamp.get_stamp(self.__server__)
     
     # 异步获取活动奖励稀有表情
@@ -586,7 +627,7 @@ class Event:
         if stamp_id is None:
             raise ValueError(f'Event {self.id} has no stamp reward.')
         # 获取贴纸资源
-        stamp = Stamp(stamp_id)
+        stamp = Stamp(stamp_id, session=self.session)
         return await stamp.get_stamp_async(self.__server__)
 
     # 获取最新 T10 排名分数线
@@ -715,7 +756,7 @@ class Event:
         info = self.__get_info__()
         if (event_type := info['eventType']) != 'festival':
             raise ValueError(f'Rotation musics are only available for festival events, not \'{event_type}\'.')
-        return get_rotation_musics(self.id)
+        return get_rotation_musics(self.id, session=self.session)
     
     # 异步获取团队 LIVE 佳节活动歌曲循环数据
     async def get_rotation_musics_async(self) -> List['FestivalRotationMusic']:
@@ -727,7 +768,7 @@ class Event:
         info = await self.__get_info_async__()
         if (event_type := info['eventType']) != 'festival':
             raise ValueError(f'Rotation musics are only available for festival events, not \'{event_type}\'.')
-        return await get_rotation_musics_async(self.id)
+        return await get_rotation_musics_async(self.id, session=self.session)
     
     # 获取团队 LIVE 佳节活动舞台数据
     def get_stages(self) -> List['FestivalStage']:
@@ -739,7 +780,7 @@ class Event:
         info = self.__get_info__()
         if (event_type := info['eventType']) != 'festival':
             raise ValueError(f'Stages are only available for festival events, not \'{event_type}\'.')
-        return get_stages(self.id)
+        return get_stages(self.id, session=self.session)
     
     # 异步获取团队 LIVE 佳节活动舞台数据
     async def get_stages_async(self) -> List['FestivalStage']:
@@ -751,4 +792,62 @@ class Event:
         info = await self.__get_info_async__()
         if (event_type := info['eventType']) != 'festival':
             raise ValueError(f'Stages are only available for festival events, not \'{event_type}\'.')
-        return await get_stages_async(self.id)
+        return await get_stages_async(self.id, session=self.session)
+
+# 批量获取活动信息
+def get_many(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['EventInfo', 'EventsAll5Info', Exception]]:
+    '''并发获取多个活动信息
+
+    参数:
+        ids (Iterable[int]): 活动 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总活动信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[EventInfo, EventsAll5Info, Exception]]: 与 `ids` 顺序一致的活动信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'EventsAll5Info'] = get_all(5, session=session) if from_all else {}
+    
+    def fetch(id: int) -> Union['EventInfo', 'EventsAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return Event(id, session=session).get_info()
+    
+    return gather_many(ids, fetch, concurrency)
+
+# 异步批量获取活动信息
+async def get_many_async(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['EventInfo', 'EventsAll5Info', Exception]]:
+    '''并发获取多个活动信息
+
+    参数:
+        ids (Iterable[int]): 活动 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总活动信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[EventInfo, EventsAll5Info, Exception]]: 与 `ids` 顺序一致的活动信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'EventsAll5Info'] = await get_all_async(5, session=session) if from_all else {}
+    
+    async def fetch(id: int) -> Union['EventInfo', 'EventsAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return await Event(id, session=session).get_info_async()
+    
+    return await gather_many_async(ids, fetch, concurrency)
@@ -6,7 +6,7 @@ from typing_extensions import overload
 from typing import TYPE_CHECKING, Literal, Optional
 
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import HTTPStatusError, NotExistException
 
 if TYPE_CHECKING:
@@ -16,7 +16,7 @@ API = get_api('bestdori.api')
 
 # 获取活动最新 T10 排名分数线
 @overload
-def get_data(server: 'Server', event: int, mid: int = 0, *, interval: int) -> 'EventTopData':
+def get_data(server: 'Server', event: int, mid: int = 0, *, interval: int, session: Optional[Session]=None) -> 'EventTopData':
     '''获取活动最新 T10 排名分数线
 
     参数:
@@ -25,6 +25,7 @@ def get_data(server: 'Server', event: int, mid: int = 0, *, interval: int) -> 'E
         mid (int, optional): 歌曲 ID ，仅在查询歌曲分数排名时为非 `0` 值
         interval (int): 间隔
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         EventTopData: T10 排名数据
@@ -32,7 +33,7 @@ def get_data(server: 'Server', event: int, mid: int = 0, *, interval: int) -> 'E
     ...
 # 获取活动最终 T10 排名分数线
 @overload
-def get_data(server: 'Server', event: int, mid: int = 0, *, latest: Literal[1]) -> 'EventTopData':
+def get_data(server: 'Server', event: int, mid: int = 0, *, latest: Literal[1], session: Optional[Session]=None) -> 'EventTopData':
     '''获取活动最终 T10 排名分数线
 
     参数:
@@ -41,6 +42,7 @@ def get_data(server: 'Server', event: int, mid: int = 0, *, latest: Literal[1])
         mid (int, optional): 歌曲 ID ，仅在查询歌曲分数排名时为非 `0` 值
         latest (Literal[1]): 获取最终排名分数线
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         EventTopData: T10 排名数据
@@ -55,6 +57,7 @@ def get_data(
     *,
     interval: Optional[int] = None,
     latest: Optional[Literal[1]] = None,
+    session: Optional[Session]=None,
 ) -> 'EventTopData':
     params = {
         'server': server,
@@ -67,7 +70,7 @@ def get_data(
         params['latest'] = latest
     
     try:
-        response = Api(API['tracker']['eventtop']).get(
+        response = Api(API['tracker']['eventtop'], session=session).get(
             params=params,
         )
     except HTTPStatusError as exception:
@@ -80,7 +83,7 @@ def get_data(
 
 # 异步获取活动最新 T10 排名分数线
 @overload
-async def get_data_async(server: 'Server', event: int, mid: int = 0, *, interval: int) -> 'EventTopData':
+async def get_data_async(server: 'Server', event: int, mid: int = 0, *, interval: int, session: Optional[Session]=None) -> 'EventTopData':
     '''异步获取活动最新 T10 排名分数线
 
     参数:
@@ -89,6 +92,7 @@ async def get_data_async(server: 'Server', event: int, mid: int = 0, *, interval
         mid (int, optional): 歌曲 ID ，仅在查询歌曲分数排名时为非 `0` 值
         interval (int): 间隔
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         EventTopData: T10 排名数据
@@ -96,7 +100,7 @@ async def get_data_async(server: 'Server', event: int, mid: int = 0, *, interval
     ...
 # 异步获取活动最终 T10 排名分数线
 @overload
-async def get_data_async(server: 'Server', event: int, mid: int = 0, *, latest: Literal[1]) -> 'EventTopData':
+async def get_data_async(server: 'Server', event: int, mid: int = 0, *, latest: Literal[1], session: Optional[Session]=None) -> 'EventTopData':
     '''异步获取活动最终 T10 排名分数线
 
     参数:
@@ -105,6 +109,7 @@ async def get_data_async(server: 'Server', event: int, mid: int = 0, *, latest:
         mid (int, optional): 歌曲 ID ，仅在查询歌曲分数排名时为非 `0` 值
         latest (Literal[1]): 获取最终排名分数线
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         EventTopData: T10 排名数据
@@ -119,6 +124,7 @@ async def get_data_async(
     *,
     interval: Optional[int] = None,
     latest: Optional[Literal[1]] = None,
+    session: Optional[Session]=None,
 ) -> 'EventTopData':
     params = {
         'server': server,
@@ -131,7 +137,7 @@ async def get_data_async(
         params['latest'] = latest
     
     try:
-        response = await Api(API['tracker']['eventtop']).aget(
+        response = await Api(API['tracker']['eventtop'], session=session).aget(
             params=params,
         )
     except HTTPStatusError as exception:
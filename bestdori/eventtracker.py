@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, List, Literal, Optional
 
 from .utils import get_api
 from . import post, eventtop
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import HTTPStatusError, NotExistException
 
 if TYPE_CHECKING:
@@ -20,22 +20,22 @@ if TYPE_CHECKING:
 API = get_api('bestdori.api')
 
 # 获取活动追踪比率列表
-def get_rates() -> List['EventTrackerRate']:
+def get_rates(*, session: Optional[Session]=None) -> List['EventTrackerRate']:
     '''获取活动追踪比率列表
 
     返回:
         List[EventTrackerRate]: 活动追踪比率列表
     '''
-    return Api(API['tracker']['rates']).get().json()
+    return Api(API['tracker']['rates'], session=session).get().json()
 
 # 异步获取活动追踪比率列表
-async def get_rates_async() -> List['EventTrackerRate']:
+async def get_rates_async(*, session: Optional[Session]=None) -> List['EventTrackerRate']:
     '''异步获取活动追踪比率列表
 
     返回:
         List[EventTrackerRate]: 活动追踪比率列表
     '''
-    return (await Api(API['tracker']['rates']).aget()).json()
+    return (await Api(API['tracker']['rates'], session=session).aget()).json()
 
 # 活动排名追踪器类
 class EventTracker:
@@ -44,20 +44,24 @@ class EventTracker:
     参数:
         server (Server): 指定服务器
         event (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, server: 'Server', event: int) -> None:
+    def __init__(self, server: 'Server', event: int, *, session: Optional[Session]=None) -> None:
         '''活动排名追踪器类
 
         参数:
             server (Server): 指定服务器
             event (int): 活动 ID
             me (Optional[Me], optional): 用户验证信息
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.server: 'Server' = server
         '''指定服务器'''
         self.event: int = event
         '''活动 ID'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     # 获取 T10 实时排名追踪信息
@@ -76,6 +80,7 @@ class EventTracker:
             event=self.event,
             mid=mid,
             interval=interval,
+            session=self.session,
         )
     
     # 异步获取 T10 实时排名追踪信息
@@ -94,6 +99,7 @@ class EventTracker:
             event=self.event,
             mid=mid,
             interval=interval,
+            session=self.session,
         )
 
     # 获取分数线追踪信息
@@ -113,7 +119,7 @@ class EventTracker:
         }
         
         try:
-            response = Api(API['tracker']['eventtracker']).get(
+            response = Api(API['tracker']['eventtracker'], session=self.session).get(
                 params=params,
             )
         except HTTPStatusError as exception:
@@ -141,7 +147,7 @@ class EventTracker:
         }
         
         try:
-            response = await Api(API['tracker']['eventtracker']).aget(
+            response = await Api(API['tracker']['eventtracker'], session=self.session).aget(
                 params=params,
             )
         except HTTPStatusError as exception:
@@ -182,6 +188,7 @@ class EventTracker:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 异步获取活动排名追踪评论
@@ -214,4 +221,5 @@ class EventTracker:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
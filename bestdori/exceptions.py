@@ -225,6 +225,17 @@ class SettingsException(BestdoriException):
         '''错误信息'''
         return
 
+# 回放记录不存在
+class ReplayMissError(BestdoriException):
+    '''回放模式下请求没有对应的录制记录'''
+    # 初始化
+    def __init__(self, key: str) -> None:
+        msg = f'No recorded response for \'{key}\' in replay mode.'
+        super().__init__(msg)
+        self.key = key
+        '''请求的录制键'''
+        return
+
 # 请求错误集合
 REQUEST_EXCEPTION: Dict[str, Type[RequestException]] = {
     'REQUEST_INVALID': RequestInvalidError,
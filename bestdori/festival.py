@@ -2,10 +2,10 @@
 
 包括舞台数据、活动歌曲数据'''
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import (
@@ -16,49 +16,53 @@ if TYPE_CHECKING:
 API = get_api('bestdori.api')
 
 # 获取歌曲循环数据
-def get_rotation_musics(id: int) -> List['FestivalRotationMusic']:
+def get_rotation_musics(id: int, *, session: Optional[Session]=None) -> List['FestivalRotationMusic']:
     '''获取歌曲循环数据
 
     参数:
         id (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         List[FestivalRotationMusic]: 歌曲循环数据
     '''
-    return Api(API['festival']['rotation_musics'].format(id=id)).get().json()
+    return Api(API['festival']['rotation_musics'].format(id=id), session=session).get().json()
 
 # 异步获取歌曲循环数据
-async def get_rotation_musics_async(id: int) -> List['FestivalRotationMusic']:
+async def get_rotation_musics_async(id: int, *, session: Optional[Session]=None) -> List['FestivalRotationMusic']:
     '''获取歌曲循环数据
 
     参数:
         id (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         List[FestivalRotationMusic]: 歌曲循环数据
     '''
-    return (await Api(API['festival']['rotation_musics'].format(id=id)).aget()).json()
+    return (await Api(API['festival']['rotation_musics'].format(id=id), session=session).aget()).json()
 
 # 获取舞台数据
-def get_stages(id: int) -> List['FestivalStage']:
+def get_stages(id: int, *, session: Optional[Session]=None) -> List['FestivalStage']:
     '''获取舞台数据
 
     参数:
         id (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         List[FestivalStage]: 舞台数据
     '''
-    return Api(API['festival']['stages'].format(id=id)).get().json()
+    return Api(API['festival']['stages'].format(id=id), session=session).get().json()
 
 # 异步获取舞台数据
-async def get_stages_async(id: int) -> List['FestivalStage']:
+async def get_stages_async(id: int, *, session: Optional[Session]=None) -> List['FestivalStage']:
     '''获取舞台数据
 
     参数:
         id (int): 活动 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         List[FestivalStage]: 舞台数据
     '''
-    return (await Api(API['festival']['stages'].format(id=id)).aget()).json()
+    return (await Api(API['festival']['stages'].format(id=id), session=session).aget()).json()
@@ -3,11 +3,13 @@
 BanG Dream! 招募相关操作'''
 import asyncio
 from typing_extensions import overload
-from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Literal, Iterable, Optional
 
 from . import post
 from .user import Me  # Me 引用保留仅用于类型检查（可后续移除）
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
+from .utils.batch import gather_many, gather_many_async
 from .utils import name, get_api
 from .exceptions import (
     NoDataException,
@@ -26,6 +28,7 @@ if TYPE_CHECKING:
         GachaAll5,
         GachaInfo,
         ServerName,
+        GachaAll5Info,
     )
 
 API = get_api('bestdori.api')
@@ -33,101 +36,109 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总招募信息
 @overload
-def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总招募信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有招募 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[1]) -> 'GachaAll1':
+def get_all(index: Literal[1], *, session: Optional[Session]=None) -> 'GachaAll1':
     '''获取总招募信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         GachaAll1: 所有已有招募的简洁信息 `all.1.json`
     '''
     ...
 @overload
-def get_all(index: Literal[3]) -> 'GachaAll3':
+def get_all(index: Literal[3], *, session: Optional[Session]=None) -> 'GachaAll3':
     '''获取总招募信息
 
     参数:
         index (Literal[3]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         GachaAll3: 所有已有招募的较详细信息 `all.3.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'GachaAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'GachaAll5':
     '''获取总招募信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         GachaAll5: 所有已有招募的详细信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[0, 1, 3, 5]=5) -> Union[Dict[str, 'NoneDict'], 'GachaAll1', 'GachaAll3', 'GachaAll5']:
-    return Api(API['gacha']['all'].format(index=index)).get().json()
+def get_all(index: Literal[0, 1, 3, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'GachaAll1', 'GachaAll3', 'GachaAll5']:
+    return Api(API['gacha']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总招募信息
 @overload
-async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总招募信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 所有已有招募 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[1]) -> 'GachaAll1':
+async def get_all_async(index: Literal[1], *, session: Optional[Session]=None) -> 'GachaAll1':
     '''获取总招募信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         GachaAll1: 所有已有招募的简洁信息 `all.1.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[3]) -> 'GachaAll3':
+async def get_all_async(index: Literal[3], *, session: Optional[Session]=None) -> 'GachaAll3':
     '''获取总招募信息
 
     参数:
         index (Literal[3]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         GachaAll3: 所有已有招募的较详细信息 `all.3.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'GachaAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'GachaAll5':
     '''获取总招募信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         GachaAll5: 所有已有招募的详细信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[0, 1, 3, 5]=5) -> Union[Dict[str, 'NoneDict'], 'GachaAll1', 'GachaAll3', 'GachaAll5']:
-    return (await Api(API['gacha']['all'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[0, 1, 3, 5]=5, *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'GachaAll1', 'GachaAll3', 'GachaAll5']:
+    return (await Api(API['gacha']['all'].format(index=index), session=session).aget()).json()
 
 # 招募类
 class Gacha:
@@ -135,18 +146,22 @@ class Gacha:
 
     参数:
         id (int): 招募 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''招募类
 
         参数:
             id (int): 招募 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''招募 ID'''
         self.__info: Optional['GachaInfo'] = None
         '''招募信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
 
     # me 参数已移除
     
@@ -186,17 +201,22 @@ class Gacha:
             GachaInfo: 招募详细信息
         '''
         try:
-            response = Api(
-                API['gacha']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'gacha',
+                self.id,
+                Api(
+                    API['gacha']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Gacha {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     def __get_info__(self) -> 'GachaInfo':
         if not self.__info:
@@ -211,17 +231,22 @@ class Gacha:
             GachaInfo: 招募详细信息
         '''
         try:
-            response = await Api(
-                API['gacha']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'gacha',
+                self.id,
+                Api(
+                    API['gacha']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Gacha {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     async def __get_info_async__(self) -> 'GachaInfo':
         if not self.__info:
@@ -258,6 +283,7 @@ class Gacha:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取招募评论
@@ -290,6 +316,7 @@ class Gacha:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取招募缩略图图片
@@ -315,7 +342,8 @@ class Gacha:
         return Api(
             ASSETS['homebanner']['get'].format(
                 server=server, banner_asset_bundle_name=banner_asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取招募缩略图图片
@@ -341,7 +369,8 @@ class Gacha:
         return (await Api(
             ASSETS['homebanner']['get'].format(
                 server=server, banner_asset_bundle_name=banner_asset_bundle_name
-            )
+            ),
+            session=self.session,
         ).aget()).content
     
     # 获取招募 pickup 图像
@@ -363,7 +392,8 @@ class Gacha:
                     Api(
                         ASSETS['gacha']['screen'].format(
                             server=server, id=self.id, asset_name=pickup,
-                        )
+                        ),
+                        session=self.session,
                     ).get().content
                 )
             except:
@@ -391,7 +421,8 @@ class Gacha:
                 return (await Api(
                     ASSETS['gacha']['screen'].format(
                     server=server, id=self.id, asset_name=pickup,
-                    )
+                    ),
+                    session=self.session,
                 ).aget()).content
             except:
                 return None
@@ -418,7 +449,8 @@ class Gacha:
             return Api(
                 ASSETS['gacha']['screen'].format(
                     server=server, id=self.id, asset_name='logo',
-                )
+                ),
+                session=self.session,
             ).get().content
         except:
             raise AssetsNotExistError('gacha logo')
@@ -437,7 +469,66 @@ class Gacha:
             return (await Api(
                 ASSETS['gacha']['screen'].format(
                     server=server, id=self.id, asset_name='logo',
-                )
+                ),
+                session=self.session,
             ).aget()).content
         except:
             raise AssetsNotExistError('gacha logo')
+
+# 批量获取招募信息
+def get_many(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['GachaInfo', 'GachaAll5Info', Exception]]:
+    '''并发获取多个招募信息
+
+    参数:
+        ids (Iterable[int]): 招募 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总招募信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[GachaInfo, GachaAll5Info, Exception]]: 与 `ids` 顺序一致的招募信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'GachaAll5Info'] = get_all(5, session=session) if from_all else {}
+    
+    def fetch(id: int) -> Union['GachaInfo', 'GachaAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return Gacha(id, session=session).get_info()
+    
+    return gather_many(ids, fetch, concurrency)
+
+# 异步批量获取招募信息
+async def get_many_async(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['GachaInfo', 'GachaAll5Info', Exception]]:
+    '''并发获取多个招募信息
+
+    参数:
+        ids (Iterable[int]): 招募 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总招募信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[GachaInfo, GachaAll5Info, Exception]]: 与 `ids` 顺序一致的招募信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'GachaAll5Info'] = await get_all_async(5, session=session) if from_all else {}
+    
+    async def fetch(id: int) -> Union['GachaInfo', 'GachaAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return await Gacha(id, session=session).get_info_async()
+    
+    return await gather_many_async(ids, fetch, concurrency)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Optional
 
 from .user import Me
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import ServerName
@@ -14,32 +14,34 @@ if TYPE_CHECKING:
 RES = get_api('bestdori.res')
 
 # 获取乐队图标
-def get_band(id: int, *, me: Optional[Me] = None) -> bytes:
+def get_band(id: int, *, me: Optional[Me] = None, session: Optional[Session]=None) -> bytes:
     '''获取乐队图标
 
     参数:
         id (int): 乐队 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 乐队图标字节数据
     '''
     # 统一使用全局 Cookies，不再读取 me
-    return Api(RES['icon']['svg'].format(name=f'band_{id}')).get().content
+    return Api(RES['icon']['svg'].format(name=f'band_{id}'), session=session).get().content
 
 # 异步获取乐队图标
-async def get_band_async(id: int, *, me: Optional[Me] = None) -> bytes:
+async def get_band_async(id: int, *, me: Optional[Me] = None, session: Optional[Session]=None) -> bytes:
     '''获取乐队图标
 
     参数:
         id (int): 乐队 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 乐队图标字节数据
     '''
-    return (await Api(RES['icon']['svg'].format(name=f'band_{id}')).aget()).content
+    return (await Api(RES['icon']['svg'].format(name=f'band_{id}'), session=session).aget()).content
 
 # 获取服务器图标
-def get_server(server: 'ServerName', *, me: Optional[Me] = None) -> bytes:
+def get_server(server: 'ServerName', *, me: Optional[Me] = None, session: Optional[Session]=None) -> bytes:
     '''获取服务器图标
 
     参数:
@@ -49,14 +51,15 @@ def get_server(server: 'ServerName', *, me: Optional[Me] = None) -> bytes:
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 服务器图标字节数据
     '''
-    return Api(RES['icon']['svg'].format(name=server)).get().content
+    return Api(RES['icon']['svg'].format(name=server), session=session).get().content
 
 # 异步获取服务器图标
-async def get_server_async(server: 'ServerName', *, me: Optional[Me] = None) -> bytes:
+async def get_server_async(server: 'ServerName', *, me: Optional[Me] = None, session: Optional[Session]=None) -> bytes:
     '''获取服务器图标
 
     参数:
@@ -66,8 +69,9 @@ async def get_server_async(server: 'ServerName', *, me: Optional[Me] = None) ->
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 服务器图标字节数据
     '''
-    return (await Api(RES['icon']['svg'].format(name=server)).aget()).content
+    return (await Api(RES['icon']['svg'].format(name=server), session=session).aget()).content
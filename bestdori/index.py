@@ -0,0 +1,556 @@
+'''`bestdori.index`
+
+主数据列式索引模块
+
+将 `all.N.json` 总信息按字段存储为连续的数值数组，并按需建立二级索引，
+筛选、排序与取前 K 项均无需逐个遍历字典：
+```python
+from bestdori import index
+
+cards = index.load('cards')
+ids = cards.where(characterId=1, rarity=[4, 5]).sort('releasedAt.jp', descending=True).ids()
+latest = cards.where('releasedAt.cn', '>=', datetime(2024, 1, 1)).top_k('releasedAt.cn', 10).rows()
+```
+'''
+
+import heapq
+from array import array
+from datetime import datetime
+from importlib import import_module
+from bisect import bisect_left, bisect_right
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Literal,
+    Mapping,
+    Iterator,
+    Optional,
+    Sequence,
+    FrozenSet,
+    NamedTuple,
+)
+
+if TYPE_CHECKING:
+    from .utils.network import Session
+
+SERVERS: Tuple[str, ...] = ('jp', 'en', 'tw', 'cn', 'kr')
+'''服务器名称，按 `PerServer` 五元组中的顺序排列'''
+
+_MISSING = float('nan')
+
+# 字段定义
+class Field(NamedTuple):
+    '''索引字段定义
+
+    参数:
+        path (Tuple[str, ...]): 字段在单条信息中的路径
+        kind (Literal['int', 'float', 'str', 'time']): 字段类型，`time` 为毫秒时间戳字符串
+        per_server (bool, optional): 是否为服务器相关的五元组，为 `True` 时将展开为
+            `<名称>.jp`、`<名称>.en` 等五列
+    '''
+    path: Tuple[str, ...]
+    kind: Literal['int', 'float', 'str', 'time']
+    per_server: bool = False
+
+# 列
+class Column:
+    '''索引中的一列，所有值均以 `float` 存储，缺失值为 `nan`，字符串值存储为类别编号
+
+    参数:
+        name (str): 列名
+        kind (Literal['int', 'float', 'str', 'time']): 列类型
+        values (array): 列数据
+        categories (Optional[List[str]], optional): 字符串列的类别
+    '''
+
+    def __init__(
+        self,
+        name: str,
+        kind: Literal['int', 'float', 'str', 'time'],
+        values: array,
+        categories: Optional[List[str]]=None,
+    ) -> None:
+        self.name = name
+        '''列名'''
+        self.kind = kind
+        '''列类型'''
+        self.values = values
+        '''列数据'''
+        self.categories = categories
+        '''字符串列的类别'''
+        self._codes = {category: float(code) for code, category in enumerate(categories or [])}
+        self._buckets: Optional[Dict[float, FrozenSet[int]]] = None
+        self._order: Optional[array] = None
+        self._sorted: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def decode(self, value: float) -> Any:
+        '''将存储的值转换为原始值
+
+        参数:
+            value (float): 存储的值
+
+        返回:
+            Any: 原始值，缺失时为 `None`
+        '''
+        if value != value:
+            return None
+        if self.categories is not None:
+            return self.categories[int(value)]
+        if self.kind in ('int', 'time'):
+            return int(value)
+        return value
+
+    def encode(self, value: Any) -> Optional[float]:
+        '''将查询值转换为存储的值
+
+        参数:
+            value (Any): 查询值，`time` 列可使用 `datetime` 或毫秒时间戳
+
+        返回:
+            Optional[float]: 存储的值，字符串列中不存在该值时为 `None`
+        '''
+        if self.categories is not None:
+            return self._codes.get(value, None)
+        if isinstance(value, datetime):
+            return value.timestamp() * 1000
+        return float(value)
+
+    def __getitem__(self, position: int) -> Any:
+        return self.decode(self.values[position])
+
+    @property
+    def buckets(self) -> Dict[float, FrozenSet[int]]:
+        '''哈希索引，存储的值到行号集合的映射'''
+        if self._buckets is None:
+            buckets: Dict[float, List[int]] = {}
+            for position, value in enumerate(self.values):
+                if value == value:
+                    buckets.setdefault(value, []).append(position)
+            self._buckets = {value: frozenset(positions) for value, positions in buckets.items()}
+        return self._buckets
+
+    @property
+    def order(self) -> array:
+        '''排序索引，按值升序排列的非缺失行号'''
+        if self._order is None:
+            values = self.values
+            order = sorted((p for p in range(len(values)) if values[p] == values[p]), key=values.__getitem__)
+            self._sorted = array('d', (values[p] for p in order))
+            self._order = array('l', order)
+        return self._order
+
+    def equal(self, value: Any) -> FrozenSet[int]:
+        '''获取值等于 `value` 的行号
+
+        参数:
+            value (Any): 查询值
+
+        返回:
+            FrozenSet[int]: 行号集合
+        '''
+        key = self.encode(value)
+        if key is None:
+            return frozenset()
+        return self.buckets.get(key, frozenset())
+
+    def range(
+        self,
+        low: Optional[Any]=None,
+        high: Optional[Any]=None,
+        *,
+        include_low: bool=True,
+        include_high: bool=True,
+    ) -> Sequence[int]:
+        '''获取值在区间内的行号，按值升序排列
+
+        参数:
+            low (Optional[Any], optional): 下界，为 `None` 时不限制
+            high (Optional[Any], optional): 上界，为 `None` 时不限制
+            include_low (bool, optional): 是否包含下界
+            include_high (bool, optional): 是否包含上界
+
+        返回:
+            Sequence[int]: 行号
+        '''
+        if self.categories is not None:
+            raise TypeError(f'Column \'{self.name}\' does not support range queries')
+        order = self.order
+        assert self._sorted is not None
+        start, stop = 0, len(order)
+        if low is not None:
+            key = self.encode(low)
+            start = (bisect_left if include_low else bisect_right)(self._sorted, key)
+        if high is not None:
+            key = self.encode(high)
+            stop = (bisect_right if include_high else bisect_left)(self._sorted, key)
+        return order[start:stop]
+
+def _get(info: Any, path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if isinstance(info, dict):
+            info = info.get(key, None)
+        elif isinstance(info, (list, tuple)) and key.isdigit() and int(key) < len(info):
+            info = info[int(key)]
+        else:
+            return None
+    return info
+
+def _number(value: Any) -> float:
+    if value is None or isinstance(value, (dict, list)):
+        return _MISSING
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _MISSING
+
+# 列式索引
+class Index:
+    '''主数据列式索引
+
+    参数:
+        data (Mapping[str, Mapping[str, Any]]): 以 ID 为键的总信息，如 `cards.get_all(5)` 的返回值
+        fields (Mapping[str, Field]): 需要建立索引的字段，键为列名
+    '''
+
+    def __init__(self, data: Mapping[str, Mapping[str, Any]], fields: Mapping[str, Field]) -> None:
+        keys = sorted(data, key=lambda id: (not id.isdigit(), int(id) if id.isdigit() else 0, id))
+        self.data = data
+        '''原始总信息'''
+        self.keys: List[str] = keys
+        '''各行对应的 ID'''
+        self.columns: Dict[str, Column] = {}
+        '''各列'''
+
+        infos = [data[key] for key in keys]
+        for name, field in fields.items():
+            if field.per_server:
+                for server_index, server in enumerate(SERVERS):
+                    path = field.path + (str(server_index),)
+                    self.columns[f'{name}.{server}'] = self._build(f'{name}.{server}', field.kind, path, infos)
+            else:
+                self.columns[name] = self._build(name, field.kind, field.path, infos)
+
+    @staticmethod
+    def _build(
+        name: str,
+        kind: Literal['int', 'float', 'str', 'time'],
+        path: Tuple[str, ...],
+        infos: List[Mapping[str, Any]],
+    ) -> Column:
+        if kind != 'str':
+            return Column(name, kind, array('d', (_number(_get(info, path)) for info in infos)))
+        categories: List[str] = []
+        codes: Dict[str, float] = {}
+        values = array('d')
+        for info in infos:
+            value = _get(info, path)
+            if value is None:
+                values.append(_MISSING)
+                continue
+            if (code := codes.get(value, None)) is None:
+                code = codes[value] = float(len(categories))
+                categories.append(value)
+            values.append(code)
+        return Column(name, kind, values, categories)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.all())
+
+    def column(self, name: str) -> Column:
+        '''获取列
+
+        参数:
+            name (str): 列名
+
+        返回:
+            Column: 列
+        '''
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KeyError(f'Unknown column \'{name}\', available: {list(self.columns)}') from None
+
+    def all(self) -> 'Query':
+        '''获取包含所有行的查询'''
+        return Query(self)
+
+    def where(self, column: Optional[str]=None, op: str='==', value: Any=None, **equals: Any) -> 'Query':
+        '''筛选行，参见 `Query.where`'''
+        return Query(self).where(column, op, value, **equals)
+
+    def sort(self, column: str, *, descending: bool=False) -> 'Query':
+        '''排序，参见 `Query.sort`'''
+        return Query(self).sort(column, descending=descending)
+
+    def top_k(self, column: str, k: int, *, largest: bool=True) -> 'Query':
+        '''取前 K 项，参见 `Query.top_k`'''
+        return Query(self).top_k(column, k, largest=largest)
+
+# 查询
+class Query:
+    '''索引查询，所有方法均返回新的查询而不修改自身
+
+    参数:
+        index (Index): 索引
+        positions (Optional[FrozenSet[int]], optional): 筛选出的行号，为 `None` 时表示所有行
+        order (Optional[Sequence[int]], optional): 排序后的行号
+    '''
+
+    def __init__(
+        self,
+        index: Index,
+        positions: Optional[FrozenSet[int]]=None,
+        order: Optional[Sequence[int]]=None,
+    ) -> None:
+        self.index = index
+        '''索引'''
+        self._positions = positions
+        self._order = order
+
+    def _filter(self, positions: FrozenSet[int]) -> 'Query':
+        if self._positions is not None:
+            positions = self._positions & positions
+        order = None
+        if self._order is not None:
+            order = [position for position in self._order if position in positions]
+        return Query(self.index, positions, order)
+
+    def where(self, column: Optional[str]=None, op: str='==', value: Any=None, **equals: Any) -> 'Query':
+        '''筛选行
+
+        可使用关键字参数进行相等筛选，值为列表、元组或集合时匹配其中任意一个值；
+        列名包含 `.` 或需要比较时使用 `where(列名, 运算符, 值)`，
+        运算符可为 `==`、`!=`、`<`、`<=`、`>`、`>=`、`in` 或 `between`（值为闭区间 `(下界, 上界)`）。
+        缺失值不满足任何条件。
+
+        参数:
+            column (Optional[str], optional): 列名
+            op (str, optional): 运算符
+            value (Any, optional): 比较值
+            **equals (Any): 列名与值
+
+        返回:
+            Query: 新的查询
+        '''
+        query = self
+        if column is not None:
+            query = query._filter(self._match(self.index.column(column), op, value))
+        for name, _value in equals.items():
+            op = 'in' if isinstance(_value, (list, tuple, set, frozenset)) else '=='
+            query = query._filter(self._match(self.index.column(name), op, _value))
+        return query
+
+    @staticmethod
+    def _match(column: Column, op: str, value: Any) -> FrozenSet[int]:
+        if op == '==':
+            return column.equal(value)
+        if op == 'in':
+            return frozenset().union(*(column.equal(_value) for _value in value))
+        if op == '!=':
+            excluded = column.equal(value)
+            return frozenset().union(*(
+                positions for positions in column.buckets.values() if positions is not excluded
+            ))
+        if op == '<':
+            return frozenset(column.range(high=value, include_high=False))
+        if op == '<=':
+            return frozenset(column.range(high=value))
+        if op == '>':
+            return frozenset(column.range(low=value, include_low=False))
+        if op == '>=':
+            return frozenset(column.range(low=value))
+        if op == 'between':
+            return frozenset(column.range(value[0], value[1]))
+        raise ValueError(f'Unsupported operator \'{op}\'')
+
+    def _current(self) -> Sequence[int]:
+        if self._order is not None:
+            return self._order
+        if self._positions is not None:
+            return sorted(self._positions)
+        return range(len(self.index))
+
+    def sort(self, column: str, *, descending: bool=False) -> 'Query':
+        '''按列排序，缺失值排在最后
+
+        排序是稳定的，多次排序时以最后一次排序的列为主要顺序
+
+        参数:
+            column (str): 列名
+            descending (bool, optional): 是否降序
+
+        返回:
+            Query: 新的查询
+        '''
+        _column = self.index.column(column)
+        values = _column.values
+        current = self._current()
+        if self._order is None and self._positions is None:
+            # 未筛选时直接使用排序索引
+            present: List[int] = list(_column.order)
+            if descending:
+                present.sort(key=values.__getitem__, reverse=True)
+        else:
+            present = [position for position in current if values[position] == values[position]]
+            present.sort(key=values.__getitem__, reverse=descending)
+        missing = [position for position in current if values[position] != values[position]]
+        return Query(self.index, self._positions, present + missing)
+
+    def top_k(self, column: str, k: int, *, largest: bool=True) -> 'Query':
+        '''取列值最大（或最小）的前 K 行，结果按该列排序，缺失值不参与
+
+        参数:
+            column (str): 列名
+            k (int): 数量
+            largest (bool, optional): 是否取最大值，为 `False` 时取最小值
+
+        返回:
+            Query: 新的查询
+        '''
+        _column = self.index.column(column)
+        values = _column.values
+        if self._order is None and self._positions is None:
+            # 未筛选时直接截取排序索引
+            order = _column.order
+            result = list(order[max(len(order) - k, 0):] if largest else order[:k]) if k > 0 else []
+            result.sort(key=values.__getitem__, reverse=largest)
+        else:
+            present = [position for position in self._current() if values[position] == values[position]]
+            select = heapq.nlargest if largest else heapq.nsmallest
+            result = select(k, present, key=values.__getitem__)
+        return Query(self.index, frozenset(result), result)
+
+    def limit(self, n: int) -> 'Query':
+        '''只保留前 `n` 行
+
+        参数:
+            n (int): 行数
+
+        返回:
+            Query: 新的查询
+        '''
+        order = list(self._current())[:n]
+        return Query(self.index, frozenset(order), order)
+
+    def __len__(self) -> int:
+        if self._positions is not None:
+            return len(self._positions)
+        return len(self.index)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids())
+
+    def ids(self) -> List[int]:
+        '''获取结果的 ID
+
+        返回:
+            List[int]: ID 列表
+        '''
+        keys = self.index.keys
+        return [int(keys[position]) for position in self._current()]
+
+    def rows(self) -> List[Mapping[str, Any]]:
+        '''获取结果的原始信息
+
+        返回:
+            List[Mapping[str, Any]]: 原始信息列表
+        '''
+        keys, data = self.index.keys, self.index.data
+        return [data[keys[position]] for position in self._current()]
+
+    def values(self, column: str) -> List[Any]:
+        '''获取结果在某一列上的值
+
+        参数:
+            column (str): 列名
+
+        返回:
+            List[Any]: 值列表，缺失值为 `None`
+        '''
+        _column = self.index.column(column)
+        return [_column[position] for position in self._current()]
+
+    def first(self) -> Optional[int]:
+        '''获取第一个结果的 ID
+
+        返回:
+            Optional[int]: ID，无结果时为 `None`
+        '''
+        current = self._current()
+        return int(self.index.keys[current[0]]) if len(current) else None
+
+SPECS: Dict[str, Tuple[int, Dict[str, Field]]] = {
+    'cards': (5, {
+        'characterId': Field(('characterId',), 'int'),
+        'attribute': Field(('attribute',), 'str'),
+        'rarity': Field(('rarity',), 'int'),
+        'type': Field(('type',), 'str'),
+        'skillId': Field(('skillId',), 'int'),
+        'releasedAt': Field(('releasedAt',), 'time', True),
+    }),
+    'songs': (7, {
+        'bandId': Field(('bandId',), 'int'),
+        'tag': Field(('tag',), 'str'),
+        'length': Field(('length',), 'float'),
+        'publishedAt': Field(('publishedAt',), 'time', True),
+        'closedAt': Field(('closedAt',), 'time', True),
+        **{
+            f'playLevel.{name}': Field(('difficulty', str(difficulty), 'playLevel'), 'int')
+            for difficulty, name in enumerate(('easy', 'normal', 'hard', 'expert', 'special'))
+        },
+        **{
+            f'notes.{name}': Field(('notes', str(difficulty)), 'int')
+            for difficulty, name in enumerate(('easy', 'normal', 'hard', 'expert', 'special'))
+        },
+    }),
+    'events': (5, {
+        'eventType': Field(('eventType',), 'str'),
+        'startAt': Field(('startAt',), 'time', True),
+        'endAt': Field(('endAt',), 'time', True),
+    }),
+    'gacha': (5, {
+        'type': Field(('type',), 'str'),
+        'publishedAt': Field(('publishedAt',), 'time', True),
+        'closedAt': Field(('closedAt',), 'time', True),
+    }),
+}
+'''预置的索引定义，键为模块名称，值为使用的 `all.N.json` 与索引字段'''
+
+# 获取并建立索引
+def load(kind: Literal['cards', 'songs', 'events', 'gacha'], *, session: Optional['Session']=None) -> Index:
+    '''获取总信息并建立列式索引
+
+    参数:
+        kind (Literal['cards', 'songs', 'events', 'gacha']): 信息类型，索引字段见 `SPECS`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        Index: 列式索引
+    '''
+    index, fields = SPECS[kind]
+    module = import_module(f'bestdori.{kind}')
+    return Index(module.get_all(index, session=session), fields)
+
+# 异步获取并建立索引
+async def load_async(kind: Literal['cards', 'songs', 'events', 'gacha'], *, session: Optional['Session']=None) -> Index:
+    '''获取总信息并建立列式索引
+
+    参数:
+        kind (Literal['cards', 'songs', 'events', 'gacha']): 信息类型，索引字段见 `SPECS`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        Index: 列式索引
+    '''
+    index, fields = SPECS[kind]
+    module = import_module(f'bestdori.{kind}')
+    return Index(await module.get_all_async(index, session=session), fields)
@@ -3,11 +3,13 @@
 BanG Dream! 登录奖励相关操作'''
 
 from typing_extensions import overload
-from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Literal, Iterable, Optional
 
 from . import post
 from .user import Me  # 保留以兼容类型，稍后可移除
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
+from .utils.batch import gather_many, gather_many_async
 from .utils import name, get_api
 from .exceptions import (
     HTTPStatusError,
@@ -24,6 +26,7 @@ if TYPE_CHECKING:
         LoginCampaignInfo,
         LoginCampaignsAll1,
         LoginCampaignsAll5,
+        LoginCampaignsAll5Info,
     )
 
 API = get_api('bestdori.api')
@@ -31,85 +34,91 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总登录奖励信息
 @overload
-def get_all(index: Literal[0]) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总登录奖励信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
         me (Optional[Me], optional): 登录用户信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         Dict[str, NoneDict]: 所有已有登录奖励 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[1]) -> 'LoginCampaignsAll1':
+def get_all(index: Literal[1], *, session: Optional[Session]=None) -> 'LoginCampaignsAll1':
     '''获取总登录奖励信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
         me (Optional[Me], optional): 登录用户信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         LoginCampaignsAll1: 所有已有登录奖励简洁信息 `all.1.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'LoginCampaignsAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'LoginCampaignsAll5':
     '''获取总登录奖励信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
         me (Optional[Me], optional): 登录用户信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         LoginCampaignsAll5: 所有已有登录奖励的较详细信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[0, 1, 5]) -> Union[Dict[str, 'NoneDict'], 'LoginCampaignsAll1', 'LoginCampaignsAll5']:
-    return Api(API['loginCampaigns']['all'].format(index=index)).get().json()
+def get_all(index: Literal[0, 1, 5], *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'LoginCampaignsAll1', 'LoginCampaignsAll5']:
+    return Api(API['loginCampaigns']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总登录奖励信息
 @overload
-async def get_all_async(index: Literal[0]) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总登录奖励信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
         me (Optional[Me], optional): 登录用户信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         Dict[str, NoneDict]: 所有已有登录奖励 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[1]) -> 'LoginCampaignsAll1':
+async def get_all_async(index: Literal[1], *, session: Optional[Session]=None) -> 'LoginCampaignsAll1':
     '''获取总登录奖励信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
         me (Optional[Me], optional): 登录用户信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         LoginCampaignsAll1: 所有已有登录奖励简洁信息 `all.1.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'LoginCampaignsAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'LoginCampaignsAll5':
     '''获取总登录奖励信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
         me (Optional[Me], optional): 登录用户信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         LoginCampaignsAll5: 所有已有登录奖励的较详细信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[0, 1, 5]) -> Union[Dict[str, 'NoneDict'], 'LoginCampaignsAll1', 'LoginCampaignsAll5']:
-    return (await Api(API['loginCampaigns']['all'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[0, 1, 5], *, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'LoginCampaignsAll1', 'LoginCampaignsAll5']:
+    return (await Api(API['loginCampaigns']['all'].format(index=index), session=session).aget()).json()
 
 # 登录奖励类
 class LoginCampaign:
@@ -117,18 +126,22 @@ class LoginCampaign:
 
     参数:
         id (int): 登录奖励 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''登录奖励类
 
         参数:
             id (int): 登录奖励 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''登录奖励 ID'''
         self.__info: Optional['LoginCampaignInfo'] = None
         '''登录奖励信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
 
     # me 参数已移除
     
@@ -168,16 +181,21 @@ class LoginCampaign:
             LoginCampaignInfo: 登录奖励详细信息
         '''
         try:
-            response = Api(
-                API['loginCampaigns']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'logincampaigns',
+                self.id,
+                Api(
+                    API['loginCampaigns']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'LoginCampaign {self.id}')
             raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
 
     def __get_info__(self) -> 'LoginCampaignInfo':
         if not self.__info:
@@ -192,16 +210,21 @@ class LoginCampaign:
             LoginCampaignInfo: 登录奖励详细信息
         '''
         try:
-            response = await Api(
-                API['loginCampaigns']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'logincampaigns',
+                self.id,
+                Api(
+                    API['loginCampaigns']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'LoginCampaign {self.id}')
             raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     async def __get_info_async__(self) -> 'LoginCampaignInfo':
         if not self.__info:
@@ -238,6 +261,7 @@ class LoginCampaign:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取登录奖励评论
@@ -270,6 +294,7 @@ class LoginCampaign:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 获取登录奖励背景图图像
@@ -293,7 +318,8 @@ class LoginCampaign:
         return Api(
             ASSETS['event']['loginbouns'].format(
                 server=server, asset_bundle_name=asset_bundle_name[index]
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取登录奖励背景图图像
@@ -317,5 +343,64 @@ class LoginCampaign:
         return (await Api(
             ASSETS['event']['loginbouns'].format(
                 server=server, asset_bundle_name=asset_bundle_name[index]
-            )
+            ),
+            session=self.session,
         ).aget()).content
+
+# 批量获取登录奖励信息
+def get_many(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['LoginCampaignInfo', 'LoginCampaignsAll5Info', Exception]]:
+    '''并发获取多个登录奖励信息
+
+    参数:
+        ids (Iterable[int]): 登录奖励 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总登录奖励信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[LoginCampaignInfo, LoginCampaignsAll5Info, Exception]]: 与 `ids` 顺序一致的登录奖励信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'LoginCampaignsAll5Info'] = get_all(5, session=session) if from_all else {}
+    
+    def fetch(id: int) -> Union['LoginCampaignInfo', 'LoginCampaignsAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return LoginCampaign(id, session=session).get_info()
+    
+    return gather_many(ids, fetch, concurrency)
+
+# 异步批量获取登录奖励信息
+async def get_many_async(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['LoginCampaignInfo', 'LoginCampaignsAll5Info', Exception]]:
+    '''并发获取多个登录奖励信息
+
+    参数:
+        ids (Iterable[int]): 登录奖励 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总登录奖励信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[LoginCampaignInfo, LoginCampaignsAll5Info, Exception]]: 与 `ids` 顺序一致的登录奖励信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'LoginCampaignsAll5Info'] = await get_all_async(5, session=session) if from_all else {}
+    
+    async def fetch(id: int) -> Union['LoginCampaignInfo', 'LoginCampaignsAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return await LoginCampaign(id, session=session).get_info_async()
+    
+    return await gather_many_async(ids, fetch, concurrency)
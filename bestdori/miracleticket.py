@@ -1,9 +1,9 @@
 '''`bestdori.miracleticket`
 
 BanG Dream! 自选券相关操作'''
-from typing import TYPE_CHECKING, List, Literal, Optional
+from typing import TYPE_CHECKING, List, Union, Literal, Iterable, Optional
 
-from .utils.network import Api
+from .utils.network import Api, Session
 from .utils import name, get_api
 from .exceptions import (
     NoDataException,
@@ -21,31 +21,35 @@ if TYPE_CHECKING:
 API = get_api('bestdori.api')
 
 # 获取总自选券信息
-def get_all(index: Literal[5]=5) -> 'MiracleTicketExchangesAll5':
+def get_all(index: Literal[5]=5, *, session: Optional[Session]=None) -> 'MiracleTicketExchangesAll5':
     '''获取总自选券信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         MiracleTicketExchangesAll5: 所有已有自选券信息 `all.5.json`
     '''
     return Api(
-        API['all']['miracleTicketExchanges'].format(index=index)
+        API['all']['miracleTicketExchanges'].format(index=index),
+        session=session,
     ).get().json()
 
 # 异步获取总自选券信息
-async def get_all_async(index: Literal[5]=5) -> 'MiracleTicketExchangesAll5':
+async def get_all_async(index: Literal[5]=5, *, session: Optional[Session]=None) -> 'MiracleTicketExchangesAll5':
     '''获取总自选券信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         MiracleTicketExchangesAll5: 所有已有自选券信息 `all.5.json`
     '''
     return (await Api(
-        API['all']['miracleTicketExchanges'].format(index=index)
+        API['all']['miracleTicketExchanges'].format(index=index),
+        session=session,
     ).aget()).json()
 
 # 自选券类
@@ -54,18 +58,22 @@ class MiracleTicketExchange:
 
     参数:
         id (int): 自选券 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''自选券类
 
         参数:
             id (int): 自选券 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''自选券 ID'''
         self.__info: Optional[MiracleTicketExchangeInfo] = None
         '''自选券信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     @property
@@ -103,7 +111,7 @@ class MiracleTicketExchange:
         返回:
             MiracleTicketExchangeInfo: 自选券详细信息
         '''
-        _all = get_all(5)
+        _all = get_all(5, session=self.session)
         if self.id not in _all.keys():
             raise NotExistException(f'Miracle ticket {self.id}')
         self.__info = _all[str(self.id)]
@@ -121,7 +129,7 @@ class MiracleTicketExchange:
         返回:
             MiracleTicketExchangeInfo: 自选券详细信息
         '''
-        _all = await get_all_async(5)
+        _all = await get_all_async(5, session=self.session)
         if self.id not in _all.keys():
             raise NotExistException(f'Miracle ticket {self.id}')
         self.__info = _all[str(self.id)]
@@ -173,3 +181,38 @@ class MiracleTicketExchange:
         if id_list is None:
             raise ServerNotAvailableError(f'Miracle ticket {name(self)}', server)
         return id_list
+
+# 批量获取自选券信息
+def get_many(ids: Iterable[int], *, session: Optional[Session]=None) -> List[Union['MiracleTicketExchangeInfo', Exception]]:
+    '''获取多个自选券信息，所有 ID 共用一次总自选券信息请求
+
+    参数:
+        ids (Iterable[int]): 自选券 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[MiracleTicketExchangeInfo, Exception]]: 与 `ids` 顺序一致的自选券信息，不存在的 ID 对应 `NotExistException`
+    '''
+    return _pick_many(ids, get_all(session=session))
+
+# 异步批量获取自选券信息
+async def get_many_async(ids: Iterable[int], *, session: Optional[Session]=None) -> List[Union['MiracleTicketExchangeInfo', Exception]]:
+    '''获取多个自选券信息，所有 ID 共用一次总自选券信息请求
+
+    参数:
+        ids (Iterable[int]): 自选券 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[MiracleTicketExchangeInfo, Exception]]: 与 `ids` 顺序一致的自选券信息，不存在的 ID 对应 `NotExistException`
+    '''
+    return _pick_many(ids, await get_all_async(session=session))
+
+def _pick_many(ids: Iterable[int], _all: 'MiracleTicketExchangesAll5') -> List[Union['MiracleTicketExchangeInfo', Exception]]:
+    result: List[Union['MiracleTicketExchangeInfo', Exception]] = []
+    for id in ids:
+        if (info := _all.get(str(id), None)) is not None:
+            result.append(info)
+        else:
+            result.append(NotExistException(f'Miracle ticket {id}'))
+    return result
@@ -0,0 +1,502 @@
+'''`bestdori.mirror`
+
+Bestdori 资源批量镜像相关操作
+
+资源将按 SHA-256 存储在内容寻址的本地目录中，清单以追加方式记录，
+中断后再次运行会跳过已完成的资源。也可以通过命令行运行:
+
+    python -m bestdori.mirror ./mirror --kinds cards songs --concurrency 8'''
+
+import os
+import json
+import asyncio
+from pathlib import Path
+from hashlib import sha256
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    NamedTuple,
+)
+
+from .utils import get_api
+from .exceptions import AssetsNotExistError
+from .utils.network import Api, Session, StreamResponse
+from . import cards, songs, events, gacha, costumes
+
+if TYPE_CHECKING:
+    from .typing import (
+        CardAll5,
+        GachaAll3,
+        SongsAll5,
+        EventsAll3,
+        ServerName,
+        CostumesAll5,
+        PerServerType,
+    )
+
+ASSETS = get_api('bestdori.assets')
+
+_SERVERS: List['ServerName'] = ['jp', 'en', 'tw', 'cn', 'kr']
+
+def _default_server(published_at: 'PerServerType[Any]') -> Optional['ServerName']:
+    '''根据各服务器发布时间获取默认服务器'''
+    for server, value in zip(_SERVERS, published_at):
+        if value is not None:
+            return server
+    return None
+
+# 镜像任务
+class MirrorTask(NamedTuple):
+    '''镜像任务'''
+    name: str
+    '''资源在清单中的名称'''
+    url: str
+    '''资源 URL'''
+
+def iter_card_assets(all5: 'CardAll5') -> Iterator[MirrorTask]:
+    '''枚举卡牌完整图片、无背景图片与缩略图
+
+    参数:
+        all5 (CardAll5): 总卡牌信息
+
+    返回:
+        Iterator[MirrorTask]: 镜像任务
+    '''
+    for id, info in all5.items():
+        if (server := _default_server(info['releasedAt'])) is None:
+            continue
+        # 三星以下的卡牌没有特训后图片
+        types = ['normal', 'after_training'] if info['rarity'] >= 3 else ['normal']
+        for type in types:
+            for name in ('card', 'trim'):
+                yield MirrorTask(
+                    f'cards/{id}/{name}_{type}.png',
+                    ASSETS['characters']['resourceset'].format(
+                        server=server,
+                        resource_set_name=info['resourceSetName'],
+                        name=name,
+                        type=type,
+                    ),
+                )
+            yield MirrorTask(
+                f'cards/{id}/thumb_{type}.png',
+                ASSETS['thumb']['chara'].format(
+                    server=server,
+                    id=int(id) // 50,
+                    resource_set_name=info['resourceSetName'],
+                    type=type,
+                ),
+            )
+
+def iter_song_assets(all5: 'SongsAll5') -> Iterator[MirrorTask]:
+    '''枚举歌曲音频与封面
+
+    参数:
+        all5 (SongsAll5): 总歌曲信息
+
+    返回:
+        Iterator[MirrorTask]: 镜像任务
+    '''
+    for id, info in all5.items():
+        if (server := _default_server(info['publishedAt'])) is None:
+            continue
+        yield MirrorTask(
+            f'songs/{id}/bgm.mp3',
+            ASSETS['songs']['sound'].format(server=server, id=int(id)),
+        )
+        # 获取数据包序列号
+        quotient, remainder = divmod(int(id), 10)
+        index = int(id) if remainder == 0 else (quotient + 1) * 10
+        for image in info['jacketImage']:
+            yield MirrorTask(
+                f'songs/{id}/jacket_{image}.png',
+                ASSETS['songs']['musicjacket'].format(
+                    server=server, index=index, jacket_image=image
+                ),
+            )
+
+def iter_event_assets(all3: 'EventsAll3') -> Iterator[MirrorTask]:
+    '''枚举活动缩略图与 logo
+
+    参数:
+        all3 (EventsAll3): 总活动信息
+
+    返回:
+        Iterator[MirrorTask]: 镜像任务
+    '''
+    for id, info in all3.items():
+        if (server := _default_server(info['startAt'])) is None:
+            continue
+        for name in ('banner', 'logo'):
+            yield MirrorTask(
+                f'events/{id}/{name}.png',
+                ASSETS['event'][name].format(
+                    server=server, asset_bundle_name=info['assetBundleName']
+                ),
+            )
+
+def iter_gacha_assets(all3: 'GachaAll3') -> Iterator[MirrorTask]:
+    '''枚举招募 pickup 图像
+
+    参数:
+        all3 (GachaAll3): 总招募信息
+
+    返回:
+        Iterator[MirrorTask]: 镜像任务
+    '''
+    for id, info in all3.items():
+        if (server := _default_server(info['publishedAt'])) is None:
+            continue
+        for pickup in ('pickup1', 'pickup2', 'pickup'):
+            yield MirrorTask(
+                f'gacha/{id}/{pickup}.png',
+                ASSETS['gacha']['screen'].format(server=server, id=id, asset_name=pickup),
+            )
+
+def iter_costume_assets(all5: 'CostumesAll5') -> Iterator[MirrorTask]:
+    '''枚举服装图标
+
+    参数:
+        all5 (CostumesAll5): 总服装信息
+
+    返回:
+        Iterator[MirrorTask]: 镜像任务
+    '''
+    for id, info in all5.items():
+        if (server := _default_server(info['publishedAt'])) is None:
+            continue
+        yield MirrorTask(
+            f'costumes/{id}/icon.png',
+            ASSETS['thumb']['costume'].format(
+                server=server, id=int(id) // 50, asset_bundle_name=info['assetBundleName']
+            ),
+        )
+
+SOURCES: Dict[str, Tuple[Any, int, Callable[[Any], Iterator[MirrorTask]]]] = {
+    'cards': (cards, 5, iter_card_assets),
+    'songs': (songs, 5, iter_song_assets),
+    'events': (events, 3, iter_event_assets),
+    'gacha': (gacha, 3, iter_gacha_assets),
+    'costumes': (costumes, 5, iter_costume_assets),
+}
+'''可镜像的资源类型，值为 `(模块, 总信息序号, 任务枚举函数)`'''
+
+# 内容寻址资源存储
+class AssetStore:
+    '''内容寻址资源存储类
+
+    资源文件存储在 `objects/<哈希前两位>/<哈希>` 中，相同内容只存储一份；
+    名称到哈希的映射以 JSON Lines 形式追加记录在 `manifest.jsonl` 中。
+
+    参数:
+        root (Union[str, Path]): 存储根目录，不存在时将自动创建
+    '''
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        '''存储根目录'''
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        '''清单条目，键为资源名称'''
+        self._lock = Lock()
+        self._temps: Set[Path] = set()
+
+        (self.root / 'objects').mkdir(parents=True, exist_ok=True)
+        (self.root / 'tmp').mkdir(exist_ok=True)
+        manifest = self.root / 'manifest.jsonl'
+        if manifest.exists():
+            with open(manifest, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 中断时可能留下不完整的最后一行
+                        continue
+                    self.entries[entry['name']] = entry
+        self._manifest = open(manifest, 'a', encoding='utf-8')
+
+    def object_path(self, digest: str) -> Path:
+        '''获取哈希对应的资源文件路径'''
+        return self.root / 'objects' / digest[:2] / digest
+
+    def path_of(self, name: str) -> Optional[Path]:
+        '''获取已镜像资源的文件路径
+
+        参数:
+            name (str): 资源名称
+
+        返回:
+            Optional[Path]: 资源文件路径，资源未镜像或不存在时返回 `None`
+        '''
+        entry = self.entries.get(name, None)
+        if entry is None or entry.get('sha256', None) is None:
+            return None
+        return self.object_path(entry['sha256'])
+
+    def has(self, name: str, *, include_missing: bool=True) -> bool:
+        '''资源是否已完成镜像
+
+        参数:
+            name (str): 资源名称
+            include_missing (bool, optional): 是否将已确认不存在的资源视为已完成
+        '''
+        entry = self.entries.get(name, None)
+        if entry is None:
+            return False
+        if entry.get('missing', False):
+            return include_missing
+        return self.object_path(entry['sha256']).exists()
+
+    def temp_path(self) -> Path:
+        '''获取一个新的临时文件路径，未加入存储的临时文件将在关闭时删除'''
+        path = self.root / 'tmp' / f'{os.getpid()}-{os.urandom(8).hex()}'
+        with self._lock:
+            self._temps.add(path)
+        return path
+
+    def add(self, task: MirrorTask, temp: Path, digest: str, size: int) -> None:
+        '''将下载完成的临时文件加入存储并记录清单'''
+        path = self.object_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        if path.exists():
+            temp.unlink()
+        else:
+            os.replace(temp, path)
+        with self._lock:
+            self._temps.discard(temp)
+        self._record({'name': task.name, 'url': task.url, 'sha256': digest, 'size': size})
+
+    def add_missing(self, task: MirrorTask) -> None:
+        '''记录不存在的资源，之后的运行将跳过该资源'''
+        self._record({'name': task.name, 'url': task.url, 'missing': True})
+
+    def _record(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self.entries[entry['name']] = entry
+            self._manifest.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._manifest.flush()
+
+    def close(self) -> None:
+        '''关闭清单文件并清理本存储创建的临时文件
+
+        同一目录可能同时被其他进程使用，因此不会删除其他存储创建的临时文件。
+        '''
+        self._manifest.close()
+        with self._lock:
+            temps, self._temps = self._temps, set()
+        for path in temps:
+            path.unlink(missing_ok=True)
+
+    def __enter__(self) -> 'AssetStore':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+# 镜像结果
+class MirrorResult:
+    '''镜像结果类'''
+
+    def __init__(self) -> None:
+        self.downloaded: int = 0
+        '''本次下载的资源数'''
+        self.skipped: int = 0
+        '''已存在而跳过的资源数'''
+        self.missing: int = 0
+        '''本次确认不存在的资源数'''
+        self.bytes: int = 0
+        '''本次下载的字节数'''
+        self.failed: List[Tuple[MirrorTask, BaseException]] = []
+        '''下载失败的资源与异常'''
+
+    def __repr__(self) -> str:
+        return (
+            f'MirrorResult(downloaded={self.downloaded}, skipped={self.skipped}, '
+            f'missing={self.missing}, bytes={self.bytes}, failed={len(self.failed)})'
+        )
+
+def _is_missing(response: StreamResponse) -> bool:
+    '''资源是否不存在，返回 HTML 页面的情况已由 `Api` 抛出 `AssetsNotExistError`'''
+    return response.status_code == 404
+
+def _check_status(response: StreamResponse) -> None:
+    if response.status_code >= 400:
+        if response.exception is not None:
+            raise response.exception
+        raise RuntimeError(f'unexpected status {response.status_code} for {response.url}')
+
+def _kinds(kinds: Optional[Iterable[str]]) -> List[str]:
+    '''校验资源类型，在发出任何请求前拒绝未知类型'''
+    if kinds is None:
+        return list(SOURCES.keys())
+    kinds = list(kinds)
+    for kind in kinds:
+        if kind not in SOURCES:
+            raise ValueError(f'unknown asset kind \'{kind}\', expected one of {list(SOURCES)}.')
+    return kinds
+
+def _collect(kinds: List[str], fetch: Callable[[str], Any]) -> List[MirrorTask]:
+    tasks: List[MirrorTask] = []
+    for kind in kinds:
+        tasks.extend(SOURCES[kind][2](fetch(kind)))
+    return tasks
+
+# 镜像资源
+def mirror(
+    root: Union[str, Path],
+    *,
+    kinds: Optional[Iterable[str]]=None,
+    concurrency: int=8,
+    retry_missing: bool=False,
+    session: Optional[Session]=None,
+) -> MirrorResult:
+    '''将 Bestdori 资源批量镜像到本地内容寻址存储
+
+    参数:
+        root (Union[str, Path]): 存储根目录
+        kinds (Optional[Iterable[str]], optional): 要镜像的资源类型，默认为 `SOURCES` 中的全部类型
+        concurrency (int, optional): 同时下载的最大资源数
+        retry_missing (bool, optional): 是否重新尝试之前确认不存在的资源
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        MirrorResult: 镜像结果
+    '''
+    tasks = _collect(
+        _kinds(kinds), lambda kind: SOURCES[kind][0].get_all(SOURCES[kind][1], session=session)
+    )
+    result = MirrorResult()
+    lock = Lock()
+
+    with AssetStore(root) as store:
+        def download(task: MirrorTask) -> None:
+            temp = store.temp_path()
+            try:
+                with Api(task.url, session=session).stream() as response:
+                    if _is_missing(response):
+                        store.add_missing(task)
+                        with lock:
+                            result.missing += 1
+                        return
+                    _check_status(response)
+                    digest, size = sha256(), 0
+                    with open(temp, 'wb') as file:
+                        for chunk in response.iter_bytes():
+                            digest.update(chunk)
+                            file.write(chunk)
+                            size += len(chunk)
+                store.add(task, temp, digest.hexdigest(), size)
+                with lock:
+                    result.downloaded += 1
+                    result.bytes += size
+            except AssetsNotExistError:
+                store.add_missing(task)
+                with lock:
+                    result.missing += 1
+            except Exception as exception:
+                with lock:
+                    result.failed.append((task, exception))
+
+        pending = []
+        for task in tasks:
+            if store.has(task.name, include_missing=not retry_missing):
+                result.skipped += 1
+            else:
+                pending.append(task)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(download, pending))
+
+    return result
+
+# 异步镜像资源
+async def mirror_async(
+    root: Union[str, Path],
+    *,
+    kinds: Optional[Iterable[str]]=None,
+    concurrency: int=8,
+    retry_missing: bool=False,
+    session: Optional[Session]=None,
+) -> MirrorResult:
+    '''将 Bestdori 资源批量镜像到本地内容寻址存储
+
+    参数:
+        root (Union[str, Path]): 存储根目录
+        kinds (Optional[Iterable[str]], optional): 要镜像的资源类型，默认为 `SOURCES` 中的全部类型
+        concurrency (int, optional): 同时下载的最大资源数
+        retry_missing (bool, optional): 是否重新尝试之前确认不存在的资源
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        MirrorResult: 镜像结果
+    '''
+    kinds = _kinds(kinds)
+    indexes = dict(zip(kinds, await asyncio.gather(*[
+        SOURCES[kind][0].get_all_async(SOURCES[kind][1], session=session)
+        for kind in kinds
+    ])))
+    tasks = _collect(kinds, lambda kind: indexes[kind])
+    result = MirrorResult()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with AssetStore(root) as store:
+        async def download(task: MirrorTask) -> None:
+            temp = store.temp_path()
+            async with semaphore:
+                try:
+                    async with Api(task.url, session=session).astream() as response:
+                        if _is_missing(response):
+                            store.add_missing(task)
+                            result.missing += 1
+                            return
+                        _check_status(response)
+                        digest, size = sha256(), 0
+                        with open(temp, 'wb') as file:
+                            async for chunk in response.aiter_bytes():
+                                digest.update(chunk)
+                                file.write(chunk)
+                                size += len(chunk)
+                    store.add(task, temp, digest.hexdigest(), size)
+                    result.downloaded += 1
+                    result.bytes += size
+                except AssetsNotExistError:
+                    store.add_missing(task)
+                    result.missing += 1
+                except Exception as exception:
+                    result.failed.append((task, exception))
+
+        pending = []
+        for task in tasks:
+            if store.has(task.name, include_missing=not retry_missing):
+                result.skipped += 1
+            else:
+                pending.append(task)
+        await asyncio.gather(*[download(task) for task in pending])
+
+    return result
+
+if __name__ == '__main__':
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser(prog='python -m bestdori.mirror', description='批量镜像 Bestdori 资源')
+    parser.add_argument('root', help='存储根目录')
+    parser.add_argument('--kinds', nargs='*', choices=list(SOURCES.keys()), help='要镜像的资源类型')
+    parser.add_argument('--concurrency', type=int, default=8, help='同时下载的最大资源数')
+    parser.add_argument('--retry-missing', action='store_true', help='重新尝试之前确认不存在的资源')
+    args = parser.parse_args()
+
+    print(mirror(
+        args.root,
+        kinds=args.kinds,
+        concurrency=args.concurrency,
+        retry_missing=args.retry_missing,
+    ))
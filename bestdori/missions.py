@@ -8,7 +8,8 @@ from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
 from . import post
 from .user import Me
 from .utils import get_api
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
 from .exceptions import (
     HTTPStatusError,
     NoDataException,
@@ -28,57 +29,61 @@ API = get_api('bestdori.api')
 
 # 获取总任务信息
 @overload
-def get_all(index: Literal[0], *, me: Optional[Me] = None) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, me: Optional[Me] = None, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总任务信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 获取到的所有已有任务 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5], *, me: Optional[Me] = None) -> 'MissionsAll5':
+def get_all(index: Literal[5], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'MissionsAll5':
     '''获取总任务信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         MissionsAll5: 获取到的所有已有任务的简洁信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[0, 5]=5, *, me: Optional[Me] = None) -> Union[Dict[str, 'NoneDict'], 'MissionsAll5']:
-    return Api(API['missions']['all'].format(index=index)).get().json()
+def get_all(index: Literal[0, 5]=5, *, me: Optional[Me] = None, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'MissionsAll5']:
+    return Api(API['missions']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总任务信息
 @overload
-async def get_all_async(index: Literal[0], *, me: Optional[Me] = None) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, me: Optional[Me] = None, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总任务信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 获取到的所有已有任务 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5], *, me: Optional[Me] = None) -> 'MissionsAll5':
+async def get_all_async(index: Literal[5], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'MissionsAll5':
     '''获取总任务信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         MissionsAll5: 获取到的所有已有任务的简洁信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[0, 5]=5, *, me: Optional[Me] = None) -> Union[Dict[str, 'NoneDict'], 'MissionsAll5']:
-    return (await Api(API['missions']['all'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[0, 5]=5, *, me: Optional[Me] = None, session: Optional[Session]=None) -> Union[Dict[str, 'NoneDict'], 'MissionsAll5']:
+    return (await Api(API['missions']['all'].format(index=index), session=session).aget()).json()
 
 # 任务类
 class Mission:
@@ -86,13 +91,15 @@ class Mission:
 
     参数:
         id (int): 任务 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int, *, me: Optional[Me] = None) -> None:
+    def __init__(self, id: int, *, me: Optional[Me] = None, session: Optional[Session]=None) -> None:
         '''任务类
 
         参数:
             id (int): 任务 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''任务 ID'''
@@ -100,6 +107,8 @@ class Mission:
         '''任务信息'''
         # me 参数已弃用
         self.__me = None
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         return
     
     @property
@@ -138,16 +147,21 @@ class Mission:
             MissionInfo: 任务详细信息
         '''
         try:
-            response = Api(
-                API['missions']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'missions',
+                self.id,
+                Api(
+                    API['missions']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Mission {self.id}') from exception
             raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     # 异步获取任务信息
     async def get_info_async(self) -> 'MissionInfo':
@@ -157,16 +171,21 @@ class Mission:
             MissionInfo: 任务详细信息
         '''
         try:
-            response = await Api(
-                API['missions']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'missions',
+                self.id,
+                Api(
+                    API['missions']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Mission {self.id}') from exception
             raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     # 获取任务评论
     def get_comment(
@@ -198,6 +217,7 @@ class Mission:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取任务评论
@@ -230,5 +250,6 @@ class Mission:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
\ No newline at end of file
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Literal, Optional
 
 from .user import Me
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import PlayerNotExistError
 
 if TYPE_CHECKING:
@@ -24,13 +24,16 @@ class Player:
     参数:
         id (int): 玩家 ID
         server (str): 服务器
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
-    def __init__(self, id: int, server: str, *, me: Optional[Me] = None) -> None:
+    def __init__(self, id: int, server: str, *, me: Optional[Me] = None, session: Optional[Session]=None) -> None:
         self.id: int = id
         self.server: str = server
         self.__profile: Optional[PlayerDataProfile] = None
         # me 参数已弃用
         self.__me = None
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
     
     @property
     def profile(self) -> 'PlayerDataProfile':
@@ -55,7 +58,8 @@ class Player:
             'mode': mode
         }
         info: 'PlayerInfo' = Api(
-            API['player']['info'].format(server=self.server, id=self.id)
+            API['player']['info'].format(server=self.server, id=self.id),
+            session=self.session,
         ).get(
             params=params,
         ).json()
@@ -86,7 +90,8 @@ class Player:
             'mode': mode
         }
         info: 'PlayerInfo' = (await Api(
-            API['player']['info'].format(server=self.server, id=self.id)
+            API['player']['info'].format(server=self.server, id=self.id),
+            session=self.session,
         ).aget(
             params=params,
         )).json()
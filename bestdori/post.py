@@ -17,7 +17,7 @@ from typing import (
 from .charts import Chart
 from .models.content import Content
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import (
     NoDataException,
     PostHasNoSongError,
@@ -63,6 +63,7 @@ def get_list(
     order: Literal['TIME_DESC', 'TIME_ASC']='TIME_DESC',
     limit: int=20,
     offset: int=0,
+    session: Optional[Session]=None,
 ) -> 'PostList':
     '''搜索社区谱面
         ```python
@@ -77,6 +78,7 @@ def get_list(
         tags (List[PostTag], optional): 搜索的标签，默认为空
         order (Literal[&#39;TIME_DESC&#39;, &#39;TIME_ASC&#39;], optional): 帖子排序，默认时间倒序
         limit (int, optional): 展示出的帖子数，默认 20
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     offset (int, optional): 忽略前面的 `offset` 个帖子，默认 0
 
     返回:
@@ -96,6 +98,7 @@ def get_list(
     limit: int=20,
     offset: int=0,
     order: Literal['TIME_DESC', 'TIME_ASC']='TIME_DESC',
+    session: Optional[Session]=None,
 ) -> 'PostList':
     '''搜索用户帖子
 
@@ -105,6 +108,7 @@ def get_list(
         offset (int, optional): 忽略前面的 `offset` 个帖子，默认 0
         order (Literal[&#39;TIME_DESC&#39;, &#39;TIME_ASC&#39;], optional): 帖子排序，默认时间倒序
         me (Optional[Me], optional): 用户验证对象
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         PostList: 搜索结果
@@ -128,6 +132,7 @@ def get_list(
     order: Literal['TIME_DESC', 'TIME_ASC'],
     limit: int=20,
     offset: int=0,
+    session: Optional[Session]=None,
 ) -> 'PostList':
     '''搜索帖子
 
@@ -140,6 +145,7 @@ def get_list(
         tags (Optional[List[PostTag]], optional): 帖子标签
         username (Optional[str], optional): 用户名
         limit (int, optional): 展示出的帖子数，默认 20
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     offset (int, optional): 忽略前面的 `offset` 个帖子，默认 0
 
     返回:
@@ -148,7 +154,7 @@ def get_list(
     ...
 
 # 搜索帖子
-def get_list(**kwargs: Any) -> 'PostList':
+def get_list(*, session: Optional[Session]=None, **kwargs: Any) -> 'PostList':
     # 去除 None 值字段
     kwargs = {key: value for key, value in kwargs.items() if value is not None}
     # 将下划线字段名转换为小驼峰字段名
@@ -157,7 +163,7 @@ def get_list(**kwargs: Any) -> 'PostList':
             "".join(x.capitalize() if i > 0 else x for i, x in enumerate(key.split("_")))
         ): value for key, value in kwargs.items() if value is not None
     }
-    response = Api(API['post']['list']).post(
+    response = Api(API['post']['list'], session=session).post(
         data=kwargs,
     )
     return response.json()
@@ -173,6 +179,7 @@ async def get_list_async(
     order: Literal['TIME_DESC', 'TIME_ASC']='TIME_DESC',
     limit: int=20,
     offset: int=0,
+    session: Optional[Session]=None,
 ) -> 'PostList':
     '''搜索社区谱面
         ```python
@@ -187,6 +194,7 @@ async def get_list_async(
         tags (List[PostTag], optional): 搜索的标签，默认为空
         order (Literal[&#39;TIME_DESC&#39;, &#39;TIME_ASC&#39;], optional): 帖子排序，默认时间倒序
         limit (int, optional): 展示出的帖子数，默认 20
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     offset (int, optional): 忽略前面的 `offset` 个帖子，默认 0
 
     返回:
@@ -206,6 +214,7 @@ async def get_list_async(
     limit: int=20,
     offset: int=0,
     order: Literal['TIME_DESC', 'TIME_ASC']='TIME_DESC',
+    session: Optional[Session]=None,
 ) -> 'PostList':
     '''搜索用户帖子
 
@@ -215,6 +224,7 @@ async def get_list_async(
         offset (int, optional): 忽略前面的 `offset` 个帖子，默认 0
         order (Literal[&#39;TIME_DESC&#39;, &#39;TIME_ASC&#39;], optional): 帖子排序，默认时间倒序
         me (Optional[Me], optional): 用户验证对象
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         PostList: 搜索结果
@@ -238,6 +248,7 @@ async def get_list_async(
     order: Literal['TIME_DESC', 'TIME_ASC'],
     limit: int=20,
     offset: int=0,
+    session: Optional[Session]=None,
 ) -> 'PostList':
     '''搜索帖子
 
@@ -252,6 +263,7 @@ async def get_list_async(
         limit (int, optional): 展示出的帖子数，默认 20
         offset (int, optional): 忽略前面的 `offset` 个帖子，默认 0
         me (Optional[Me], optional): 用户验证对象
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         PostList: 搜索结果
@@ -259,7 +271,7 @@ async def get_list_async(
     ...
 
 # 异步搜索帖子
-async def get_list_async(**kwargs: Any) -> 'PostList':
+async def get_list_async(*, session: Optional[Session]=None, **kwargs: Any) -> 'PostList':
     # 去除 None 值字段
     kwargs = {key: value for key, value in kwargs.items() if value is not None}
     # 将下划线字段名转换为小驼峰字段名
@@ -268,7 +280,7 @@ async def get_list_async(**kwargs: Any) -> 'PostList':
             "".join(x.capitalize() if i > 0 else x for i, x in enumerate(key.split("_")))
         ): value for key, value in kwargs.items() if value is not None
     }
-    response = await Api(API['post']['list']).apost(
+    response = await Api(API['post']['list'], session=session).apost(
         data=kwargs,
     )
     return response.json()
@@ -278,12 +290,15 @@ def search_tags(
     type: str,
     data: str='',
     fuzzy: bool=True,
+    *,
+    session: Optional[Session]=None,
 ) -> List['PostTagGetResultTag']:
     '''搜索已有标签
 
     参数:
         type (str): 标签类型
         data (str, optional): 搜索标签数据关键词
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     fuzzy (bool, optional): 是否使用模糊搜索
 
     返回:
@@ -295,7 +310,7 @@ def search_tags(
                 "count": ..., # 标签数量 (int)
             }
     '''
-    response = Api(API['post']['tag']).get(
+    response = Api(API['post']['tag'], session=session).get(
         params={
             'type': type,
             'data': data,
@@ -310,6 +325,8 @@ async def search_tags_async(
     type: str,
     data: str='',
     fuzzy: bool=True,
+    *,
+    session: Optional[Session]=None,
 ) -> List['PostTagGetResultTag']:
     '''搜索已有标签
 
@@ -317,6 +334,7 @@ async def search_tags_async(
         type (str): 标签类型
         data (str, optional): 搜索标签数据关键词
         fuzzy (bool, optional): 是否使用模糊搜索
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         List[PostTagGetResultTag]: 标签类 `Tag` 列表搜索结果
@@ -327,7 +345,7 @@ async def search_tags_async(
                 "count": ..., # 标签数量 (int)
             }
     '''
-    response = await Api(API['post']['tag']).aget(
+    response = await Api(API['post']['tag'], session=session).aget(
         params={
             'type': type,
             'data': data,
@@ -350,7 +368,8 @@ def post(
     level: int,
     song: Union['PostSongCustom', 'PostSongProvided'],
     tags: List['PostTag']=[],
-    title: str
+    title: str,
+    session: Optional[Session]=None,
 ) -> int:
     '''发表谱面
 
@@ -366,6 +385,7 @@ def post(
         song (Union[PostSongCustom, PostSongProvided]): 歌曲
         tags (List[PostTag], optional): 谱面标签
         title (str): 谱面标题
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 谱面 ID
@@ -379,7 +399,8 @@ def post(
     category_name: Literal['SELF_POST']='SELF_POST',
     content: List[Content],
     tags: List['PostTag']=[],
-    title: str
+    title: str,
+    session: Optional[Session]=None,
 ) -> int:
     '''发表文本帖子
 
@@ -389,6 +410,7 @@ def post(
         content (List[Content]): 帖子内容
         tags (List[PostTag], optional): 帖子标签
         title (str): 帖子标题
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 帖子 ID
@@ -407,11 +429,12 @@ def post(
     level: Optional[int]=None,
     song: Optional[Union['PostSongCustom', 'PostSongProvided']]=None,
     tags: Optional[List['PostTag']]=None,
-    title: Optional[str]=None
+    title: Optional[str]=None,
+    session: Optional[Session]=None,
 ) -> int: ...
 
 # 发表帖子
-def post(**kwargs: Any) -> int:
+def post(*, session: Optional[Session]=None, **kwargs: Any) -> int:
     # 转换特定字段
     if 'chart' in kwargs:
         kwargs['chart'] = kwargs['chart'].to_list()
@@ -428,7 +451,7 @@ def post(**kwargs: Any) -> int:
         ): value for key, value in kwargs.items() if value is not None
     }
     # 仅使用全局 Cookies
-    response = Api(API['post']['post']).post(
+    response = Api(API['post']['post'], session=session).post(
         data=kwargs
     )
     return response.json().get('id')
@@ -446,7 +469,8 @@ async def post_async(
     level: int,
     song: Union['PostSongCustom', 'PostSongProvided'],
     tags: List['PostTag']=[],
-    title: str
+    title: str,
+    session: Optional[Session]=None,
 ) -> int:
     '''发表谱面
 
@@ -461,6 +485,7 @@ async def post_async(
         song (Union[PostSongCustom, PostSongProvided]): 歌曲
         tags (List[PostTag], optional): 谱面标签
         title (str): 谱面标题
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 谱面 ID
@@ -474,7 +499,8 @@ async def post_async(
     category_name: Literal['SELF_POST']='SELF_POST',
     content: List[Content],
     tags: List['PostTag']=[],
-    title: str
+    title: str,
+    session: Optional[Session]=None,
 ) -> int:
     '''发表文本帖子
 
@@ -484,6 +510,7 @@ async def post_async(
         content (List[Content]): 帖子内容
         tags (List[PostTag], optional): 帖子标签
         title (str): 帖子标题
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 帖子 ID
@@ -502,11 +529,12 @@ async def post_async(
     level: Optional[int]=None,
     song: Optional[Union['PostSongCustom', 'PostSongProvided']]=None,
     tags: Optional[List['PostTag']]=None,
-    title: Optional[str]=None
+    title: Optional[str]=None,
+    session: Optional[Session]=None,
 ) -> int: ...
 
 # 异步发表帖子
-async def post_async(**kwargs: Any) -> int:
+async def post_async(*, session: Optional[Session]=None, **kwargs: Any) -> int:
     # 转换特定字段
     if 'chart' in kwargs:
         kwargs['chart'] = kwargs['chart'].to_list()
@@ -522,19 +550,20 @@ async def post_async(**kwargs: Any) -> int:
             "".join(x.capitalize() if i > 0 else x for i, x in enumerate(key.split("_")))
         ): value for key, value in kwargs.items() if value is not None
     }
-    response = await Api(API['post']['post']).apost(
+    response = await Api(API['post']['post'], session=session).apost(
         data=kwargs
     )
     return response.json().get('id')
 
 # 查询帖子顺序
-def find_post(category_name: str, category_id: str, id: int) -> int:
+def find_post(category_name: str, category_id: str, id: int, *, session: Optional[Session]=None) -> int:
     '''查询帖子顺序
 
     参数:
         category_name (str): 画廊名称
         category_id (str): 画廊 ID
         id (int): 查询的帖子 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 帖子在该画廊的时间顺序
@@ -544,7 +573,7 @@ def find_post(category_name: str, category_id: str, id: int) -> int:
         'categoryId': category_id,
         'id': id
     }
-    response = Api(API['post']['find']).get(
+    response = Api(API['post']['find'], session=session).get(
         params=params,
     )
     if (position := response.json().get('position', None)) is None:
@@ -552,13 +581,14 @@ def find_post(category_name: str, category_id: str, id: int) -> int:
     return position
 
 # 异步查询帖子顺序
-async def find_post_async(category_name: str, category_id: str, id: int) -> int:
+async def find_post_async(category_name: str, category_id: str, id: int, *, session: Optional[Session]=None) -> int:
     '''查询帖子顺序
 
     参数:
         category_name (str): 画廊名称
         category_id (str): 画廊 ID
         id (int): 查询的帖子 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         int: 帖子在该画廊的时间顺序
@@ -568,7 +598,7 @@ async def find_post_async(category_name: str, category_id: str, id: int) -> int:
         'categoryId': category_id,
         'id': id
     }
-    response = await Api(API['post']['find']).aget(
+    response = await Api(API['post']['find'], session=session).aget(
         params=params,
     )
     if (position := response.json().get('position', None)) is None:
@@ -581,13 +611,15 @@ class Post:
 
     参数:
         id (str): 社区帖子 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''社区帖子类
 
         参数:
             id (int): 社区帖子 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''社区帖子 ID'''
@@ -595,6 +627,8 @@ class Post:
         '''社区帖子详细内容'''
         self.__basic: Optional['PostBasic'] = None
         '''社区帖子基础信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         # me 参数已完全移除
     
     @property
@@ -618,7 +652,7 @@ class Post:
         返回:
             PostBasic: 帖子基础信息
         '''
-        response = Api(API['post']['basic']).get(
+        response = Api(API['post']['basic'], session=self.session).get(
             params={'id': self.id},
         )
         self.__basic = response.json()
@@ -631,7 +665,7 @@ class Post:
         返回:
             PostBasic: 帖子基础信息
         '''
-        response = await Api(API['post']['basic']).aget(
+        response = await Api(API['post']['basic'], session=self.session).aget(
             params={'id': self.id},
         )
         self.__basic = response.json()
@@ -644,7 +678,7 @@ class Post:
         返回:
             PostInfo: 帖子详细信息
         '''
-        response = Api(API['post']['details']).get(
+        response = Api(API['post']['details'], session=self.session).get(
             params={'id': self.id},
         )
         _detail: 'PostDetail' = response.json()
@@ -663,7 +697,7 @@ class Post:
         返回:
             PostInfo: 帖子详细信息
         '''
-        response = await Api(API['post']['details']).aget(
+        response = await Api(API['post']['details'], session=self.session).aget(
             params={'id': self.id},
         )
         _detail: 'PostDetail' = response.json()
@@ -749,13 +783,13 @@ class Post:
             if (audio := song.get('audio', None)) is None:
                 result['audio'] = None
             else:
-                response = Api(audio).get()
+                response = Api(audio, session=self.session).get()
                 result['audio'] = response.content
             # 获取歌曲封面
             if (cover := song.get('cover', None)) is None:
                 result['cover'] = None
             else:
-                response = Api(cover).get()
+                response = Api(cover, session=self.session).get()
                 result['cover'] = response.content
         
         elif _type == 'bandori': # BanG Dream! 歌曲
@@ -763,7 +797,7 @@ class Post:
             if (id := song.get('id', None)) is None:
                 raise ValueError('Unable to get song Id.')
             # 获取歌曲信息
-            info: 'SongInfo' = Api(API['songs']['info'].format(id=id)).get().json()
+            info: 'SongInfo' = Api(API['songs']['info'].format(id=id), session=self.session).get().json()
             # 获取歌曲所在服务器
             published_at = info['publishedAt']
             # 根据 publishedAt 数据判断服务器
@@ -777,7 +811,8 @@ class Post:
             
             # 获取歌曲音频
             result['audio'] = Api(
-                ASSETS['songs']['sound'].format(server=server, id=id)
+                ASSETS['songs']['sound'].format(server=server, id=id),
+                session=self.session,
             ).get().content
             
             # 获取歌曲封面
@@ -792,7 +827,8 @@ class Post:
             result['cover'] = Api(
                 ASSETS['songs']['musicjacket'].format(
                     server=server, index=index, jacket_image=jacket_image[-1]
-                )
+                ),
+                session=self.session,
             ).get().content
         
         elif _type == 'llsif': # LoveLive! 歌曲
@@ -800,15 +836,15 @@ class Post:
             if (id := song.get('id', None)) is None:
                 raise ValueError('Unable to get song Id.')
             # 获取歌曲信息
-            misc: 'LLSifMisc' = Api(API['misc']['llsif'].format(index=10)).get().json()
+            misc: 'LLSifMisc' = Api(API['misc']['llsif'].format(index=10), session=self.session).get().json()
             _info = misc[str(id)]
             # 获取歌曲资源库
             live_icon_asset = _info.get('live_icon_asset')
             sound_asset = _info.get('sound_asset')
             # 获取歌曲音频
-            result['audio'] = Api(ASSETS['llsif']['assets'].format(assets=sound_asset)).get().content
+            result['audio'] = Api(ASSETS['llsif']['assets'].format(assets=sound_asset), session=self.session).get().content
             # 获取歌曲封面
-            result['cover'] = Api(ASSETS['llsif']['assets'].format(assets=live_icon_asset)).get().content
+            result['cover'] = Api(ASSETS['llsif']['assets'].format(assets=live_icon_asset), session=self.session).get().content
         
         else:
             raise AssetsNotExistError(f'Song type \'{_type}\'')
@@ -833,13 +869,13 @@ class Post:
             if (audio := song.get('audio', None)) is None:
                 result['audio'] = None
             else:
-                response = await Api(audio).aget()
+                response = await Api(audio, session=self.session).aget()
                 result['audio'] = response.content
             # 获取歌曲封面
             if (cover := song.get('cover', None)) is None:
                 result['cover'] = None
             else:
-                response = await Api(cover).aget()
+                response = await Api(cover, session=self.session).aget()
                 result['cover'] = response.content
         
         elif _type == 'bandori':
@@ -847,7 +883,7 @@ class Post:
             if (id := song.get('id', None)) is None:
                 raise ValueError('Unable to get song Id.')
             # 获取歌曲信息
-            info: 'SongInfo' = (await Api(API['songs']['info'].format(id=id)).aget()).json()
+            info: 'SongInfo' = (await Api(API['songs']['info'].format(id=id), session=self.session).aget()).json()
             # 获取歌曲所在服务器
             published_at = info['publishedAt']
             # 根据 publishedAt 数据判断服务器
@@ -861,7 +897,8 @@ class Post:
             
             # 获取歌曲音频
             result['audio'] = (await Api(
-                ASSETS['songs']['sound'].format(server=server, id=id)
+                ASSETS['songs']['sound'].format(server=server, id=id),
+                session=self.session,
             ).aget()).content
             
             # 获取歌曲封面
@@ -876,7 +913,8 @@ class Post:
             result['cover'] = (await Api(
                 ASSETS['songs']['musicjacket'].format(
                     server=server, index=index, jacket_image=jacket_image[-1]
-                )
+                ),
+                session=self.session,
             ).aget()).content
         
         elif _type == 'llsif':
@@ -884,15 +922,15 @@ class Post:
             if (id := song.get('id', None)) is None:
                 raise ValueError('Unable to get song Id.')
             # 获取歌曲信息
-            misc: 'LLSifMisc' = (await Api(API['misc']['llsif'].format(index=10)).aget()).json()
+            misc: 'LLSifMisc' = (await Api(API['misc']['llsif'].format(index=10), session=self.session).aget()).json()
             _info = misc[str(id)]
             # 获取歌曲资源库
             live_icon_asset = _info.get('live_icon_asset')
             sound_asset = _info.get('sound_asset')
             # 获取歌曲音频
-            result['audio'] = (await Api(ASSETS['llsif']['assets'].format(assets=sound_asset)).aget()).content
+            result['audio'] = (await Api(ASSETS['llsif']['assets'].format(assets=sound_asset), session=self.session).aget()).content
             # 获取歌曲封面
-            result['cover'] = (await Api(ASSETS['llsif']['assets'].format(assets=live_icon_asset)).aget()).content
+            result['cover'] = (await Api(ASSETS['llsif']['assets'].format(assets=live_icon_asset), session=self.session).aget()).content
         
         else:
             raise AssetsNotExistError(f'Song type \'{_type}\'')
@@ -929,6 +967,7 @@ class Post:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取帖子评论
@@ -961,6 +1000,7 @@ class Post:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 评论帖子
@@ -977,7 +1017,8 @@ class Post:
         return post(
             category_id=str(self.id),
             category_name='POST_COMMENT',
-            content=content
+            content=content,
+            session=self.session,
         )
     
     # 异步评论帖子
@@ -993,7 +1034,8 @@ class Post:
         return await post_async(
             category_id=str(self.id),
             category_name='POST_COMMENT',
-            content=content
+            content=content,
+            session=self.session,
         )
     
     # 喜欢 / 取消喜欢帖子
@@ -1003,7 +1045,7 @@ class Post:
         参数:
             value (bool, optional): 值 `True`: 喜欢帖子 `False`: 取消喜欢帖子
         '''
-        Api(API['post']['like']).post(
+        Api(API['post']['like'], session=self.session).post(
             data={'id': self.id, 'value': value},
         )
     
@@ -1014,6 +1056,6 @@ class Post:
         参数:
             value (bool, optional): 值 `True`: 喜欢帖子 `False`: 取消喜欢帖子
         '''
-        await Api(API['post']['like']).apost(
+        await Api(API['post']['like'], session=self.session).apost(
             data={'id': self.id, 'value': value},
         )
@@ -1,6 +1,15 @@
 '''`bestdori.settings` 设置项'''
 
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from bestdori.utils.memo import Memo
+
+if TYPE_CHECKING:
+    from bestdori.utils.network.cache import ResponseCache
+    from bestdori.utils.network.retry import RetryPolicy
+    from bestdori.utils.network.ratelimit import RateLimit
+    from bestdori.utils.network.hooks import Hooks
+    from bestdori.utils.network.replay import Cassette
 
 class AyachanSettings:
     '''`bestdori.ayachan` 设置类'''
@@ -27,4 +36,79 @@ class Settings:
     timeout: int = 10
     '''超时时间'''
     
+    max_connections: int = 100
+    '''连接池最大连接数'''
+    
+    max_connections_per_host: int = 10
+    '''连接池对单个主机的最大连接数
+
+    `httpx` 不区分主机，该值将作为其最大保活连接数
+    '''
+    
+    keepalive_expiry: float = 5.0
+    '''空闲连接的保活时间（秒）'''
+    
+    http2: bool = False
+    '''是否启用 HTTP/2
+
+    仅 `httpx` 客户端支持，需要安装 `httpx[http2]`。
+    启用后对同一主机的大量并发请求将在少数连接上多路复用，无需为每个并发请求单独建立连接
+    '''
+    
+    json_codec: Optional[str] = None
+    '''JSON 编解码器，可选 `orjson`、`msgspec`、`ujson`、`json`
+
+    为 `None` 时按上述顺序自动选择已安装的实现，
+    用于解析响应、序列化请求体以及谱面的 JSON 转换
+    '''
+    
+    memo: Memo = Memo()
+    '''进程内实体信息缓存
+
+    卡牌、歌曲、活动等实体的 `get_info` 结果将按 `(实体类型, ID)` 在所有实例间共享，
+    可通过 `memo.ttls` 为各实体类型单独设置有效期，设置 `memo.ttl = 0` 即可禁用
+    '''
+    
+    retry: Optional['RetryPolicy'] = None
+    '''GET 请求的重试策略
+
+    为 `None` 时使用默认策略：网络错误、超时及 429/5xx 响应最多尝试 3 次，
+    使用带抖动的指数退避并遵循 `Retry-After`；设置为 `RetryPolicy(max_attempts=1)` 即可禁用重试
+    '''
+    
+    rate_limits: Dict[str, 'RateLimit'] = {}
+    '''各主机的请求限速配置，键为 `PREFIX` 中的名称（如 `bestdori`、`ayachan`、`sonolus`）
+
+    未配置的主机不限速，例如 `settings.rate_limits['bestdori'] = RateLimit(5, max_concurrency=4)`
+    将对 bestdori.com 的请求限制为每秒 5 个且最多同时进行 4 个
+    '''
+    
+    coalesce: bool = True
+    '''是否合并并发的相同 GET 请求
+
+    启用时，同一会话中 URL、参数与 Cookies 均相同的并发 GET 请求只会实际发送一次，
+    所有调用方共享同一个响应
+    '''
+    
+    cache: Optional['ResponseCache'] = None
+    '''GET 响应缓存，为 `None` 时不缓存
+
+    可设置为 `MemoryCache` 或 `DiskCache`，缓存的响应将使用
+    `ETag` / `Last-Modified` 进行条件请求验证，未修改时直接复用本地内容
+    '''
+    
+    hooks: List['Hooks'] = []
+    '''请求事件钩子，为空时不记录任何请求事件
+
+    可添加 `MetricsCollector` 按端点统计请求计数与耗时分布，
+    或继承 `Hooks` 自定义 `on_request_start`、`on_response`、`on_error`、`on_retry`、`on_cache_hit` 事件
+    '''
+    
+    cassette: Optional['Cassette'] = None
+    '''请求录制文件，为 `None` 时不录制也不回放
+
+    设置为 `Cassette(path, mode='record')` 时录制所有请求的响应，
+    设置为 `Cassette(path)` 时只从录制文件回放响应而不访问网络
+    '''
+    
 settings = Settings()
\ No newline at end of file
@@ -5,7 +5,7 @@ from typing_extensions import overload
 from typing import TYPE_CHECKING, Union, Literal, Optional
 
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import (
@@ -17,54 +17,58 @@ API = get_api('bestdori.api')
 
 # 获取总歌曲 Meta 信息
 @overload
-def get_all(index: Literal[2]) -> 'SongsMetaAll2':
+def get_all(index: Literal[2], *, session: Optional[Session]=None) -> 'SongsMetaAll2':
     '''获取总歌曲 Meta 信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsMetaAll2: 获取到的所有已有歌曲的 Meta 信息, 只有 7s 技能数值信息 `all.2.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5]) -> 'SongsMetaAll5':
+def get_all(index: Literal[5], *, session: Optional[Session]=None) -> 'SongsMetaAll5':
     '''获取总歌曲 Meta 信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsMetaAll5: 获取到的所有已有歌曲的 Meta 信息 `all.5.json`
     '''
     ...
 
-def get_all(index: Literal[2, 5]=5) -> Union['SongsMetaAll2', 'SongsMetaAll5']:
-    return Api(API['all']['meta'].format(index=index)).get().json()
+def get_all(index: Literal[2, 5]=5, *, session: Optional[Session]=None) -> Union['SongsMetaAll2', 'SongsMetaAll5']:
+    return Api(API['all']['meta'].format(index=index), session=session).get().json()
 
 # 异步获取总歌曲 Meta 信息
 @overload
-async def get_all_async(index: Literal[2]) -> 'SongsMetaAll2':
+async def get_all_async(index: Literal[2], *, session: Optional[Session]=None) -> 'SongsMetaAll2':
     '''异步获取总歌曲 Meta 信息
 
     参数:
         index (Literal[2]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         SongsMetaAll2: 获取到的所有已有歌曲的 Meta 信息, 只有 7s 技能数值信息 `all.2.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5]) -> 'SongsMetaAll5':
+async def get_all_async(index: Literal[5], *, session: Optional[Session]=None) -> 'SongsMetaAll5':
     '''异步获取总歌曲 Meta 信息
 
     参数:
         index (Literal[5]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         SongsMetaAll5: 获取到的所有已有歌曲的 Meta 信息 `all.5.json`
     '''
     ...
 
-async def get_all_async(index: Literal[2, 5]=5) -> Union['SongsMetaAll2', 'SongsMetaAll5']:
-    return (await Api(API['all']['meta'].format(index=index)).aget()).json()
+async def get_all_async(index: Literal[2, 5]=5, *, session: Optional[Session]=None) -> Union['SongsMetaAll2', 'SongsMetaAll5']:
+    return (await Api(API['all']['meta'].format(index=index), session=session).aget()).json()
@@ -1,14 +1,17 @@
 '''`bestdori.songs`
 
 BanG Dream! 歌曲相关操作'''
+from pathlib import Path
 from typing_extensions import overload
-from typing import TYPE_CHECKING, Dict, List, Union, Literal, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Literal, Iterable, Optional
 
 from . import post
 from .user import Me
 from .charts import Chart
 from .utils import get_api
-from .utils.network import Api
+from .settings import settings
+from .utils.network import Api, Session
+from .utils.batch import gather_many, gather_many_async
 from .exceptions import (
     HTTPStatusError,
     NoDataException,
@@ -25,6 +28,7 @@ if TYPE_CHECKING:
         SongsAll7,
         SongsAll8,
         ServerName,
+        SongsAll5Info,
         DifficultyName,
     )
 
@@ -33,55 +37,60 @@ ASSETS = get_api('bestdori.assets')
 
 # 获取总歌曲信息
 @overload
-def get_all(index: Literal[0], *, me: Optional[Me] = None) -> Dict[str, 'NoneDict']:
+def get_all(index: Literal[0], *, me: Optional[Me] = None, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''获取总歌曲信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 获取到的所有已有歌曲 ID `all.0.json`
     '''
     ...
 @overload
-def get_all(index: Literal[1], *, me: Optional[Me] = None) -> 'SongsAll1':
+def get_all(index: Literal[1], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll1':
     '''获取总歌曲信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll1: 获取到的所有已有歌曲的曲名信息 `all.1.json`
     '''
     ...
 @overload
-def get_all(index: Literal[5], *, me: Optional[Me] = None) -> 'SongsAll5':
+def get_all(index: Literal[5], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll5':
     '''获取总歌曲信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`，默认为该项
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll5: 获取到的所有已有歌曲的简洁信息 `all.5.json`
     '''
     ...
 @overload
-def get_all(index: Literal[7], *, me: Optional[Me] = None) -> 'SongsAll7':
+def get_all(index: Literal[7], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll7':
     '''获取总歌曲信息
 
     参数:
         index (Literal[7]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll7: 获取到的所有已有歌曲的较为详细信息 `all.7.json`
     '''
     ...
 @overload
-def get_all(index: Literal[8], *, me: Optional[Me] = None) -> 'SongsAll8':
+def get_all(index: Literal[8], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll8':
     '''获取总歌曲信息
 
     参数:
         index (Literal[8]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll8: 获取到的所有已有歌曲的详细信息 `all.8.json`
@@ -89,61 +98,66 @@ def get_all(index: Literal[8], *, me: Optional[Me] = None) -> 'SongsAll8':
     ...
 
 def get_all(
-        index: Literal[0, 1, 5, 7, 8]=5, *, me: Optional[Me] = None
+        index: Literal[0, 1, 5, 7, 8]=5, *, me: Optional[Me] = None, session: Optional[Session]=None
     ) -> Union[Dict[str, 'NoneDict'], 'SongsAll1', 'SongsAll5', 'SongsAll7', 'SongsAll8']:
-    return Api(API['songs']['all'].format(index=index)).get().json()
+    return Api(API['songs']['all'].format(index=index), session=session).get().json()
 
 # 异步获取总歌曲信息
 @overload
-async def get_all_async(index: Literal[0], *, me: Optional[Me] = None) -> Dict[str, 'NoneDict']:
+async def get_all_async(index: Literal[0], *, me: Optional[Me] = None, session: Optional[Session]=None) -> Dict[str, 'NoneDict']:
     '''异步获取总歌曲信息
 
     参数:
         index (Literal[0]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         Dict[str, NoneDict]: 获取到的所有已有歌曲 ID `all.0.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[1], *, me: Optional[Me] = None) -> 'SongsAll1':
+async def get_all_async(index: Literal[1], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll1':
     '''异步获取总歌曲信息
 
     参数:
         index (Literal[1]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll1: 获取到的所有已有歌曲的曲名信息 `all.1.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[5], *, me: Optional[Me] = None) -> 'SongsAll5':
+async def get_all_async(index: Literal[5], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll5':
     '''异步获取总歌曲信息
 
     参数:
         index (Literal[5], optional): 指定获取哪种 `all.json`，默认为该项
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll5: 获取到的所有已有歌曲的简洁信息 `all.5.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[7], *, me: Optional[Me] = None) -> 'SongsAll7':
+async def get_all_async(index: Literal[7], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll7':
     '''异步获取总歌曲信息
 
     参数:
         index (Literal[7]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll7: 获取到的所有已有歌曲的较为详细信息 `all.7.json`
     '''
     ...
 @overload
-async def get_all_async(index: Literal[8], *, me: Optional[Me] = None) -> 'SongsAll8':
+async def get_all_async(index: Literal[8], *, me: Optional[Me] = None, session: Optional[Session]=None) -> 'SongsAll8':
     '''异步获取总歌曲信息
 
     参数:
         index (Literal[8]): 指定获取哪种 `all.json`
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         SongsAll8: 获取到的所有已有歌曲的详细信息 `all.8.json`
@@ -151,9 +165,9 @@ async def get_all_async(index: Literal[8], *, me: Optional[Me] = None) -> 'Songs
     ...
 
 async def get_all_async(
-    index: Literal[0, 1, 5, 7, 8]=5, *, me: Optional[Me] = None
+    index: Literal[0, 1, 5, 7, 8]=5, *, me: Optional[Me] = None, session: Optional[Session]=None
 ) -> Union[Dict[str, 'NoneDict'], 'SongsAll1', 'SongsAll5', 'SongsAll7', 'SongsAll8']:
-    return (await Api(API['songs']['all'].format(index=index)).aget()).json()
+    return (await Api(API['songs']['all'].format(index=index), session=session).aget()).json()
 
 # 歌曲封面内部类
 class Jacket:
@@ -162,13 +176,16 @@ class Jacket:
     参数:
         url (str): 封面链接
         bytes (bytes): 封面字节数据
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
     def __init__(
         self,
         index: int,
         jacket_image: str,
-        server: 'ServerName'
+        server: 'ServerName',
+        *,
+        session: Optional[Session]=None,
     ) -> None:
         '''歌曲封面类'''
         self._index: int = index
@@ -178,6 +195,8 @@ class Jacket:
         self._server: 'ServerName' = server
         '''封面所在服务器'''
 
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         return
     
     # 封面 url
@@ -187,7 +206,8 @@ class Jacket:
         return Api(
             ASSETS['songs']['musicjacket'].format(
                 server=self._server, index=self._index, jacket_image=self._jacket_image
-            )
+            ),
+            session=self.session,
         ).url
     
     # 获取封面字节数据
@@ -196,7 +216,8 @@ class Jacket:
         return Api(
             ASSETS['songs']['musicjacket'].format(
                 server=self._server, index=self._index, jacket_image=self._jacket_image
-            )
+            ),
+            session=self.session,
         ).get().content
     
     # 异步获取封面字节数据
@@ -205,7 +226,8 @@ class Jacket:
         return (await Api(
             ASSETS['songs']['musicjacket'].format(
                 server=self._server, index=self._index, jacket_image=self._jacket_image
-            )
+            ),
+            session=self.session,
         ).aget()).content
 
 # 歌曲类
@@ -214,13 +236,15 @@ class Song:
 
     参数:
         id (int): 歌曲 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int, *, me: Optional[Me] = None) -> None:
+    def __init__(self, id: int, *, me: Optional[Me] = None, session: Optional[Session]=None) -> None:
         '''歌曲类
 
         参数:
             id (int): 歌曲 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''歌曲 ID'''
@@ -228,6 +252,8 @@ class Song:
         '''歌曲信息'''
         # me 参数已弃用
         self.__me = None
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         return
     
     @property
@@ -245,17 +271,22 @@ class Song:
             SongInfo: 歌曲详细信息
         '''
         try:
-            response = Api(
-                API['songs']['info'].format(id=self.id)
-            ).get()
+            info = settings.memo.fetch(
+                'songs',
+                self.id,
+                Api(
+                    API['songs']['info'].format(id=self.id),
+                    session=self.session,
+                ).get,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Song {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     def __get_info__(self) -> 'SongInfo':
         if self.__info is None:
@@ -270,17 +301,22 @@ class Song:
             SongInfo: 歌曲详细信息
         '''
         try:
-            response = await Api(
-                API['songs']['info'].format(id=self.id)
-            ).aget()
+            info = await settings.memo.afetch(
+                'songs',
+                self.id,
+                Api(
+                    API['songs']['info'].format(id=self.id),
+                    session=self.session,
+                ).aget,
+            )
         except HTTPStatusError as exception:
             if exception.response.status_code == 404:
                 raise NotExistException(f'Song {self.id}')
             else:
                 raise exception
         
-        self.__info = response.json()
-        return self.info
+        self.__info = info
+        return info
     
     async def __get_info_async__(self) -> 'SongInfo':
         if self.__info is None:
@@ -319,7 +355,7 @@ class Song:
         jacket: List[Jacket] = []
         
         for image in jacket_image:
-            jacket.append(Jacket(index, image, self.__server__))
+            jacket.append(Jacket(index, image, self.__server__, session=self.session))
         
         return jacket
     
@@ -338,7 +374,7 @@ class Song:
         jacket: List[Jacket] = []
         
         for image in jacket_image:
-            jacket.append(Jacket(index, image, self.__server__))
+            jacket.append(Jacket(index, image, self.__server__, session=self.session))
         
         return jacket
     
@@ -356,7 +392,7 @@ class Song:
             Chart: 获取到的谱面对象
         '''
         try:
-            chart = Chart.get_chart(self.id, diff)
+            chart = Chart.get_chart(self.id, diff, session=self.session)
             return chart
         except HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -379,7 +415,7 @@ class Song:
             Chart: 获取到的谱面对象
         '''
         try:
-            chart = await Chart.get_chart_async(self.id, diff)
+            chart = await Chart.get_chart_async(self.id, diff, session=self.session)
             return chart
         except HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -397,7 +433,8 @@ class Song:
         '''
         self.__get_info__()
         return Api(
-            ASSETS['songs']['sound'].format(server=self.__server__, id=self.id)
+            ASSETS['songs']['sound'].format(server=self.__server__, id=self.id),
+            session=self.session,
         ).get().content
     
     # 异步获取歌曲音频
@@ -409,9 +446,42 @@ class Song:
         '''
         await self.__get_info_async__()
         return (await Api(
-            ASSETS['songs']['sound'].format(server=self.__server__, id=self.id)
+            ASSETS['songs']['sound'].format(server=self.__server__, id=self.id),
+            session=self.session,
         ).aget()).content
     
+    # 下载歌曲音频
+    def download_bgm(self, path: Union[str, Path]) -> int:
+        '''将歌曲音频流式下载到文件
+
+        参数:
+            path (Union[str, Path]): 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        '''
+        self.__get_info__()
+        return Api(
+            ASSETS['songs']['sound'].format(server=self.__server__, id=self.id),
+            session=self.session,
+        ).download_to(path)
+    
+    # 异步下载歌曲音频
+    async def download_bgm_async(self, path: Union[str, Path]) -> int:
+        '''将歌曲音频流式下载到文件
+
+        参数:
+            path (Union[str, Path]): 目标文件路径
+
+        返回:
+            int: 写入的字节数
+        '''
+        await self.__get_info_async__()
+        return await Api(
+            ASSETS['songs']['sound'].format(server=self.__server__, id=self.id),
+            session=self.session,
+        ).adownload_to(path)
+    
     # 获取歌曲评论
     def get_comment(
         self,
@@ -442,6 +512,7 @@ class Song:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
     
     # 异步获取歌曲评论
@@ -474,4 +545,63 @@ class Song:
             order=order,
             limit=limit,
             offset=offset,
+            session=self.session,
         )
+
+# 批量获取歌曲信息
+def get_many(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['SongInfo', 'SongsAll5Info', Exception]]:
+    '''并发获取多个歌曲信息
+
+    参数:
+        ids (Iterable[int]): 歌曲 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总歌曲信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[SongInfo, SongsAll5Info, Exception]]: 与 `ids` 顺序一致的歌曲信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'SongsAll5Info'] = get_all(5, session=session) if from_all else {}
+    
+    def fetch(id: int) -> Union['SongInfo', 'SongsAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return Song(id, session=session).get_info()
+    
+    return gather_many(ids, fetch, concurrency)
+
+# 异步批量获取歌曲信息
+async def get_many_async(
+    ids: Iterable[int],
+    *,
+    concurrency: int=8,
+    from_all: bool=False,
+    session: Optional[Session]=None,
+) -> List[Union['SongInfo', 'SongsAll5Info', Exception]]:
+    '''并发获取多个歌曲信息
+
+    参数:
+        ids (Iterable[int]): 歌曲 ID
+        concurrency (int, optional): 同时进行的最大请求数
+        from_all (bool, optional): 是否优先使用总歌曲信息 `all.5.json` 中的条目，
+            其中只包含部分字段，但所有 ID 只需一次请求；不在其中的 ID 仍会单独请求
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        List[Union[SongInfo, SongsAll5Info, Exception]]: 与 `ids` 顺序一致的歌曲信息，获取失败的 ID 对应其异常
+    '''
+    _all: Dict[str, 'SongsAll5Info'] = await get_all_async(5, session=session) if from_all else {}
+    
+    async def fetch(id: int) -> Union['SongInfo', 'SongsAll5Info']:
+        if (info := _all.get(str(id), None)) is not None:
+            return info
+        return await Song(id, session=session).get_info_async()
+    
+    return await gather_many_async(ids, fetch, concurrency)
@@ -4,7 +4,7 @@ BanG Dream! 贴纸资源相关操作'''
 from typing import TYPE_CHECKING, Literal, Optional
 
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import AssetsNotExistError
 
 if TYPE_CHECKING:
@@ -18,32 +18,34 @@ API = get_api('bestdori.api')
 ASSETS = get_api('bestdori.assets')
 
 # 获取总贴纸资源信息
-def get_all(index: Literal[2]=2) -> 'StampsAll2':
+def get_all(index: Literal[2]=2, *, session: Optional[Session]=None) -> 'StampsAll2':
     '''获取总活动信息
 
     参数:
         index (Literal[2], optional): 指定获取哪种 `all.json`
             `2`: 获取所有已有贴纸信息 `all.2.json`
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         StampsAll2: 获取到的总贴纸信息
     '''
-    return Api(API['all']['stamps'].format(index=index)).get().json()
+    return Api(API['all']['stamps'].format(index=index), session=session).get().json()
 
 # 异步获取总贴纸资源信息
-async def get_all_async(index: Literal[2]=2) -> 'StampsAll2':
+async def get_all_async(index: Literal[2]=2, *, session: Optional[Session]=None) -> 'StampsAll2':
     '''获取总活动信息
 
     参数:
         index (Literal[2], optional): 指定获取哪种 `all.json`
             `2`: 获取所有已有贴纸信息 `all.2.json`
         me (Optional[Me], optional): 用户验证信息
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         StampsAll2: 获取到的总贴纸信息
     '''
-    return (await Api(API['all']['stamps'].format(index=index)).aget()).json()
+    return (await Api(API['all']['stamps'].format(index=index), session=session).aget()).json()
 
 # 贴纸类
 class Stamp:
@@ -51,18 +53,22 @@ class Stamp:
 
     参数:
         id (int): 贴纸 ID
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, id: int) -> None:
+    def __init__(self, id: int, *, session: Optional[Session]=None) -> None:
         '''贴纸类
 
         参数:
             id (int): 贴纸 ID
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.id: int = id
         '''贴纸 ID'''
         self.__info: Optional['StampInfo'] = None
         '''贴纸资源信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     # 获取贴纸资源信息
@@ -72,7 +78,7 @@ class Stamp:
         返回:
             StampInfo: 贴纸资源信息
         '''
-        _all = get_all()
+        _all = get_all(session=self.session)
         if str(self.id) not in _all:
             raise AssetsNotExistError(f'stamp {self.id}')
         self.__info = _all[str(self.id)]
@@ -90,7 +96,7 @@ class Stamp:
         返回:
             StampInfo: 贴纸资源信息
         '''
-        _all = await get_all_async()
+        _all = await get_all_async(session=self.session)
         if str(self.id) not in _all:
             raise AssetsNotExistError(f'stamp {self.id}')
         self.__info = _all[str(self.id)]
@@ -116,7 +122,8 @@ class Stamp:
         '''
         info = self.__get_info__()
         return Api(
-            ASSETS['stamp']['get'].format(server=server, image_name=info['imageName'])
+            ASSETS['stamp']['get'].format(server=server, image_name=info['imageName']),
+            session=self.session,
         ).get().content
     
     # 异步获取贴纸资源
@@ -134,5 +141,6 @@ class Stamp:
         '''
         info = await self.__get_info_async__()
         return (await Api(
-            ASSETS['stamp']['get'].format(server=server, image_name=info['imageName'])
+            ASSETS['stamp']['get'].format(server=server, image_name=info['imageName']),
+            session=self.session,
         ).aget()).content
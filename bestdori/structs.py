@@ -0,0 +1,289 @@
+'''`bestdori.structs`
+
+将主数据直接从响应字节解码为 `msgspec.Struct` 结构体
+
+结构体由 `bestdori.typing` 中的 `TypedDict` 定义自动生成，解码时会按类型定义校验数据，
+类型定义中未声明的字段将被忽略。
+结构体使用 `__slots__` 存储字段，不保存键名且不参与垃圾回收追踪，
+内存占用远小于嵌套字典，字段以属性方式访问：
+```python
+from bestdori import structs
+
+cards = structs.get_all('cards', 5)
+print(cards['1'].rarity, cards['1'].prefix[0])
+```
+'''
+
+import keyword
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Set, Dict, List, Tuple, Union, Optional, ForwardRef
+
+from typing_extensions import (
+    Required,
+    NotRequired,
+    get_args,
+    get_origin,
+    is_typeddict,
+    get_type_hints,
+)
+
+from . import typing as _typing
+from .utils import get_api
+from .utils.network import Api
+
+if TYPE_CHECKING:
+    from .utils.network import Session
+
+try:
+    import msgspec
+except ModuleNotFoundError as exception:
+    raise ImportError(
+        'module \'msgspec\' is not installed, please install it by running \'pip install msgspec\''
+    ) from exception
+
+API = get_api('bestdori.api')
+
+ALL: Dict[str, Dict[int, str]] = {
+    'bands': {1: 'BandsAll1'},
+    'cards': {2: 'CardAll2', 3: 'CardAll3', 5: 'CardAll5'},
+    'characters': {2: 'CharacterAll2', 5: 'CharacterAll5'},
+    'comics': {5: 'ComicsAll5'},
+    'costumes': {5: 'CostumesAll5'},
+    'events': {1: 'EventsAll1', 3: 'EventsAll3', 4: 'EventsAll4', 5: 'EventsAll5', 6: 'EventsAll6'},
+    'archives': {5: 'EventArchiveAll5'},
+    'gacha': {1: 'GachaAll1', 3: 'GachaAll3', 5: 'GachaAll5'},
+    'loginCampaigns': {1: 'LoginCampaignsAll1', 5: 'LoginCampaignsAll5'},
+    'miracleTicketExchanges': {5: 'MiracleTicketExchangesAll5'},
+    'missions': {5: 'MissionsAll5'},
+    'skills': {2: 'SkillsAll2', 5: 'SkillsAll5', 10: 'SkillsAll10'},
+    'songs': {1: 'SongsAll1', 5: 'SongsAll5', 7: 'SongsAll7', 8: 'SongsAll8'},
+    'stamps': {2: 'StampsAll2'},
+}
+'''可解码的总信息 `all.N.json` 及其对应的 `bestdori.typing` 类型名称'''
+
+_structs: Dict[Tuple[Tuple[type, ...], bool], type] = {}
+_decoders: Dict[Tuple[Any, bool], 'msgspec.json.Decoder'] = {}
+_lock = RLock()
+
+def _is_object(tp: Any) -> bool:
+    '''判断类型在 JSON 中是否为对象'''
+    if isinstance(tp, type) and issubclass(tp, msgspec.Struct):
+        return True
+    return get_origin(tp) is dict or tp is dict
+
+def _field_name(key: str) -> str:
+    '''将键名转换为合法的属性名'''
+    if key.isidentifier() and not keyword.iskeyword(key):
+        return key
+    name = ''.join(c if c.isalnum() else '_' for c in key)
+    return name + '_' if name.isidentifier() else '_' + name
+
+def _struct(typed_dicts: Tuple[type, ...], partial: bool, building: Set[Tuple[type, ...]]) -> Any:
+    '''由 `TypedDict` 生成结构体，传入多个 `TypedDict` 时合并为一个结构体'''
+    if (struct := _structs.get((typed_dicts, partial), None)) is not None:
+        return struct
+    if typed_dicts in building:
+        # 自引用的类型不生成结构体
+        return Dict[str, Any]
+
+    building.add(typed_dicts)
+    try:
+        # 合并各 `TypedDict` 的字段，仅在所有类型中都必需的字段才是必需的
+        hints: Dict[str, List[Any]] = {}
+        required_counts: Dict[str, int] = {}
+        for typed_dict in typed_dicts:
+            _hints = get_type_hints(typed_dict, include_extras=True)
+            for key, hint in _hints.items():
+                required = key in getattr(typed_dict, '__required_keys__', _hints)
+                if get_origin(hint) is NotRequired:
+                    required, hint = False, get_args(hint)[0]
+                elif get_origin(hint) is Required:
+                    required, hint = True, get_args(hint)[0]
+                if hint not in hints.setdefault(key, []):
+                    hints[key].append(hint)
+                required_counts[key] = required_counts.get(key, 0) + required
+
+        fields: List[Tuple[str, Any, Any]] = []
+        for key, _hint in hints.items():
+            field_type = _convert(Union[tuple(_hint)], building)
+            name = _field_name(key)
+            if required_counts[key] == len(typed_dicts) and not partial:
+                default = msgspec.field(name=key) if name != key else msgspec.NODEFAULT
+            else:
+                field_type = Union[field_type, msgspec.UnsetType]
+                default = msgspec.field(default=msgspec.UNSET, name=key)
+            fields.append((name, field_type, default))
+
+        struct = msgspec.defstruct(
+            'Or'.join(typed_dict.__name__ for typed_dict in typed_dicts) + ('Partial' if partial else ''),
+            fields,
+            kw_only=True,
+            omit_defaults=True,
+            gc=False,
+            module=__name__,
+        )
+    finally:
+        building.discard(typed_dicts)
+    _structs[(typed_dicts, partial)] = struct
+    return struct
+
+def _resolve(tp: Any) -> Any:
+    '''解析 `bestdori.typing` 中的前向引用'''
+    if isinstance(tp, str):
+        tp = ForwardRef(tp)
+    if isinstance(tp, ForwardRef):
+        return getattr(_typing, tp.__forward_arg__)
+    return tp
+
+def _convert(tp: Any, building: Set[Tuple[type, ...]]) -> Any:
+    '''将类型注解中的 `TypedDict` 转换为结构体'''
+    tp = _resolve(tp)
+    if is_typeddict(tp):
+        return _struct((tp,), False, building)
+
+    origin, args = get_origin(tp), get_args(tp)
+    if origin in (Required, NotRequired):
+        return _convert(args[0], building)
+    if origin is Union:
+        # `Emptiable[T]` 可能为空字典，转换为所有字段均可缺省的结构体
+        args = tuple(_resolve(arg) for arg in args)
+        partial = _typing.NoneDict in args
+        args = tuple(arg for arg in args if arg is not _typing.NoneDict)
+        typed_dicts = tuple(arg for arg in args if is_typeddict(arg))
+        others = tuple(arg for arg in args if not is_typeddict(arg))
+        members = tuple(_convert(arg, building) for arg in others)
+        if typed_dicts:
+            # msgspec 无法区分多个对象类型的联合，多个 `TypedDict` 合并为一个结构体
+            members += (_struct(typed_dicts, partial, building),)
+        elif partial:
+            members += (Dict[str, Any],)
+        if sum(_is_object(member) for member in members) > 1:
+            # 仍无法区分时保持为原始数据
+            return Any
+        return Union[members]
+    if origin is list:
+        return List[_convert(args[0], building)] if args else list
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return Tuple[_convert(args[0], building), ...]
+        return Tuple[tuple(_convert(arg, building) for arg in args)] if args else tuple
+    if origin is dict:
+        return Dict[_convert(args[0], building), _convert(args[1], building)] if args else dict
+    return tp
+
+# 获取类型对应的结构体类型
+def struct_type(tp: Any) -> Any:
+    '''获取类型注解对应的结构体类型
+
+    类型注解中的所有 `TypedDict` 都将被替换为生成的结构体，
+    例如 `CardAll5` 即 `Dict[str, CardAll5Info]` 将转换为 `Dict[str, CardAll5Info 结构体]`
+
+    参数:
+        tp (Any): 类型注解，如 `bestdori.typing.CardInfo`
+
+    返回:
+        Any: 结构体类型
+    '''
+    with _lock:
+        return _convert(tp, set())
+
+def _decoder(tp: Any, strict: bool) -> 'msgspec.json.Decoder':
+    if (decoder := _decoders.get((tp, strict), None)) is not None:
+        return decoder
+    with _lock:
+        decoder = _decoders[(tp, strict)] = msgspec.json.Decoder(struct_type(tp), strict=strict)
+    return decoder
+
+# 解码 JSON 数据为结构体
+def decode(data: Union[str, bytes], tp: Any, *, strict: bool=True) -> Any:
+    '''将 JSON 数据解码为结构体并校验
+
+    参数:
+        data (Union[str, bytes]): JSON 数据，通常为响应内容 `Response.content`
+        tp (Any): 数据对应的 `bestdori.typing` 类型
+        strict (bool, optional): 是否严格校验类型，为 `False` 时允许字符串与数字间的转换
+
+    返回:
+        Any: 解码后的结构体
+
+    异常:
+        msgspec.ValidationError: 数据与类型定义不符
+    '''
+    return _decoder(tp, strict).decode(data)
+
+# 转换已解析的数据为结构体
+def convert(obj: Any, tp: Any, *, strict: bool=True) -> Any:
+    '''将已解析的 Python 对象转换为结构体并校验
+
+    参数:
+        obj (Any): 已解析的数据，如 `get_info()` 的返回值
+        tp (Any): 数据对应的 `bestdori.typing` 类型
+        strict (bool, optional): 是否严格校验类型
+
+    返回:
+        Any: 转换后的结构体
+    '''
+    return msgspec.convert(obj, struct_type(tp), strict=strict)
+
+# 转换结构体为 Python 内置类型
+def to_builtins(obj: Any) -> Any:
+    '''将结构体转换回字典、列表等 Python 内置类型
+
+    参数:
+        obj (Any): 结构体
+
+    返回:
+        Any: 转换后的对象
+    '''
+    return msgspec.to_builtins(obj)
+
+def _all(kind: str, index: int) -> Tuple[str, Any]:
+    indexes = ALL.get(kind, None)
+    if indexes is None or index not in indexes:
+        raise ValueError(f'Unsupported all.json: {kind}/all.{index}.json')
+    url = API[kind]['all'] if 'all' in API.get(kind, {}) else API['all'][kind]
+    return url.format(index=index), getattr(_typing, indexes[index])
+
+# 获取总信息结构体
+def get_all(
+    kind: str,
+    index: int,
+    *,
+    strict: bool=True,
+    session: Optional['Session']=None,
+) -> Dict[str, Any]:
+    '''获取总信息并解码为结构体
+
+    参数:
+        kind (str): 信息类型，可选值见 `ALL`，如 `cards`、`songs`、`events`
+        index (int): 指定获取哪种 `all.json`
+        strict (bool, optional): 是否严格校验类型
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        Dict[str, Any]: 以 ID 为键的结构体字典
+    '''
+    url, tp = _all(kind, index)
+    return decode(Api(url, session=session).get().content, tp, strict=strict)
+
+# 异步获取总信息结构体
+async def get_all_async(
+    kind: str,
+    index: int,
+    *,
+    strict: bool=True,
+    session: Optional['Session']=None,
+) -> Dict[str, Any]:
+    '''获取总信息并解码为结构体
+
+    参数:
+        kind (str): 信息类型，可选值见 `ALL`，如 `cards`、`songs`、`events`
+        index (int): 指定获取哪种 `all.json`
+        strict (bool, optional): 是否严格校验类型
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        Dict[str, Any]: 以 ID 为键的结构体字典
+    '''
+    url, tp = _all(kind, index)
+    return decode((await Api(url, session=session).aget()).content, tp, strict=strict)
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Literal, Optional
 
 from .user import Me
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 
 if TYPE_CHECKING:
     from .typing import ServerName
@@ -21,6 +21,7 @@ def get_chara(
     *,
     server: 'ServerName',
     me: Optional[Me] = None,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取卡牌缩略图
 
@@ -34,6 +35,7 @@ def get_chara(
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         bytes: 卡牌缩略图字节数据 `bytes`
@@ -44,7 +46,8 @@ def get_chara(
             id=id // 50,
             resource_set_name=resource_set_name,
             type=type,
-        )
+        ),
+        session=session,
     ).get().content
 
 # 异步获取卡牌缩略图
@@ -55,6 +58,7 @@ async def get_chara_async(
     *,
     server: 'ServerName',
     me: Optional[Me] = None,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取卡牌缩略图
 
@@ -68,6 +72,7 @@ async def get_chara_async(
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         bytes: 卡牌缩略图字节数据 `bytes`
@@ -78,7 +83,8 @@ async def get_chara_async(
             id=id // 50,
             resource_set_name=resource_set_name,
             type=type,
-        )
+        ),
+        session=session,
     ).aget()).content
 
 # 获取称号资源
@@ -87,6 +93,7 @@ def get_degree(
     *,
     server: 'ServerName',
     me: Optional[Me] = None,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取称号资源
 
@@ -98,11 +105,12 @@ def get_degree(
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 称号资源字节数据 `bytes`
     '''
-    return Api(ASSETS['thumb']['degree'].format(server=server, degree_name=degree_name)).get().content
+    return Api(ASSETS['thumb']['degree'].format(server=server, degree_name=degree_name), session=session).get().content
 
 # 异步获取称号资源
 async def get_degree_async(
@@ -110,6 +118,7 @@ async def get_degree_async(
     *,
     server: 'ServerName',
     me: Optional[Me] = None,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取称号资源
 
@@ -121,11 +130,12 @@ async def get_degree_async(
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 称号资源字节数据 `bytes`
     '''
-    return (await Api(ASSETS['thumb']['degree'].format(server=server, degree_name=degree_name)).aget()).content
+    return (await Api(ASSETS['thumb']['degree'].format(server=server, degree_name=degree_name), session=session).aget()).content
 
 # 获取服装图标
 def get_costume(
@@ -134,6 +144,7 @@ def get_costume(
     *,
     server: 'ServerName',
     me: Optional[Me] = None,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取服装图标
 
@@ -146,6 +157,7 @@ def get_costume(
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 服装图标
@@ -153,7 +165,8 @@ def get_costume(
     return Api(
         ASSETS['thumb']['costume'].format(
             server=server, id=id // 50, asset_bundle_name=asset_bundle_name
-        )
+        ),
+        session=session,
     ).get().content
 
 # 异步获取服装图标
@@ -163,6 +176,7 @@ async def get_costume_async(
     *,
     server: 'ServerName',
     me: Optional[Me] = None,
+    session: Optional[Session]=None,
 ) -> bytes:
     '''获取服装图标
 
@@ -175,6 +189,7 @@ async def get_costume_async(
             `tw`: 台服
             `cn`: 国服
             `kr`: 韩服
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     
     返回:
         bytes: 服装图标
@@ -182,5 +197,6 @@ async def get_costume_async(
     return (await Api(
         ASSETS['thumb']['costume'].format(
             server=server, id=id // 50, asset_bundle_name=asset_bundle_name
-        )
+        ),
+        session=session,
     ).aget()).content
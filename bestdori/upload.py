@@ -7,34 +7,64 @@ from io import BufferedReader
 from typing import Union, Optional
 
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session
 from .exceptions import AlreadyUploadedError
 
 API = get_api('bestdori.api')
 
 # 从 Bestdori 获取指定哈希文件字节
-def download(hash: str) -> bytes:
+def download(hash: str, *, session: Optional[Session]=None) -> bytes:
     '''从 Bestdori 获取指定哈希文件字节
 
     参数:
         hash (str): 文件哈希值
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 文件字节 `bytes`
     '''
-    return Api(API['upload']['file'].format(hash=hash)).get().content
+    return Api(API['upload']['file'].format(hash=hash), session=session).get().content
 
 # 异步从 Bestdori 获取指定哈希文件字节
-async def download_async(hash: str) -> bytes:
+async def download_async(hash: str, *, session: Optional[Session]=None) -> bytes:
     '''从 Bestdori 获取指定哈希文件字节
 
     参数:
         hash (str): 文件哈希值
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
     返回:
         bytes: 文件字节 `bytes`
     '''
-    return (await Api(API['upload']['file'].format(hash=hash)).aget()).content
+    return (await Api(API['upload']['file'].format(hash=hash), session=session).aget()).content
+
+# 下载 Bestdori 指定哈希文件
+def download_to(hash: str, path: Union[str, Path], *, session: Optional[Session]=None) -> int:
+    '''将 Bestdori 指定哈希文件流式下载到文件
+
+    参数:
+        hash (str): 文件哈希值
+        path (Union[str, Path]): 目标文件路径
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        int: 写入的字节数
+    '''
+    return Api(API['upload']['file'].format(hash=hash), session=session).download_to(path)
+
+# 异步下载 Bestdori 指定哈希文件
+async def download_to_async(hash: str, path: Union[str, Path], *, session: Optional[Session]=None) -> int:
+    '''将 Bestdori 指定哈希文件流式下载到文件
+
+    参数:
+        hash (str): 文件哈希值
+        path (Union[str, Path]): 目标文件路径
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
+
+    返回:
+        int: 写入的字节数
+    '''
+    return await Api(API['upload']['file'].format(hash=hash), session=session).adownload_to(path)
 
 # 通过哈希值构建 Bestdori 文件 URL
 def hash_to_url(hash: str) -> str:
@@ -56,9 +86,10 @@ class Upload:
         file_bytes (bytes): 文件字节
         name (str): 文件名
         reader (BufferedReader): 文件字节流
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, file_bytes: bytes, name: str, reader: BufferedReader) -> None:
+    def __init__(self, file_bytes: bytes, name: str, reader: BufferedReader, *, session: Optional[Session]=None) -> None:
         # 处理文件字节
         hash = sha1(file_bytes).hexdigest() # 计算 SHA-1 哈希
         size = len(file_bytes) # 计算文件大小
@@ -73,15 +104,18 @@ class Upload:
         '''文件名'''
         self._reader: BufferedReader = reader
         '''文件字节流'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     # 从路径中获取文件
     @classmethod
-    def from_path(cls, path: Union[str, Path]) -> 'Upload':
+    def from_path(cls, path: Union[str, Path], *, session: Optional[Session]=None) -> 'Upload':
         '''从路径中获取文件
 
         参数:
             path (Union[str, Path]): 文件路径
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
 
         返回:
             Upload: 上传文件对象
@@ -93,7 +127,7 @@ class Upload:
         file = open(path, 'rb')
         file_bytes = file.read()
         # 返回上传文件对象
-        return cls(file_bytes, file_name, file)
+        return cls(file_bytes, file_name, file, session=session)
     
     # 上传文件
     def upload(self) -> str:
@@ -113,7 +147,7 @@ class Upload:
         }
         # 发送预上传请求
         try:
-            Api(API['upload']['prepare']).post(
+            Api(API['upload']['prepare'], session=self.session).post(
                 data=payload,
             )
         except AlreadyUploadedError:
@@ -121,7 +155,7 @@ class Upload:
             return self._hash
         # 发送上传请求
         with self._reader:
-            response = Api(API['upload']['upload']).post(
+            response = Api(API['upload']['upload'], session=self.session).post(
                 files={
                     'file': (self._name, self._reader, None)
                 },
@@ -131,7 +165,7 @@ class Upload:
         #重复查询至多 5 次上传状态
         for _ in range(5):
             # 发送上传状态查询请求
-            response = Api(API['upload']['status'].format(hash=hash_get)).get()
+            response = Api(API['upload']['status'].format(hash=hash_get), session=self.session).get()
             # 获取上传状态
             status = response.json()['status']
             # 若上传成功则返回
@@ -158,7 +192,7 @@ class Upload:
         }
         # 发送预上传请求
         try:
-            await Api(API['upload']['prepare']).apost(
+            await Api(API['upload']['prepare'], session=self.session).apost(
                 data=payload,
             )
         except AlreadyUploadedError:
@@ -166,7 +200,7 @@ class Upload:
             return self._hash
         # 发送上传请求
         with self._reader:
-            response = await Api(API['upload']['upload']).apost(
+            response = await Api(API['upload']['upload'], session=self.session).apost(
                 files={
                     'file': (self._name, self._reader, None)
                 },
@@ -176,7 +210,7 @@ class Upload:
         #重复查询至多 5 次上传状态
         for _ in range(5):
             # 发送上传状态查询请求
-            response = await Api(API['upload']['status'].format(hash=hash_get)).aget()
+            response = await Api(API['upload']['status'].format(hash=hash_get), session=self.session).aget()
             # 获取上传状态
             status = response.json()['status']
             # 若上传成功则返回
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Literal, Optional
 
 from . import post
 from .utils import get_api
-from .utils.network import Api
+from .utils.network import Api, Session, get_default_session
 
 if TYPE_CHECKING:
     from .typing import PostList, UserInfo, UserMeInfo
@@ -19,13 +19,16 @@ class User:
 
     参数:
         username (str): 用户名
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, username: str) -> None:     
+    def __init__(self, username: str, *, session: Optional[Session]=None) -> None:     
         self.username: str = username
         '''用户名'''
         self.__info: Optional['UserInfo'] = None
         '''用户信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         
     
     @property
@@ -43,7 +46,8 @@ class User:
         '''
         # 不再使用 me.cookies，统一依赖全局 Api Cookies
         response = Api(
-            API['user']['info']
+            API['user']['info'],
+            session=self.session,
         ).get(
             params={'username': self.username},
         )
@@ -64,7 +68,8 @@ class User:
         '''
         # 不再使用 me.cookies，统一依赖全局 Api Cookies
         response = await Api(
-            API['user']['info']
+            API['user']['info'],
+            session=self.session,
         ).aget(
             params={'username': self.username},
         )
@@ -103,6 +108,7 @@ class User:
         '''
         return post.get_list(
             username=self.username, limit=limit, offset=offset, order=order,
+            session=self.session,
         )
     
     # 异步获取用户帖子
@@ -131,6 +137,7 @@ class User:
         '''
         return await post.get_list_async(
             username=self.username, limit=limit, offset=offset, order=order,
+            session=self.session,
         )
     
     # 获取用户谱面
@@ -164,6 +171,7 @@ class User:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 异步获取用户谱面
@@ -197,6 +205,7 @@ class User:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 获取用户文本帖子
@@ -230,6 +239,7 @@ class User:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 异步获取用户文本帖子
@@ -263,6 +273,7 @@ class User:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 获取用户故事
@@ -296,6 +307,7 @@ class User:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
     
     # 异步获取用户故事
@@ -329,6 +341,7 @@ class User:
             limit=limit,
             offset=offset,
             order=order,
+            session=self.session,
         )
 
 # 当前用户类
@@ -338,14 +351,16 @@ class Me:
     参数:
         username (str): 用户名
         password (str): 密码
+        session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
     '''
     # 初始化
-    def __init__(self, username: str, password: str) -> None:
+    def __init__(self, username: str, password: str, *, session: Optional[Session]=None) -> None:
         '''自身用户类
 
         参数:
             username (str): 用户名
             password (str): 密码
+            session (Optional[Session], optional): 请求所使用的会话，默认使用全局默认会话
         '''
         self.username: str = username
         '''用户名'''
@@ -355,6 +370,8 @@ class Me:
         '''用户 Cookies'''
         self.__me: Optional['UserMeInfo'] = None
         '''用户自我信息'''
+        self.session: Optional[Session] = session
+        '''请求所使用的会话'''
         return
     
     # 用户 Cookies
@@ -376,23 +393,27 @@ class Me:
     def login(self) -> None:
         '''登录用户账号。'''
         response = Api(
-            API['user']['login']
+            API['user']['login'],
+            session=self.session,
         ).post(data={'username': self.username, 'password': self.password})
         self.__cookies = response.cookies
-        Api.set_cookies(response.cookies)
+        session = self.session if self.session is not None else get_default_session()
+        session.cookies = response.cookies
 
-        response = Api(API['user']['me']).get(cookies=self.cookies)
+        response = Api(API['user']['me'], session=self.session).get(cookies=self.cookies)
         self.__me = response.json()
     
     async def login_async(self) -> None:
         '''登录用户账号。'''
         response = await Api(
-            API['user']['login']
+            API['user']['login'],
+            session=self.session,
         ).apost(data={'username': self.username, 'password': self.password})
         self.__cookies = response.cookies
-        Api.set_cookies(response.cookies)
+        session = self.session if self.session is not None else get_default_session()
+        session.cookies = response.cookies
         
-        response = await Api(API['user']['me']).aget(cookies=self.cookies)
+        response = await Api(API['user']['me'], session=self.session).aget(cookies=self.cookies)
         self.__me = response.json()
     
     def user(self) -> 'User':
@@ -401,7 +422,7 @@ class Me:
         返回:
             User: 当前用户的用户类实例
         '''
-        return User(self.username)
+        return User(self.username, session=self.session)
     
     def update_info(self, info: 'UserInfo') -> 'UserInfo':
         '''更新用户信息
@@ -413,7 +434,8 @@ class Me:
             UserInfo: 更新成功后的用户信息
         '''
         Api(
-            API['user']['info']
+            API['user']['info'],
+            session=self.session,
         ).post(data=dict(info))
         
         return self.user().get_info()
@@ -428,7 +450,8 @@ class Me:
             UserInfo: 更新成功后的用户信息
         '''
         await Api(
-            API['user']['info']
+            API['user']['info'],
+            session=self.session,
         ).apost(data=dict(info))
 
         return await self.user().get_info_async()
@@ -5,8 +5,9 @@
 import sys
 from json import load
 from functools import lru_cache
-from importlib import resources
-from typing import Dict, List, Tuple, Optional, Protocol
+from typing import Dict, List, Tuple, Iterator, Mapping, Optional, Protocol
+
+from .endpoints import compile_api
 
 class _NamedObject(Protocol):
     '''可获取 `__name__` 属性方法的类型'''
@@ -15,15 +16,10 @@ class _NamedObject(Protocol):
     def __name__(self) -> List[Optional[str]]: ...
 
 @lru_cache(maxsize=128)
-def get_api(*paths: str) -> Dict[str, Dict[str, str]]:
-    '''获取 API 字典
-
-    参数:
-        *paths (str): API 文件路径
+def _load_api(*paths: str) -> Dict[str, Dict[str, str]]:
+    '''读取 API 文件并编译其中的 URL 模板'''
+    from importlib import resources
 
-    返回:
-        Dict[str, Dict[str, str]]: API 字典
-    '''
     _paths = []
     for path in paths:
         _paths.extend(path.split('.'))
@@ -36,11 +32,57 @@ def get_api(*paths: str) -> Dict[str, Dict[str, str]]:
     
     if sys.version_info < (3, 11):
         with resources.open_text(_path, filename) as f:
-            return load(f)
+            return compile_api(load(f), '.'.join(_paths))
     else:
         path = resources.files(_path).joinpath(filename)
         with path.open('r') as f:
-            return load(f)
+            return compile_api(load(f), '.'.join(_paths))
+
+class ApiTable(Mapping[str, Dict[str, str]]):
+    '''延迟读取的 API 字典，首次访问时才读取对应的 API 文件
+
+    参数:
+        *paths (str): API 文件路径
+    '''
+
+    def __init__(self, *paths: str) -> None:
+        self._paths = paths
+        self._table: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def table(self) -> Dict[str, Dict[str, str]]:
+        '''API 字典'''
+        if self._table is None:
+            self._table = _load_api(*self._paths)
+        return self._table
+
+    def __getitem__(self, key: str) -> Dict[str, str]:
+        return self.table[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __repr__(self) -> str:
+        if self._table is None:
+            return f'ApiTable({", ".join(map(repr, self._paths))})'
+        return repr(self._table)
+
+@lru_cache(maxsize=128)
+def get_api(*paths: str) -> ApiTable:
+    '''获取 API 字典
+
+    API 文件将在首次访问字典内容时才被读取
+
+    参数:
+        *paths (str): API 文件路径
+
+    返回:
+        ApiTable: API 字典
+    '''
+    return ApiTable(*paths)
 
 # 将十六进制颜色代码转换为 RGB 元组
 def hex_to_rgb(hex: str) -> Tuple[int, int, int]:
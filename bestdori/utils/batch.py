@@ -0,0 +1,63 @@
+'''`bestdori.utils.batch`
+
+批量并发请求辅助模块'''
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union, TypeVar, Callable, Iterable, Awaitable
+
+K = TypeVar('K')
+T = TypeVar('T')
+
+def gather_many(
+    keys: Iterable[K],
+    fetch: Callable[[K], T],
+    concurrency: int,
+) -> List[Union[T, Exception]]:
+    '''在线程池中并发调用 `fetch`
+
+    参数:
+        keys (Iterable[K]): 调用参数
+        fetch (Callable[[K], T]): 获取单个结果的方法
+        concurrency (int): 最大并发数
+
+    返回:
+        List[Union[T, Exception]]: 与 `keys` 顺序一致的结果，调用失败时为对应的异常
+    '''
+    def _fetch(key: K) -> Union[T, Exception]:
+        try:
+            return fetch(key)
+        except Exception as exception:
+            return exception
+
+    keys = list(keys)
+    if concurrency <= 1 or len(keys) <= 1:
+        return [_fetch(key) for key in keys]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(keys))) as executor:
+        return list(executor.map(_fetch, keys))
+
+async def gather_many_async(
+    keys: Iterable[K],
+    fetch: Callable[[K], Awaitable[T]],
+    concurrency: int,
+) -> List[Union[T, Exception]]:
+    '''在事件循环中并发调用 `fetch`
+
+    参数:
+        keys (Iterable[K]): 调用参数
+        fetch (Callable[[K], Awaitable[T]]): 异步获取单个结果的方法
+        concurrency (int): 最大并发数
+
+    返回:
+        List[Union[T, Exception]]: 与 `keys` 顺序一致的结果，调用失败时为对应的异常
+    '''
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _fetch(key: K) -> Union[T, Exception]:
+        async with semaphore:
+            try:
+                return await fetch(key)
+            except Exception as exception:
+                return exception
+
+    return list(await asyncio.gather(*[_fetch(key) for key in keys]))
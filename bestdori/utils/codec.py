@@ -0,0 +1,211 @@
+'''`bestdori.utils.codec`
+
+JSON 编解码模块，按需选用 `orjson` / `msgspec` / `ujson` 等更快的实现，
+均未安装时回退到标准库 `json`'''
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Type, Union, Optional
+
+from bestdori.settings import settings
+
+# JSON 编解码器基类
+class JsonCodec(ABC):
+    '''JSON 编解码器基类'''
+
+    name: str
+    '''编解码器名称'''
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        '''解析 JSON 数据
+
+        参数:
+            data (Union[str, bytes]): JSON 字符串或 UTF-8 字节
+
+        返回:
+            Any: 解析后的对象
+        '''
+        raise NotImplementedError
+
+    @abstractmethod
+    def dumpb(self, obj: Any) -> bytes:
+        '''将对象序列化为 UTF-8 编码的 JSON 字节
+
+        参数:
+            obj (Any): 要序列化的对象
+
+        返回:
+            bytes: JSON 字节
+        '''
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> str:
+        '''将对象序列化为 JSON 字符串，非 ASCII 字符不转义
+
+        参数:
+            obj (Any): 要序列化的对象
+
+        返回:
+            str: JSON 字符串
+        '''
+        return self.dumpb(obj).decode('utf-8')
+
+class StdlibCodec(JsonCodec):
+    '''标准库 `json` 编解码器'''
+
+    name = 'json'
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode('utf-8')
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+class OrjsonCodec(JsonCodec):
+    '''`orjson` 编解码器'''
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._dumps(obj, option=self._option)
+
+class MsgspecCodec(JsonCodec):
+    '''`msgspec` 编解码器'''
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+class UjsonCodec(JsonCodec):
+    '''`ujson` 编解码器'''
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._loads = ujson.loads
+        self._dumps = ujson.dumps
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode('utf-8')
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+    'ujson': UjsonCodec,
+    'json': StdlibCodec,
+}
+'''可用的编解码器，按自动选择时的优先级排列'''
+
+_codecs: Dict[str, JsonCodec] = {}
+_auto: Optional[JsonCodec] = None
+
+# 获取指定名称的编解码器
+def get_codec(name: Optional[str]=None) -> JsonCodec:
+    '''获取 JSON 编解码器
+
+    参数:
+        name (Optional[str], optional): 编解码器名称，可选 `orjson`、`msgspec`、`ujson`、`json`，
+            为 `None` 时使用 `settings.json_codec`，仍为 `None` 时自动选择已安装的最快实现
+
+    返回:
+        JsonCodec: JSON 编解码器
+    '''
+    global _auto
+
+    if name is None:
+        name = settings.json_codec
+    if name is None:
+        if _auto is None:
+            _auto = available()[0]
+        return _auto
+    if (codec := _codecs.get(name, None)) is not None:
+        return codec
+    if name not in CODECS:
+        raise ValueError(f'Unknown JSON codec \'{name}\', expected one of {list(CODECS)}')
+    try:
+        codec = _codecs[name] = CODECS[name]()
+    except ModuleNotFoundError as exception:
+        raise ImportError(
+            f'module \'{name}\' is not installed, please install it by running \'pip install {name}\''
+        ) from exception
+    return codec
+
+# 获取所有已安装的编解码器
+def available() -> List[JsonCodec]:
+    '''获取所有已安装的编解码器
+
+    返回:
+        List[JsonCodec]: 已安装的编解码器，按优先级排列
+    '''
+    codecs: List[JsonCodec] = []
+    for name in CODECS:
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            continue
+    return codecs
+
+def loads(data: Union[str, bytes]) -> Any:
+    '''使用当前编解码器解析 JSON 数据
+
+    参数:
+        data (Union[str, bytes]): JSON 字符串或 UTF-8 字节
+
+    返回:
+        Any: 解析后的对象
+    '''
+    return get_codec().loads(data)
+
+def dumps(obj: Any) -> str:
+    '''使用当前编解码器将对象序列化为 JSON 字符串
+
+    参数:
+        obj (Any): 要序列化的对象
+
+    返回:
+        str: JSON 字符串
+    '''
+    return get_codec().dumps(obj)
+
+def dumpb(obj: Any) -> bytes:
+    '''使用当前编解码器将对象序列化为 UTF-8 编码的 JSON 字节
+
+    参数:
+        obj (Any): 要序列化的对象
+
+    返回:
+        bytes: JSON 字节
+    '''
+    return get_codec().dumpb(obj)
@@ -0,0 +1,179 @@
+'''`bestdori.utils.endpoints`
+
+预编译的 API 端点注册表
+
+`get_api` 读取的 API 文件中的每个 URL 模板都会在加载时被编译为 `Endpoint`，
+预先确定其所属主机、请求头与响应处理方式。格式化得到的 `Url` 携带这些路由信息，
+发送请求时无需再逐一比对 URL 前缀，
+其携带的端点名称（如 `bestdori.api.cards.info`）用于请求事件与指标统计。'''
+
+from typing import Any, Dict, Type, Tuple, Literal, Optional
+
+PREFIX: Dict[str, str] = {
+    'ayachan': 'https://api.ayachan.fun',
+    'bestdori': 'https://bestdori.com',
+    'sonolus': 'https://sonolus.ayachan.fun',
+    'niconi': 'https://card.niconi.co.ni',
+}
+'''各主机的 URL 前缀'''
+
+# 路由信息类
+class Route:
+    '''请求路由信息，决定请求头与响应处理方式
+
+    相同的路由信息只会存在一个实例，应通过 `route_of` 获取
+
+    参数:
+        host (Optional[str]): 所属主机在 `PREFIX` 中的名称
+        relative (bool): 是否为相对于 Bestdori 的路径
+        api (bool): 是否为 Bestdori API
+        assets (bool): 是否为资源文件
+        upload (bool): 是否为 Bestdori 文件上传 API
+    '''
+    __slots__ = ('host', 'relative', 'api', 'assets', 'upload', 'url_class')
+
+    def __init__(self, host: Optional[str], relative: bool, api: bool, assets: bool, upload: bool) -> None:
+        self.host = host
+        '''所属主机在 `PREFIX` 中的名称'''
+        self.relative = relative
+        '''是否为相对于 Bestdori 的路径'''
+        self.api = api
+        '''是否为 Bestdori API'''
+        self.assets = assets
+        '''是否为资源文件'''
+        self.upload = upload
+        '''是否为 Bestdori 文件上传 API'''
+        self.url_class: Type[Url] = type('Url', (Url,), {'__slots__': (), 'route': self})
+        '''携带该路由信息的 `Url` 类型'''
+
+    def headers_key(self, method: Literal['GET', 'POST']) -> Optional[str]:
+        '''获取请求所需的请求头在 `HEADERS_DICT` 中的名称
+
+        参数:
+            method (Literal['GET', 'POST']): 请求方法
+
+        返回:
+            Optional[str]: 请求头名称，无需特殊请求头时为 `None`
+        '''
+        if self.host == 'bestdori' and not self.upload:
+            # Bestdori 文件上传 API 需要特殊的请求头
+            return 'bestdori-api'
+        if self.host == 'sonolus' and method == 'POST':
+            # Sonolus 测试服上传 API 需要特殊的请求头
+            return 'sonolus-post'
+        return None
+
+    def __repr__(self) -> str:
+        return (
+            f'Route(host={self.host!r}, relative={self.relative}, '
+            f'api={self.api}, assets={self.assets}, upload={self.upload})'
+        )
+
+# 携带路由信息的 URL
+class Url(str):
+    '''携带路由信息的 URL 字符串，每种路由信息对应一个子类，实例不占用额外空间'''
+    __slots__ = ()
+
+    route: Route
+    '''路由信息'''
+    endpoint: Optional[str] = None
+    '''端点名称，不是由 API 文件中的端点格式化得到时为 `None`'''
+
+_routes: Dict[Tuple[Optional[str], bool, bool, bool, bool], Route] = {}
+
+# 解析 URL 的路由信息
+def route_of(url: str) -> Route:
+    '''解析 URL 的路由信息
+
+    参数:
+        url (str): 请求 URL，以 `/` 开头时视为 Bestdori 的路径
+
+    返回:
+        Route: 路由信息
+    '''
+    relative = not url.startswith('http')
+    host: Optional[str] = 'bestdori' if relative else None
+    if host is None:
+        for name, prefix in PREFIX.items():
+            if url.startswith(prefix):
+                host = name
+                break
+    api = host == 'bestdori' and '/api/' in url
+    key = (host, relative, api, not api and ('/assets/' in url or '/res/' in url), url.endswith('/api/upload'))
+    if (route := _routes.get(key, None)) is None:
+        route = _routes.setdefault(key, Route(*key))
+    return route
+
+# API 端点
+class Endpoint(str):
+    '''预编译的 API 端点，可直接作为 URL 模板字符串使用
+
+    `format` 返回携带路由信息与端点名称的 `Url`。路径整体由占位符给出的模板
+    （如 `https://card.niconi.co.ni/{assets}`）无法预先确定路由信息，将在格式化后解析。
+
+    参数:
+        template (str): URL 模板
+        name (Optional[str], optional): 端点名称
+    '''
+
+    route: Route
+    '''路由信息，路径由占位符给出时为模板本身的路由信息，以格式化得到的 `Url` 为准'''
+    endpoint: Optional[str]
+    '''端点名称'''
+
+    def __new__(cls, template: str, name: Optional[str]=None) -> 'Endpoint':
+        endpoint = super().__new__(cls, template)
+        endpoint.route = route_of(template)
+        endpoint.endpoint = name
+        path = template
+        if endpoint.route.host is not None and not endpoint.route.relative:
+            path = template[len(PREFIX[endpoint.route.host]):]
+        # 路径由占位符给出时路由信息取决于格式化后的 URL
+        endpoint._dynamic = path.lstrip('/').startswith('{')
+        endpoint._url_classes = {}
+        endpoint._url_class = endpoint._class_of(endpoint.route)
+        endpoint._url = None if '{' in template else endpoint._url_class(template)
+        return endpoint
+
+    def _class_of(self, route: Route) -> Type[Url]:
+        '''获取携带路由信息与端点名称的 `Url` 类型'''
+        if self.endpoint is None:
+            return route.url_class
+        if (url_class := self._url_classes.get(route, None)) is None:
+            url_class = self._url_classes.setdefault(
+                route, type('Url', (route.url_class,), {'__slots__': (), 'endpoint': self.endpoint})
+            )
+        return url_class
+
+    def format(self, *args: Any, **kwargs: Any) -> Url:
+        '''格式化 URL 模板
+
+        返回:
+            Url: 携带路由信息与端点名称的 URL
+        '''
+        if self._url is not None:
+            return self._url
+        url = str.format(self, *args, **kwargs)
+        if self._dynamic:
+            return self._class_of(route_of(url))(url)
+        return self._url_class(url)
+
+# 编译 API 字典
+def compile_api(table: Any, name: Optional[str]=None) -> Any:
+    '''将 API 字典中的所有 URL 模板编译为 `Endpoint`
+
+    参数:
+        table (Any): API 字典
+        name (Optional[str], optional): API 字典的名称，端点名称为其与各级键名以 `.` 连接
+
+    返回:
+        Any: 编译后的 API 字典
+    '''
+    if isinstance(table, dict):
+        return {
+            key: compile_api(value, key if name is None else f'{name}.{key}')
+            for key, value in table.items()
+        }
+    if isinstance(table, str):
+        return Endpoint(table, name)
+    return table
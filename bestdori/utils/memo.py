@@ -0,0 +1,177 @@
+'''`bestdori.utils.memo`
+
+进程内实体信息缓存模块'''
+
+import time
+from threading import Lock
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Callable, Hashable, Optional, Awaitable
+
+if TYPE_CHECKING:
+    from .network.client import Response
+
+# 实体信息缓存类
+class Memo:
+    '''进程内实体信息缓存类，按 `(实体类型, ID)` 缓存已解析的信息
+
+    缓存在所有实例、会话以及同步与异步方法之间共享。
+    返回的信息对象为共享对象，请勿直接修改。
+
+    参数:
+        ttl (float, optional): 默认的缓存有效期（秒），为 `0` 时不缓存
+        ttls (Optional[Dict[str, float]], optional): 各实体类型单独的缓存有效期（秒）
+        max_entries (int, optional): 最大缓存条目数
+        max_bytes (int, optional): 最大缓存字节数，按原始响应内容大小估算
+    '''
+
+    def __init__(
+        self,
+        *,
+        ttl: float=300.0,
+        ttls: Optional[Dict[str, float]]=None,
+        max_entries: int=1024,
+        max_bytes: int=32 * 1024 * 1024,
+    ) -> None:
+        self.ttl = ttl
+        '''默认的缓存有效期（秒）'''
+        self.ttls: Dict[str, float] = dict(ttls) if ttls is not None else {}
+        '''各实体类型单独的缓存有效期（秒）'''
+        self.max_entries = max_entries
+        '''最大缓存条目数'''
+        self.max_bytes = max_bytes
+        '''最大缓存字节数'''
+        self.hits = 0
+        '''命中次数'''
+        self.misses = 0
+        '''未命中次数'''
+
+        self._entries: 'OrderedDict[Tuple[str, Hashable], Tuple[Any, float, int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        '''当前缓存占用的字节数'''
+        return self._bytes
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        '''缓存统计信息'''
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+        }
+
+    def get_ttl(self, kind: str) -> float:
+        '''获取实体类型的缓存有效期'''
+        return self.ttls.get(kind, self.ttl)
+
+    def get(self, kind: str, key: Hashable) -> Optional[Any]:
+        '''获取缓存的实体信息
+
+        参数:
+            kind (str): 实体类型
+            key (Hashable): 实体 ID
+
+        返回:
+            Optional[Any]: 缓存的实体信息，不存在或已过期时返回 `None`
+        '''
+        with self._lock:
+            item = self._entries.get((kind, key), None)
+            if item is not None:
+                value, expires, size = item
+                if expires > time.monotonic():
+                    self._entries.move_to_end((kind, key))
+                    self.hits += 1
+                    return value
+                del self._entries[(kind, key)]
+                self._bytes -= size
+            self.misses += 1
+            return None
+
+    def set(self, kind: str, key: Hashable, value: Any, *, size: int=0) -> None:
+        '''缓存实体信息
+
+        参数:
+            kind (str): 实体类型
+            key (Hashable): 实体 ID
+            value (Any): 实体信息
+            size (int, optional): 实体信息的估算字节数
+        '''
+        ttl = self.get_ttl(kind)
+        if ttl <= 0 or self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if (old := self._entries.pop((kind, key), None)) is not None:
+                self._bytes -= old[2]
+            self._entries[(kind, key)] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def invalidate(self, kind: Optional[str]=None, key: Optional[Hashable]=None) -> None:
+        '''使缓存失效
+
+        参数:
+            kind (Optional[str], optional): 实体类型，为 `None` 时清空所有缓存
+            key (Optional[Hashable], optional): 实体 ID，为 `None` 时清空该类型的所有缓存
+        '''
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            if key is not None:
+                targets = [(kind, key)] if (kind, key) in self._entries else []
+            else:
+                targets = [_key for _key in self._entries if _key[0] == kind]
+            for target in targets:
+                self._bytes -= self._entries.pop(target)[2]
+
+    def clear(self) -> None:
+        '''清空缓存与统计信息'''
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def fetch(self, kind: str, key: Hashable, request: Callable[[], 'Response']) -> Any:
+        '''获取实体信息，缓存未命中时发送请求并缓存解析结果
+
+        参数:
+            kind (str): 实体类型
+            key (Hashable): 实体 ID
+            request (Callable[[], Response]): 发送请求的方法
+
+        返回:
+            Any: 实体信息
+        '''
+        if (value := self.get(kind, key)) is not None:
+            return value
+        response = request()
+        value = response.json()
+        self.set(kind, key, value, size=len(response.content))
+        return value
+
+    async def afetch(self, kind: str, key: Hashable, request: Callable[[], Awaitable['Response']]) -> Any:
+        '''异步获取实体信息，缓存未命中时发送请求并缓存解析结果
+
+        参数:
+            kind (str): 实体类型
+            key (Hashable): 实体 ID
+            request (Callable[[], Awaitable[Response]]): 异步发送请求的方法
+
+        返回:
+            Any: 实体信息
+        '''
+        if (value := self.get(kind, key)) is not None:
+            return value
+        response = await request()
+        value = response.json()
+        self.set(kind, key, value, size=len(response.content))
+        return value
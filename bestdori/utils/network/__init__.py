@@ -1,9 +1,15 @@
-
+import os
+import time
+import asyncio
+import warnings
+from pathlib import Path
+from contextlib import contextmanager, asynccontextmanager
 from multidict import CIMultiDict
 from http.cookiejar import CookieJar
-from typing import Any, Dict, Type, Union, Literal, Optional, overload
+from typing import Any, Dict, Union, Literal, Iterator, Optional, AsyncIterator
 
 from bestdori.settings import settings
+from bestdori.utils.endpoints import PREFIX as PREFIX, Route, route_of
 from bestdori.exceptions import (
     REQUEST_EXCEPTION,
     RequestException,
@@ -16,17 +22,40 @@ from bestdori.exceptions import (
 from .client import (
     Client as Client,
     Request as Request,
+    Timings as Timings,
     Response as Response,
     AsyncClient as AsyncClient,
     FilesContent as FilesContent,
+    StreamResponse as StreamResponse,
+)
+from .cache import (
+    DiskCache as DiskCache,
+    CacheEntry as CacheEntry,
+    MemoryCache as MemoryCache,
+    ResponseCache as ResponseCache,
+    cache_key,
+)
+from .retry import RetryPolicy as RetryPolicy
+from .replay import (
+    Cassette as Cassette,
+    ReplayClient as ReplayClient,
+    AsyncReplayClient as AsyncReplayClient,
+)
+from .hooks import (
+    Hooks as Hooks,
+    Histogram as Histogram,
+    RequestEvent as RequestEvent,
+    EndpointMetrics as EndpointMetrics,
+    MetricsCollector as MetricsCollector,
+)
+from .ratelimit import RateLimit as RateLimit, rate_limiter
+from .session import (
+    Session as Session,
+    _get_client_class,
+    _get_async_client_class,
+    get_default_session as get_default_session,
 )
 
-PREFIX = {
-    'ayachan': 'https://api.ayachan.fun',
-    'bestdori': 'https://bestdori.com',
-    'sonolus': 'https://sonolus.ayachan.fun',
-    'niconi': 'https://card.niconi.co.ni',
-}
 HEADERS_DICT: Dict[str, CIMultiDict[str]] = {
     'bestdori-api': CIMultiDict({'Content-Type': 'application/json;charset=UTF-8'}),
     'sonolus-post': CIMultiDict({
@@ -34,62 +63,9 @@ HEADERS_DICT: Dict[str, CIMultiDict[str]] = {
     }),
 }
 
-__CLIENT_AVAILABLE__ = {
-    'httpx': ['sync', 'async'],
-    'aiohttp': ['async'],
-}
-
-__Client__: Optional[Type[Client]] = None
-'''当前的同步客户端类'''
-__AsyncClient__: Optional[Type[AsyncClient]] = None
-'''当前的异步客户端类'''
-
-@overload
-def _import_client(name: str) -> Type[Client]:
-    ...
-
-@overload
-def _import_client(name: str, _async: Literal[True]) -> Type[AsyncClient]:
-    ...
-
-def _import_client(name: str, _async: bool = False) -> Union[Type[Client], Type[AsyncClient]]:
-    '''导入客户端类'''
-    
-    if name == 'httpx':
-        if _async:
-            from .httpx import AsyncClient
-            return AsyncClient
-        else:
-            from .httpx import Client
-            return Client
-    elif name == 'aiohttp':
-        if _async:
-            from .aiohttp import AsyncClient
-            return AsyncClient
-        else:
-            raise ImportError('\'aiohttp\' does not support sync client.')
-    else:
-        raise ImportError(f'cannot find builtin {name} client.')
-
 def get_client(*, proxy: Optional[str], timeout: int, cookies: Optional[CookieJar]) -> Client:
     '''获取一个当前可用的同步客户端'''
-    global __Client__
-    
-    if __Client__ is None:
-        for name, types in __CLIENT_AVAILABLE__.items():
-            if 'sync' in types:
-                try:
-                    __Client__ = _import_client(name)
-                    break
-                except ImportError:
-                    continue
-        else:
-            raise ImportError(
-                'module \'aiohttp\' and \'httpx\' are not installed, '
-                'please install it by running \'pip install aiohttp\' or \'pip install httpx\'',
-            )
-    
-    client = __Client__(proxy, timeout)
+    client = _get_client_class()(proxy, timeout)
     if cookies is not None:
         client.set_cookies(cookies)
     
@@ -97,52 +73,50 @@ def get_client(*, proxy: Optional[str], timeout: int, cookies: Optional[CookieJa
 
 def get_async_client(*, proxy: Optional[str], timeout: int, cookies: Optional[CookieJar]) -> AsyncClient:
     '''获取一个当前可用的异步客户端'''
-    global __AsyncClient__
-    
-    if __AsyncClient__ is None:
-        for name, types in __CLIENT_AVAILABLE__.items():
-            if 'async' in types:
-                try:
-                    __AsyncClient__ = _import_client(name, _async=True)
-                    break
-                except ImportError as e:
-                    print(e)
-                    continue
-        else:
-            raise ImportError('no available client.')
-    
-    client = __AsyncClient__(proxy, timeout)
+    client = _get_async_client_class()(proxy, timeout)
     if cookies is not None:
         client.set_cookies(cookies)
     
     return client
 
+CHUNK_SIZE = 64 * 1024
+'''流式读取时默认的单块最大字节数'''
+
+def _store(cache: ResponseCache, method: Literal['set', 'delete'], *args: Any) -> None:
+    '''写入或删除缓存条目，缓存只是尽力而为，写入失败时发出警告并视为未缓存，不影响请求结果'''
+    try:
+        getattr(cache, method)(*args)
+    except Exception as exception:
+        warnings.warn(
+            f'{type(cache).__name__}.{method} raised {exception!r}',
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
 # API 请求发送类
 class Api:
     '''API 请求发送类'''
     
     _url: str
-    _cookies: Optional[CookieJar] = None
     
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, *, session: Optional[Session]=None) -> None:
         self._url = url
-    
-    @property
-    def url(self) -> str:
+        self.route: Route = getattr(url, 'route', None) or route_of(url)
+        '''路由信息，由 API 文件中的端点预先确定或根据 URL 解析'''
+        self.url: str = f'{PREFIX["bestdori"]}{url}' if self.route.relative else url
         '''请求 URL'''
-        if self._url.startswith('http'):
-            return self._url
-        return f'{PREFIX["bestdori"]}{self._url}'
+        self.session = session if session is not None else get_default_session()
+        '''发送请求所使用的会话'''
     
     @classmethod
     def set_cookies(cls, cookies: CookieJar) -> None:
-        '''设置全局 Cookies'''
-        cls._cookies = cookies
+        '''设置全局默认会话的 Cookies'''
+        get_default_session().cookies = cookies
     
     @classmethod
     def get_cookies(cls) -> Optional[CookieJar]:
-        '''获取全局 Cookies'''
-        return cls._cookies
+        '''获取全局默认会话的 Cookies'''
+        return get_default_session().cookies
     
     def _build_request(
         self,
@@ -155,14 +129,8 @@ class Api:
     ) -> Request:
         '''构建请求体'''
         
-        if self.url.startswith(PREFIX['bestdori']) and not self.url.endswith('/api/upload'):
-            # Bestdori 文件上传 API 需要特殊的请求头
-            headers = HEADERS_DICT['bestdori-api']
-        elif self.url.startswith(PREFIX['sonolus']) and method == 'POST':
-            # Sonolus 测试服上传 API 需要特殊的请求头
-            headers = HEADERS_DICT['sonolus-post']
-        else:
-            headers = None
+        key = self.route.headers_key(method)
+        headers = HEADERS_DICT[key] if key is not None else None
         
         return Request(
             method,
@@ -180,12 +148,12 @@ class Api:
             response.raise_for_status()
         except Exception as e:
             # 对于 Ayachan 的 400/500 响应码抛出特殊的异常
-            if PREFIX['ayachan'] in self.url and response.status_code in (400, 500):
+            if self.route.host == 'ayachan' and response.status_code in (400, 500):
                 response_data: Dict[str, Any] = response.json()
                 raise AyachanResponseError(response_data.get('error', 'None'))
             
             # 对于 Sonolus 的非 200 响应码抛出特殊的异常
-            elif PREFIX['sonolus'] in self.url and response.status_code != 200:
+            elif self.route.host == 'sonolus' and response.status_code != 200:
                 response_data: Dict[str, Any] = response.json()
                 raise SonolusException(
                     f"code: {response_data.get('code', None)}, "
@@ -197,9 +165,7 @@ class Api:
         if not content_type:
             raise NoContentTypeError(response.url.path)
         
-        url = str(response.url)
-        
-        if url.startswith(PREFIX['bestdori']) and '/api/' in url:
+        if self.route.api:
             # 处理 Bestdori API 响应
             if 'application/json' not in content_type:
                 return response
@@ -226,14 +192,220 @@ class Api:
                 else:
                     raise RequestException(response.request.url.path)
         
-        elif '/assets/' in url or '/res/' in url:
+        elif self.route.assets:
             # 处理资源获取响应，如果返回了 HTML 页面则说明资源不存在
             if 'text/html' in content_type:
-                raise AssetsNotExistError(url)
+                raise AssetsNotExistError(str(response.url))
+            return response
+        
+        return response
+    
+    @staticmethod
+    def _add_conditional_headers(request: Request, entry: CacheEntry) -> None:
+        '''为请求添加条件验证请求头'''
+        # 请求头可能来自共享的 HEADERS_DICT，需要复制后再修改
+        headers = CIMultiDict(request.headers) if request.headers is not None else CIMultiDict()
+        headers.update(entry.conditional_headers())
+        request.headers = headers
+    
+    def _handle_cached_response(
+        self,
+        response: Response,
+        cache: ResponseCache,
+        key: str,
+        entry: Optional[CacheEntry],
+        event: Optional[RequestEvent]=None,
+    ) -> Response:
+        '''处理启用缓存的 GET 请求的响应体'''
+        if entry is not None and response.status_code == 304:
+            # 资源未修改，刷新缓存条目后复用本地内容
+            entry.revalidate(response)
+            _store(cache, 'set', key, entry)
+            response = entry.to_response(response.request)
+            if event is not None:
+                event.cache_hit('revalidated', response)
             return response
         
+        if event is not None:
+            event.cache = 'miss'
+        response = self._handle_response(response)
+        if (new_entry := CacheEntry.from_response(response)) is not None:
+            _store(cache, 'set', key, new_entry)
+        elif entry is not None:
+            _store(cache, 'delete', key)
         return response
     
+    def _transmit(
+        self,
+        request: Request,
+        retry: Optional[RetryPolicy]=None,
+        event: Optional[RequestEvent]=None,
+    ) -> Response:
+        '''通过会话连接池发送请求，请求将按主机限速，GET 请求将按重试策略重试'''
+        policy = (retry or self.session.get_retry()) if request.method == 'GET' else None
+        attempt = 1
+        while True:
+            client = self.session.get_client()
+            try:
+                with rate_limiter.limit(self.url, self.route.host):
+                    if event is not None:
+                        event.begin_attempt(attempt, request)
+                    response = client.request(request)
+            except Exception as exception:
+                if event is not None:
+                    event.end_attempt(exception=exception)
+                if policy is None:
+                    raise
+                delay = policy.next_delay(
+                    attempt, exception=exception, transient=client.transient_exceptions,
+                )
+                if delay is None:
+                    raise
+            else:
+                if event is not None:
+                    event.end_attempt(response)
+                if policy is None:
+                    return response
+                delay = policy.next_delay(attempt, response=response)
+                if delay is None:
+                    return response
+            if event is not None:
+                event.retry(delay)
+            time.sleep(delay)
+            attempt += 1
+    
+    async def _atransmit(
+        self,
+        request: Request,
+        retry: Optional[RetryPolicy]=None,
+        event: Optional[RequestEvent]=None,
+    ) -> Response:
+        '''通过会话连接池异步发送请求，请求将按主机限速，GET 请求将按重试策略重试'''
+        policy = (retry or self.session.get_retry()) if request.method == 'GET' else None
+        attempt = 1
+        while True:
+            client = await self.session.get_async_client()
+            try:
+                async with rate_limiter.limit_async(self.url, self.route.host):
+                    if event is not None:
+                        event.begin_attempt(attempt, request)
+                    response = await client.request(request)
+            except Exception as exception:
+                if event is not None:
+                    event.end_attempt(exception=exception)
+                if policy is None:
+                    raise
+                delay = policy.next_delay(
+                    attempt, exception=exception, transient=client.transient_exceptions,
+                )
+                if delay is None:
+                    raise
+            else:
+                if event is not None:
+                    event.end_attempt(response)
+                if policy is None:
+                    return response
+                delay = policy.next_delay(attempt, response=response)
+                if delay is None:
+                    return response
+            if event is not None:
+                event.retry(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    @property
+    def endpoint(self) -> str:
+        '''端点名称，不是由 API 文件中的端点格式化得到时为请求 URL'''
+        return getattr(self._url, 'endpoint', None) or self.url
+    
+    def _start_event(self, request: Request) -> Optional[RequestEvent]:
+        '''创建请求事件并触发 `on_request_start`，未注册钩子时返回 `None`'''
+        hooks = self.session.get_hooks()
+        if not hooks:
+            return None
+        event = RequestEvent(self.endpoint, self.route.host, request, hooks)
+        event.emit('on_request_start')
+        return event
+    
+    def _dispatch(self, request: Request, retry: Optional[RetryPolicy], event: Optional[RequestEvent]) -> Response:
+        '''查询缓存或发送请求'''
+        cache = self.session.get_cache() if request.method == 'GET' else None
+        if cache is None:
+            response = self._transmit(request, retry, event)
+            return self._handle_response(response)
+        
+        key = cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            if entry.is_fresh():
+                response = entry.to_response(request)
+                if event is not None:
+                    event.cache_hit('hit', response)
+                return response
+            self._add_conditional_headers(request, entry)
+        
+        response = self._transmit(request, retry, event)
+        
+        return self._handle_cached_response(response, cache, key, entry, event)
+    
+    async def _adispatch(
+        self,
+        request: Request,
+        retry: Optional[RetryPolicy],
+        event: Optional[RequestEvent],
+    ) -> Response:
+        '''异步查询缓存或发送请求'''
+        cache = self.session.get_cache() if request.method == 'GET' else None
+        if cache is None:
+            response = await self._atransmit(request, retry, event)
+            return self._handle_response(response)
+        
+        key = cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            if entry.is_fresh():
+                response = entry.to_response(request)
+                if event is not None:
+                    event.cache_hit('hit', response)
+                return response
+            self._add_conditional_headers(request, entry)
+        
+        response = await self._atransmit(request, retry, event)
+        
+        return self._handle_cached_response(response, cache, key, entry, event)
+    
+    def _send(self, request: Request, retry: Optional[RetryPolicy]=None) -> Response:
+        '''发送已构建的请求并处理响应'''
+        if (event := self._start_event(request)) is None:
+            return self._dispatch(request, retry, None)
+        try:
+            response = self._dispatch(request, retry, event)
+        except Exception as exception:
+            event.finish(exception)
+            raise
+        event.finish()
+        return response
+    
+    async def _asend(self, request: Request, retry: Optional[RetryPolicy]=None) -> Response:
+        '''异步发送已构建的请求并处理响应'''
+        if (event := self._start_event(request)) is None:
+            return await self._adispatch(request, retry, None)
+        try:
+            response = await self._adispatch(request, retry, event)
+        except Exception as exception:
+            event.finish(exception)
+            raise
+        event.finish()
+        return response
+    
+    @staticmethod
+    def _coalesce_key(request: Request) -> Optional[str]:
+        '''获取用于合并并发请求的键，不可合并时返回 `None`'''
+        if request.method != 'GET' or not settings.coalesce:
+            return None
+        # 不同 Cookies 的请求可能得到不同的响应，不能合并
+        return f'{cache_key(request)} {id(request.cookies)}'
+    
     def _request(
         self,
         method: Literal['GET', 'POST'],
@@ -242,18 +414,16 @@ class Api:
         params: Optional[Dict[str, Any]]=None,
         data: Optional[Any]=None,
         files: Optional[FilesContent]=None,
+        retry: Optional[RetryPolicy]=None,
     ) -> Response:
         '''发送请求'''
+        if cookies is None:
+            cookies = self.session.cookies
         request = self._build_request(method, cookies=cookies, params=params, data=data, files=files)
-
-        with get_client(
-            proxy=settings.proxy,
-            timeout=settings.timeout,
-            cookies=self.get_cookies(),
-        ) as client:
-            response = client.request(request)
         
-        return self._handle_response(response)
+        if (key := self._coalesce_key(request)) is None:
+            return self._send(request, retry)
+        return self.session._coalesce(key, lambda: self._send(request, retry))
     
     async def _arequest(
         self,
@@ -263,52 +433,203 @@ class Api:
         params: Optional[Dict[str, Any]]=None,
         data: Optional[Any]=None,
         files: Optional[FilesContent]=None,
+        retry: Optional[RetryPolicy]=None,
     ) -> Response:
         '''异步发送请求'''
+        if cookies is None:
+            cookies = self.session.cookies
         request = self._build_request(method, cookies=cookies, params=params, data=data, files=files)
         
-        async with get_async_client(
-            proxy=settings.proxy,
-            timeout=settings.timeout,
-            cookies=self.get_cookies(),
-        ) as client:
-            response = await client.request(request)
-        
-        return self._handle_response(response)
+        if (key := self._coalesce_key(request)) is None:
+            return await self._asend(request, retry)
+        return await self.session._acoalesce(key, lambda: self._asend(request, retry))
     
     def get(
         self,
         *,
         cookies: Optional[CookieJar]=None,
         params: Optional[Dict[str, Any]]=None,
+        retry: Optional[RetryPolicy]=None,
     ) -> Response:
         '''发送 GET 请求
 
         参数:
             cookies (Optional[CookieJar], optional): Cookies
             params (Optional[Dict[str, Any]], optional): URL 参数
+            retry (Optional[RetryPolicy], optional): 本次请求的重试策略，默认使用会话的重试策略
 
         返回:
             Response: 响应体
         '''
-        return self._request('GET', cookies=cookies, params=params)
+        return self._request('GET', cookies=cookies, params=params, retry=retry)
     
     async def aget(
         self,
         *,
         cookies: Optional[CookieJar]=None,
         params: Optional[Dict[str, Any]]=None,
+        retry: Optional[RetryPolicy]=None,
     ) -> Response:
         '''异步发送 GET 请求
 
         参数:
             cookies (Optional[CookieJar], optional): Cookies
             params (Optional[Dict[str, Any]], optional): 调用参数
+            retry (Optional[RetryPolicy], optional): 本次请求的重试策略，默认使用会话的重试策略
 
         返回:
             Response: 响应体
         '''
-        return await self._arequest('GET', cookies=cookies, params=params)
+        return await self._arequest('GET', cookies=cookies, params=params, retry=retry)
+    
+    def _handle_stream_response(self, response: StreamResponse) -> None:
+        '''处理流式响应体'''
+        content_type = response.headers.get('Content-Type', None) or ''
+        # 错误响应与 JSON 响应需要完整内容才能判断，读取后按普通响应处理
+        if response.status_code >= 400 or 'application/json' in content_type:
+            response.read()
+        self._handle_response(response)
+    
+    async def _ahandle_stream_response(self, response: StreamResponse) -> None:
+        '''异步处理流式响应体'''
+        content_type = response.headers.get('Content-Type', None) or ''
+        if response.status_code >= 400 or 'application/json' in content_type:
+            await response.aread()
+        self._handle_response(response)
+    
+    @contextmanager
+    def stream(
+        self,
+        *,
+        cookies: Optional[CookieJar]=None,
+        params: Optional[Dict[str, Any]]=None,
+        chunk_size: int=CHUNK_SIZE,
+    ) -> Iterator[StreamResponse]:
+        '''发送 GET 请求并获取流式响应，响应内容不会完整保存在内存中
+
+        流式请求不经过响应缓存、请求合并与重试，但仍受主机限速约束
+
+        参数:
+            cookies (Optional[CookieJar], optional): Cookies
+            params (Optional[Dict[str, Any]], optional): URL 参数
+            chunk_size (int, optional): 每次读取的最大字节数
+
+        返回:
+            Iterator[StreamResponse]: 流式响应体上下文，使用 `iter_bytes` 逐块读取内容
+        '''
+        if cookies is None:
+            cookies = self.session.cookies
+        request = self._build_request('GET', cookies=cookies, params=params)
+        
+        client = self.session.get_client()
+        with rate_limiter.limit(self.url, self.route.host):
+            with client.stream(request, chunk_size) as response:
+                self._handle_stream_response(response)
+                yield response
+    
+    @asynccontextmanager
+    async def astream(
+        self,
+        *,
+        cookies: Optional[CookieJar]=None,
+        params: Optional[Dict[str, Any]]=None,
+        chunk_size: int=CHUNK_SIZE,
+    ) -> AsyncIterator[StreamResponse]:
+        '''异步发送 GET 请求并获取流式响应，响应内容不会完整保存在内存中
+
+        流式请求不经过响应缓存、请求合并与重试，但仍受主机限速约束
+
+        参数:
+            cookies (Optional[CookieJar], optional): Cookies
+            params (Optional[Dict[str, Any]], optional): URL 参数
+            chunk_size (int, optional): 每次读取的最大字节数
+
+        返回:
+            AsyncIterator[StreamResponse]: 流式响应体上下文，使用 `aiter_bytes` 逐块读取内容
+        '''
+        if cookies is None:
+            cookies = self.session.cookies
+        request = self._build_request('GET', cookies=cookies, params=params)
+        
+        client = await self.session.get_async_client()
+        async with rate_limiter.limit_async(self.url, self.route.host):
+            async with client.stream(request, chunk_size) as response:
+                await self._ahandle_stream_response(response)
+                yield response
+    
+    def download_to(
+        self,
+        path: Union[str, Path],
+        *,
+        cookies: Optional[CookieJar]=None,
+        params: Optional[Dict[str, Any]]=None,
+        chunk_size: int=CHUNK_SIZE,
+    ) -> int:
+        '''将 GET 请求的响应内容流式写入文件
+
+        内容先写入同目录下的临时文件，下载完成后再替换目标文件，
+        下载中断时不会留下不完整的目标文件
+
+        参数:
+            path (Union[str, Path]): 目标文件路径
+            cookies (Optional[CookieJar], optional): Cookies
+            params (Optional[Dict[str, Any]], optional): URL 参数
+            chunk_size (int, optional): 每次读取的最大字节数
+
+        返回:
+            int: 写入的字节数
+        '''
+        path = Path(path)
+        temp = path.with_name(f'{path.name}.part')
+        size = 0
+        try:
+            with self.stream(cookies=cookies, params=params, chunk_size=chunk_size) as response:
+                with open(temp, 'wb') as file:
+                    for chunk in response.iter_bytes():
+                        file.write(chunk)
+                        size += len(chunk)
+            os.replace(temp, path)
+        finally:
+            if temp.exists():
+                temp.unlink()
+        return size
+    
+    async def adownload_to(
+        self,
+        path: Union[str, Path],
+        *,
+        cookies: Optional[CookieJar]=None,
+        params: Optional[Dict[str, Any]]=None,
+        chunk_size: int=CHUNK_SIZE,
+    ) -> int:
+        '''将 GET 请求的响应内容异步流式写入文件
+
+        内容先写入同目录下的临时文件，下载完成后再替换目标文件，
+        下载中断时不会留下不完整的目标文件
+
+        参数:
+            path (Union[str, Path]): 目标文件路径
+            cookies (Optional[CookieJar], optional): Cookies
+            params (Optional[Dict[str, Any]], optional): URL 参数
+            chunk_size (int, optional): 每次读取的最大字节数
+
+        返回:
+            int: 写入的字节数
+        '''
+        path = Path(path)
+        temp = path.with_name(f'{path.name}.part')
+        size = 0
+        try:
+            async with self.astream(cookies=cookies, params=params, chunk_size=chunk_size) as response:
+                with open(temp, 'wb') as file:
+                    async for chunk in response.aiter_bytes():
+                        file.write(chunk)
+                        size += len(chunk)
+            os.replace(temp, path)
+        finally:
+            if temp.exists():
+                temp.unlink()
+        return size
     
     def post(
         self,
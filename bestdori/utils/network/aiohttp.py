@@ -1,4 +1,8 @@
-from typing import Any
+import time
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, AsyncIterator
+from contextlib import asynccontextmanager
 
 from yarl import URL
 from multidict import CIMultiDict
@@ -6,7 +10,9 @@ from http.cookies import SimpleCookie
 from typing_extensions import override
 from http.cookiejar import Cookie, CookieJar
 
-from .client import Request, Response
+from bestdori.utils import codec
+
+from .client import Request, Timings, Response, StreamResponse, accept_encoding
 from .client import AsyncClient as _AsyncClient
 
 try:
@@ -16,6 +22,28 @@ except ModuleNotFoundError as exception:
         'module \'aiohttp\' is not installed, please install it by running \'pip install aiohttp\''
     ) from exception
 
+try:
+    from aiohttp import compression_utils as _compression
+except ImportError:
+    _compression = None # type: ignore[assignment]
+
+ACCEPT_ENCODING = accept_encoding(
+    ['gzip', 'deflate']
+    + (['br'] if getattr(_compression, 'HAS_BROTLI', False) else [])
+    + (['zstd'] if getattr(_compression, 'HAS_ZSTD', False) else [])
+)
+'''协商的响应内容编码，`br` 需要安装 `brotli`，`zstd` 需要 Python 3.14 或安装 `backports.zstd`'''
+
+def _compressed_bytes(response: aiohttp.ClientResponse, content: bytes) -> Optional[int]:
+    '''获取已读取的响应实际传输的内容字节数'''
+    if (total := getattr(response.content, 'total_raw_bytes', None)) is not None:
+        return total
+    # 旧版本 aiohttp 不记录解压前的字节数，只能依据响应头推断
+    if 'Content-Encoding' not in response.headers:
+        return len(content)
+    length = response.headers.get('Content-Length', None)
+    return int(length) if length is not None and length.isdigit() else None
+
 def _simplecookie_to_cookiejar(simple_cookie: SimpleCookie) -> CookieJar:
     jar = CookieJar()
     for name, morsel in simple_cookie.items():
@@ -43,9 +71,45 @@ def _simplecookie_to_cookiejar(simple_cookie: SimpleCookie) -> CookieJar:
         jar.set_cookie(cookie)
     return jar
 
+def _trace_config() -> aiohttp.TraceConfig:
+    '''构建记录请求各阶段耗时的追踪配置，仅对携带 `Timings` 的请求生效'''
+    
+    async def on_dns_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+        if context.trace_request_ctx is not None:
+            context.dns_start = time.perf_counter()
+    
+    async def on_dns_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+        timings: Optional[Timings] = context.trace_request_ctx
+        if timings is not None:
+            timings.dns = time.perf_counter() - context.dns_start
+    
+    async def on_connect_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+        if context.trace_request_ctx is not None:
+            context.connect_start = time.perf_counter()
+    
+    async def on_connect_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+        timings: Optional[Timings] = context.trace_request_ctx
+        if timings is not None:
+            # aiohttp 建立连接的耗时包含 DNS 解析，需要扣除
+            timings.connect = time.perf_counter() - context.connect_start - (timings.dns or 0.0)
+    
+    async def on_request_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+        timings: Optional[Timings] = context.trace_request_ctx
+        if timings is not None:
+            timings.ttfb = timings.elapsed()
+    
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_end)
+    trace_config.on_connection_create_start.append(on_connect_start)
+    trace_config.on_connection_create_end.append(on_connect_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
 class AsyncClient(_AsyncClient):
     '''AIOHTTP 异步 HTTP 客户端'''
     _client_session: aiohttp.ClientSession
+    transient_exceptions = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
 
     @override
     def set_cookies(self, cookies: CookieJar) -> None:
@@ -66,9 +130,22 @@ class AsyncClient(_AsyncClient):
     
     @override
     async def __aenter__(self) -> 'AsyncClient':
+        connector_kwargs: Dict[str, Any] = {}
+        if self.max_connections is not None:
+            connector_kwargs['limit'] = self.max_connections
+        if self.max_connections_per_host is not None:
+            connector_kwargs['limit_per_host'] = self.max_connections_per_host
+        if self.keepalive_expiry is not None:
+            connector_kwargs['keepalive_timeout'] = self.keepalive_expiry
+        
+        # 连接池会被多次请求复用，Cookie 由每个请求单独携带，不在会话中累积
         self._client_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(**connector_kwargs),
+            cookie_jar=aiohttp.DummyCookieJar(),
             timeout=aiohttp.ClientTimeout(self.timeout),
             trust_env=False,
+            headers={'Accept-Encoding': ACCEPT_ENCODING},
+            trace_configs=[_trace_config()],
         )
         await self._client_session.__aenter__()
         return self
@@ -76,15 +153,19 @@ class AsyncClient(_AsyncClient):
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         await self._client_session.__aexit__(exc_type, exc_value, traceback)
     
-    async def request(self, request: Request) -> Response:
-        '''异步发送请求并获取响应'''
-        response: aiohttp.ClientResponse
-        
+    def _request_kwargs(self, request: Request) -> Dict[str, Any]:
+        '''构建 aiohttp 请求参数'''
         data = request.data
+        headers = request.headers
         if request.files:
             data = aiohttp.FormData(data or {}, quote_fields=False)
             for name, file in request.files.items():
                 data.add_field(name, file[1].read(), filename=file[0])
+        elif data or request.json is not None:
+            # 与 httpx 客户端一致，请求数据以 JSON 形式发送
+            data = codec.dumpb(data if data else request.json)
+            headers = CIMultiDict(headers or {})
+            headers.setdefault('Content-Type', 'application/json')
         
         # 转换 cookie
         cookies = None
@@ -94,33 +175,67 @@ class AsyncClient(_AsyncClient):
                 for cookie in request.cookies
                 if cookie.value is not None
             )
-
+        
+        return {
+            'cookies': cookies,
+            'headers': headers,
+            'params': request.params,
+            'data': data,
+            'proxy': self.proxy,
+            'trace_request_ctx': request.timings,
+        }
+    
+    async def request(self, request: Request) -> Response:
+        '''异步发送请求并获取响应'''
+        response: aiohttp.ClientResponse
+        
         async with self._client_session.request(
             request.method,
             request.url,
-            cookies=cookies,
-            headers=request.headers,
-            params=request.params,
-            data=data,
-            json=request.json,
-            proxy=self.proxy,
+            **self._request_kwargs(request),
         ) as response:
-            
+            content = await response.read()
+            compressed_bytes = _compressed_bytes(response, content)
             try:
                 response.raise_for_status()
                 return Response(
                     request,
                     CIMultiDict(response.headers),
                     _simplecookie_to_cookiejar(response.cookies),
-                    await response.read(),
+                    content,
                     response.status,
+                    compressed_bytes=compressed_bytes,
                 )
             except Exception as exception:
                 return Response(
                     request,
                     CIMultiDict(response.headers),
                     _simplecookie_to_cookiejar(response.cookies),
-                    await response.read(),
+                    content,
                     response.status,
                     exception,
-                )
\ No newline at end of file
+                    compressed_bytes=compressed_bytes,
+                )
+    
+    @override
+    @asynccontextmanager
+    async def stream(self, request: Request, chunk_size: int) -> AsyncIterator[StreamResponse]:
+        '''异步发送请求并获取流式响应，退出上下文时释放连接'''
+        async with self._client_session.request(
+            request.method,
+            request.url,
+            **self._request_kwargs(request),
+        ) as response:
+            exception: Optional[Exception] = None
+            try:
+                response.raise_for_status()
+            except Exception as _exception:
+                exception = _exception
+            yield StreamResponse(
+                request,
+                CIMultiDict(response.headers),
+                _simplecookie_to_cookiejar(response.cookies),
+                response.status,
+                response.content.iter_chunked(chunk_size),
+                exception,
+            )
@@ -0,0 +1,331 @@
+'''`bestdori.utils.network.cache`
+
+HTTP 响应缓存模块，支持 `Cache-Control` 与 `ETag` / `Last-Modified` 条件请求'''
+
+import os
+import re
+import time
+from json import dumps, loads
+from hashlib import sha256
+from threading import Lock
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from collections import OrderedDict
+from abc import ABC, abstractmethod
+from urllib.parse import urlencode
+from http.cookiejar import CookieJar
+from typing import Dict, List, Tuple, Union, Optional
+
+from multidict import CIMultiDict
+
+from .client import Request, Response
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    '''解析 `Cache-Control` 响应头'''
+    directives: Dict[str, Optional[str]] = {}
+    if not value:
+        return directives
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition('=')
+        directives[name.strip().lower()] = arg.strip().strip('"') if arg else None
+    return directives
+
+def cache_key(request: Request) -> str:
+    '''根据请求方法、URL 与参数生成缓存键
+
+    参数:
+        request (Request): 请求体
+
+    返回:
+        str: 缓存键
+    '''
+    key = f'{request.method} {request.url}'
+    if request.params:
+        key += '?' + urlencode(sorted((str(k), str(v)) for k, v in request.params.items()))
+    return key
+
+# 缓存条目类
+class CacheEntry:
+    '''缓存条目类
+
+    参数:
+        status_code (int): 状态码
+        headers (List[Tuple[str, str]]): 响应头
+        content (bytes): 响应内容
+        stored_at (float): 存储（或最近一次验证）的时间戳
+    '''
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        content: bytes,
+        stored_at: float,
+    ) -> None:
+        self.status_code = status_code
+        '''状态码'''
+        self.headers = headers
+        '''响应头'''
+        self.content = content
+        '''响应内容'''
+        self.stored_at = stored_at
+        '''存储（或最近一次验证）的时间戳'''
+
+    @property
+    def size(self) -> int:
+        '''条目占用的近似字节数'''
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def _header(self, name: str) -> Optional[str]:
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def etag(self) -> Optional[str]:
+        '''`ETag` 验证器'''
+        return self._header('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        '''`Last-Modified` 验证器'''
+        return self._header('Last-Modified')
+
+    @property
+    def max_age(self) -> Optional[float]:
+        '''响应可直接复用的时长，为 `None` 时每次使用前都需要验证'''
+        directives = _parse_cache_control(self._header('Cache-Control'))
+        if 'no-cache' in directives:
+            return None
+        value = directives.get('max-age', None)
+        if value is None:
+            return None
+        try:
+            max_age = float(value)
+        except ValueError:
+            return None
+        age = self._header('Age')
+        if age is not None:
+            try:
+                max_age -= float(age)
+            except ValueError:
+                pass
+        return max_age
+
+    def is_fresh(self, now: Optional[float]=None) -> bool:
+        '''条目是否仍可不经验证直接使用'''
+        max_age = self.max_age
+        if max_age is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - self.stored_at < max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        '''获取用于条件请求的请求头'''
+        headers: Dict[str, str] = {}
+        if (etag := self.etag) is not None:
+            headers['If-None-Match'] = etag
+        if (last_modified := self.last_modified) is not None:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def revalidate(self, response: Response) -> None:
+        '''根据 `304 Not Modified` 响应刷新条目'''
+        updated = {key.lower() for key in response.headers.keys()}
+        updated.discard('content-length')
+        headers = [(k, v) for k, v in self.headers if k.lower() not in updated]
+        headers.extend(
+            (k, v) for k, v in response.headers.items() if k.lower() != 'content-length'
+        )
+        self.headers = headers
+        self.stored_at = time.time()
+
+    def to_response(self, request: Request) -> Response:
+        '''将条目还原为响应体'''
+        return Response(
+            request,
+            CIMultiDict(self.headers),
+            CookieJar(),
+            self.content,
+            self.status_code,
+        )
+
+    @classmethod
+    def from_response(cls, response: Response) -> Optional['CacheEntry']:
+        '''从响应体创建缓存条目，响应不可缓存时返回 `None`'''
+        if response.request.method != 'GET' or response.status_code != 200:
+            return None
+        directives = _parse_cache_control(response.headers.get('Cache-Control', None))
+        if 'no-store' in directives or 'private' in directives:
+            return None
+        vary = response.headers.get('Vary', '')
+        if '*' in vary or ('cookie' in vary.lower() and response.request.cookies):
+            return None
+
+        entry = cls(
+            response.status_code,
+            list(response.headers.items()),
+            response.content,
+            time.time(),
+        )
+        # 既无法直接复用也无法条件验证的响应缓存下来没有意义
+        if entry.max_age is None and entry.etag is None and entry.last_modified is None:
+            return None
+        return entry
+
+class ResponseCache(ABC):
+    '''响应缓存后端基类'''
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        '''获取缓存条目'''
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        '''存储缓存条目'''
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        '''删除缓存条目'''
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        '''清空缓存'''
+        raise NotImplementedError
+
+# 内存缓存
+class MemoryCache(ResponseCache):
+    '''内存 LRU 响应缓存
+
+    参数:
+        max_bytes (int, optional): 缓存占用的最大字节数，超出时按最近最少使用顺序淘汰
+    '''
+
+    def __init__(self, max_bytes: int=64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        '''缓存占用的最大字节数'''
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+
+    @property
+    def bytes(self) -> int:
+        '''当前缓存占用的字节数'''
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        size = entry.size
+        with self._lock:
+            if (old := self._entries.pop(key, None)) is not None:
+                self._bytes -= old.size
+            if size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if (old := self._entries.pop(key, None)) is not None:
+                self._bytes -= old.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+_ENTRY_NAME = re.compile(r'[0-9a-f]{64}(\.[^/]*\.tmp)?')
+'''`DiskCache` 写入的文件名：条目为键的 SHA-256，临时文件为条目名加随机后缀'''
+
+# 磁盘缓存
+class DiskCache(ResponseCache):
+    '''磁盘目录响应缓存，进程重启后仍然有效
+
+    每个条目存储为目录下的一个文件，首行为元数据，其后为响应内容。
+
+    参数:
+        directory (Union[str, Path]): 缓存目录，不存在时将自动创建
+    '''
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        '''缓存目录'''
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / sha256(key.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                meta = loads(file.readline())
+                content = file.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('key', None) != key:
+            return None
+        return CacheEntry(
+            meta['status_code'],
+            [(k, v) for k, v in meta['headers']],
+            content,
+            meta['stored_at'],
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        meta = dumps({
+            'key': key,
+            'status_code': entry.status_code,
+            'headers': entry.headers,
+            'stored_at': entry.stored_at,
+        }, ensure_ascii=True)
+        # 先写入临时文件再替换，避免并发读取到不完整的条目；每次写入使用独立的临时文件，
+        # 同一进程内多个线程写入同一条目时不会互相覆盖或删除对方的临时文件
+        with NamedTemporaryFile(dir=self.directory, prefix=f'{path.name}.', suffix='.tmp', delete=False) as file:
+            temp = file.name
+            try:
+                file.write(meta.encode('utf-8') + b'\n')
+                file.write(entry.content)
+            except BaseException:
+                file.close()
+                os.unlink(temp)
+                raise
+        try:
+            os.replace(temp, path)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        '''删除本缓存写入的条目与临时文件，目录中的其他文件不受影响'''
+        for path in self.directory.iterdir():
+            if _ENTRY_NAME.fullmatch(path.name) and path.is_file():
+                path.unlink(missing_ok=True)
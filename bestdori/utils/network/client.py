@@ -1,19 +1,78 @@
 '''HTTP 客户端类型基类'''
 
 from yarl import URL
-from json import loads
+import json
+import time
 from io import BufferedReader
 from multidict import CIMultiDict
 from abc import ABC, abstractmethod
 from http.cookiejar import CookieJar
-from typing import Any, Dict, Tuple, Optional, TypeAlias
+from contextlib import contextmanager, asynccontextmanager
+from typing import (
+    Any,
+    Dict,
+    Type,
+    Tuple,
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeAlias,
+    AsyncIterator,
+)
 
 from typing_extensions import Self
 
+from bestdori.utils import codec
 from bestdori.exceptions import HTTPStatusError
 
 FilesContent: TypeAlias = Dict[str, Tuple[str, BufferedReader, Optional[str]]]
 
+ENCODINGS: Tuple[str, ...] = ('zstd', 'br', 'gzip', 'deflate')
+'''协商的响应内容编码，按压缩率从高到低排列'''
+
+def accept_encoding(supported: Iterable[str]) -> str:
+    '''根据客户端可以解码的内容编码生成 `Accept-Encoding` 请求头
+
+    参数:
+        supported (Iterable[str]): 客户端可以解码的内容编码
+
+    返回:
+        str: `Accept-Encoding` 请求头的值
+    '''
+    supported = set(supported)
+    return ', '.join(encoding for encoding in ENCODINGS if encoding in supported) or 'identity'
+
+class Timings:
+    '''单次请求尝试的网络耗时（秒）
+
+    由客户端在发送请求时填充，底层库未提供或未发生的阶段为 `None`，
+    例如复用已有连接时 `dns` 与 `connect` 均为 `None`
+    '''
+    __slots__ = ('start', 'dns', 'connect', 'ttfb', 'total')
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        '''开始发送请求的时间点，为 `time.perf_counter()` 的返回值'''
+        self.dns: Optional[float] = None
+        '''DNS 解析耗时'''
+        self.connect: Optional[float] = None
+        '''建立连接耗时，包括 TLS 握手'''
+        self.ttfb: Optional[float] = None
+        '''从开始发送请求到收到响应头的耗时'''
+        self.total: Optional[float] = None
+        '''从开始发送请求到读取完响应内容的耗时'''
+
+    def elapsed(self) -> float:
+        '''获取自开始发送请求以来经过的时间'''
+        return time.perf_counter() - self.start
+
+    def __repr__(self) -> str:
+        return (
+            f'Timings(dns={self.dns}, connect={self.connect}, '
+            f'ttfb={self.ttfb}, total={self.total})'
+        )
+
 class Request:
     '''HTTP 请求类'''
     
@@ -45,6 +104,8 @@ class Request:
         '''请求文件'''
         self.json = json
         '''请求 JSON 数据'''
+        self.timings: Optional[Timings] = None
+        '''本次尝试的网络耗时，不为 `None` 时客户端将记录各阶段耗时'''
 
 class Response:
     '''HTTP 响应类'''
@@ -57,6 +118,8 @@ class Response:
         content: bytes,
         status_code: int,
         exception: Optional[Exception]=None,
+        *,
+        compressed_bytes: Optional[int]=None,
     ) -> None:
         self.request = request
         '''请求体'''
@@ -72,29 +135,127 @@ class Response:
         '''状态码'''
         self.exception = exception
         '''异常'''
+        self.compressed_bytes = compressed_bytes
+        '''实际传输的响应内容字节数（解压前），未压缩时与 `decompressed_bytes` 相同，
+        来自缓存、录制或底层库未提供时为 `None`'''
     
     @property
     def url(self) -> URL:
         '''响应 URL'''
         return self.request.url
     
+    @property
+    def decompressed_bytes(self) -> int:
+        '''解压后的响应内容字节数'''
+        return len(self.content)
+    
+    @property
+    def content_encoding(self) -> Optional[str]:
+        '''响应内容编码，如 `br`、`zstd`、`gzip`，未压缩时为 `None`'''
+        return self.headers.get('Content-Encoding', None)
+    
     def json(self, **kwargs: Any) -> Any:
-        '''解析 JSON 响应内容'''
-        return loads(self.content, **kwargs)
+        '''解析 JSON 响应内容
+
+        未传入参数时使用 `bestdori.utils.codec` 中的编解码器，
+        否则将参数传递给标准库 `json.loads`
+        '''
+        if kwargs:
+            return json.loads(self.content, **kwargs)
+        return codec.loads(self.content)
     
     def raise_for_status(self) -> None:
         '''检查响应状态码'''
         if self.status_code >= 400:
             raise HTTPStatusError(self)
 
+class StreamResponse(Response):
+    '''流式 HTTP 响应类，响应内容需通过 `iter_bytes` / `aiter_bytes` 逐块读取'''
+    
+    def __init__(
+        self,
+        request: Request,
+        headers: CIMultiDict[str],
+        cookies: CookieJar,
+        status_code: int,
+        chunks: Union[Iterator[bytes], AsyncIterator[bytes]],
+        exception: Optional[Exception]=None,
+    ) -> None:
+        super().__init__(request, headers, cookies, b'', status_code, exception)
+        self.chunks = chunks
+        '''响应内容块迭代器'''
+        self.is_read = False
+        '''响应内容是否已被完整读取到 `content` 中'''
+    
+    def read(self) -> bytes:
+        '''完整读取响应内容'''
+        if not self.is_read:
+            self.content = b''.join(self.iter_bytes())
+            self.is_read = True
+        return self.content
+    
+    async def aread(self) -> bytes:
+        '''异步完整读取响应内容'''
+        if not self.is_read:
+            self.content = b''.join([chunk async for chunk in self.aiter_bytes()])
+            self.is_read = True
+        return self.content
+    
+    def iter_bytes(self) -> Iterator[bytes]:
+        '''逐块迭代响应内容'''
+        if self.is_read:
+            if self.content:
+                yield self.content
+            return
+        if not isinstance(self.chunks, Iterator):
+            raise TypeError('asynchronous stream must be consumed with \'aiter_bytes\'.')
+        yield from self.chunks
+    
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        '''异步逐块迭代响应内容'''
+        if self.is_read:
+            if self.content:
+                yield self.content
+            return
+        if isinstance(self.chunks, Iterator):
+            for chunk in self.chunks:
+                yield chunk
+            return
+        async for chunk in self.chunks:
+            yield chunk
+
+def _iter_chunks(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size]
+
 class _BaseClient(ABC):
     '''HTTP 客户端类型基类'''
     
-    def __init__(self, proxy: Optional[str], timeout: int) -> None:
+    transient_exceptions: Tuple[Type[BaseException], ...] = ()
+    '''客户端发送请求时可能抛出的、可以重试的网络与超时异常类型'''
+    
+    def __init__(
+        self,
+        proxy: Optional[str],
+        timeout: int,
+        *,
+        max_connections: Optional[int]=None,
+        max_connections_per_host: Optional[int]=None,
+        keepalive_expiry: Optional[float]=None,
+        http2: bool=False,
+    ) -> None:
         self.proxy = proxy
         '''代理服务器地址'''
         self.timeout = timeout
         '''超时时间'''
+        self.max_connections = max_connections
+        '''连接池最大连接数，为 `None` 时使用底层库默认值'''
+        self.max_connections_per_host = max_connections_per_host
+        '''连接池对单个主机的最大连接数，为 `None` 时使用底层库默认值'''
+        self.keepalive_expiry = keepalive_expiry
+        '''空闲连接的保活时间，为 `None` 时使用底层库默认值'''
+        self.http2 = http2
+        '''是否启用 HTTP/2，不支持 HTTP/2 的客户端将忽略该选项'''
     
     @abstractmethod
     def set_cookies(self, cookies: CookieJar) -> None:
@@ -104,8 +265,24 @@ class _BaseClient(ABC):
 class Client(_BaseClient):
     '''同步 HTTP 客户端类型基类'''
     
-    def __init__(self, proxy: Optional[str], timeout: int) -> None:
-        super().__init__(proxy, timeout)
+    def __init__(
+        self,
+        proxy: Optional[str],
+        timeout: int,
+        *,
+        max_connections: Optional[int]=None,
+        max_connections_per_host: Optional[int]=None,
+        keepalive_expiry: Optional[float]=None,
+        http2: bool=False,
+    ) -> None:
+        super().__init__(
+            proxy,
+            timeout,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
     
     @abstractmethod
     def __enter__(self) -> Self:
@@ -119,12 +296,44 @@ class Client(_BaseClient):
     def request(self, request: Request) -> Response:
         '''发送请求并获取响应'''
         raise NotImplementedError
+    
+    @contextmanager
+    def stream(self, request: Request, chunk_size: int) -> Iterator[StreamResponse]:
+        '''发送请求并获取流式响应，退出上下文时释放连接
+
+        未实现流式读取的客户端将读取完整响应后再分块返回
+        '''
+        response = self.request(request)
+        yield StreamResponse(
+            request,
+            response.headers,
+            response.cookies,
+            response.status_code,
+            _iter_chunks(response.content, chunk_size),
+            response.exception,
+        )
 
 class AsyncClient(_BaseClient):
     '''异步 HTTP 客户端类型基类'''
     
-    def __init__(self, proxy: Optional[str], timeout: int) -> None:
-        super().__init__(proxy, timeout)
+    def __init__(
+        self,
+        proxy: Optional[str],
+        timeout: int,
+        *,
+        max_connections: Optional[int]=None,
+        max_connections_per_host: Optional[int]=None,
+        keepalive_expiry: Optional[float]=None,
+        http2: bool=False,
+    ) -> None:
+        super().__init__(
+            proxy,
+            timeout,
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
     
     @abstractmethod
     async def __aenter__(self) -> Self:
@@ -138,3 +347,19 @@ class AsyncClient(_BaseClient):
     async def request(self, request: Request) -> Response:
         '''异步发送请求并获取响应'''
         raise NotImplementedError
+    
+    @asynccontextmanager
+    async def stream(self, request: Request, chunk_size: int) -> AsyncIterator[StreamResponse]:
+        '''异步发送请求并获取流式响应，退出上下文时释放连接
+
+        未实现流式读取的客户端将读取完整响应后再分块返回
+        '''
+        response = await self.request(request)
+        yield StreamResponse(
+            request,
+            response.headers,
+            response.cookies,
+            response.status_code,
+            _iter_chunks(response.content, chunk_size),
+            response.exception,
+        )
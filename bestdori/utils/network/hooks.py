@@ -0,0 +1,406 @@
+'''`bestdori.utils.network.hooks`
+
+请求事件钩子与指标收集模块
+
+通过 `settings.hooks` 或 `Session(hooks=...)` 注册 `Hooks` 实例后，
+`Api` 发送的每个请求都将依次触发以下事件，各事件接收同一个 `RequestEvent`：
+
+- `on_request_start`: 请求开始，尚未查询缓存
+- `on_cache_hit`: 命中缓存，包括直接复用新鲜条目与 304 验证后复用
+- `on_retry`: 某次尝试失败，等待 `event.delay` 秒后重试
+- `on_response`: 请求成功完成，包括命中缓存的请求
+- `on_error`: 请求最终失败
+
+流式请求与合并请求中的跟随方不会触发事件。'''
+
+import time
+import warnings
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Dict, List, Tuple, Literal, Optional, Sequence
+
+from .client import Request, Timings, Response
+
+CacheStatus = Literal['hit', 'revalidated', 'miss']
+'''缓存结果，`hit` 为直接复用新鲜条目，`revalidated` 为 304 验证后复用，`miss` 为未命中'''
+
+# 请求事件类
+class RequestEvent:
+    '''请求事件，在同一个请求的各钩子之间传递，属性随请求进行逐步填充
+
+    参数:
+        endpoint (str): 端点名称，无法确定时为请求 URL
+        host (Optional[str]): 所属主机在 `PREFIX` 中的名称
+        request (Request): 请求体
+        hooks (Sequence[Hooks]): 接收事件的钩子
+    '''
+    __slots__ = (
+        'endpoint',
+        'host',
+        'method',
+        'url',
+        'attempt',
+        'status',
+        'response_bytes',
+        'compressed_bytes',
+        'cache',
+        'exception',
+        'delay',
+        'timings',
+        'start',
+        'elapsed',
+        'hooks',
+    )
+
+    def __init__(self, endpoint: str, host: Optional[str], request: Request, hooks: Sequence['Hooks']) -> None:
+        self.endpoint = endpoint
+        '''端点名称，如 `bestdori.api.cards.info`，无法确定时为请求 URL'''
+        self.host = host
+        '''所属主机在 `PREFIX` 中的名称'''
+        self.method = request.method
+        '''请求方法'''
+        self.url = str(request.url)
+        '''请求 URL'''
+        self.attempt = 0
+        '''当前尝试次数，从 `1` 开始，命中缓存时为 `0`'''
+        self.status: Optional[int] = None
+        '''最近一次得到的响应状态码'''
+        self.response_bytes: Optional[int] = None
+        '''最近一次得到的响应内容字节数（解压后）'''
+        self.compressed_bytes: Optional[int] = None
+        '''最近一次尝试实际传输的响应内容字节数（解压前），命中缓存或底层库未提供时为 `None`'''
+        self.cache: Optional[CacheStatus] = None
+        '''缓存结果，未启用缓存时为 `None`'''
+        self.exception: Optional[BaseException] = None
+        '''最近一次尝试或处理响应时抛出的异常'''
+        self.delay: Optional[float] = None
+        '''重试前需要等待的秒数，仅在 `on_retry` 中有效'''
+        self.timings: Optional[Timings] = None
+        '''最近一次尝试的网络耗时'''
+        self.start = time.perf_counter()
+        '''请求开始的时间点，为 `time.perf_counter()` 的返回值'''
+        self.elapsed: Optional[float] = None
+        '''请求的总耗时（秒），包括重试等待时间，请求结束后才会填充'''
+        self.hooks = hooks
+        '''接收事件的钩子'''
+
+    def emit(self, name: str) -> None:
+        '''依次调用各钩子的事件方法，钩子抛出的异常不会影响请求
+
+        参数:
+            name (str): 事件方法名称，如 `on_response`
+        '''
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(self)
+            except Exception as exception:
+                warnings.warn(
+                    f'{type(hook).__name__}.{name} raised {exception!r}',
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
+    def begin_attempt(self, attempt: int, request: Request) -> None:
+        '''开始一次尝试，为请求附加新的耗时记录'''
+        self.attempt = attempt
+        self.status = self.response_bytes = self.compressed_bytes = None
+        self.exception = self.delay = None
+        self.timings = request.timings = Timings()
+
+    def end_attempt(
+        self,
+        response: Optional[Response]=None,
+        exception: Optional[BaseException]=None,
+    ) -> None:
+        '''结束一次尝试，记录其响应或异常'''
+        if self.timings is not None:
+            self.timings.total = self.timings.elapsed()
+        if response is not None:
+            self.status = response.status_code
+            self.response_bytes = len(response.content)
+            self.compressed_bytes = response.compressed_bytes
+        self.exception = exception
+
+    def retry(self, delay: float) -> None:
+        '''记录重试等待时间并触发 `on_retry`'''
+        self.delay = delay
+        self.emit('on_retry')
+
+    def cache_hit(self, status: CacheStatus, response: Response) -> None:
+        '''记录缓存结果并触发 `on_cache_hit`'''
+        self.cache = status
+        self.status = response.status_code
+        self.response_bytes = len(response.content)
+        self.emit('on_cache_hit')
+
+    def finish(self, exception: Optional[BaseException]=None) -> None:
+        '''结束请求并触发 `on_response` 或 `on_error`'''
+        self.elapsed = time.perf_counter() - self.start
+        if exception is None:
+            self.emit('on_response')
+        else:
+            self.exception = exception
+            self.emit('on_error')
+
+    def __repr__(self) -> str:
+        return (
+            f'RequestEvent(endpoint={self.endpoint!r}, method={self.method!r}, '
+            f'status={self.status}, attempt={self.attempt}, cache={self.cache!r}, '
+            f'elapsed={self.elapsed})'
+        )
+
+# 请求事件钩子基类
+class Hooks:
+    '''请求事件钩子基类，继承并覆盖需要的事件方法即可
+
+    事件方法在发送请求的线程或事件循环中同步调用，应尽快返回
+    '''
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        '''请求开始'''
+
+    def on_cache_hit(self, event: RequestEvent) -> None:
+        '''命中缓存'''
+
+    def on_retry(self, event: RequestEvent) -> None:
+        '''某次尝试失败，即将重试'''
+
+    def on_response(self, event: RequestEvent) -> None:
+        '''请求成功完成'''
+
+    def on_error(self, event: RequestEvent) -> None:
+        '''请求最终失败'''
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0,
+)
+'''默认的耗时直方图桶上界（秒）'''
+
+# 直方图类
+class Histogram:
+    '''固定桶直方图，记录数值分布并估算分位数
+
+    参数:
+        buckets (Sequence[float], optional): 各桶的上界，需升序排列，超出最大上界的值计入额外的溢出桶
+    '''
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self, buckets: Sequence[float]=DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        '''各桶的上界'''
+        self.counts = [0] * (len(self.buckets) + 1)
+        '''各桶的计数，最后一项为溢出桶'''
+        self.count = 0
+        '''记录的数值个数'''
+        self.sum = 0.0
+        '''记录的数值之和'''
+        self.min = float('inf')
+        '''记录的最小值'''
+        self.max = float('-inf')
+        '''记录的最大值'''
+
+    def observe(self, value: float) -> None:
+        '''记录一个数值'''
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        '''估算分位数，在所在桶内线性插值
+
+        参数:
+            q (float): 分位点，范围为 `[0, 1]`
+
+        返回:
+            Optional[float]: 分位数估计值，未记录任何数值时为 `None`
+        '''
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+    @property
+    def mean(self) -> Optional[float]:
+        '''平均值，未记录任何数值时为 `None`'''
+        return self.sum / self.count if self.count else None
+
+# 端点指标类
+class EndpointMetrics:
+    '''单个端点的请求指标'''
+    __slots__ = (
+        'requests',
+        'responses',
+        'errors',
+        'retries',
+        'cache_hits',
+        'response_bytes',
+        'compressed_bytes',
+        'statuses',
+        'latency',
+        'ttfb',
+    )
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.requests = 0
+        '''开始的请求数'''
+        self.responses = 0
+        '''成功完成的请求数'''
+        self.errors = 0
+        '''最终失败的请求数'''
+        self.retries = 0
+        '''重试次数'''
+        self.cache_hits = 0
+        '''命中缓存的请求数'''
+        self.response_bytes = 0
+        '''接收的响应内容总字节数（解压后），不含命中缓存的请求'''
+        self.compressed_bytes = 0
+        '''实际传输的响应内容总字节数（解压前），不含命中缓存的请求，304 验证的请求只计入其传输的字节数'''
+        self.statuses: Dict[int, int] = {}
+        '''各响应状态码的计数'''
+        self.latency = Histogram(buckets)
+        '''请求总耗时的分布，包括重试等待时间'''
+        self.ttfb = Histogram(buckets)
+        '''首字节耗时的分布，不含命中缓存的请求'''
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''转换为字典'''
+        return {
+            'requests': self.requests,
+            'responses': self.responses,
+            'errors': self.errors,
+            'retries': self.retries,
+            'cache_hits': self.cache_hits,
+            'response_bytes': self.response_bytes,
+            'compressed_bytes': self.compressed_bytes,
+            'statuses': dict(self.statuses),
+            'latency': {
+                'count': self.latency.count,
+                'sum': self.latency.sum,
+                'mean': self.latency.mean,
+                'p50': self.latency.quantile(0.5),
+                'p90': self.latency.quantile(0.9),
+                'p99': self.latency.quantile(0.99),
+                'max': self.latency.max if self.latency.count else None,
+            },
+            'ttfb': {
+                'mean': self.ttfb.mean,
+                'p99': self.ttfb.quantile(0.99),
+            },
+        }
+
+# 内存指标收集类
+class MetricsCollector(Hooks):
+    '''线程安全的内存指标收集钩子，按端点统计请求计数与耗时分布
+
+    ```python
+    from bestdori import settings
+    from bestdori.utils.network import MetricsCollector
+
+    metrics = MetricsCollector()
+    settings.hooks.append(metrics)
+    ...
+    for endpoint, p99 in metrics.top(5):
+        print(endpoint, p99)
+    ```
+
+    参数:
+        buckets (Sequence[float], optional): 耗时直方图的桶上界（秒）
+    '''
+
+    def __init__(self, buckets: Sequence[float]=DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        '''耗时直方图的桶上界'''
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        '''各端点的指标'''
+        self._lock = Lock()
+
+    def _metrics(self, endpoint: str) -> EndpointMetrics:
+        if (metrics := self.endpoints.get(endpoint, None)) is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics(self.buckets)
+        return metrics
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._metrics(event.endpoint).requests += 1
+
+    def on_cache_hit(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._metrics(event.endpoint).cache_hits += 1
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._metrics(event.endpoint).retries += 1
+
+    def _finish(self, event: RequestEvent, metrics: EndpointMetrics) -> None:
+        if event.status is not None:
+            metrics.statuses[event.status] = metrics.statuses.get(event.status, 0) + 1
+        if event.elapsed is not None:
+            metrics.latency.observe(event.elapsed)
+        if event.attempt > 0 and event.cache != 'hit':
+            if event.response_bytes is not None and event.cache != 'revalidated':
+                metrics.response_bytes += event.response_bytes
+            if event.compressed_bytes is not None:
+                metrics.compressed_bytes += event.compressed_bytes
+            if event.timings is not None and event.timings.ttfb is not None:
+                metrics.ttfb.observe(event.timings.ttfb)
+
+    def on_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event.endpoint)
+            metrics.responses += 1
+            self._finish(event, metrics)
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._metrics(event.endpoint)
+            metrics.errors += 1
+            self._finish(event, metrics)
+
+    def top(self, n: int=10, *, by: Literal['p99', 'p90', 'p50', 'total'] = 'p99') -> List[Tuple[str, float]]:
+        '''获取耗时最高的端点
+
+        参数:
+            n (int, optional): 获取的端点数
+            by (Literal['p99', 'p90', 'p50', 'total'], optional): 排序依据，
+                `total` 为总耗时，即对整体耗时贡献最大的端点
+
+        返回:
+            List[Tuple[str, float]]: 端点名称与对应耗时（秒），按耗时降序排列
+        '''
+        with self._lock:
+            values: List[Tuple[str, float]] = []
+            for endpoint, metrics in self.endpoints.items():
+                if by == 'total':
+                    value: Optional[float] = metrics.latency.sum
+                else:
+                    value = metrics.latency.quantile(int(by[1:]) / 100)
+                if value is not None and metrics.latency.count:
+                    values.append((endpoint, value))
+        values.sort(key=lambda item: item[1], reverse=True)
+        return values[:n]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        '''获取所有端点指标的快照
+
+        返回:
+            Dict[str, Dict[str, Any]]: 以端点名称为键的指标字典
+        '''
+        with self._lock:
+            return {endpoint: metrics.to_dict() for endpoint, metrics in self.endpoints.items()}
+
+    def reset(self) -> None:
+        '''清空所有指标'''
+        with self._lock:
+            self.endpoints.clear()
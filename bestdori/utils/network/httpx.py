@@ -1,11 +1,15 @@
-from json import dumps
-from typing import Any, cast
+import time
+from importlib.util import find_spec
+from typing import Any, Dict, Union, Callable, Iterator, Optional, AsyncIterator, cast
+from contextlib import contextmanager, asynccontextmanager
 
 from multidict import CIMultiDict
 from http.cookiejar import CookieJar
 from typing_extensions import override
 
-from .client import Request, Response
+from bestdori.utils import codec
+
+from .client import Request, Timings, Response, StreamResponse, accept_encoding
 from .client import Client as _Client
 from .client import AsyncClient as _AsyncClient
 
@@ -18,9 +22,126 @@ except ModuleNotFoundError as exception:
 
 __HTTPX_ABOVE_0_28_0__ : bool = tuple(httpx.__version__.split('.')) >= ('0', '28', '0')
 
+try:
+    from httpx._decoders import SUPPORTED_DECODERS as _DECODERS
+except ImportError:
+    _DECODERS = {'gzip': None, 'deflate': None} # type: ignore[assignment]
+
+ACCEPT_ENCODING = accept_encoding(_DECODERS)
+'''协商的响应内容编码，`br` 与 `zstd` 分别需要安装 `brotli` 与 `zstandard`'''
+
+def _client_kwargs(client: Union[_Client, _AsyncClient]) -> Dict[str, Any]:
+    '''构建 httpx 客户端的初始化参数'''
+    kwargs: Dict[str, Any] = {'timeout': client.timeout}
+    
+    if __HTTPX_ABOVE_0_28_0__:
+        kwargs['proxy'] = client.proxy
+    else:
+        kwargs['proxies'] = {
+            'http://': client.proxy,
+            'https://': client.proxy,
+        }
+    
+    # httpx 不区分主机限制连接数，以单主机上限作为最大保活连接数
+    limits: Dict[str, Any] = {}
+    if client.max_connections is not None:
+        limits['max_connections'] = client.max_connections
+    if client.max_connections_per_host is not None:
+        limits['max_keepalive_connections'] = client.max_connections_per_host
+    if client.keepalive_expiry is not None:
+        limits['keepalive_expiry'] = client.keepalive_expiry
+    if limits:
+        kwargs['limits'] = httpx.Limits(**limits)
+    
+    if client.http2:
+        if find_spec('h2') is None:
+            raise ImportError(
+                'module \'h2\' is not installed, please install it by running \'pip install httpx[http2]\''
+            )
+        # 同一主机的并发请求将在少数连接上多路复用
+        kwargs['http2'] = True
+    
+    return kwargs
+
+def _tracer(timings: Timings) -> Callable[[str, Dict[str, Any]], None]:
+    '''构建根据 httpcore 追踪事件记录耗时的回调'''
+    connect_start = 0.0
+    
+    def trace(name: str, info: Dict[str, Any]) -> None:
+        nonlocal connect_start
+        if name == 'connection.connect_tcp.started':
+            connect_start = time.perf_counter()
+        elif name in ('connection.connect_tcp.complete', 'connection.start_tls.complete'):
+            # httpcore 在建立 TCP 连接时解析 DNS，无法单独统计
+            timings.connect = time.perf_counter() - connect_start
+        elif name.endswith('.receive_response_headers.complete'):
+            timings.ttfb = timings.elapsed()
+    
+    return trace
+
+def _extensions(request: Request, _async: bool) -> Optional[Dict[str, Any]]:
+    '''构建 httpx 请求扩展，需要记录耗时时启用追踪'''
+    if request.timings is None:
+        return None
+    trace = _tracer(request.timings)
+    if not _async:
+        return {'trace': trace}
+    
+    async def atrace(name: str, info: Dict[str, Any]) -> None:
+        trace(name, info)
+    
+    return {'trace': atrace}
+
+def _build_request(request: Request, _async: bool=False) -> httpx.Request:
+    '''构建 httpx 请求'''
+    # `send` 不会合并客户端的默认请求头，需要在请求中声明可以解码的内容编码
+    headers = CIMultiDict(request.headers or {})
+    headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
+    content: Optional[bytes] = None
+    if request.files:
+        content = codec.dumpb(request.data) if request.data else None
+    elif request.data or request.json is not None:
+        # 使用 `bestdori.utils.codec` 序列化 JSON 请求体，而非 httpx 内置的标准库实现
+        content = codec.dumpb(request.data if request.data else request.json)
+        headers.setdefault('Content-Type', 'application/json')
+    
+    if __HTTPX_ABOVE_0_28_0__:
+        return httpx.Request(
+            request.method,
+            str(request.url),
+            params=request.params,
+            headers=headers,
+            cookies=request.cookies,
+            content=content,
+            files=request.files,
+            extensions=_extensions(request, _async),
+        )
+    else:
+        return httpx.Request(
+            request.method,
+            str(request.url),
+            params=request.params,
+            headers=headers,
+            cookies=request.cookies,
+            data=cast(dict, content),
+            files=request.files,
+            extensions=_extensions(request, _async),
+        )
+
+def _exception(response: httpx.Response) -> Optional[Exception]:
+    '''获取响应状态码对应的异常'''
+    try:
+        response.raise_for_status()
+    except Exception as exception:
+        return exception
+    return None
+
+_TRANSIENT_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
 class Client(_Client):
     '''HTTPX 同步 HTTP 客户端类型'''
     _client: httpx.Client
+    transient_exceptions = _TRANSIENT_EXCEPTIONS
 
     @override
     def set_cookies(self, cookies: CookieJar) -> None:
@@ -29,22 +150,10 @@ class Client(_Client):
     
     @override
     def __enter__(self) -> "Client":
-        if __HTTPX_ABOVE_0_28_0__:
-            self._client = httpx.Client(
-                proxy=self.proxy,
-                timeout=self.timeout,
-                trust_env=True,
-            )
-        else:
-            proxies = {
-                'http://': self.proxy,
-                'https://': self.proxy,
-            }
-            self._client = httpx.Client(
-                proxies=cast(dict, proxies), # type: ignore
-                timeout=self.timeout,
-                trust_env=True,
-            )
+        self._client = httpx.Client(
+            **_client_kwargs(self),
+            trust_env=True,
+        )
         
         self._client.__enter__()
         return self
@@ -56,28 +165,7 @@ class Client(_Client):
     @override
     def request(self, request: Request) -> Response:
         '''发送请求并获取响应'''
-        if __HTTPX_ABOVE_0_28_0__:
-            _request = httpx.Request(
-                request.method,
-                str(request.url),
-                params=request.params,
-                headers=request.headers,
-                cookies=request.cookies,
-                content=cast(dict, dumps(request.data)) if request.data else None,
-                files=request.files,
-                json=request.json,
-            )
-        else:
-            _request = httpx.Request(
-                request.method,
-                str(request.url),
-                params=request.params,
-                headers=request.headers,
-                cookies=request.cookies,
-                data=cast(dict, dumps(request.data)) if request.data else None,
-                files=request.files,
-                json=request.json,
-            )
+        _request = _build_request(request)
         
         response = self._client.send(_request)
         
@@ -89,6 +177,7 @@ class Client(_Client):
                 response.cookies.jar,
                 response.content,
                 response.status_code,
+                compressed_bytes=response.num_bytes_downloaded,
             )
         except Exception as exception:
             return Response(
@@ -98,35 +187,42 @@ class Client(_Client):
                 response.content,
                 response.status_code,
                 exception,
+                compressed_bytes=response.num_bytes_downloaded,
             )
+    
+    @override
+    @contextmanager
+    def stream(self, request: Request, chunk_size: int) -> Iterator[StreamResponse]:
+        '''发送请求并获取流式响应，退出上下文时释放连接'''
+        response = self._client.send(_build_request(request), stream=True)
+        try:
+            yield StreamResponse(
+                request,
+                CIMultiDict(response.headers),
+                response.cookies.jar,
+                response.status_code,
+                response.iter_bytes(chunk_size),
+                _exception(response),
+            )
+        finally:
+            response.close()
 
 class AsyncClient(_AsyncClient):
     '''HTTPX 异步 HTTP 客户端类型'''
     _async_client: httpx.AsyncClient
+    transient_exceptions = _TRANSIENT_EXCEPTIONS
 
     @override
-    async def set_cookies(self, cookies: CookieJar) -> None:
+    def set_cookies(self, cookies: CookieJar) -> None:
         '''设置 Cookie'''
         self._async_client.cookies = cookies
 
     @override
     async def __aenter__(self) -> "AsyncClient":
-        if __HTTPX_ABOVE_0_28_0__:
-            self._async_client = httpx.AsyncClient(
-                proxy=self.proxy,
-                timeout=self.timeout,
-                trust_env=False,
-            )
-        else:
-            proxies = {
-                'http://': self.proxy,
-                'https://': self.proxy,
-            }
-            self._async_client = httpx.AsyncClient(
-                proxies=cast(dict, proxies), # type: ignore
-                timeout=self.timeout,
-                trust_env=False,
-            )
+        self._async_client = httpx.AsyncClient(
+            **_client_kwargs(self),
+            trust_env=False,
+        )
         
         await self._async_client.__aenter__()
         return self
@@ -138,28 +234,7 @@ class AsyncClient(_AsyncClient):
     @override
     async def request(self, request: Request) -> Response:
         '''异步发送请求并获取响应'''
-        if __HTTPX_ABOVE_0_28_0__:
-            _request = httpx.Request(
-                request.method,
-                str(request.url),
-                params=request.params,
-                headers=request.headers,
-                cookies=request.cookies,
-                content=cast(dict, dumps(request.data)) if request.data else None,
-                files=request.files,
-                json=request.json,
-            )
-        else:
-            _request = httpx.Request(
-                request.method,
-                str(request.url),
-                params=request.params,
-                headers=request.headers,
-                cookies=request.cookies,
-                data=cast(dict, dumps(request.data)) if request.data else None,
-                files=request.files,
-                json=request.json,
-            )
+        _request = _build_request(request, _async=True)
         
         response = await self._async_client.send(_request)
         
@@ -171,6 +246,7 @@ class AsyncClient(_AsyncClient):
                 response.cookies.jar,
                 response.content,
                 response.status_code,
+                compressed_bytes=response.num_bytes_downloaded,
             )
         except Exception as exception:
             return Response(
@@ -180,4 +256,22 @@ class AsyncClient(_AsyncClient):
                 response.content,
                 response.status_code,
                 exception,
+                compressed_bytes=response.num_bytes_downloaded,
+            )
+    
+    @override
+    @asynccontextmanager
+    async def stream(self, request: Request, chunk_size: int) -> AsyncIterator[StreamResponse]:
+        '''异步发送请求并获取流式响应，退出上下文时释放连接'''
+        response = await self._async_client.send(_build_request(request, _async=True), stream=True)
+        try:
+            yield StreamResponse(
+                request,
+                CIMultiDict(response.headers),
+                response.cookies.jar,
+                response.status_code,
+                response.aiter_bytes(chunk_size),
+                _exception(response),
             )
+        finally:
+            await response.aclose()
@@ -0,0 +1,128 @@
+'''`bestdori.utils.network.otel`
+
+OpenTelemetry 指标适配模块，需要安装 `opentelemetry-api`
+
+将请求事件记录为 OpenTelemetry 指标，可通过 OpenTelemetry SDK 的任意导出器
+（如 `opentelemetry-exporter-prometheus`）导出：
+```python
+from bestdori import settings
+from bestdori.utils.network.otel import OpenTelemetryHooks
+
+settings.hooks.append(OpenTelemetryHooks())
+```
+
+所有指标均带有 `bestdori.endpoint`、`bestdori.host`、`http.request.method` 属性，
+请求完成后记录的指标另带有 `http.response.status_code` 与 `bestdori.cache` 属性。'''
+
+from typing import Any, Dict, Optional
+
+from .hooks import Hooks, RequestEvent
+
+try:
+    from opentelemetry import metrics
+except ModuleNotFoundError as exception:
+    raise ImportError(
+        'module \'opentelemetry\' is not installed, please install it by running \'pip install opentelemetry-api\''
+    ) from exception
+
+def _attributes(event: RequestEvent) -> Dict[str, Any]:
+    '''获取请求事件的基本指标属性'''
+    attributes: Dict[str, Any] = {
+        'bestdori.endpoint': event.endpoint,
+        'http.request.method': event.method,
+    }
+    if event.host is not None:
+        attributes['bestdori.host'] = event.host
+    return attributes
+
+def _result_attributes(event: RequestEvent) -> Dict[str, Any]:
+    '''获取请求完成后的指标属性'''
+    attributes = _attributes(event)
+    if event.status is not None:
+        attributes['http.response.status_code'] = event.status
+    if event.cache is not None:
+        attributes['bestdori.cache'] = event.cache
+    if event.exception is not None:
+        attributes['error.type'] = type(event.exception).__qualname__
+    return attributes
+
+# OpenTelemetry 指标钩子类
+class OpenTelemetryHooks(Hooks):
+    '''将请求事件记录为 OpenTelemetry 指标的钩子
+
+    记录的指标:
+        `bestdori.client.requests`: 开始的请求数
+        `bestdori.client.errors`: 最终失败的请求数
+        `bestdori.client.retries`: 重试次数
+        `bestdori.client.cache_hits`: 命中缓存的请求数
+        `bestdori.client.response.size`: 接收的响应内容字节数（解压后）
+        `bestdori.client.response.compressed_size`: 实际传输的响应内容字节数（解压前）
+        `bestdori.client.request.duration`: 请求总耗时（秒）
+        `bestdori.client.ttfb`: 首字节耗时（秒）
+
+    参数:
+        meter_provider (Optional[metrics.MeterProvider], optional): 指标提供者，默认使用全局提供者
+    '''
+
+    def __init__(self, meter_provider: Optional['metrics.MeterProvider']=None) -> None:
+        meter = metrics.get_meter('bestdori', meter_provider=meter_provider)
+        self.requests = meter.create_counter(
+            'bestdori.client.requests', unit='{request}', description='Requests started',
+        )
+        '''开始的请求数'''
+        self.errors = meter.create_counter(
+            'bestdori.client.errors', unit='{request}', description='Requests failed',
+        )
+        '''最终失败的请求数'''
+        self.retries = meter.create_counter(
+            'bestdori.client.retries', unit='{retry}', description='Retried attempts',
+        )
+        '''重试次数'''
+        self.cache_hits = meter.create_counter(
+            'bestdori.client.cache_hits', unit='{request}', description='Requests served from cache',
+        )
+        '''命中缓存的请求数'''
+        self.response_size = meter.create_counter(
+            'bestdori.client.response.size', unit='By', description='Response body bytes received',
+        )
+        '''接收的响应内容字节数'''
+        self.compressed_size = meter.create_counter(
+            'bestdori.client.response.compressed_size', unit='By', description='Response body bytes transferred before decompression',
+        )
+        '''实际传输的响应内容字节数'''
+        self.duration = meter.create_histogram(
+            'bestdori.client.request.duration', unit='s', description='Request duration including retries',
+        )
+        '''请求总耗时'''
+        self.ttfb = meter.create_histogram(
+            'bestdori.client.ttfb', unit='s', description='Time to first byte of the last attempt',
+        )
+        '''首字节耗时'''
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        self.requests.add(1, _attributes(event))
+
+    def on_cache_hit(self, event: RequestEvent) -> None:
+        self.cache_hits.add(1, _attributes(event))
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self.retries.add(1, _result_attributes(event))
+
+    def _finish(self, event: RequestEvent) -> None:
+        attributes = _result_attributes(event)
+        if event.elapsed is not None:
+            self.duration.record(event.elapsed, attributes)
+        if event.attempt > 0 and event.cache != 'hit':
+            if event.response_bytes is not None and event.cache != 'revalidated':
+                self.response_size.add(event.response_bytes, attributes)
+            if event.compressed_bytes is not None:
+                self.compressed_size.add(event.compressed_bytes, attributes)
+            if event.timings is not None and event.timings.ttfb is not None:
+                self.ttfb.record(event.timings.ttfb, attributes)
+
+    def on_response(self, event: RequestEvent) -> None:
+        self._finish(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.errors.add(1, _result_attributes(event))
+        self._finish(event)
@@ -0,0 +1,243 @@
+'''`bestdori.utils.network.ratelimit`
+
+客户端请求限速模块，按 `PREFIX` 中的主机分别限制请求速率与并发数'''
+
+import time
+import asyncio
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from collections import deque
+from typing import Dict, Deque, Tuple, Callable, Iterator, Optional, AsyncIterator
+
+from bestdori.settings import settings
+from bestdori.utils.endpoints import PREFIX
+
+# 限速配置类
+class RateLimit:
+    '''限速配置类
+
+    参数:
+        rate (Optional[float], optional): 每秒允许发送的请求数，为 `None` 时不限制速率
+        burst (Optional[int], optional): 令牌桶容量，即允许的突发请求数，默认为 `max(1, rate)`
+        max_concurrency (Optional[int], optional): 同时进行的最大请求数，为 `None` 时不限制，
+            同步请求与所有事件循环中的异步请求共享该上限
+    '''
+
+    def __init__(
+        self,
+        rate: Optional[float]=None,
+        *,
+        burst: Optional[int]=None,
+        max_concurrency: Optional[int]=None,
+    ) -> None:
+        self.rate = rate
+        '''每秒允许发送的请求数'''
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        '''令牌桶容量'''
+        self.max_concurrency = max_concurrency
+        '''同时进行的最大请求数'''
+
+    def _key(self) -> Tuple[Optional[float], int, Optional[int]]:
+        return (self.rate, self.burst, self.max_concurrency)
+
+# 令牌桶类
+class TokenBucket:
+    '''线程安全的令牌桶类
+
+    令牌不足时按预约方式扣减，调用方只需等待返回的时长，无需轮询。
+
+    参数:
+        rate (float): 每秒补充的令牌数
+        burst (int): 令牌桶容量
+    '''
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        '''每秒补充的令牌数'''
+        self.burst = burst
+        '''令牌桶容量'''
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        '''预约一个令牌
+
+        返回:
+            float: 令牌可用前需要等待的秒数
+        '''
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        '''获取一个令牌，令牌不足时阻塞等待'''
+        if (delay := self.reserve()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        '''异步获取一个令牌，令牌不足时等待'''
+        if (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
+
+# 并发计数类
+class ConcurrencySlots:
+    '''线程安全的并发计数类，同步调用与任意数量的事件循环共享同一上限
+
+    槽位已满时调用方按先后顺序排队，释放的槽位直接交给下一个等待者。
+
+    参数:
+        limit (int): 同时持有的最大槽位数
+    '''
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        '''同时持有的最大槽位数'''
+        self._active = 0
+        self._lock = threading.Lock()
+        # 等待者的唤醒方法，返回是否成功接收槽位
+        self._waiters: Deque[Callable[[], bool]] = deque()
+
+    @property
+    def active(self) -> int:
+        '''当前持有的槽位数'''
+        return self._active
+
+    def acquire(self) -> None:
+        '''获取一个槽位，槽位已满时阻塞等待'''
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return
+            event = threading.Event()
+            self._waiters.append(lambda: event.set() or True)
+        event.wait()
+
+    async def acquire_async(self) -> None:
+        '''异步获取一个槽位，槽位已满时等待'''
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return
+            future: asyncio.Future[None] = loop.create_future()
+            self._waiters.append(lambda: self._wake(loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 已接收槽位后被取消时归还槽位
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def _wake(self, loop: asyncio.AbstractEventLoop, future: 'asyncio.Future[None]') -> bool:
+        try:
+            loop.call_soon_threadsafe(self._grant, future)
+        except RuntimeError:
+            # 事件循环已关闭，跳过该等待者
+            return False
+        return True
+
+    def _grant(self, future: 'asyncio.Future[None]') -> None:
+        if future.done():
+            # 等待者已被取消，将槽位交给下一个等待者
+            self.release()
+        else:
+            future.set_result(None)
+
+    def release(self) -> None:
+        '''释放一个槽位'''
+        with self._lock:
+            while self._waiters:
+                if self._waiters.popleft()():
+                    return
+            self._active -= 1
+
+class _HostLimiter:
+    '''单个主机的限速器'''
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.key = limit._key()
+        self.bucket = TokenBucket(limit.rate, limit.burst) if limit.rate else None
+        # 同步调用与所有事件循环共享同一并发计数
+        self.slots = ConcurrencySlots(limit.max_concurrency) if limit.max_concurrency else None
+
+# 限速器类
+class RateLimiter:
+    '''按主机限速的限速器类，配置读取自 `settings.rate_limits`'''
+
+    def __init__(self) -> None:
+        self._limiters: Dict[str, _HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str, host: Optional[str]=None) -> Optional[_HostLimiter]:
+        if not settings.rate_limits:
+            return None
+        if host is not None and host in settings.rate_limits:
+            # 已知所属主机时直接查找，无需比对 URL 前缀
+            return self._limiter(host, settings.rate_limits[host])
+        for name, limit in settings.rate_limits.items():
+            if url.startswith(PREFIX.get(name, name)):
+                return self._limiter(name, limit)
+        return None
+
+    def _limiter(self, name: str, limit: RateLimit) -> _HostLimiter:
+        limiter = self._limiters.get(name, None)
+        if limiter is None or limiter.key != limit._key():
+            with self._lock:
+                limiter = self._limiters.get(name, None)
+                if limiter is None or limiter.key != limit._key():
+                    limiter = self._limiters[name] = _HostLimiter(limit)
+        return limiter
+
+    @contextmanager
+    def limit(self, url: str, host: Optional[str]=None) -> Iterator[None]:
+        '''在限速下发送请求
+
+        参数:
+            url (str): 请求 URL
+            host (Optional[str], optional): 所属主机在 `PREFIX` 中的名称，已知时无需比对 URL 前缀
+        '''
+        limiter = self._get(url, host)
+        if limiter is None:
+            yield
+            return
+        if limiter.slots is not None:
+            limiter.slots.acquire()
+        try:
+            if limiter.bucket is not None:
+                limiter.bucket.acquire()
+            yield
+        finally:
+            if limiter.slots is not None:
+                limiter.slots.release()
+
+    @asynccontextmanager
+    async def limit_async(self, url: str, host: Optional[str]=None) -> AsyncIterator[None]:
+        '''在限速下异步发送请求
+
+        参数:
+            url (str): 请求 URL
+            host (Optional[str], optional): 所属主机在 `PREFIX` 中的名称，已知时无需比对 URL 前缀
+        '''
+        limiter = self._get(url, host)
+        if limiter is None:
+            yield
+            return
+        if limiter.slots is not None:
+            await limiter.slots.acquire_async()
+        try:
+            if limiter.bucket is not None:
+                await limiter.bucket.acquire_async()
+            yield
+        finally:
+            if limiter.slots is not None:
+                limiter.slots.release()
+
+rate_limiter = RateLimiter()
+'''全局限速器，所有会话共享'''
@@ -0,0 +1,308 @@
+'''`bestdori.utils.network.replay`
+
+请求录制与回放模块
+
+通过 `settings.cassette` 或 `Session(cassette=...)` 设置 `Cassette` 后，会话的客户端将被替换为录制回放客户端：
+
+- `record`: 正常发送请求，并将响应录制到文件中
+- `replay`: 只从录制文件中读取响应，不访问网络，请求没有对应的录制时抛出 `ReplayMissError`
+- `auto`: 优先使用录制的响应，没有录制时发送请求并录制
+
+```python
+from bestdori import settings
+from bestdori.utils.network import Cassette
+
+settings.cassette = Cassette('bestdori.zip', mode='record')
+...  # 正常调用 API
+settings.cassette.save()
+
+settings.cassette = Cassette('bestdori.zip')  # 回放，无需网络
+```
+
+请求按方法、URL、参数与请求内容匹配，不区分 Cookies。
+录制文件为 zip 压缩包，相同的响应内容只存储一份，回放时全部读入内存。
+录制的响应将在会话关闭、调用 `save` 或进程退出时写入文件。'''
+
+import os
+import time
+import atexit
+import zipfile
+from hashlib import sha256
+from threading import Lock
+from pathlib import Path
+from json import dumps, loads
+from http.cookiejar import CookieJar
+from typing import Any, Dict, List, Union, Literal, Optional
+
+from typing_extensions import Self
+
+from bestdori.exceptions import ReplayMissError
+
+from .cache import CacheEntry, ResponseCache, cache_key
+from .client import Client, Request, Response, AsyncClient
+
+ReplayMode = Literal['record', 'replay', 'auto']
+'''录制回放模式'''
+
+_INDEX = 'index.json'
+
+def _body_digest(request: Request) -> Optional[str]:
+    '''计算请求内容的摘要，没有请求内容时返回 `None`'''
+    if request.data is None and request.json is None and not request.files:
+        return None
+    body: Dict[str, Any] = {'data': request.data, 'json': request.json}
+    if request.files:
+        # 文件内容已被读取或正在读取，只使用文件名区分
+        body['files'] = {name: file[0] for name, file in request.files.items()}
+    return sha256(dumps(body, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+# 录制文件类
+class Cassette:
+    '''请求录制文件
+
+    参数:
+        path (Union[str, Path]): 录制文件路径
+        mode (ReplayMode, optional): 录制回放模式，`replay` 模式下文件必须存在
+    '''
+
+    def __init__(self, path: Union[str, Path], mode: ReplayMode='replay') -> None:
+        if mode not in ('record', 'replay', 'auto'):
+            raise ValueError(f'Unknown replay mode \'{mode}\', expected one of [\'record\', \'replay\', \'auto\']')
+        self.path = Path(path)
+        '''录制文件路径'''
+        self.mode: ReplayMode = mode
+        '''录制回放模式'''
+        self._records: Optional[Dict[str, CacheEntry]] = None
+        self._dirty = False
+        self._lock = Lock()
+        self._registered = False
+
+    @staticmethod
+    def key(request: Request) -> str:
+        '''获取请求的录制键
+
+        GET 请求的录制键与响应缓存的缓存键相同
+
+        参数:
+            request (Request): 请求体
+
+        返回:
+            str: 录制键
+        '''
+        key = cache_key(request)
+        if (digest := _body_digest(request)) is not None:
+            key += f' #{digest}'
+        return key
+
+    @property
+    def records(self) -> Dict[str, CacheEntry]:
+        '''所有录制的响应，首次访问时从文件中读取'''
+        if self._records is None:
+            with self._lock:
+                if self._records is None:
+                    self._records = self._load()
+        return self._records
+
+    def _load(self) -> Dict[str, CacheEntry]:
+        if not self.path.exists():
+            if self.mode == 'replay':
+                raise FileNotFoundError(f'Cassette \'{self.path}\' does not exist.')
+            return {}
+        records: Dict[str, CacheEntry] = {}
+        bodies: Dict[str, bytes] = {}
+        with zipfile.ZipFile(self.path) as archive:
+            for item in loads(archive.read(_INDEX)):
+                digest = item['body']
+                if (content := bodies.get(digest, None)) is None:
+                    content = bodies[digest] = archive.read(f'bodies/{digest}')
+                records[item['key']] = CacheEntry(
+                    item['status_code'],
+                    [(k, v) for k, v in item['headers']],
+                    content,
+                    item['stored_at'],
+                )
+        return records
+
+    def get(self, request: Request) -> Optional[Response]:
+        '''获取请求对应的录制响应
+
+        参数:
+            request (Request): 请求体
+
+        返回:
+            Optional[Response]: 录制的响应，没有录制时返回 `None`
+        '''
+        if (entry := self.records.get(self.key(request), None)) is None:
+            return None
+        return entry.to_response(request)
+
+    def put(self, response: Response) -> None:
+        '''录制响应
+
+        参数:
+            response (Response): 响应体
+        '''
+        entry = CacheEntry(
+            response.status_code,
+            list(response.headers.items()),
+            response.content,
+            time.time(),
+        )
+        key = self.key(response.request)
+        records = self.records
+        with self._lock:
+            records[key] = entry
+            self._dirty = True
+            if not self._registered:
+                # 未关闭的会话不会保存录制，退出时兜底保存
+                atexit.register(self.save)
+                self._registered = True
+
+    def save(self) -> None:
+        '''将录制的响应写入文件，没有新的录制时不做任何操作'''
+        with self._lock:
+            if not self._dirty or self._records is None:
+                return
+            index: List[Dict[str, Any]] = []
+            written = set()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # 先写入临时文件再替换，写入中断时不会破坏已有的录制文件
+            temp = self.path.with_name(f'{self.path.name}.{os.getpid()}.tmp')
+            with zipfile.ZipFile(temp, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for key, entry in self._records.items():
+                    digest = sha256(entry.content).hexdigest()
+                    if digest not in written:
+                        archive.writestr(f'bodies/{digest}', entry.content)
+                        written.add(digest)
+                    index.append({
+                        'key': key,
+                        'status_code': entry.status_code,
+                        'headers': entry.headers,
+                        'stored_at': entry.stored_at,
+                        'body': digest,
+                    })
+                archive.writestr(_INDEX, dumps(index, ensure_ascii=False))
+            os.replace(temp, self.path)
+            self._dirty = False
+
+    def warm(self, cache: ResponseCache) -> int:
+        '''将录制的 GET 响应写入响应缓存，用于无法访问网络的环境预热缓存
+
+        参数:
+            cache (ResponseCache): 响应缓存
+
+        返回:
+            int: 写入的条目数
+        '''
+        count = 0
+        for key, entry in list(self.records.items()):
+            if key.startswith('GET ') and ' #' not in key and entry.status_code == 200:
+                cache.set(key, entry)
+                count += 1
+        return count
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.save()
+
+    def __repr__(self) -> str:
+        return f'Cassette({str(self.path)!r}, mode={self.mode!r})'
+
+# 录制回放同步客户端类
+class ReplayClient(Client):
+    '''录制回放同步客户端，由会话根据 `Cassette` 自动创建
+
+    参数:
+        cassette (Cassette): 录制文件
+        client (Optional[Client]): 实际发送请求的客户端，`replay` 模式下为 `None`
+    '''
+
+    def __init__(self, cassette: Cassette, client: Optional[Client]) -> None:
+        super().__init__(
+            client.proxy if client is not None else None,
+            client.timeout if client is not None else 0,
+        )
+        self.cassette = cassette
+        '''录制文件'''
+        self.client = client
+        '''实际发送请求的客户端'''
+        if client is not None:
+            self.transient_exceptions = client.transient_exceptions
+
+    def set_cookies(self, cookies: CookieJar) -> None:
+        if self.client is not None:
+            self.client.set_cookies(cookies)
+
+    def __enter__(self) -> Self:
+        if self.client is not None:
+            self.client.__enter__()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        try:
+            if self.client is not None:
+                self.client.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.cassette.save()
+
+    def request(self, request: Request) -> Response:
+        '''回放或发送请求并录制响应'''
+        if self.cassette.mode != 'record' and (response := self.cassette.get(request)) is not None:
+            return response
+        if self.client is None:
+            raise ReplayMissError(self.cassette.key(request))
+        response = self.client.request(request)
+        self.cassette.put(response)
+        return response
+
+# 录制回放异步客户端类
+class AsyncReplayClient(AsyncClient):
+    '''录制回放异步客户端，由会话根据 `Cassette` 自动创建
+
+    参数:
+        cassette (Cassette): 录制文件
+        client (Optional[AsyncClient]): 实际发送请求的客户端，`replay` 模式下为 `None`
+    '''
+
+    def __init__(self, cassette: Cassette, client: Optional[AsyncClient]) -> None:
+        super().__init__(
+            client.proxy if client is not None else None,
+            client.timeout if client is not None else 0,
+        )
+        self.cassette = cassette
+        '''录制文件'''
+        self.client = client
+        '''实际发送请求的客户端'''
+        if client is not None:
+            self.transient_exceptions = client.transient_exceptions
+
+    def set_cookies(self, cookies: CookieJar) -> None:
+        if self.client is not None:
+            self.client.set_cookies(cookies)
+
+    async def __aenter__(self) -> Self:
+        if self.client is not None:
+            await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        try:
+            if self.client is not None:
+                await self.client.__aexit__(exc_type, exc_value, traceback)
+        finally:
+            self.cassette.save()
+
+    async def request(self, request: Request) -> Response:
+        '''回放或异步发送请求并录制响应'''
+        if self.cassette.mode != 'record' and (response := self.cassette.get(request)) is not None:
+            return response
+        if self.client is None:
+            raise ReplayMissError(self.cassette.key(request))
+        response = await self.client.request(request)
+        self.cassette.put(response)
+        return response
@@ -0,0 +1,130 @@
+'''`bestdori.utils.network.retry`
+
+请求重试策略模块'''
+
+import time
+import random
+from email.utils import parsedate_to_datetime
+from typing import Type, Tuple, Iterable, Optional
+
+from .client import Response
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    '''解析 `Retry-After` 响应头
+
+    参数:
+        value (Optional[str]): 响应头的值，可为秒数或 HTTP 日期
+
+    返回:
+        Optional[float]: 需要等待的秒数，无法解析时返回 `None`
+    '''
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+# 重试策略类
+class RetryPolicy:
+    '''请求重试策略类，仅作用于幂等的 GET 请求
+
+    重试间隔使用带上限的指数退避，启用抖动时在 `[0, 退避时间]` 中随机取值；
+    响应带有 `Retry-After` 时优先使用其指定的等待时间。
+
+    参数:
+        max_attempts (int, optional): 最大尝试次数（含首次请求），为 `1` 时不重试
+        backoff_base (float, optional): 指数退避的基础时间（秒）
+        backoff_cap (float, optional): 单次退避时间上限（秒）
+        jitter (bool, optional): 是否对退避时间添加随机抖动
+        statuses (Iterable[int], optional): 需要重试的响应状态码
+        exceptions (Tuple[Type[BaseException], ...], optional): 额外需要重试的异常类型，
+            客户端的网络与超时异常总是会被重试
+        respect_retry_after (bool, optional): 是否遵循 `Retry-After` 响应头
+        max_retry_after (float, optional): `Retry-After` 超过该值（秒）时放弃重试
+    '''
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int=3,
+        backoff_base: float=0.5,
+        backoff_cap: float=30.0,
+        jitter: bool=True,
+        statuses: Iterable[int]=(429, 500, 502, 503, 504),
+        exceptions: Tuple[Type[BaseException], ...]=(),
+        respect_retry_after: bool=True,
+        max_retry_after: float=60.0,
+    ) -> None:
+        self.max_attempts = max_attempts
+        '''最大尝试次数（含首次请求）'''
+        self.backoff_base = backoff_base
+        '''指数退避的基础时间（秒）'''
+        self.backoff_cap = backoff_cap
+        '''单次退避时间上限（秒）'''
+        self.jitter = jitter
+        '''是否对退避时间添加随机抖动'''
+        self.statuses = frozenset(statuses)
+        '''需要重试的响应状态码'''
+        self.exceptions = exceptions
+        '''额外需要重试的异常类型'''
+        self.respect_retry_after = respect_retry_after
+        '''是否遵循 `Retry-After` 响应头'''
+        self.max_retry_after = max_retry_after
+        '''`Retry-After` 超过该值（秒）时放弃重试'''
+
+    def backoff(self, attempt: int) -> float:
+        '''计算第 `attempt` 次尝试失败后的退避时间
+
+        参数:
+            attempt (int): 已进行的尝试次数，从 `1` 开始
+
+        返回:
+            float: 退避时间（秒）
+        '''
+        delay = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        *,
+        response: Optional[Response]=None,
+        exception: Optional[BaseException]=None,
+        transient: Tuple[Type[BaseException], ...]=(),
+    ) -> Optional[float]:
+        '''判断是否需要重试并计算等待时间
+
+        参数:
+            attempt (int): 已进行的尝试次数，从 `1` 开始
+            response (Optional[Response], optional): 本次尝试得到的响应
+            exception (Optional[BaseException], optional): 本次尝试抛出的异常
+            transient (Tuple[Type[BaseException], ...], optional): 客户端的网络与超时异常类型
+
+        返回:
+            Optional[float]: 重试前需要等待的秒数，不需要重试时返回 `None`
+        '''
+        if attempt >= self.max_attempts:
+            return None
+
+        if exception is not None:
+            if isinstance(exception, transient + self.exceptions):
+                return self.backoff(attempt)
+            return None
+
+        if response is None or response.status_code not in self.statuses:
+            return None
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get('Retry-After', None))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                return retry_after
+        return self.backoff(attempt)
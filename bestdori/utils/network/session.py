@@ -0,0 +1,425 @@
+'''`bestdori.utils.network.session`
+
+HTTP 会话模块，持有可跨请求复用的长连接池'''
+
+import atexit
+import asyncio
+from threading import Lock
+from concurrent.futures import Future
+from http.cookiejar import CookieJar
+from typing import (
+    Any,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    TypeVar,
+    Literal,
+    Callable,
+    Optional,
+    Awaitable,
+    overload,
+)
+
+from typing_extensions import Self
+
+from bestdori.settings import settings
+
+from .hooks import Hooks
+from .retry import RetryPolicy
+from .cache import ResponseCache
+from .replay import Cassette, ReplayClient, AsyncReplayClient
+from .client import Client, AsyncClient
+
+T = TypeVar('T')
+
+__CLIENT_AVAILABLE__ = {
+    'httpx': ['sync', 'async'],
+    'aiohttp': ['async'],
+}
+
+__Client__: Optional[Type[Client]] = None
+'''当前的同步客户端类'''
+__AsyncClient__: Optional[Type[AsyncClient]] = None
+'''当前的异步客户端类'''
+
+@overload
+def _import_client(name: str) -> Type[Client]:
+    ...
+
+@overload
+def _import_client(name: str, _async: Literal[True]) -> Type[AsyncClient]:
+    ...
+
+def _import_client(name: str, _async: bool = False) -> Union[Type[Client], Type[AsyncClient]]:
+    '''导入客户端类'''
+
+    if name == 'httpx':
+        if _async:
+            from .httpx import AsyncClient
+            return AsyncClient
+        else:
+            from .httpx import Client
+            return Client
+    elif name == 'aiohttp':
+        if _async:
+            from .aiohttp import AsyncClient
+            return AsyncClient
+        else:
+            raise ImportError('\'aiohttp\' does not support sync client.')
+    else:
+        raise ImportError(f'cannot find builtin {name} client.')
+
+def _get_client_class() -> Type[Client]:
+    '''获取当前可用的同步客户端类'''
+    global __Client__
+
+    if __Client__ is None:
+        for name, types in __CLIENT_AVAILABLE__.items():
+            if 'sync' in types:
+                try:
+                    __Client__ = _import_client(name)
+                    break
+                except ImportError:
+                    continue
+        else:
+            raise ImportError(
+                'module \'aiohttp\' and \'httpx\' are not installed, '
+                'please install it by running \'pip install aiohttp\' or \'pip install httpx\'',
+            )
+
+    return __Client__
+
+def _get_async_client_class() -> Type[AsyncClient]:
+    '''获取当前可用的异步客户端类'''
+    global __AsyncClient__
+
+    if __AsyncClient__ is None:
+        for name, types in __CLIENT_AVAILABLE__.items():
+            if 'async' in types:
+                try:
+                    __AsyncClient__ = _import_client(name, _async=True)
+                    break
+                except ImportError as e:
+                    print(e)
+                    continue
+        else:
+            raise ImportError('no available client.')
+
+    return __AsyncClient__
+
+_DEFAULT_RETRY = RetryPolicy()
+
+# HTTP 会话类
+class Session:
+    '''HTTP 会话类，持有可跨请求复用的同步与异步长连接池与登录状态
+
+    不同会话之间的连接池与 Cookies 相互隔离，可在同一进程中同时使用多个账号或代理。
+    未指定的参数将在打开连接池时从 `bestdori.settings` 中读取，
+    若设置项在连接池打开后发生变化，连接池将在下一次请求时重建。
+
+    参数:
+        cookies (Optional[CookieJar], optional): 会话 Cookies，通常由 `Me.login` 设置
+        proxy (Optional[str], optional): 代理服务器
+        timeout (Optional[int], optional): 超时时间
+        max_connections (Optional[int], optional): 连接池最大连接数
+        max_connections_per_host (Optional[int], optional): 连接池对单个主机的最大连接数
+        keepalive_expiry (Optional[float], optional): 空闲连接的保活时间（秒）
+        http2 (Optional[bool], optional): 是否启用 HTTP/2，仅 `httpx` 客户端支持
+        cache (Optional[ResponseCache], optional): GET 响应缓存，未指定时使用 `settings.cache`
+        retry (Optional[RetryPolicy], optional): GET 请求的重试策略，未指定时使用 `settings.retry`
+        hooks (Optional[List[Hooks]], optional): 请求事件钩子，未指定时使用 `settings.hooks`
+        cassette (Optional[Cassette], optional): 请求录制文件，未指定时使用 `settings.cassette`
+    '''
+
+    def __init__(
+        self,
+        *,
+        cookies: Optional[CookieJar]=None,
+        proxy: Optional[str]=None,
+        timeout: Optional[int]=None,
+        max_connections: Optional[int]=None,
+        max_connections_per_host: Optional[int]=None,
+        keepalive_expiry: Optional[float]=None,
+        http2: Optional[bool]=None,
+        cache: Optional[ResponseCache]=None,
+        retry: Optional[RetryPolicy]=None,
+        hooks: Optional[List[Hooks]]=None,
+        cassette: Optional[Cassette]=None,
+    ) -> None:
+        self.cookies = cookies
+        '''会话 Cookies，未显式指定 Cookies 的请求都将携带'''
+        self.proxy = proxy
+        '''代理服务器'''
+        self.timeout = timeout
+        '''超时时间'''
+        self.max_connections = max_connections
+        '''连接池最大连接数'''
+        self.max_connections_per_host = max_connections_per_host
+        '''连接池对单个主机的最大连接数'''
+        self.keepalive_expiry = keepalive_expiry
+        '''空闲连接的保活时间（秒）'''
+        self.http2 = http2
+        '''是否启用 HTTP/2'''
+        self.cache = cache
+        '''GET 响应缓存'''
+        self.retry = retry
+        '''GET 请求的重试策略'''
+        self.hooks = hooks
+        '''请求事件钩子'''
+        self.cassette = cassette
+        '''请求录制文件'''
+
+        self._client: Optional[Client] = None
+        self._client_config: Optional[Tuple[Any, ...]] = None
+        self._client_lock = Lock()
+
+        self._async_client: Optional[AsyncClient] = None
+        self._async_client_config: Optional[Tuple[Any, ...]] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_lock: Optional[asyncio.Lock] = None
+
+        self._inflight: Dict[str, Future[Any]] = {}
+        self._inflight_lock = Lock()
+        self._async_inflight: Dict[str, asyncio.Task[Any]] = {}
+        self._async_inflight_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _config(self) -> Tuple[Any, ...]:
+        '''获取当前生效的连接池配置'''
+        return (
+            self.proxy if self.proxy is not None else settings.proxy,
+            self.timeout if self.timeout is not None else settings.timeout,
+            self.max_connections if self.max_connections is not None else settings.max_connections,
+            (
+                self.max_connections_per_host
+                if self.max_connections_per_host is not None
+                else settings.max_connections_per_host
+            ),
+            self.keepalive_expiry if self.keepalive_expiry is not None else settings.keepalive_expiry,
+            self.http2 if self.http2 is not None else settings.http2,
+            (cassette := self.get_cassette()),
+            cassette.mode if cassette is not None else None,
+        )
+
+    @staticmethod
+    def _build(config: Tuple[Any, ...], _async: bool=False) -> Any:
+        proxy, timeout, max_connections, max_connections_per_host, keepalive_expiry, http2, cassette, mode = config
+        client = None
+        # 回放模式不需要访问网络，无需创建实际的客户端
+        if mode != 'replay':
+            client_class = _get_async_client_class() if _async else _get_client_class()
+            client = client_class(
+                proxy,
+                timeout,
+                max_connections=max_connections,
+                max_connections_per_host=max_connections_per_host,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
+        if cassette is None:
+            return client
+        return AsyncReplayClient(cassette, client) if _async else ReplayClient(cassette, client)
+
+    def get_cache(self) -> Optional[ResponseCache]:
+        '''获取当前生效的响应缓存
+
+        返回:
+            Optional[ResponseCache]: 响应缓存，为 `None` 时不缓存
+        '''
+        return self.cache if self.cache is not None else settings.cache
+
+    def get_retry(self) -> RetryPolicy:
+        '''获取当前生效的重试策略
+
+        返回:
+            RetryPolicy: 重试策略
+        '''
+        if self.retry is not None:
+            return self.retry
+        if settings.retry is not None:
+            return settings.retry
+        return _DEFAULT_RETRY
+
+    def get_hooks(self) -> List[Hooks]:
+        '''获取当前生效的请求事件钩子
+
+        返回:
+            List[Hooks]: 请求事件钩子，为空时不记录请求事件
+        '''
+        return self.hooks if self.hooks is not None else settings.hooks
+
+    def get_cassette(self) -> Optional[Cassette]:
+        '''获取当前生效的请求录制文件
+
+        返回:
+            Optional[Cassette]: 请求录制文件，为 `None` 时不录制也不回放
+        '''
+        return self.cassette if self.cassette is not None else settings.cassette
+
+    @property
+    def is_open(self) -> bool:
+        '''同步连接池是否已打开'''
+        return self._client is not None
+
+    def open(self) -> Self:
+        '''打开同步连接池，若已打开则不做任何操作'''
+        self.get_client()
+        return self
+
+    def close(self) -> None:
+        '''关闭同步连接池'''
+        with self._client_lock:
+            client, self._client = self._client, None
+            self._client_config = None
+        if client is not None:
+            client.__exit__(None, None, None)
+
+    def get_client(self) -> Client:
+        '''获取同步客户端，连接池未打开时将自动打开
+
+        返回:
+            Client: 已打开的同步客户端
+        '''
+        config = self._config()
+        client = self._client
+        if client is not None and self._client_config == config:
+            return client
+
+        with self._client_lock:
+            if self._client is not None and self._client_config == config:
+                return self._client
+
+            stale, self._client = self._client, None
+            if stale is not None:
+                stale.__exit__(None, None, None)
+
+            client = self._build(config)
+            client.__enter__()
+            self._client = client
+            self._client_config = config
+
+        return client
+
+    async def aopen(self) -> Self:
+        '''打开异步连接池，若已打开则不做任何操作'''
+        await self.get_async_client()
+        return self
+
+    async def aclose(self) -> None:
+        '''关闭异步连接池'''
+        client, self._async_client = self._async_client, None
+        loop, self._async_loop = self._async_loop, None
+        self._async_client_config = None
+        self._async_lock = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.__aexit__(None, None, None)
+
+    async def get_async_client(self) -> AsyncClient:
+        '''获取异步客户端，连接池未打开时将自动打开
+
+        异步连接池与事件循环绑定，在新的事件循环中调用时将重新创建
+
+        返回:
+            AsyncClient: 已打开的异步客户端
+        '''
+        config = self._config()
+        loop = asyncio.get_running_loop()
+        client = self._async_client
+        if (
+            client is not None
+            and self._async_loop is loop
+            and self._async_client_config == config
+        ):
+            return client
+
+        if self._async_loop is not loop or self._async_lock is None:
+            # 旧的事件循环中的连接无法在当前循环中复用，直接丢弃
+            self._async_client = None
+            self._async_client_config = None
+            self._async_loop = loop
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            if self._async_client is not None and self._async_client_config == config:
+                return self._async_client
+
+            stale, self._async_client = self._async_client, None
+            if stale is not None:
+                await stale.__aexit__(None, None, None)
+
+            client = self._build(config, _async=True)
+            await client.__aenter__()
+            self._async_client = client
+            self._async_client_config = config
+
+        return client
+
+    def _coalesce(self, key: str, func: Callable[[], T]) -> T:
+        '''合并并发的相同请求，同一时刻相同键的请求只会执行一次'''
+        with self._inflight_lock:
+            future = self._inflight.get(key, None)
+            leader = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    async def _acoalesce(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        '''异步合并并发的相同请求，同一时刻相同键的请求只会执行一次'''
+        loop = asyncio.get_running_loop()
+        if self._async_inflight_loop is not loop:
+            self._async_inflight = {}
+            self._async_inflight_loop = loop
+
+        task = self._async_inflight.get(key, None)
+        if task is None:
+            task = loop.create_task(func())  # type: ignore[arg-type]
+            self._async_inflight[key] = task
+
+            def _done(_task: 'asyncio.Task[Any]') -> None:
+                if self._async_inflight.get(key, None) is _task:
+                    del self._async_inflight[key]
+                # 所有等待方都已取消时避免产生未获取异常的警告
+                if not _task.cancelled():
+                    _task.exception()
+
+            task.add_done_callback(_done)
+
+        # 单个等待方被取消时不影响其他等待方
+        return await asyncio.shield(task)
+
+    def __enter__(self) -> Self:
+        return self.open()
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return await self.aopen()
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.aclose()
+
+_default_session = Session()
+atexit.register(_default_session.close)
+
+def get_default_session() -> Session:
+    '''获取全局默认会话
+
+    返回:
+        Session: 全局默认会话，未显式指定会话的请求都将使用该会话
+    '''
+    return _default_session
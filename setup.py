@@ -33,8 +33,25 @@ setup(
         'httpx': [
             'httpx>=0.22.0',
         ],
+        'http2': [
+            'httpx[http2]>=0.22.0',
+        ],
         'aiohttp': [
             'aiohttp>=3.8.1',
         ],
+        'orjson': [
+            'orjson>=3.8.0',
+        ],
+        'msgspec': [
+            'msgspec>=0.18.0',
+        ],
+        'compression': [
+            'brotli>=1.0.9',
+            'zstandard>=0.18.0',
+            'backports.zstd>=1.0.0; python_version < "3.14"',
+        ],
+        'otel': [
+            'opentelemetry-api>=1.12.0',
+        ],
     },
 )
\ No newline at end of file